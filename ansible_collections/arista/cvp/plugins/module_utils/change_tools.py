@@ -31,10 +31,8 @@ from copy import deepcopy
 from ansible.module_utils.basic import AnsibleModule
 import ansible_collections.arista.cvp.plugins.module_utils.logger   # noqa # pylint: disable=unused-import
 from ansible_collections.arista.cvp.plugins.module_utils.response import CvApiResult, CvManagerResult, CvAnsibleResponse  # noqa # pylint: disable=unused-import
-from ansible_collections.arista.cvp.plugins.module_utils.resources.schemas import v3 as schema
 from ansible_collections.arista.cvp.plugins.module_utils.tools_schema import validate_json_schema
 try:
-    from cvprac.cvp_client import CvpClient  # noqa # pylint: disable=unused-import
     from cvprac.cvp_client_errors import CvpApiError, CvpRequestError  # noqa # pylint: disable=unused-import
     HAS_CVPRAC = True
 except ImportError:
@@ -50,7 +48,7 @@ MODULE_LOGGER.info('Start change_tools module execution')
 
 
 class CvChangeControlInput(object):
-    def __init__(self, user_change: dict, schema=schema.SCHEMA_CV_CHANGE_CONTROL) -> None:
+    def __init__(self, user_change: dict, schema="SCHEMA_CV_CHANGE_CONTROL") -> None:
         self.__user_change = user_change
         self.__schema = schema
 
@@ -60,7 +58,7 @@ class CvChangeControlInput(object):
         check_schemas Validate schemas for user's input
         """
         if not validate_json_schema(user_json=self.__user_change, schema=self.__schema):
-            MODULE_LOGGER.error("Invalid change control input : \n%s", str(self.__user_change))
+            MODULE_LOGGER.error("Invalid change control input : \n%s", self.__user_change)
             return False
         return True
 
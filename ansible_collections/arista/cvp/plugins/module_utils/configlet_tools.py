@@ -9,6 +9,7 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import importlib.util
 import traceback
 import logging
 import re
@@ -16,26 +17,18 @@ from typing import List
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.arista.cvp.plugins.module_utils.response import CvApiResult, CvManagerResult, CvAnsibleResponse
 from ansible_collections.arista.cvp.plugins.module_utils.resources.api.fields import Api
-from ansible_collections.arista.cvp.plugins.module_utils.resources.schemas import v3 as schema
+from ansible_collections.arista.cvp.plugins.module_utils.tools_metrics import record_cache_lookup
 from ansible_collections.arista.cvp.plugins.module_utils.tools_schema import validate_json_schema
 import ansible_collections.arista.cvp.plugins.module_utils.logger   # noqa # pylint: disable=unused-import
 try:
-    from cvprac.cvp_client import CvpClient  # noqa # pylint: disable=unused-import
     from cvprac.cvp_client_errors import CvpApiError, CvpRequestError  # noqa # pylint: disable=unused-import
     HAS_CVPRAC = True
 except ImportError:
     HAS_CVPRAC = False
     CVPRAC_IMP_ERR = traceback.format_exc()
-try:
-    import difflib
-    HAS_DIFFLIB = True
-except ImportError:
-    HAS_DIFFLIB = False
-try:
-    import hashlib
-    HAS_HASHLIB = True
-except ImportError:
-    HAS_HASHLIB = False
+# difflib and hashlib are only imported when a configlet diff is computed
+HAS_DIFFLIB = importlib.util.find_spec('difflib') is not None
+HAS_HASHLIB = importlib.util.find_spec('hashlib') is not None
 
 MODULE_LOGGER = logging.getLogger(__name__)
 MODULE_LOGGER.info('Start cv_container_v3 module execution')
@@ -43,7 +36,7 @@ MODULE_LOGGER.info('Start cv_container_v3 module execution')
 
 class ConfigletInput(object):
 
-    def __init__(self, user_topology: dict, schema=schema.SCHEMA_CV_CONFIGLET):
+    def __init__(self, user_topology: dict, schema="SCHEMA_CV_CONFIGLET"):
         self.__topology = user_topology
         self.__schema = schema
 
@@ -53,7 +46,7 @@ class ConfigletInput(object):
         check_schemas Validate schemas for user's input
         """
         if not validate_json_schema(user_json=self.__topology, schema=self.__schema):
-            MODULE_LOGGER.error("Invalid configlet input : \n%s", str(self.__topology))
+            MODULE_LOGGER.error("Invalid configlet input : \n%s", self.__topology)
             return False
         return True
 
@@ -72,6 +65,8 @@ class CvConfigletTools(object):
         self._ansible = ansible_module
         self.WINDOWS_LINE_ENDING = '\r\n'
         self.UNIX_LINE_ENDING = '\n'
+        # Configlets read from Cloudvision by name, entries are dropped when a configlet is changed
+        self._configlets_cache = {}
 
     def _str_cleanup_line_ending(self, content: str):
         """
@@ -106,6 +101,8 @@ class CvConfigletTools(object):
             '  '	line common to both sequences
             '? '	line not present in either input sequence
         """
+        import difflib
+        import hashlib
         fromlines = self._str_cleanup_line_ending(content=fromText).splitlines(1)
         tolines = self._str_cleanup_line_ending(content=toText).splitlines(1)
         diff = list(difflib.unified_diff(
@@ -133,13 +130,7 @@ class CvConfigletTools(object):
         bool
             True if configlet exists or False if not present
         """
-        try:
-            response = self._cvp_client.api.get_configlet_by_name(name=configlet_name)
-        except CvpApiError:
-            return False
-        if response is not None:
-            return True
-        return False
+        return self.get_configlet_data_cv(configlet_name=configlet_name) is not None
 
     def get_configlet_data_cv(self, configlet_name: str):
         """
@@ -155,11 +146,15 @@ class CvConfigletTools(object):
         dict
             Configlet information in a dict format
         """
+        record_cache_lookup(self._cvp_client, 'configlet_tools.configlets', hit=configlet_name in self._configlets_cache)
+        if configlet_name in self._configlets_cache:
+            return self._configlets_cache[configlet_name]
         data = None
         try:
             data = self._cvp_client.api.get_configlet_by_name(name=configlet_name)
         except CvpApiError:
             return None
+        self._configlets_cache[configlet_name] = data
         return data
 
     def apply(self, configlet_list: list, present: bool = True, note: str = 'Managed by Ansible AVD'):
@@ -191,7 +186,7 @@ class CvConfigletTools(object):
                         fromText=cv_data[Api.generic.CONFIG], toText=configlet[Api.generic.CONFIG], fromName='CVP', toName='Ansible')
                     configlet['notediff'] = self._compare(
                         fromText=cv_data['note'], toText=note, fromName='CVP', toName='Ansible')
-                    MODULE_LOGGER.debug("configlet note diff: %s", str(configlet['notediff']))
+                    MODULE_LOGGER.debug("configlet note diff: %s", configlet['notediff'])
                     if (configlet['diff'][0]) is True or (configlet['notediff'][0] is True):
                         to_update.append(configlet)
 
@@ -214,25 +209,25 @@ class CvConfigletTools(object):
             creation = self.create(to_create=to_create, note=note)
             for entry in creation:
                 MODULE_LOGGER.debug(
-                    'configlet created: %s', str(entry.results))
+                    'configlet created: %s', entry.results)
                 created_configlets.add_change(entry)
         if present and to_update:
             update = self.update(to_update=to_update, note=note)
             for entry in update:
                 MODULE_LOGGER.debug(
-                    'configlet updated: %s', str(entry.results))
+                    'configlet updated: %s', entry.results)
                 updated_configlets.add_change(entry)
         if not present and to_delete:
             delete = self.delete(to_delete=to_delete)
             for entry in delete:
                 MODULE_LOGGER.debug(
-                    'configlet deleted: %s', str(entry.results))
+                    'configlet deleted: %s', entry.results)
                 deleted_configlets.add_change(entry)
         response = CvAnsibleResponse()
         response.add_manager(created_configlets)
         response.add_manager(updated_configlets)
         response.add_manager(deleted_configlets)
-        MODULE_LOGGER.info('Configlet change result is: %s', str(response.content))
+        MODULE_LOGGER.info('Configlet change result is: %s', response.content)
         return response
 
     def update(self, to_update: list, note: str = 'Managed by Ansible AVD'):
@@ -275,10 +270,10 @@ class CvConfigletTools(object):
         configlets_notes = note
         for configlet in to_update:
             change_response = CvApiResult(action_name=configlet[Api.generic.NAME])
+            self._configlets_cache.pop(configlet[Api.generic.NAME], None)
             if self._ansible.check_mode:
                 change_response.add_entry('[check mode] to be updated')
-                MODULE_LOGGER.info('[check mode] - Configlet %s updated on cloudvision', str(
-                    configlet[Api.generic.NAME]))
+                MODULE_LOGGER.info('[check mode] - Configlet %s updated on cloudvision', configlet[Api.generic.NAME])
                 change_response.success = True
                 if 'diff' in configlet:
                     change_response.diff = configlet['diff']
@@ -299,8 +294,7 @@ class CvConfigletTools(object):
                     # Add logging to ansible response.
                     change_response.add_entry(message)
                     # Generate logging error message
-                    MODULE_LOGGER.error('Error updating configlet %s: %s', str(
-                        configlet[Api.generic.NAME]), str(error))
+                    MODULE_LOGGER.error('Error updating configlet %s: %s', configlet[Api.generic.NAME], error)
                     self._ansible.fail_json(msg=message)
                 else:
                     if "errorMessage" in str(update_resp):
@@ -311,8 +305,7 @@ class CvConfigletTools(object):
                         # Add logging to ansible response.
                         change_response.add_entry(message)
                         # Generate logging error message
-                        MODULE_LOGGER.error('Error updating configlet %s: %s', str(
-                            configlet[Api.generic.NAME]), str(update_resp['errorMessage']))
+                        MODULE_LOGGER.error('Error updating configlet %s: %s', configlet[Api.generic.NAME], update_resp['errorMessage'])
                         self._ansible.fail_json(msg=message)
                     else:
                         # Inform module a changed has been done
@@ -329,18 +322,18 @@ class CvConfigletTools(object):
                                 change_response.diff = configlet['diff']
                                 change_response.changed = True
                                 MODULE_LOGGER.info(
-                                    'Found diff in configlet %s.', str(configlet[Api.generic.NAME]))
+                                    'Found diff in configlet %s.', configlet[Api.generic.NAME])
                         if 'notediff' in configlet:
                             if configlet['notediff'] is not None and configlet['notediff'][0] is True:
                                 change_response.diff = configlet['notediff']
                                 change_response.changed = True
                                 MODULE_LOGGER.info(
-                                    'Found diff in configlet note of configlet %s.', str(configlet[Api.generic.NAME]))
+                                    'Found diff in configlet note of configlet %s.', configlet[Api.generic.NAME])
                         # Collect generated tasks
                         if 'taskIds' in update_resp and len(update_resp['taskIds']) > 0:
                             change_response.taskIds = update_resp['taskIds']
                         MODULE_LOGGER.info(
-                            'Configlet %s updated on cloudvision', str(configlet[Api.generic.NAME]))
+                            'Configlet %s updated on cloudvision', configlet[Api.generic.NAME])
             response_data.append(change_response)
         return response_data
 
@@ -385,10 +378,10 @@ class CvConfigletTools(object):
         for configlet in to_create:
             # Run section to guess changes when module runs with --check flag
             change_response = CvApiResult(action_name=configlet[Api.generic.NAME])
+            self._configlets_cache.pop(configlet[Api.generic.NAME], None)
             if self._ansible.check_mode:
                 change_response.add_entry('[check mode] to be created')
-                MODULE_LOGGER.info('[check mode] - Configlet %s created on cloudvision', str(
-                    configlet[Api.generic.NAME]))
+                MODULE_LOGGER.info('[check mode] - Configlet %s created on cloudvision', configlet[Api.generic.NAME])
                 change_response.success = True
             else:
                 try:
@@ -402,8 +395,7 @@ class CvConfigletTools(object):
                     # Add logging to ansible response.
                     change_response.add_entry(message)
                     # Generate logging error message
-                    MODULE_LOGGER.error('Error creating configlet %s: %s', str(
-                        configlet[Api.generic.NAME]), str(error))
+                    MODULE_LOGGER.error('Error creating configlet %s: %s', configlet[Api.generic.NAME], error)
                     self._ansible.fail_json(msg=message)
                 else:
                     if "errorMessage" in str(new_resp):
@@ -416,14 +408,14 @@ class CvConfigletTools(object):
                         change_response.add_entry(message)
                         # Generate logging error message
                         MODULE_LOGGER.error(
-                            'Error creating configlet %s: %s', str(configlet[Api.generic.NAME]), str(new_resp))
+                            'Error creating configlet %s: %s', configlet[Api.generic.NAME], new_resp)
                         self._ansible.fail_json(msg=message)
                     else:
                         self._cvp_client.api.add_note_to_configlet(new_resp, configlets_notes)
                         change_response.add_entry('configlet created')
                         change_response.changed = True
                         change_response.success = True
-                        MODULE_LOGGER.info('Configlet %s created on cloudvision', str(configlet[Api.generic.NAME]))
+                        MODULE_LOGGER.info('Configlet %s created on cloudvision', configlet[Api.generic.NAME])
             response_data.append(change_response)
         return response_data
 
@@ -463,11 +455,11 @@ class CvConfigletTools(object):
         response_data = []
         for configlet in to_delete:
             change_response = CvApiResult(action_name=configlet[Api.generic.NAME])
+            self._configlets_cache.pop(configlet[Api.generic.NAME], None)
             # Run section to guess changes when module runs with --check flag
             if self._ansible.check_mode:
                 change_response.add_entry('[check mode] to be deleted')
-                MODULE_LOGGER.info('[check mode] - Configlet %s created on cloudvision', str(
-                    configlet[Api.generic.NAME]))
+                MODULE_LOGGER.info('[check mode] - Configlet %s created on cloudvision', configlet[Api.generic.NAME])
             else:
                 try:
                     delete_resp = self._cvp_client.api.delete_configlet(
@@ -481,8 +473,7 @@ class CvConfigletTools(object):
                     # Add logging to ansible response.
                     change_response.add_entry(message)
                     # Generate logging error message
-                    MODULE_LOGGER.error('Error deleting configlet %s: %s', str(
-                        configlet[Api.generic.NAME]), str(error))
+                    MODULE_LOGGER.error('Error deleting configlet %s: %s', configlet[Api.generic.NAME], error)
                     self._ansible.fail_json(msg=message)
                 else:
                     if "errorMessage" in str(delete_resp):
@@ -494,12 +485,12 @@ class CvConfigletTools(object):
                         change_response.add_entry(message)
                         # Generate logging error message
                         MODULE_LOGGER.error(
-                            'Error deleting configlet %s: %s', str(configlet[Api.generic.NAME]), str(delete_resp))
+                            'Error deleting configlet %s: %s', configlet[Api.generic.NAME], delete_resp)
                         self._ansible.fail_json(msg=message)
                     else:
                         change_response.add_entry('configlet deleted')
                         change_response.changed = True
                         change_response.success = True  # noqa # pylint: disable=unused-variable
-                        MODULE_LOGGER.info('Configlet %s deleted on cloudvision', str(configlet[Api.generic.NAME]))
+                        MODULE_LOGGER.info('Configlet %s deleted on cloudvision', configlet[Api.generic.NAME])
             response_data.append(change_response)
         return response_data
@@ -18,7 +18,7 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.arista.cvp.plugins.module_utils.resources.api.fields import Api
 from ansible_collections.arista.cvp.plugins.module_utils.resources.modules.fields import ContainerResponseFields, ModuleOptionValues
 from ansible_collections.arista.cvp.plugins.module_utils.response import CvApiResult, CvManagerResult, CvAnsibleResponse
-from ansible_collections.arista.cvp.plugins.module_utils.resources.schemas import v3 as schema
+from ansible_collections.arista.cvp.plugins.module_utils.tools_metrics import call_cached
 from ansible_collections.arista.cvp.plugins.module_utils.tools_schema import validate_json_schema
 from ansible_collections.arista.cvp.plugins.module_utils.resources.exceptions import AnsibleCVPApiError, AnsibleCVPNotFoundError, CVPRessource
 try:
@@ -42,7 +42,7 @@ class ContainerInput(object):
     ContainerInput Object to manage Container Topology in context of arista.cvp collection.
     """
 
-    def __init__(self, user_topology: dict, container_root_name: str = 'Tenant', schema=schema.SCHEMA_CV_CONTAINER):
+    def __init__(self, user_topology: dict, container_root_name: str = 'Tenant', schema="SCHEMA_CV_CONTAINER"):
         self.__topology = user_topology
         self.__parent_field: str = Api.generic.PARENT_CONTAINER_NAME
         self.__root_name = container_root_name
@@ -64,14 +64,12 @@ class ContainerInput(object):
         Any
             Value of the key. None if not found
         """
-        MODULE_LOGGER.debug('Receive request to get data for container %s about its %s key', str(
-            container_name), str(key_name))
+        MODULE_LOGGER.debug('Receive request to get data for container %s about its %s key', container_name, key_name)
         if (
             container_name in self.__topology
             and key_name in self.__topology[container_name]
         ):
-            MODULE_LOGGER.debug('  -> Found data for container %s: %s', str(
-                container_name), str(self.__topology[container_name][key_name]))
+            MODULE_LOGGER.debug('  -> Found data for container %s: %s', container_name, self.__topology[container_name][key_name])
             return self.__topology[container_name][key_name]
         return None
 
@@ -83,7 +81,7 @@ class ContainerInput(object):
         MODULE_LOGGER.info('start json schema validation')
         if not validate_json_schema(user_json=self.__topology, schema=self.__schema):
             MODULE_LOGGER.error(
-                "Invalid configlet input : \n%s\n\n%s", str(self.__topology), self.__schema)
+                "Invalid configlet input : \n%s\n\n%s", self.__topology, self.__schema)
             return False
         return True
 
@@ -98,7 +96,7 @@ class ContainerInput(object):
             List of containers
         """
         result_list = []
-        MODULE_LOGGER.info("Build list of container to create from %s", str(self.__topology))
+        MODULE_LOGGER.info("Build list of container to create from %s", self.__topology)
 
         while (len(result_list) < len(self.__topology)):
             container_added = False
@@ -114,11 +112,11 @@ class ContainerInput(object):
                 containerWithoutParent = [item for item in self.__topology.keys() if item not in result_list]
                 MODULE_LOGGER.warning(
                     'Breaking the while loop as the following containers dont have a parent present in the topology %s',
-                    str(containerWithoutParent))
+                    containerWithoutParent)
                 result_list += containerWithoutParent
                 break
 
-        MODULE_LOGGER.info('List of containers to apply on CV: %s', str(result_list))
+        MODULE_LOGGER.info('List of containers to apply on CV: %s', result_list)
         return result_list
 
     def __str__(self):
@@ -281,7 +279,7 @@ class CvContainerTools(object):
         dict
             Configlet information in a filtered manner
         """
-        MODULE_LOGGER.info('Getting information for configlet %s', str(configlet_name))
+        MODULE_LOGGER.info('Getting information for configlet %s', configlet_name)
         data = self.__cvp_client.api.get_configlet_by_name(name=configlet_name)
         if data is not None:
             return self.__standard_output(source=data)
@@ -337,7 +335,7 @@ class CvContainerTools(object):
                 )
 
                 MODULE_LOGGER.warning(
-                    '[check_mode] - Fake container creation of %s', str(container[Api.generic.NAME]))
+                    '[check_mode] - Fake container creation of %s', container[Api.generic.NAME])
             else:
                 try:
                     resp = self.__cvp_client.api.apply_configlets_to_container(
@@ -477,7 +475,7 @@ class CvContainerTools(object):
             else:
                 # Get the assigned image bundle information
                 try:
-                    MODULE_LOGGER.info("Getting the image bundle info for bundle: %s", str(image_bundle))
+                    MODULE_LOGGER.info("Getting the image bundle info for bundle: %s", image_bundle)
                     assigned_image_facts = self.__cvp_client.api.get_image_bundle_by_name(image_bundle)
                 except CvpApiError as e:
                     message = "Error retrieving image bundle info for: " + str(image_bundle) + ". Error was: " + str(e)
@@ -500,10 +498,10 @@ class CvContainerTools(object):
                     if len(current_image_facts['imageBundleList']) != 0 and\
                             current_image_facts['imageBundleList'][0][Api.generic.KEY] == assigned_image_facts['id']:
                         # Check that the current image bundle and the assigned image bundle are the same
-                        MODULE_LOGGER.info("Nothing to do. Image bundle already assigned to %s container", str(container[Api.generic.NAME]))
+                        MODULE_LOGGER.info("Nothing to do. Image bundle already assigned to %s container", container[Api.generic.NAME])
                     else:
-                        MODULE_LOGGER.debug("Image bundle %s has key %s", str(image_bundle), str(assigned_image_facts['id']))
-                        MODULE_LOGGER.info("Applying %s to container %s", str(image_bundle), str(container[Api.generic.NAME]))
+                        MODULE_LOGGER.debug("Image bundle %s has key %s", image_bundle, assigned_image_facts['id'])
+                        MODULE_LOGGER.info("Applying %s to container %s", image_bundle, container[Api.generic.NAME])
                         try:
                             resp = self.__cvp_client.api.apply_image_to_element(
                                 assigned_image_facts,
@@ -519,7 +517,7 @@ class CvContainerTools(object):
                             MODULE_LOGGER.error(message)
                             self.__ansible.fail_json(msg=message)
                         except CvpApiError as catch_error:
-                            MODULE_LOGGER.error('Error applying bundle to device: %s', str(catch_error))
+                            MODULE_LOGGER.error('Error applying bundle to device: %s', catch_error)
                             self.__ansible.fail_json(msg='Error applying bundle to container' + container[Api.generic.NAME] + ': ' + catch_error)
                         else:
                             if resp['data']['status'] == 'success':
@@ -570,7 +568,7 @@ class CvContainerTools(object):
                     self.__ansible.fail_json(msg=message)
 
                 if len(current_image_facts['imageBundleList']) != 0:
-                    MODULE_LOGGER.debug('Remove image %s from container %s', str(current_image_facts), str(container))
+                    MODULE_LOGGER.debug('Remove image %s from container %s', current_image_facts, container)
                     try:
                         resp = self.__cvp_client.api.remove_image_from_element(
                             current_image_facts['imageBundleList'][0],
@@ -586,7 +584,7 @@ class CvContainerTools(object):
                         MODULE_LOGGER.error(message)
                         self.__ansible.fail_json(msg=message)
                     except CvpApiError as catch_error:
-                        MODULE_LOGGER.error('Error removing bundle from container: %s', str(catch_error))
+                        MODULE_LOGGER.error('Error removing bundle from container: %s', catch_error)
                         self.__ansible.fail_json(msg='Error removing bundle from container: ' + container[Api.generic.NAME] + ': ' + catch_error)
                     else:
                         if resp['data']['status'] == 'success':
@@ -636,20 +634,20 @@ class CvContainerTools(object):
         """
         cv_response = self.__cvp_client.api.get_container_by_name(
             name=container_name)
-        MODULE_LOGGER.debug('Get container ID (%s) response from cv for container %s', str(cv_response), str(container_name))
+        MODULE_LOGGER.debug('Get container ID (%s) response from cv for container %s', cv_response, container_name)
         if cv_response is not None and Api.generic.KEY in cv_response:
             container_id = cv_response[Api.generic.KEY]
             container_facts = self.__cvp_client.api.filter_topology(node_id=container_id)[Api.container.TOPOLOGY]
             MODULE_LOGGER.debug('Collecting assigned image bundle name')
             assigned_bundle = self.__cvp_client.api.get_image_bundle_by_container_id(container_id)
-            MODULE_LOGGER.debug('Retrieved the bundle information: %s', str(assigned_bundle))
+            MODULE_LOGGER.debug('Retrieved the bundle information: %s', assigned_bundle)
             if len(assigned_bundle['imageBundleList']) == 1:
                 container_facts[Api.generic.IMAGE_BUNDLE_NAME] = assigned_bundle['imageBundleList'][0][Api.generic.NAME]
             elif len(assigned_bundle['imageBundleList']) == 0:
                 container_facts[Api.generic.IMAGE_BUNDLE_NAME] = None
             else:
-                MODULE_LOGGER.error('Image bundle list is larger than expected (%d): %s', int(assigned_bundle['imageBundleList']), str(assigned_bundle))
-            MODULE_LOGGER.debug('Return info for container %s', str(container_name))
+                MODULE_LOGGER.error('Image bundle list is larger than expected (%d): %s', int(assigned_bundle['imageBundleList']), assigned_bundle)
+            MODULE_LOGGER.debug('Return info for container %s', container_name)
             return self.__standard_output(source=container_facts)
         return None
 
@@ -698,15 +696,15 @@ class CvContainerTools(object):
         configlets_list = configlets_and_mappers['data'][Api.generic.CONFIGLETS]
         mappers = configlets_and_mappers['data']['configletMappers']
         configlets_configured = []
-        MODULE_LOGGER.info('container %s has id %s', str(container_name), str(container_id))
+        MODULE_LOGGER.info('container %s has id %s', container_name, container_id)
         for mapper in mappers:
             if mapper[Api.mappers.OBJECT_ID] == container_id:
                 MODULE_LOGGER.info(
-                    'Found 1 mappers for container %s : %s', str(container_name), str(mapper))
+                    'Found 1 mappers for container %s : %s', container_name, mapper)
                 configlets_configured.append(
                     next((x for x in configlets_list if x[Api.generic.KEY] == mapper[Api.configlet.ID])))
-        MODULE_LOGGER.debug('List of configlets from CV is: %s', str(
-            [x[Api.generic.NAME] for x in configlets_configured]))
+        if MODULE_LOGGER.isEnabledFor(logging.DEBUG):
+            MODULE_LOGGER.debug('List of configlets from CV is: %s', [x[Api.generic.NAME] for x in configlets_configured])
         return configlets_configured
 
     def get_container_id(self, container_name: str):
@@ -799,7 +797,7 @@ class CvContainerTools(object):
         bool
             True if container exists, False if not
         """
-        MODULE_LOGGER.info("Checking if container_name:%s exists", str(container_name))
+        MODULE_LOGGER.info("Checking if container_name:%s exists", container_name)
         try:
             cv_data = self.__cvp_client.api.get_container_by_name(name=container_name)
         except (CvpApiError, CvpClientError) as error:
@@ -844,11 +842,11 @@ class CvContainerTools(object):
         """
         resp = {}
         change_result = CvApiResult(action_name=container)
-        MODULE_LOGGER.debug('parent container is set to: %s', str(parent))
-        if self.is_container_exists(container_name=parent):
+        MODULE_LOGGER.debug('parent container is set to: %s', parent)
+        if call_cached(self.__cvp_client, 'container_tools.exists', self.is_container_exists, container_name=parent):
             parent_id = self.__cvp_client.api.get_container_by_name(name=parent)[Api.generic.KEY]
-            MODULE_LOGGER.debug('Parent container (%s) for container %s exists', str(parent), str(container))
-            if self.is_container_exists(container_name=container) is False:
+            MODULE_LOGGER.debug('Parent container (%s) for container %s exists', parent, container)
+            if call_cached(self.__cvp_client, 'container_tools.exists', self.is_container_exists, container_name=container) is False:
                 if self.__check_mode:
                     change_result.success = True
                     change_result.changed = True
@@ -884,7 +882,8 @@ class CvContainerTools(object):
                 parent) + ") is missing for container " + str(container)
             MODULE_LOGGER.error(message)
             self.__ansible.fail_json(msg=message)
-        MODULE_LOGGER.info('Container creation result is %s', str(change_result.results))
+        if MODULE_LOGGER.isEnabledFor(logging.INFO):
+            MODULE_LOGGER.info('Container creation result is %s', change_result.results)
         return change_result
 
     def delete_container(self, container: str, parent: str):
@@ -914,12 +913,12 @@ class CvContainerTools(object):
         """
         resp = {}
         change_result = CvApiResult(action_name=container)
-        if self.is_container_exists(container_name=container) is False:
+        if call_cached(self.__cvp_client, 'container_tools.exists', self.is_container_exists, container_name=container) is False:
             message = "Unable to delete container " + \
                 str(container) + ": container does not exist on CVP"
             MODULE_LOGGER.error(message)
             self.__ansible.fail_json(msg=message)
-        elif self.is_empty(container_name=container) is False:
+        elif call_cached(self.__cvp_client, 'container_tools.empty', self.is_empty, container_name=container) is False:
             message = "Unable to delete container " + str(container) + ": container not empty - either it has child container(s) or \
                 some device(s) are attached to it on CVP"
             MODULE_LOGGER.error(message)
@@ -1026,14 +1025,14 @@ class CvContainerTools(object):
         dict
             Action result
         """
-        MODULE_LOGGER.info('Running configlet detach for container %s', str(container))
+        MODULE_LOGGER.info('Running configlet detach for container %s', container)
         container_info = self.get_container_info(container_name=container)
         detach_configlets = []
         for configlet in configlets:
             data = self.__get_configlet_info(configlet_name=configlet[Api.generic.NAME])
             if data is not None:
                 detach_configlets.append(data)
-        MODULE_LOGGER.info('Sending data to self.__configlet_del: %s', str(detach_configlets))
+        MODULE_LOGGER.info('Sending data to self.__configlet_del: %s', detach_configlets)
         return self.__configlet_del(container=container_info, configlets=detach_configlets)
 
     def image_bundle_attach(self, container: str, image_name: str):
@@ -1063,7 +1062,7 @@ class CvContainerTools(object):
             Action result
         """
         container_info = self.get_container_info(container_name=container)
-        MODULE_LOGGER.debug("Attempting to apply image bundle %s to container %s", str(image_name), str(container))
+        MODULE_LOGGER.debug("Attempting to apply image bundle %s to container %s", image_name, container)
         return self.__image_bundle_add(container=container_info, image_bundle=image_name)
 
     def image_bundle_detach(self, container: str):
@@ -1091,7 +1090,7 @@ class CvContainerTools(object):
             Action result
         """
         container_info = self.get_container_info(container_name=container)
-        MODULE_LOGGER.debug("Attampting to remove image bundle from %s", str(container))
+        MODULE_LOGGER.debug("Attampting to remove image bundle from %s", container)
         return self.__image_bundle_del(container=container_info)
 
     def build_topology(self, user_topology: ContainerInput, present: bool = True, apply_mode: str = 'loose'):
@@ -1136,8 +1135,8 @@ class CvContainerTools(object):
             # Create containers topology in Cloudvision
             if present:
                 for user_container in user_topology.ordered_list_containers:
-                    MODULE_LOGGER.info('Start creation process for container %s under %s', str(
-                        user_container), str(user_topology.get_parent(container_name=user_container)))
+                    MODULE_LOGGER.info('Start creation process for container %s under %s',
+                                       user_container, user_topology.get_parent(container_name=user_container))
                     resp = self.create_container(
                         container=user_container, parent=user_topology.get_parent(container_name=user_container))
                     container_add_manager.add_change(resp)
@@ -1166,7 +1165,7 @@ class CvContainerTools(object):
                             cv_configlets_detach.add_change(resp)
 
                     if user_topology.has_image_bundle(container_name=user_container):
-                        MODULE_LOGGER.debug('%s container has an image bundle assigned', str(user_container))
+                        MODULE_LOGGER.debug('%s container has an image bundle assigned', user_container)
                         resp = self.image_bundle_attach(
                             container=user_container, image_name=user_topology.get_image_bundle(container_name=user_container))
                         cv_image_bundle_attach.add_change(resp)
@@ -1176,8 +1175,8 @@ class CvContainerTools(object):
 
             else:
                 for user_container in reversed(user_topology.ordered_list_containers):
-                    MODULE_LOGGER.info('Start deletion process for container %s under %s', str(
-                        user_container), str(user_topology.get_parent(container_name=user_container)))
+                    MODULE_LOGGER.info('Start deletion process for container %s under %s',
+                                       user_container, user_topology.get_parent(container_name=user_container))
                     resp = self.delete_container(
                         container=user_container, parent=user_topology.get_parent(container_name=user_container))
                     container_delete_manager.add_change(resp)
@@ -1192,5 +1191,5 @@ class CvContainerTools(object):
         response.add_manager(cv_image_bundle_attach)
         response.add_manager(cv_image_bundle_detach)
         MODULE_LOGGER.debug(
-            'Container manager is sending result data: %s', str(response))
+            'Container manager is sending result data: %s', response)
         return response
@@ -14,6 +14,7 @@ __metaclass__ = type
 
 import traceback
 import logging
+import threading
 import uuid
 import time
 from functools import lru_cache
@@ -30,15 +31,14 @@ from ansible_collections.arista.cvp.plugins.module_utils.resources.modules.field
     DeviceResponseFields,
 )
 from ansible_collections.arista.cvp.plugins.module_utils.generic_tools import CvElement
-from ansible_collections.arista.cvp.plugins.module_utils.resources.schemas import (
-    v3 as schema,
-)
+from ansible_collections.arista.cvp.plugins.module_utils.tools_cv import get_tasks_by_id
+from ansible_collections.arista.cvp.plugins.module_utils.tools_metrics import record_cache_lookup
 from ansible_collections.arista.cvp.plugins.module_utils.tools_schema import (
+    HAS_JSONSCHEMA,
     validate_json_schema,
 )
 
 try:
-    from cvprac.cvp_client import CvpClient  # noqa # pylint: disable=unused-import
     from cvprac.cvp_client_errors import (
         CvpApiError,
         CvpRequestError,
@@ -48,16 +48,13 @@ try:
 except ImportError:
     HAS_CVPRAC = False
     CVPRAC_IMP_ERR = traceback.format_exc()
-try:
-    import jsonschema  # noqa # pylint: disable=unused-import
-
-    HAS_JSONSCHEMA = True
-except ImportError:
-    HAS_JSONSCHEMA = False
 
 MODULE_LOGGER = logging.getLogger(__name__)
 MODULE_LOGGER.info("Start device_tools module execution")
 
+# Endpoint confirming all temp actions staged by the session, not exposed as a public cvprac method
+SAVE_TOPOLOGY_URL = "/provisioning/v2/saveTopology.do"
+
 # TODO - use f-strings
 # pylint: disable=consider-using-f-string
 
@@ -65,32 +62,116 @@ MODULE_LOGGER.info("Start device_tools module execution")
 class DeviceElement(object):
     """
     DeviceElement Object to represent Device Element from user inventory
+
+    Only fields consumed by the collection are kept from user data, and the value
+    used to lookup device on Cloudvision is cached for the active search mode.
     """
 
+    __slots__ = (
+        "__fqdn",
+        "__hostname",
+        "__sysmac",
+        "__serial",
+        "__mgmtip",
+        "__container",
+        "__configlets",
+        "__current_parent_container_id",
+        "__current_container_name",
+        "__image_bundle",
+        "__facts",
+        "__lookup_by",
+        "__lookup_key",
+        "__owners",
+    )
+
     def __init__(self, data: dict):
-        self.__data = data
-        self.__fqdn = self.__data.get(Api.device.FQDN)
-        self.__sysmac = self.__data.get(Api.device.SYSMAC)
-        self.__serial = self.__data.get(Api.device.SERIAL)
-        self.__mgmtip = self.__data.get(Api.device.MGMTIP)
-        self.__container = self.__data[Api.generic.PARENT_CONTAINER_NAME]
+        self.__fqdn = data.get(Api.device.FQDN)
+        self.__sysmac = data.get(Api.device.SYSMAC)
+        self.__serial = data.get(Api.device.SERIAL)
+        self.__mgmtip = data.get(Api.device.MGMTIP)
+        self.__container = data[Api.generic.PARENT_CONTAINER_NAME]
+        self.__configlets = data.get(Api.generic.CONFIGLETS, [])
         self.__current_parent_container_id = None
-        self.__image_bundle = self.__data.get(Api.device.BUNDLE)
-
-        if Api.device.BUNDLE in self.__data:
-            self.__image_bundle = data[Api.device.BUNDLE]
-        if Api.device.SYSMAC in data:
-            self.__sysmac = data[Api.device.SYSMAC]
-        if Api.device.SERIAL in data:
-            self.__serial = data[Api.device.SERIAL]
+        self.__current_container_name = None
+        self.__image_bundle = data.get(Api.device.BUNDLE)
+        self.__facts = None
+        self.__hostname = None
+        self.__lookup_by = None
+        self.__lookup_key = None
+        self.__owners = []
+
         if Api.device.HOSTNAME in data:
             self.__hostname = data[Api.device.HOSTNAME]
-        if Api.device.MGMTIP in data:
-            self.__mgmtip = data[Api.device.MGMTIP]
-        elif Api.device.FQDN in data:
-            self.__hostname = data[Api.device.FQDN].split(".")[0]
-        else:
-            self.__hostname = None
+        if Api.device.MGMTIP not in data:
+            if Api.device.FQDN in data:
+                self.__hostname = data[Api.device.FQDN].split(".")[0]
+            else:
+                self.__hostname = None
+
+    def __invalidate_lookup(self):
+        """
+        __invalidate_lookup Reset cached lookup key when a searchable field is updated
+        """
+        self.__lookup_by = None
+        self.__lookup_key = None
+        for callback in self.__owners:
+            callback()
+
+    def add_owner(self, callback):
+        """
+        add_owner Register a callback run when a searchable field is updated
+
+        Used by inventories holding this device to know their lookup tables are outdated.
+
+        Parameters
+        ----------
+        callback : callable
+            Function called without argument after a searchable field is updated
+        """
+        self.__owners.append(callback)
+
+    def remove_owner(self, callback):
+        """
+        remove_owner Unregister a callback added with add_owner
+
+        Parameters
+        ----------
+        callback : callable
+            Function previously registered
+        """
+        if callback in self.__owners:
+            self.__owners.remove(callback)
+
+    def get_lookup_key(self, search_by: str):
+        """
+        get_lookup_key Value to use to search device on Cloudvision
+
+        Value is cached for the last search mode requested as tools call this method
+        for every device in every action.
+
+        Parameters
+        ----------
+        search_by : str
+            Search mode (fqdn, hostname, systemMacAddress or serialNumber)
+
+        Returns
+        -------
+        str
+            Value of the field matching search mode, None if not set or unsupported
+        """
+        if search_by != self.__lookup_by:
+            if search_by == Api.device.FQDN:
+                self.__lookup_key = self.__fqdn
+            elif search_by == Api.device.HOSTNAME:
+                self.__lookup_key = self.__hostname
+            elif search_by == Api.device.SYSMAC:
+                self.__lookup_key = self.__sysmac
+            elif search_by == Api.device.SERIAL:
+                self.__lookup_key = self.__serial
+            else:
+                self.__lookup_key = None
+            self.__lookup_by = search_by
+        return self.__lookup_key
 
     @property
     def fqdn(self):
@@ -115,6 +196,7 @@ class DeviceElement(object):
             fqdn to configure on device
         """
         self.__fqdn = fqdn
+        self.__invalidate_lookup()
 
     @property
     def hostname(self):
@@ -139,6 +221,7 @@ class DeviceElement(object):
             hostname to configure on device
         """
         self.__hostname = hostname
+        self.__invalidate_lookup()
 
     @property
     def system_mac(self):
@@ -163,6 +246,7 @@ class DeviceElement(object):
             systemMac address to configure on device
         """
         self.__sysmac = mac
+        self.__invalidate_lookup()
 
     @property
     def mgmt_ip(self):
@@ -200,6 +284,19 @@ class DeviceElement(object):
         """
         return self.__serial
 
+    @serial_number.setter
+    def serial_number(self, serial: str):
+        """
+        serial_number Setter for device serial number
+
+        Parameters
+        ----------
+        serial : str
+            Serial number to configure on device
+        """
+        self.__serial = serial
+        self.__invalidate_lookup()
+
     @property
     def container(self):
         """
@@ -222,9 +319,7 @@ class DeviceElement(object):
         list
             List of configlets name
         """
-        if Api.generic.CONFIGLETS in self.__data:
-            return self.__data[Api.generic.CONFIGLETS]
-        return []
+        return self.__configlets
 
     @property
     def parent_container_id(self):
@@ -262,6 +357,54 @@ class DeviceElement(object):
         """
         self.__current_parent_container_id = id
 
+    @property
+    def current_container_name(self):
+        """
+        current_container_name Getter for name of the container where device is attached on Cloudvision
+
+        Returns
+        -------
+        str
+            Name of the current parent container
+        """
+        return self.__current_container_name
+
+    @current_container_name.setter
+    def current_container_name(self, name: str):
+        """
+        current_container_name Setter for name of the container where device is attached on Cloudvision
+
+        Parameters
+        ----------
+        name : str
+            Name of the current parent container
+        """
+        self.__current_container_name = name
+
+    @property
+    def facts(self):
+        """
+        facts Getter for device data collected from Cloudvision
+
+        Returns
+        -------
+        dict
+            Device data from Cloudvision including image bundle, None if not collected
+        """
+        return self.__facts
+
+    @facts.setter
+    def facts(self, facts: dict):
+        """
+        facts Setter for device data collected from Cloudvision
+
+        Parameters
+        ----------
+        facts : dict
+            Device data from Cloudvision
+        """
+        self.__facts = facts
+
     @property
     def info(self):
         """
@@ -283,44 +426,55 @@ class DeviceElement(object):
             res[Api.device.SYSMAC] = self.__sysmac
             res[Api.generic.KEY] = self.__sysmac
         res[Api.generic.PARENT_CONTAINER_NAME] = self.__container
-        if Api.generic.CONFIGLETS in self.__data:
-            res[Api.generic.CONFIGLETS] = self.__data[Api.generic.CONFIGLETS]
-        else:
-            res[Api.generic.CONFIGLETS] = []
+        res[Api.generic.CONFIGLETS] = self.configlets
         # res[Api.generic.PARENT_CONTAINER_ID] = self.__current_parent_container_id
-        if Api.generic.IMAGE_BUNDLE_NAME in self.__data:
-            res[Api.generic.IMAGE_BUNDLE_NAME] = self.__data[
-                Api.generic.IMAGE_BUNDLE_NAME
-            ]
+        if self.__image_bundle is not None:
+            res[Api.generic.IMAGE_BUNDLE_NAME] = self.__image_bundle
         return res
 
 
 class DeviceInventory(object):
     """
     DeviceInventory Local User defined inventory
+
+    Devices are indexed per search method on first lookup to provide constant time access.
     """
 
+    # Search methods supported by get_device
+    INDEXED_SEARCH_METHODS = [
+        Api.device.FQDN,
+        Api.device.HOSTNAME,
+        Api.device.SYSMAC,
+        Api.device.SERIAL,
+    ]
+
     def __init__(
         self,
         data: list,
-        schema=schema.SCHEMA_CV_DEVICE,
+        schema="SCHEMA_CV_DEVICE",
         search_method: str = Api.device.FQDN,
     ):
         self.__inventory = []
         self.__data = data
         self.__schema = schema
+        self.__index = {}
+        # Set by devices of this inventory when a searchable field is updated
+        self.__index_outdated = False
+        self.__index_lock = threading.Lock()
         self.search_method = search_method
         for entry in data:
             # if Api.device.FQDN in entry:
-            self.__inventory.append(DeviceElement(data=entry))
+            device = DeviceElement(data=entry)
+            device.add_owner(self.__mark_outdated)
+            self.__inventory.append(device)
 
     @property
     def is_valid(self):
         """
         check_schemas Validate schemas for user's input
         """
-        if not validate_json_schema(user_json=self.__data, schema=self.__schema):
-            MODULE_LOGGER.error("Invalid configlet input : \n%s", str(self.__data))
+        if not validate_json_schema(user_json=self.__data, schema=self.__schema, per_item=True):
+            MODULE_LOGGER.error("Invalid configlet input : \n%s", self.__data)
             return False
         return True
 
@@ -336,6 +490,65 @@ class DeviceInventory(object):
         """
         return self.__inventory
 
+    @devices.setter
+    def devices(self, devices: list):
+        """
+        devices Setter to replace list of devices in inventory
+
+        Parameters
+        ----------
+        devices : list
+            A list of DeviceElement
+        """
+        for device in self.__inventory:
+            device.remove_owner(self.__mark_outdated)
+        self.__inventory = devices
+        for device in self.__inventory:
+            device.add_owner(self.__mark_outdated)
+        self.reindex()
+
+    def __mark_outdated(self):
+        """
+        __mark_outdated Flag lookup tables as outdated after a device update
+        """
+        self.__index_outdated = True
+
+    def __build_index(self, search_method: str):
+        """
+        __build_index Build lookup table for a search method
+
+        When the same value is used by multiple devices, the first one is kept to
+        behave like a sequential search.
+
+        Parameters
+        ----------
+        search_method : str
+            Field used to index devices
+
+        Returns
+        -------
+        dict
+            Mapping between field value and DeviceElement
+        """
+        index = {}
+        for device in self.__inventory:
+            key = device.get_lookup_key(search_method)
+            if key is not None:
+                index.setdefault(key, device)
+        self.__index[search_method] = index
+        return index
+
+    def reindex(self):
+        """
+        reindex Drop all lookup tables
+
+        Called on lookup when a searchable field of a device has been updated.
+        Tables are rebuilt on next lookup.
+        """
+        with self.__index_lock:
+            self.__index_outdated = False
+            self.__index = {}
+
     def get_device(self, device_string: str, search_method: str = Api.device.FQDN):
         """
         get_device Extract device from inventory
@@ -343,7 +556,7 @@ class DeviceInventory(object):
         Parameters
         ----------
         device_string : str
-            Data to lookup device from inventory. Can be FQDN or sysMac field
+            Data to lookup device from inventory. Can be FQDN, hostname, sysMac or serialNumber field
         search_method : str, optional
             Field to search for device, by default fqdn
 
@@ -352,17 +565,20 @@ class DeviceInventory(object):
         DeviceElement
             Data structure with device information.
         """
-        # Lookup using systemMacAddress
-        for device in self.__inventory:
-            if (
-                self.search_method is Api.device.SYSMAC
-                or search_method is Api.device.SYSMAC
-            ):
-                if device.system_mac == device_string:
-                    return device
-            elif device.fqdn == device_string:
-                return device
-        return None
+        # Lookup using systemMacAddress takes precedence, unsupported methods fallback to fqdn
+        if Api.device.SYSMAC in [self.search_method, search_method]:
+            search_method = Api.device.SYSMAC
+        elif search_method not in self.INDEXED_SEARCH_METHODS:
+            search_method = Api.device.FQDN
+        with self.__index_lock:
+            # A device of this inventory has been updated since index creation
+            if self.__index_outdated:
+                self.__index_outdated = False
+                self.__index = {}
+            index = self.__index.get(search_method)
+            if index is None:
+                index = self.__build_index(search_method)
+        return index.get(device_string)
 
 
 class CvDeviceTools(object):
@@ -370,6 +586,14 @@ class CvDeviceTools(object):
     CvDeviceTools Object to operate Device operation on Cloudvision
     """
 
+    # Mapping between search mode and DeviceElement attribute used to check device exists on Cloudvision
+    DEVICE_SEARCH_ATTRIBUTE = {
+        Api.device.HOSTNAME: "fqdn",
+        Api.device.FQDN: "fqdn",
+        Api.device.SYSMAC: "system_mac",
+        Api.device.SERIAL: "serial_number",
+    }
+
     # Updated as per issue #365 to set default search with hostname field
     def __init__(
         self,
@@ -377,14 +601,27 @@ class CvDeviceTools(object):
         ansible_module: AnsibleModule = None,
         search_by: str = Api.device.HOSTNAME,
         check_mode: bool = False,
+        batch_mode: bool = False,
     ):
         self.__cv_client = cv_connection
         self.__ansible = ansible_module
         self.__search_by = search_by
         self.__configlets_and_mappers_cache = None
+        # Configlets directly applied to each device from configlets mappers - format {<device_id>: [CvElement]}
+        self.__device_configlets_index = None
+        self.__cv_inventory_cache = None
+        self.__cv_inventory_index = {}
+        # Cache for device facts collected during inventory refresh - format {<search_by>: {<lookup_key>: {<device facts>}}}
+        self.__devices_facts_cache = {}
+        # Cache for image information of devices, requested by image actions only - format {<device_id>: {<image facts>}}
+        self.__devices_image_cache = {}
         self.__check_mode = check_mode
+        # When set, changes are staged as temp actions and saved once per action type
+        self.__batch_mode = batch_mode
         # Cache for list of configlets applied to each container - format {<container_id>: {"name": "<>", "parentContainerId": "<>", "configlets": ['', '']}
         self.__containers_configlet_list_cache = {}
+        # Index of containers built from topology - format {<container_name>: {"name": "<>", "key": "<>"}}
+        self.__containers_index = None
 
     # ------------------------------------------ #
     # Getters & Setters
@@ -430,6 +667,30 @@ class CvDeviceTools(object):
     def check_mode(self, mode: str):
         self.__check_mode = mode
 
+    @property
+    def batch_mode(self):
+        """
+        batch_mode Getter to expose topology commit mechanism
+
+        Returns
+        -------
+        bool
+            True if changes are saved with a single topology save per action type
+        """
+        return self.__batch_mode
+
+    @batch_mode.setter
+    def batch_mode(self, mode: bool):
+        """
+        batch_mode Setter to configure topology commit mechanism
+
+        Parameters
+        ----------
+        mode : bool
+            True to stage changes and save topology once per action type
+        """
+        self.__batch_mode = mode
+
     # ------------------------------------------ #
     # Private functions
     # ------------------------------------------ #
@@ -455,7 +716,9 @@ class CvDeviceTools(object):
             Information returns by Cloudvision
         """
         cv_data: dict = {}
-        MODULE_LOGGER.debug("Looking for device using %s as search_by", str(search_by))
+        if search_value in self.__devices_facts_cache.get(search_by, {}):
+            return self.__devices_facts_cache[search_by][search_value]
+        MODULE_LOGGER.debug("Looking for device using %s as search_by", search_by)
         if search_by == Api.device.FQDN:
             cv_data = self.__cv_client.api.get_device_by_name(
                 fqdn=search_value, search_by_hostname=False
@@ -471,19 +734,84 @@ class CvDeviceTools(object):
                 device_serial=search_value
             )
 
-        if cv_data is not None and len(cv_data) > 0:
-            cv_data[Api.device.BUNDLE] = self.__cv_client.api.get_device_image_info(
-                cv_data["key"]
-            )
-
         MODULE_LOGGER.debug(
             "Got following data for %s using %s: %s",
-            str(search_value),
-            str(search_by),
-            str(cv_data),
+            search_value,
+            search_by,
+            cv_data,
         )
         return cv_data
 
+    def __update_device_facts(self, device: DeviceElement, changes: dict = None, image: bool = False):
+        """
+        __update_device_facts Update cached facts of a device changed on Cloudvision by this manager
+
+        Cached facts are replaced by an updated copy, so next actions get the state after the change
+        without requesting Cloudvision again. Cached image information is dropped on image change
+        and requested again when needed.
+
+        Parameters
+        ----------
+        device : DeviceElement
+            Device changed on Cloudvision
+        changes : dict, optional
+            Fields of device facts changed, by default None
+        image : bool, optional
+            Set when image bundle applied to the device is changed, by default False
+        """
+        cv_data = self.get_device_facts(device_lookup=device.get_lookup_key(self.__search_by))
+        if not cv_data:
+            return
+        if image:
+            self.__devices_image_cache.pop(cv_data[Api.generic.KEY], None)
+        if changes:
+            updated = dict(cv_data)
+            updated.update(changes)
+            for search_by, facts_cache in self.__devices_facts_cache.items():
+                lookup_key = device.get_lookup_key(search_by)
+                if facts_cache.get(lookup_key) is cv_data:
+                    facts_cache[lookup_key] = updated
+            if device.facts is cv_data:
+                device.facts = updated
+            device.parent_container_id = updated.get(Api.generic.PARENT_CONTAINER_ID)
+            device.current_container_name = updated.get(Api.device.CONTAINER_NAME)
+            # Results built from previous facts
+            self.__get_device.cache_clear()
+            self.get_container_current.cache_clear()
+
+    def __get_cv_inventory_index(self, search_by: str = Api.device.HOSTNAME):
+        """
+        __get_cv_inventory_index Index devices available on Cloudvision by search key
+
+        Inventory is collected once with a single API call and indexes are built on demand.
+        Hostname index uses the first part of the FQDN like Cloudvision search does.
+
+        Parameters
+        ----------
+        search_by : str, optional
+            Field to use to index devices, by default HOSTNAME
+
+        Returns
+        -------
+        dict
+            Mapping between search key and device data from Cloudvision
+        """
+        if self.__cv_inventory_cache is None:
+            MODULE_LOGGER.debug("[API call] Get all devices from inventory: self.__cv_client.api.get_inventory()")
+            self.__cv_inventory_cache = self.__cv_client.api.get_inventory()
+            self.__cv_inventory_index = {}
+        if search_by not in self.__cv_inventory_index:
+            index = {}
+            for cv_device in self.__cv_inventory_cache:
+                if search_by == Api.device.HOSTNAME:
+                    key = cv_device.get(Api.device.FQDN, "").split(".")[0]
+                else:
+                    key = cv_device.get(search_by)
+                if key:
+                    index.setdefault(key, cv_device)
+            self.__cv_inventory_index[search_by] = index
+        return self.__cv_inventory_index[search_by]
+
     @lru_cache
     def __get_configlet_info(self, configlet_name: str):
         """
@@ -501,17 +829,65 @@ class CvDeviceTools(object):
         dict
             Configlet data
         """
-        if self.__configlets_and_mappers_cache is None:
-            self.__configlets_and_mappers_cache = (
-                self.__cv_client.api.get_configlets_and_mappers()
-            )
-        for configlet in self.__configlets_and_mappers_cache["data"][
+        for configlet in self.__get_configlets_and_mappers()["data"][
             Api.generic.CONFIGLETS
         ]:
             if configlet_name == configlet[Api.generic.NAME]:
                 return configlet
         return None
 
+    def __get_configlets_and_mappers(self):
+        """
+        __get_configlets_and_mappers Get configlets and mappers from Cloudvision once and save as a cache in instance.
+
+        Returns
+        -------
+        dict
+            Configlets and mappers data
+        """
+        if self.__configlets_and_mappers_cache is None:
+            self.__configlets_and_mappers_cache = (
+                self.__cv_client.api.get_configlets_and_mappers()
+            )
+        return self.__configlets_and_mappers_cache
+
+    def __get_mapped_device_configlets(self, device_id: str):
+        """
+        __get_mapped_device_configlets Get configlets directly applied to a device from configlets mappers.
+
+        Index of all devices is built on first call from configlets and mappers cache. Configlets
+        are sorted with order field of mappers, which is the order they are applied on the device.
+        Configlets inherited from containers and generated by builders are not part of it.
+
+        Parameters
+        ----------
+        device_id : str
+            Device ID (system MAC address)
+
+        Returns
+        -------
+        list
+            List of CvElement with KEY and NAME of every configlet in applied order, None when order
+            is not reported by Cloudvision for one of the mappers of the device.
+        """
+        if self.__device_configlets_index is None:
+            data = self.__get_configlets_and_mappers()["data"]
+            configlets = {configlet[Api.generic.KEY]: configlet for configlet in data[Api.generic.CONFIGLETS]}
+            mappers = {}
+            for mapper in data.get(Api.mappers.CONFIGLET_MAPPERS, []):
+                if mapper.get(Api.mappers.TYPE) == "netelement" and mapper[Api.configlet.ID] in configlets:
+                    mappers.setdefault(mapper[Api.mappers.OBJECT_ID], []).append(mapper)
+            self.__device_configlets_index = {}
+            for object_id, device_mappers in mappers.items():
+                if any(mapper.get(Api.mappers.ORDER) is None for mapper in device_mappers):
+                    self.__device_configlets_index[object_id] = None
+                    continue
+                self.__device_configlets_index[object_id] = [
+                    CvElement(cv_data=configlets[mapper[Api.configlet.ID]])
+                    for mapper in sorted(device_mappers, key=lambda mapper: int(mapper[Api.mappers.ORDER]))
+                ]
+        return self.__device_configlets_index.get(device_id, [])
+
     def __get_reordered_configlets_list(
         self, configlet_applied_to_device_list, configlet_playbook_list
     ):
@@ -550,7 +926,7 @@ class CvDeviceTools(object):
             else:
                 MODULE_LOGGER.debug(
                     "Removing the configlet %s from the current configlet list and adding it to the new list.",
-                    str(configlet),
+                    configlet,
                 )
                 for x in configlet_applied_to_device_list:
                     if x.name == configlet:
@@ -565,7 +941,7 @@ class CvDeviceTools(object):
 
         # Joining the 2 new list (configlets already present + new configlet in right order)
         reordered_configlets_list = configlets_attached_get_configlet_info + new_configlets_list
-        MODULE_LOGGER.debug("reordered_configlets_list %s", str(reordered_configlets_list))
+        MODULE_LOGGER.debug("reordered_configlets_list %s", reordered_configlets_list)
         # Find any reconcile configlet and move to the end of the reordered list.
         reconciled_configlet_indexes = [index for index, configlet in enumerate(reordered_configlets_list) if configlet["reconciled"]]
         reconciled_configlet_indexes.reverse()
@@ -599,18 +975,7 @@ class CvDeviceTools(object):
         """
         # Need to collect all missing device systemMacAddress
         # deploy needs to locate devices by mac-address
-        if self.__search_by in [Api.device.FQDN, Api.device.HOSTNAME]:
-            user_inventory = self.refresh_systemMacAddress(
-                user_inventory=user_inventory
-            )
-
-        elif self.__search_by == Api.device.SERIAL:
-            user_inventory = self.refresh_fqdn(user_inventory=user_inventory)
-            user_inventory = self.refresh_systemMacAddress(
-                user_inventory=user_inventory
-            )
-
-        return user_inventory
+        return self.refresh_inventory(user_inventory=user_inventory)
 
     def __check_devices_exist(self, user_inventory: DeviceInventory):
         """
@@ -651,38 +1016,23 @@ class CvDeviceTools(object):
         DeviceInventory
             Device inventory where missing devices are removed
         """
-
-        # Use dict to map the relevant attribute of the device to use for search
-        DEVICE_SEARCH_ATTRIBUTE = {
-            Api.device.HOSTNAME: "fqdn",
-            Api.device.FQDN: "fqdn",
-            Api.device.SYSMAC: "system_mac",
-            Api.device.SERIAL: "serial_number",
-        }
-
         MODULE_LOGGER.debug("Remove missing devices from user_inventory")
 
-        # Loop through devices and record index of missing ones for later removal
-        missing_devices_indexes: list = []
-        for index, device in enumerate(user_inventory.devices):
-            device_search_key = getattr(
-                device, DEVICE_SEARCH_ATTRIBUTE[self.__search_by], "fqdn"
+        attribute = self.DEVICE_SEARCH_ATTRIBUTE.get(self.__search_by, "fqdn")
+        cv_index = self.__get_cv_inventory_index(search_by=self.__search_by)
+        missing_devices = {
+            getattr(device, attribute) for device in user_inventory.devices
+        } - cv_index.keys()
+        if missing_devices:
+            MODULE_LOGGER.debug(
+                "Devices not present in CVP, removing from user_inventory: %s",
+                missing_devices,
             )
-            if (
-                self.is_device_exist(device_search_key, search_mode=self.__search_by)
-                is False
-            ):
-                missing_devices_indexes.append(index)
-                MODULE_LOGGER.debug(
-                    "Device not present in CVP, removing from user_inventory: %s",
-                    device_search_key,
-                )
-
-        # Remove missing devices from list - reversed to not change indexes.
-        missing_devices_indexes.reverse()
-        for index in missing_devices_indexes:
-            user_inventory.devices.pop(index)
-
+            user_inventory.devices = [
+                device
+                for device in user_inventory.devices
+                if getattr(device, attribute) not in missing_devices
+            ]
         return user_inventory
 
     def __state_present(self, user_inventory: DeviceInventory, apply_mode: str = ModuleOptionValues.APPLY_MODE_LOOSE,
@@ -776,32 +1126,32 @@ class CvDeviceTools(object):
         response.add_manager(cv_move)
         MODULE_LOGGER.debug(
             "AnsibleResponse updated, new content with cv_move: %s",
-            str(response.content),
+            response.content,
         )
         response.add_manager(cv_deploy)
         MODULE_LOGGER.debug(
             "AnsibleResponse updated, new content with cv_deploy: %s",
-            str(response.content),
+            response.content,
         )
         response.add_manager(cv_configlets_attach)
         MODULE_LOGGER.debug(
             "AnsibleResponse updated, new content with cv_configlets_attach: %s",
-            str(response.content),
+            response.content,
         )
         response.add_manager(cv_bundle_attach)
         MODULE_LOGGER.debug(
             "AnsibleResponse updated, new content with cv_bundle_attach: %s",
-            str(response.content),
+            response.content,
         )
         response.add_manager(cv_configlets_detach)
         MODULE_LOGGER.debug(
             "AnsibleResponse updated, new content with cv_configlets_detach: %s",
-            str(response.content),
+            response.content,
         )
         response.add_manager(cv_bundle_detach)
         MODULE_LOGGER.debug(
             "AnsibleResponse updated, new content with cv_bundle_detach: %s",
-            str(response.content),
+            response.content,
         )
 
         return response
@@ -844,7 +1194,7 @@ class CvDeviceTools(object):
         # Execute device reset
         action_result = self.reset_device(user_inventory=user_inventory)
         if action_result is not None:
-            MODULE_LOGGER.debug("action_result is: %s", str(action_result))
+            MODULE_LOGGER.debug("action_result is: %s", action_result)
             for update in action_result:
                 cv_reset.add_change(change=update)
         response.add_manager(cv_reset)
@@ -889,7 +1239,7 @@ class CvDeviceTools(object):
         # Execute device delete
         action_result = self.delete_device(user_inventory=user_inventory)
         if action_result is not None:
-            MODULE_LOGGER.debug("action_result is: %s", str(action_result))
+            MODULE_LOGGER.debug("action_result is: %s", action_result)
             for update in action_result:
                 cv_reset.add_change(change=update)
         response.add_manager(cv_reset)
@@ -935,12 +1285,131 @@ class CvDeviceTools(object):
         # Execute device decommission
         action_result = self.decommission_device(user_inventory=user_inventory)
         if action_result is not None:
-            MODULE_LOGGER.debug("action_result is: %s", str(action_result))
+            MODULE_LOGGER.debug("action_result is: %s", action_result)
             for update in action_result:
                 cv_reset.add_change(change=update)
         response.add_manager(cv_reset)
         return response
 
+    def __get_tasks_per_device(self, task_ids: list):
+        """
+        __get_tasks_per_device Map a list of task IDs to devices they have been created for
+
+        Parameters
+        ----------
+        task_ids : list
+            List of task IDs returned by Cloudvision
+
+        Returns
+        -------
+        dict
+            List of task IDs per device - format {<device systemMacAddress>: [<task_id>]}
+        """
+        device_tasks: dict = {}
+        for task in get_tasks_by_id(cv_client=self.__cv_client, task_ids=task_ids):
+            device_id = task[Api.device.TASK_DETAILS][Api.task.NETELEMENT_ID]
+            device_tasks.setdefault(device_id, []).append(task[Api.generic.TASK_ID])
+        return device_tasks
+
+    def __get_unstaged_devices(self, staged_changes: dict):
+        """
+        __get_unstaged_devices List devices with a change which is not in temp actions of Cloudvision
+
+        cvprac does not report errors when it adds a temp action, so staged changes are checked
+        against temp actions before they are saved.
+
+        Parameters
+        ----------
+        staged_changes : dict
+            Staged changes - format {<device systemMacAddress>: (CvApiResult, [<entries>])}
+
+        Returns
+        -------
+        list
+            systemMacAddress of devices without temp action
+        """
+        temp_actions = self.__cv_client.api.get_all_temp_actions()
+        staged_nodes = set()
+        for action in (temp_actions or {}).get("data", []):
+            staged_nodes.update([action.get("nodeId"), action.get("toId")])
+        return [device_id for device_id in staged_changes if device_id not in staged_nodes]
+
+    def __check_temp_actions(self, staged_changes: dict, app_name: str):
+        """
+        __check_temp_actions Fail in batch mode when temp actions are pending before first change is staged
+
+        saveTopology saves all temp actions of the user session, so changes staged outside of
+        this module run would be saved with the ones of the module.
+
+        Parameters
+        ----------
+        staged_changes : dict
+            Changes already staged by the action - format {<device systemMacAddress>: (CvApiResult, [<entries>])}
+        app_name : str
+            Name of the action staging changes
+        """
+        if not self.__batch_mode or staged_changes:
+            return
+        temp_actions = (self.__cv_client.api.get_all_temp_actions() or {}).get("data", [])
+        if temp_actions:
+            error_message = (f"Cannot stage changes of {app_name}: {len(temp_actions)} temp actions are already pending "
+                             "on Cloudvision and would be saved with them. Save or cancel them, or disable batch mode.")
+            MODULE_LOGGER.error(error_message)
+            self.__ansible.fail_json(msg=error_message)
+
+    def __save_topology(self, staged_changes: dict, app_name: str):
+        """
+        __save_topology Save all changes staged as temp actions with a single saveTopology call
+
+        Task IDs created by Cloudvision are mapped back to the CvApiResult of each device.
+        Module fails if a change has not been staged or if Cloudvision does not save topology.
+
+        Parameters
+        ----------
+        staged_changes : dict
+            Staged changes - format {<device systemMacAddress>: (CvApiResult, [<entries>])}
+        app_name : str
+            Name of the action which has staged changes
+        """
+        if not staged_changes:
+            return
+        MODULE_LOGGER.info(
+            "Saving topology for %d changes staged by %s", len(staged_changes), app_name
+        )
+        try:
+            unstaged_devices = self.__get_unstaged_devices(staged_changes)
+            # Changes which have been staged are saved anyway, so they do not stay pending in temp actions
+            resp = self.__cv_client.post(
+                SAVE_TOPOLOGY_URL, data=[], timeout=self.__cv_client.api.request_timeout
+            )
+        except CvpApiError as catch_error:
+            error_message = f"Error saving topology for {app_name}: {catch_error}"
+            MODULE_LOGGER.error(error_message)
+            self.__ansible.fail_json(msg=error_message)
+        except CvpRequestError:
+            error_message = f"Error saving topology for {app_name}. User is unauthorized!"
+            MODULE_LOGGER.error(error_message)
+            self.__ansible.fail_json(msg=error_message)
+        else:
+            if not resp or resp["data"].get("status") != "success":
+                error_message = f"Error saving topology for {app_name}: {resp}"
+                MODULE_LOGGER.error(error_message)
+                self.__ansible.fail_json(msg=error_message)
+            task_ids = resp["data"].get(Api.task.TASK_IDS, [])
+            device_tasks = self.__get_tasks_per_device(task_ids)
+            for device_id, (result_data, entries) in staged_changes.items():
+                if device_id in unstaged_devices:
+                    continue
+                result_data.changed = True
+                result_data.success = True
+                result_data.taskIds = device_tasks.get(device_id, [])
+                result_data.add_entries(entries)
+            if unstaged_devices:
+                error_message = (f"Changes of {app_name} not staged on Cloudvision for devices {unstaged_devices}, "
+                                 f"other changes saved with tasks {task_ids}")
+                MODULE_LOGGER.error(error_message)
+                self.__ansible.fail_json(msg=error_message)
+
     def __build_topology_cache(self, container):
         """
         Recursive method. Takes a container in the format of __cv_client.api.filter_topology() cvprac call and
@@ -954,9 +1423,7 @@ class CvDeviceTools(object):
             container information. dict_keys(['key', Api.generic.NAME, 'type', 'childContainerCount', 'childNetElementCount', 'parentContainerId', 'mode',
             'deviceStatus', 'childTaskCount', 'childContainerList', 'childNetElementList', 'hierarchyNetElementCount', 'tempAction', 'tempEvent'])
         """
-        MODULE_LOGGER.debug(
-            "Adding to cache container: {0}".format(container[Api.generic.NAME])
-        )
+        MODULE_LOGGER.debug("Adding to cache container: %s", container[Api.generic.NAME])
         cache_new_entry = {
             Api.generic.NAME: container[Api.generic.NAME],
             Api.generic.PARENT_CONTAINER_ID: container[Api.generic.PARENT_CONTAINER_ID],
@@ -967,6 +1434,51 @@ class CvDeviceTools(object):
         for child_container in container[Api.container.CHILDREN_LIST]:
             self.__build_topology_cache(child_container)
 
+    def __get_topology_cache(self):
+        """
+        __get_topology_cache Get containers from Cloudvision topology with a single API call
+
+        Returns
+        -------
+        dict
+            Containers from topology - format {<container_id>: {"name": "<>", "parentContainerId": "<>"}}
+        """
+        # If the cache is not empty, we skip the API call
+        record_cache_lookup(self.__cv_client, "device_tools.topology", hit=bool(self.__containers_configlet_list_cache))
+        if not self.__containers_configlet_list_cache:
+            MODULE_LOGGER.debug(
+                "[API call] get info about all the containers: self.__cv_client.api.filter_topology()"
+            )
+            topology = self.__cv_client.api.filter_topology()
+            self.__build_topology_cache(topology[Api.container.TOPOLOGY])
+        return self.__containers_configlet_list_cache
+
+    def __get_containers_index(self):
+        """
+        __get_containers_index Build index of containers per name from Cloudvision topology
+
+        Returns
+        -------
+        dict
+            Containers per name - format {<container_name>: {"name": "<>", "key": "<>"}}
+        """
+        if self.__containers_index is None:
+            self.__containers_index = {}
+            try:
+                topology_cache = self.__get_topology_cache()
+            except (CvpApiError, CvpRequestError):
+                MODULE_LOGGER.debug("Error getting topology from Cloudvision")
+            else:
+                for container_id, container in topology_cache.items():
+                    self.__containers_index.setdefault(
+                        container[Api.generic.NAME],
+                        {
+                            Api.generic.NAME: container[Api.generic.NAME],
+                            Api.generic.KEY: container_id,
+                        },
+                    )
+        return self.__containers_index
+
     def __get_configlet_list_inherited_from_container(self, device: DeviceElement):
         """
         __get_configlet_list_inherited_from_container Provides way to get the full list of configlets applied to the parent containers of the device.
@@ -983,31 +1495,15 @@ class CvDeviceTools(object):
             List of configlet
         """
         inherited_configlet_list = []
-        # If the cache is not empty, we skip the API call
-        if not self.__containers_configlet_list_cache:
-            MODULE_LOGGER.debug(
-                "[API call] get info about all the containers: self.__cv_client.api.filter_topology()"
-            )
-            topology = self.__cv_client.api.filter_topology()
-            self.__build_topology_cache(topology[Api.container.TOPOLOGY])
+        self.__get_topology_cache()
 
         parent_container_name = device.container
-        # Get parent container id of the device by comparing all containers name in the topology
-        parent_container_id = ""
-        # TODO - use dict items
-        #      for container_id in ..
-        # pylint: disable=consider-using-dict-items
-        for container_id in self.__containers_configlet_list_cache:
-            if (
-                self.__containers_configlet_list_cache[container_id][Api.generic.NAME]
-                == parent_container_name
-            ):
-                parent_container_id = container_id
-                break
-        MODULE_LOGGER.debug(
-            "parent_container_name is:  {0}".format(parent_container_name)
-        )
-        MODULE_LOGGER.debug("parent_container_id is:  {0}".format(parent_container_id))
+        # Get parent container id of the device from containers index
+        parent_container_id = self.__get_containers_index().get(
+            parent_container_name, {}
+        ).get(Api.generic.KEY, "")
+        MODULE_LOGGER.debug("parent_container_name is:  %s", parent_container_name)
+        MODULE_LOGGER.debug("parent_container_id is:  %s", parent_container_id)
 
         # While loop to retrieve the lists of configlets applied to all the parents containers
         # Cache variable is self.__containers_configlet_list_cache - format
@@ -1020,9 +1516,7 @@ class CvDeviceTools(object):
                 and Api.generic.CONFIGLETS
                 in self.__containers_configlet_list_cache[container_id].keys()
             ):
-                MODULE_LOGGER.debug(
-                    "Using cache for following container: {0}".format(container_id)
-                )
+                MODULE_LOGGER.debug("Using cache for following container: %s", container_id)
                 inherited_configlet_list += self.__containers_configlet_list_cache[
                     container_id
                 ][Api.generic.CONFIGLETS]
@@ -1037,9 +1531,8 @@ class CvDeviceTools(object):
                 ]
                 # Get list of configlet for current container
                 MODULE_LOGGER.debug(
-                    "[API call] Get configlet associated with container: {0}".format(
-                        container_name
-                    )
+                    "[API call] Get configlet associated with container: %s",
+                    container_name,
                 )
                 current_container_configlets_info = (
                     self.__cv_client.api.get_configlets_by_container_id(container_id)
@@ -1062,15 +1555,13 @@ class CvDeviceTools(object):
                     Api.generic.CONFIGLETS
                 ] = configletList
                 MODULE_LOGGER.debug(
-                    "Cache updated: with configlets {0} from container {1}".format(
-                        configletList, container_name
-                    )
+                    "Cache updated: with configlets %s from container %s",
+                    configletList,
+                    container_name,
                 )
 
         MODULE_LOGGER.debug(
-            "Container inherited configlet list is: {0}".format(
-                inherited_configlet_list
-            )
+            "Container inherited configlet list is: %s", inherited_configlet_list
         )
         return inherited_configlet_list
 
@@ -1147,7 +1638,8 @@ class CvDeviceTools(object):
                 )
                 for configlet in configlets_data:
                     configlet_list.append(CvElement(cv_data=configlet))
-                MODULE_LOGGER.debug("configlet_list in get_device_configlets function is: %s", str([x.name for x in configlet_list]))
+                if MODULE_LOGGER.isEnabledFor(logging.DEBUG):
+                    MODULE_LOGGER.debug("configlet_list in get_device_configlets function is: %s", [x.name for x in configlet_list])
                 return configlet_list
         return None
 
@@ -1190,7 +1682,15 @@ class CvDeviceTools(object):
             A dict with key and name
         """
         cv_data = self.get_device_facts(device_lookup=device_lookup)
-        MODULE_LOGGER.debug("cv_data lookup returned: %s", str(cv_data))
+        MODULE_LOGGER.debug("cv_data lookup returned: %s", cv_data)
+        # Image information is only requested for devices with image actions and cached apart from
+        # device facts, so facts shared by cache are not updated
+        if cv_data and Api.device.BUNDLE not in cv_data:
+            device_id = cv_data[Api.generic.KEY]
+            if device_id not in self.__devices_image_cache:
+                self.__devices_image_cache[device_id] = self.__cv_client.api.get_device_image_info(device_id)
+            cv_data = dict(cv_data)
+            cv_data[Api.device.BUNDLE] = self.__devices_image_cache[device_id]
         if cv_data is not None and Api.generic.IMAGE_BUNDLE_NAME in cv_data:
             if cv_data[Api.generic.IMAGE_BUNDLE_NAME][Api.image.NAME] is None:
                 return {
@@ -1215,6 +1715,9 @@ class CvDeviceTools(object):
         """
         get_container_info Retrieve container information from Cloudvision
 
+        Container is resolved from topology index and only requested from
+        Cloudvision when not part of it.
+
         Parameters
         ----------
         container_name : str
@@ -1225,6 +1728,9 @@ class CvDeviceTools(object):
         dict
             Data from Cloudvision
         """
+        container_index = self.__get_containers_index()
+        if container_name in container_index:
+            return container_index[container_name]
         try:
             resp = self.__cv_client.api.get_container_by_name(name=str(container_name))
         except CvpApiError:
@@ -1248,7 +1754,7 @@ class CvDeviceTools(object):
         dict
             A dict with key and name
         """
-        MODULE_LOGGER.debug("Get container for device %s", str(device_lookup))
+        MODULE_LOGGER.debug("Get container for device %s", device_lookup)
         container_id = self.get_device_facts(device_lookup=device_lookup)
         if Api.generic.PARENT_CONTAINER_ID in container_id:
             return {
@@ -1258,6 +1764,58 @@ class CvDeviceTools(object):
         else:
             return None
 
+    def refresh_inventory(self, user_inventory: DeviceInventory):
+        """
+        refresh_inventory Get all device information from Cloudvision in a single pass
+
+        Devices are resolved from one inventory collection and updated in place with
+        systemMacAddress, FQDN, hostname when not set, serial number and current parent
+        container. Collected facts are cached, so next actions do not request Cloudvision
+        again for the same device. Image bundle is only requested by image actions.
+        Devices without systemMacAddress after refresh are removed from inventory.
+
+        Parameters
+        ----------
+        user_inventory : DeviceInventory
+            Inventory provided by user and that need to be refreshed
+
+        Returns
+        -------
+        DeviceInventory
+            Updated device inventory
+        """
+        cv_index = self.__get_cv_inventory_index(search_by=self.__search_by)
+        facts_cache = self.__devices_facts_cache.setdefault(self.__search_by, {})
+        user_result: list = []
+        for device in user_inventory.devices:
+            lookup_key = device.get_lookup_key(self.__search_by)
+            cv_device = cv_index.get(lookup_key)
+            if cv_device is None:
+                MODULE_LOGGER.debug("Device %s not found on Cloudvision", lookup_key)
+            else:
+                if device.system_mac is None:
+                    device.system_mac = cv_device[Api.device.SYSMAC]
+                if self.__search_by in [Api.device.SERIAL, Api.device.SYSMAC]:
+                    device.fqdn = cv_device[Api.device.FQDN]
+                if device.serial_number is None:
+                    device.serial_number = cv_device.get(Api.device.SERIAL)
+                # hostname getter returns FQDN, so check value used for hostname lookups
+                if device.get_lookup_key(Api.device.HOSTNAME) is None and device.fqdn is not None:
+                    device.hostname = device.fqdn.split(".")[0]
+                device.parent_container_id = cv_device.get(Api.generic.PARENT_CONTAINER_ID)
+                device.current_container_name = cv_device.get(Api.device.CONTAINER_NAME)
+                facts_cache.setdefault(lookup_key, cv_device)
+                device.facts = facts_cache[lookup_key]
+                # Lookup key may have been updated during refresh
+                facts_cache.setdefault(device.get_lookup_key(self.__search_by), device.facts)
+
+            if device.system_mac is not None:
+                user_result.append(device)
+
+        MODULE_LOGGER.info("%d devices refreshed from Cloudvision", len(user_result))
+        user_inventory.devices = user_result
+        return user_inventory
+
     def refresh_systemMacAddress(self, user_inventory: DeviceInventory):
         # sourcery skip: class-extract-method
         """
@@ -1275,23 +1833,23 @@ class CvDeviceTools(object):
         """
         device: DeviceElement = None
         user_result: list = []
-        MODULE_LOGGER.info("Inventory to refresh is %s", str(user_inventory.devices))
+        MODULE_LOGGER.info("Inventory to refresh is %s", user_inventory.devices)
         for device in user_inventory.devices:
-            MODULE_LOGGER.info("Lookup is based on %s field", str(self.__search_by))
-            MODULE_LOGGER.debug("Found device %s to refresh data", str(device.info))
+            MODULE_LOGGER.info("Lookup is based on %s field", self.__search_by)
+            MODULE_LOGGER.debug("Found device %s to refresh data", device.info)
             if device.system_mac is None:
                 system_mac = self.get_device_facts(
-                    device_lookup=device.info[self.__search_by]
+                    device_lookup=device.get_lookup_key(self.__search_by)
                 )[Api.device.SYSMAC]
                 MODULE_LOGGER.debug(
-                    "Get sysmac %s for device %s", str(device.fqdn), str(system_mac)
+                    "Get sysmac %s for device %s", device.fqdn, system_mac
                 )
                 device.system_mac = system_mac
 
             if device.system_mac is not None:
                 user_result.append(device.info)
 
-        MODULE_LOGGER.warning("Update list is: %s", str(user_result))
+        MODULE_LOGGER.warning("Update list is: %s", user_result)
         return DeviceInventory(data=user_result)
 
     def refresh_fqdn(self, user_inventory: DeviceInventory):
@@ -1310,15 +1868,15 @@ class CvDeviceTools(object):
         """
         device: DeviceElement = None
         user_result: list = []
-        MODULE_LOGGER.info("Inventory to refresh is %s", str(user_inventory.devices))
+        MODULE_LOGGER.info("Inventory to refresh is %s", user_inventory.devices)
         for device in user_inventory.devices:
-            MODULE_LOGGER.debug("Found device %s to refresh data", str(device.info))
+            MODULE_LOGGER.debug("Found device %s to refresh data", device.info)
             if device.system_mac is not None and self.__search_by == Api.device.SYSMAC:
                 fqdn = self.get_device_facts(device_lookup=device.system_mac)[
                     Api.device.FQDN
                 ]
                 MODULE_LOGGER.debug(
-                    "Get fqdn %s for device %s", str(fqdn), str(device.system_mac)
+                    "Get fqdn %s for device %s", fqdn, device.system_mac
                 )
                 device.fqdn = fqdn
                 user_result.append(device.info)
@@ -1330,14 +1888,14 @@ class CvDeviceTools(object):
                     Api.device.FQDN
                 ]
                 MODULE_LOGGER.debug(
-                    "Get fqdn %s for device %s", str(fqdn), str(device.serial_number)
+                    "Get fqdn %s for device %s", fqdn, device.serial_number
                 )
                 device.fqdn = fqdn
                 user_result.append(device.info)
             else:
                 MODULE_LOGGER.debug("Skipping following device: %s", device.info)
 
-        MODULE_LOGGER.warning("Update list is: %s", str(user_result))
+        MODULE_LOGGER.warning("Update list is: %s", user_result)
         return DeviceInventory(data=user_result)
 
     def check_device_exist(
@@ -1358,54 +1916,24 @@ class CvDeviceTools(object):
             List of devices not present in CVP
         """
         MODULE_LOGGER.debug("Check if all the devices specified exist in CVP")
-        device_not_present: list = []
-        for device in user_inventory.devices:
-            if (
-                self.__search_by == Api.device.HOSTNAME
-                or search_mode == Api.device.HOSTNAME
-            ):
-                if (
-                    self.is_device_exist(device.fqdn, search_mode=Api.device.HOSTNAME)
-                    is False
-                ):
-                    device_not_present.append(device.fqdn)
-                    MODULE_LOGGER.error(
-                        "Device not present in CVP but in the user_inventory: %s",
-                        device.fqdn,
-                    )
-
-            elif self.__search_by == Api.device.FQDN or search_mode == Api.device.FQDN:
-                if (
-                    self.is_device_exist(device.fqdn, search_mode=Api.device.FQDN)
-                    is False
-                ):
-                    device_not_present.append(device.fqdn)
-                    MODULE_LOGGER.error(
-                        "Device not present in CVP but in the user_inventory: %s",
-                        device.fqdn,
-                    )
-
-            elif self.__search_by == Api.device.SYSMAC:
-                if self.is_device_exist(device.system_mac) is False:
-                    device_not_present.append(
-                        device.system_mac, search_mode=Api.device.SYSMAC
-                    )
-                    MODULE_LOGGER.error(
-                        "Device not present in CVP but in the user_inventory: %s",
-                        device.system_mac,
-                    )
-            elif search_mode == Api.device.SERIAL:
-                if (
-                    self.is_device_exist(
-                        device.serial_number, search_mode=Api.device.SERIAL
-                    )
-                    is False
-                ):
-                    device_not_present.append(device.serial_number)
-                    MODULE_LOGGER.error(
-                        "Device not present in CVP but in the user_inventory: %s",
-                        device.serial_number,
-                    )
+        if Api.device.HOSTNAME in [self.__search_by, search_mode]:
+            search_mode = Api.device.HOSTNAME
+        elif Api.device.FQDN in [self.__search_by, search_mode]:
+            search_mode = Api.device.FQDN
+        elif self.__search_by == Api.device.SYSMAC:
+            search_mode = Api.device.SYSMAC
+        elif search_mode != Api.device.SERIAL:
+            return []
+
+        attribute = self.DEVICE_SEARCH_ATTRIBUTE[search_mode]
+        user_keys = [getattr(device, attribute) for device in user_inventory.devices]
+        missing_keys = set(user_keys) - self.__get_cv_inventory_index(search_by=search_mode).keys()
+        device_not_present: list = [key for key in user_keys if key in missing_keys]
+        if device_not_present:
+            MODULE_LOGGER.error(
+                "Devices not present in CVP but in the user_inventory: %s",
+                device_not_present,
+            )
         return device_not_present
 
     # ------------------------------------------ #
@@ -1448,7 +1976,7 @@ class CvDeviceTools(object):
         """
         response = CvAnsibleResponse()
         self.__search_by = search_mode
-        MODULE_LOGGER.debug("Manager search mode is set to: %s", str(self.__search_by))
+        MODULE_LOGGER.debug("Manager search mode is set to: %s", self.__search_by)
 
         if state == ModuleOptionValues.STATE_MODE_PRESENT:
             MODULE_LOGGER.info("Processing data to create/update devices")
@@ -1496,21 +2024,29 @@ class CvDeviceTools(object):
             List of CvApiResult for all API calls
         """
         results = []
+        staged_changes = {}
+        # Group devices per target container: each container is resolved once and moves are staged together
+        devices_per_container = {}
         for device in user_inventory.devices:
             result_data = CvApiResult(
                 action_name="{0}_to_{1}".format(device.fqdn, device.container)
             )
+            results.append(result_data)
             if device.system_mac is not None:
-                new_container_info = self.get_container_info(
-                    container_name=device.container
+                devices_per_container.setdefault(device.container, []).append(
+                    (device, result_data)
                 )
-                if new_container_info is None:
-                    error_message = f"The target container '{device.container}' for the device '{device.fqdn}' does not exist on CVP."
-                    MODULE_LOGGER.error(error_message)
-                    self.__ansible.fail_json(msg=error_message)
 
+        for container_name, devices in devices_per_container.items():
+            new_container_info = self.get_container_info(container_name=container_name)
+            if new_container_info is None:
+                error_message = f"The target container '{container_name}' for the device '{devices[0][0].fqdn}' does not exist on CVP."
+                MODULE_LOGGER.error(error_message)
+                self.__ansible.fail_json(msg=error_message)
+
+            for device, result_data in devices:
                 current_container_info = self.get_container_current(
-                    device_lookup=device.info[self.__search_by]
+                    device_lookup=device.get_lookup_key(self.__search_by)
                 )
 
                 # Move devices when they are not in undefined container
@@ -1525,12 +2061,16 @@ class CvDeviceTools(object):
                         result_data.success = True
                         result_data.taskIds = ["unsupported_in_check_mode"]
                     else:
+                        # Current container from cached facts, so cvprac does not look it up again per device
+                        device_info = device.info
+                        device_info[Api.generic.PARENT_CONTAINER_ID] = current_container_info[Api.generic.KEY]
+                        self.__check_temp_actions(staged_changes, app_name="CvDeviceTools.move_device")
                         try:
                             resp = self.__cv_client.api.move_device_to_container(
                                 app_name="CvDeviceTools.move_device",
-                                device=device.info,
+                                device=device_info,
                                 container=new_container_info,
-                                create_task=True,
+                                create_task=not self.__batch_mode,
                             )
                         except CvpApiError:
                             error_message = f"Error to move device {device.fqdn} to container {device.container}"
@@ -1541,15 +2081,21 @@ class CvDeviceTools(object):
                             MODULE_LOGGER.error(error_message)
                             self.__ansible.fail_json(msg=error_message)
                         else:
-                            if resp and resp['data']['status'] == 'success':
+                            if self.__batch_mode:
+                                staged_changes[device.system_mac] = (result_data, [])
+                            elif resp and resp['data']['status'] == 'success':
                                 result_data.changed = True
                                 result_data.success = True
                                 result_data.taskIds = resp["data"][Api.task.TASK_IDS]
+                            self.__update_device_facts(device, changes={
+                                Api.generic.PARENT_CONTAINER_ID: new_container_info[Api.generic.KEY],
+                                Api.device.CONTAINER_NAME: new_container_info[Api.generic.NAME],
+                            })
 
                     result_data.add_entry(
                         "{0}-{1}".format(device.fqdn, device.container)
                     )
-            results.append(result_data)
+        self.__save_topology(staged_changes, app_name="CvDeviceTools.move_device")
         return results
 
     def apply_bundle(self, user_inventory: DeviceInventory):
@@ -1581,7 +2127,7 @@ class CvDeviceTools(object):
 
         for device in user_inventory.devices:
             MODULE_LOGGER.debug(
-                "Applying image bundle for device: %s", str(device.fqdn)
+                "Applying image bundle for device: %s", device.fqdn
             )
             result_data = CvApiResult(
                 action_name=device.fqdn + "_image_bundle_attached"
@@ -1589,7 +2135,7 @@ class CvDeviceTools(object):
 
             # We can't attach/detach an image to a device in the undefined container
             current_container_info = self.get_container_current(
-                device_lookup=device.info[self.__search_by]
+                device_lookup=device.get_lookup_key(self.__search_by)
             )
             if (
                 device.configlets is None
@@ -1601,20 +2147,24 @@ class CvDeviceTools(object):
                 )
                 continue
 
+            # Current image bundle is only needed when user assigns one
+            if device.image_bundle is None:
+                continue
+
             # GET IMAGE BUNDLE
             MODULE_LOGGER.debug(
                 "Attempting to get current image bundle for %s using %s",
-                str(device.fqdn),
-                str(device.info[self.__search_by]),
+                device.fqdn,
+                device.get_lookup_key(self.__search_by),
             )
             current_image_bundle = self.get_device_image_bundle(
-                device_lookup=device.info[self.__search_by]
+                device_lookup=device.get_lookup_key(self.__search_by)
             )
             MODULE_LOGGER.debug(
-                "Current image bundle assigned is: %s", str(current_image_bundle)
+                "Current image bundle assigned is: %s", current_image_bundle
             )
             MODULE_LOGGER.debug(
-                "User assigned image bundle is: %s", str(device.image_bundle)
+                "User assigned image bundle is: %s", device.image_bundle
             )
 
             if device.image_bundle is not None:
@@ -1625,11 +2175,11 @@ class CvDeviceTools(object):
                     and current_image_bundle[Api.image.TYPE] == "netelement"
                 ):
                     MODULE_LOGGER.debug(
-                        "No actions needed for device: %s", str(device.fqdn)
+                        "No actions needed for device: %s", device.fqdn
                     )
                     MODULE_LOGGER.debug(
                         "%s has %s assigned and applied",
-                        str(device.fqdn),
+                        device.fqdn,
                         current_image_bundle[Api.generic.IMAGE_BUNDLE_NAME],
                     )
                     pass
@@ -1637,13 +2187,13 @@ class CvDeviceTools(object):
                 else:
                     MODULE_LOGGER.debug(
                         "Updating %s to use image bundle: %s",
-                        str(device.fqdn),
-                        str(device.image_bundle),
+                        device.fqdn,
+                        device.image_bundle,
                     )
 
                     # get device facts from CV
                     device_facts = self.get_device_facts(
-                        device_lookup=device.info[self.__search_by]
+                        device_lookup=device.get_lookup_key(self.__search_by)
                     )
 
                     assigned_image_facts = (
@@ -1653,7 +2203,7 @@ class CvDeviceTools(object):
                     )
                     if assigned_image_facts is None:
                         MODULE_LOGGER.error(
-                            "Error image bundle %s not found", str(device.image_bundle)
+                            "Error image bundle %s not found", device.image_bundle
                         )
                         self.__ansible.fail_json(
                             msg=f"Error applying bundle to device {device.fqdn}: {str(device.image_bundle)} not found"
@@ -1661,8 +2211,8 @@ class CvDeviceTools(object):
 
                     MODULE_LOGGER.debug(
                         "%s image bundle facts are: %s",
-                        str(device.image_bundle),
-                        str(assigned_image_facts),
+                        device.image_bundle,
+                        assigned_image_facts,
                     )
 
                     if self.__check_mode:
@@ -1671,7 +2221,7 @@ class CvDeviceTools(object):
                         result_data.taskIds = ["check_mode"]
                         MODULE_LOGGER.warning(
                             "[check_mode] - Fake assign of %s to %s",
-                            str(device.image_bundle),
+                            device.image_bundle,
                             device.hostname,
                         )
                     else:
@@ -1685,14 +2235,14 @@ class CvDeviceTools(object):
 
                         except CvpApiError as catch_error:
                             MODULE_LOGGER.error(
-                                "Error applying bundle to device: %s", str(catch_error)
+                                "Error applying bundle to device: %s", catch_error
                             )
                             self.__ansible.fail_json(
                                 msg=f"Error applying bundle to device {device.fqdn}: {str(catch_error)}"
                             )
                         except CvpRequestError as catch_error:
                             MODULE_LOGGER.error(
-                                "Error applying bundle to device: %s", str(catch_error)
+                                "Error applying bundle to device: %s", catch_error
                             )
                             self.__ansible.fail_json(
                                 msg=f"Error applying bundle to device {device.fqdn}: {str(catch_error)}"
@@ -1703,6 +2253,7 @@ class CvDeviceTools(object):
                                 result_data.success = True
                                 result_data.taskIds = resp["data"][Api.task.TASK_IDS]
                                 result_data.add_entry(f"{device.image_bundle} apply to {device.fqdn}")
+                            self.__update_device_facts(device, image=True)
 
                 results.append(result_data)
 
@@ -1728,7 +2279,7 @@ class CvDeviceTools(object):
 
         for device in user_inventory.devices:
             MODULE_LOGGER.debug(
-                "Detaching image bundle from device: %s", str(device.fqdn)
+                "Detaching image bundle from device: %s", device.fqdn
             )
             result_data = CvApiResult(
                 action_name=device.fqdn + "_image_bundle_detached"
@@ -1736,7 +2287,7 @@ class CvDeviceTools(object):
 
             # We can't attach/detach an image to a device in the undefined container
             current_container_info = self.get_container_current(
-                device_lookup=device.info[self.__search_by]
+                device_lookup=device.get_lookup_key(self.__search_by)
             )
             if (
                 device.configlets is None
@@ -1748,14 +2299,14 @@ class CvDeviceTools(object):
             # GET IMAGE BUNDLE
             MODULE_LOGGER.debug(
                 "Attempting to get current image bundle for %s using %s",
-                str(device.fqdn),
-                str(device.info[self.__search_by]),
+                device.fqdn,
+                device.get_lookup_key(self.__search_by),
             )
             current_image_bundle = self.get_device_image_bundle(
-                device_lookup=device.info[self.__search_by]
+                device_lookup=device.get_lookup_key(self.__search_by)
             )
             MODULE_LOGGER.debug(
-                "Current image bundle assigned is: %s", str(current_image_bundle)
+                "Current image bundle assigned is: %s", current_image_bundle
             )
 
             # Check to make sure that the assigned image isn't inherited from the container
@@ -1767,7 +2318,7 @@ class CvDeviceTools(object):
 
                     # get device facts from CV
                     device_facts = self.get_device_facts(
-                        device_lookup=device.info[self.__search_by]
+                        device_lookup=device.get_lookup_key(self.__search_by)
                     )
 
                     assigned_image_facts = (
@@ -1796,7 +2347,7 @@ class CvDeviceTools(object):
                         except CvpApiError as catch_error:
                             MODULE_LOGGER.error(
                                 "Error removing bundle from device: %s",
-                                str(catch_error),
+                                catch_error,
                             )
                             self.__ansible.fail_json(
                                 msg=f"Error removing bundle from device {device.fqdn}: {str(catch_error)}"
@@ -1807,6 +2358,7 @@ class CvDeviceTools(object):
                                 result_data.success = True
                                 result_data.taskIds = resp["data"][Api.task.TASK_IDS]
                                 result_data.add_entry(f"{device.image_bundle} detach from {device.fqdn}")
+                            self.__update_device_facts(device, image=True)
 
                 results.append(result_data)
 
@@ -1830,15 +2382,17 @@ class CvDeviceTools(object):
             List of CvApiResult for all API calls
         """
         results = []
-        MODULE_LOGGER.debug(
-            "Apply configlets to following inventory: %s",
-            str([x.info for x in user_inventory.devices]),
-        )
+        staged_changes = {}
+        if MODULE_LOGGER.isEnabledFor(logging.DEBUG):
+            MODULE_LOGGER.debug(
+                "Apply configlets to following inventory: %s",
+                [x.info for x in user_inventory.devices],
+            )
         for device in user_inventory.devices:
-            MODULE_LOGGER.debug("Applying configlet for device: %s", str(device.fqdn))
+            MODULE_LOGGER.debug("Applying configlet for device: %s", device.fqdn)
             result_data = CvApiResult(action_name=device.fqdn + "_configlet_attached")
             current_container_info = self.get_container_current(
-                device_lookup=device.info[self.__search_by]
+                device_lookup=device.get_lookup_key(self.__search_by)
             )
             if (
                 device.configlets is None
@@ -1846,6 +2400,21 @@ class CvDeviceTools(object):
                 == Api.container.UNDEFINED_CONTAINER_ID
             ):
                 continue
+            # Configlets already in place are checked against mappers collected once for all devices,
+            # configlets attached are only read from Cloudvision when a change is required or when
+            # applied order is unknown. Cloudvision lists configlets inherited from containers first.
+            configlets_mapped = self.__get_mapped_device_configlets(
+                device_id=self.get_device_id(device_lookup=device.get_lookup_key(self.__search_by))
+            )
+            if configlets_mapped is not None and [x.name for x in configlets_mapped] == [
+                x[Api.generic.NAME]
+                for x in self.__get_reordered_configlets_list(list(configlets_mapped), device.configlets)
+            ]:
+                MODULE_LOGGER.info(
+                    "[%s] - There was no changes detected in the configlets list, skipping task creation for the device.",
+                    device.fqdn,
+                )
+                continue
             # get configlet information from CV
             configlets_attached = []
             if self.__search_by == Api.device.SERIAL:
@@ -1865,35 +2434,34 @@ class CvDeviceTools(object):
             configlets_reordered_list = self.__get_reordered_configlets_list(
                 configlets_attached, device.configlets
             )
+            configlets_reordered_names = [x[Api.generic.NAME] for x in configlets_reordered_list]
 
             # Check if changes have been made
             MODULE_LOGGER.debug(
                 "[%s] - Old configlet list: %s",
-                str(device.fqdn),
-                str(configlets_attached_before_changes),
+                device.fqdn,
+                configlets_attached_before_changes,
             )
             MODULE_LOGGER.debug(
                 "[%s] - New configlet list: %s",
-                str(device.fqdn),
-                str([x[Api.generic.NAME] for x in configlets_reordered_list]),
+                device.fqdn,
+                configlets_reordered_names,
             )
-            if str(configlets_attached_before_changes) == str(
-                [x[Api.generic.NAME] for x in configlets_reordered_list]
-            ):
+            if configlets_attached_before_changes == configlets_reordered_names:
                 MODULE_LOGGER.info(
                     "[%s] - There was no changes detected in the configlets list, skipping task creation for the device.",
-                    str(device.fqdn),
+                    device.fqdn,
                 )
                 continue
 
             MODULE_LOGGER.info(
                 "Creating task for device [%s] configlet list is: %s",
-                str(device.fqdn),
-                str([x[Api.generic.NAME] for x in configlets_reordered_list]),
+                device.fqdn,
+                configlets_reordered_names,
             )
             # get device facts from CV
             device_facts = self.get_device_facts(
-                device_lookup=device.info[self.__search_by]
+                device_lookup=device.get_lookup_key(self.__search_by)
             )
 
             # Attach configlets to device
@@ -1908,12 +2476,13 @@ class CvDeviceTools(object):
                         device.hostname,
                     )
                 else:
+                    self.__check_temp_actions(staged_changes, app_name="CvDeviceTools.apply_configlets")
                     try:
                         resp = self.__cv_client.api.apply_configlets_to_device(
                             app_name="CvDeviceTools.apply_configlets",
                             dev=device_facts,
                             new_configlets=configlets_reordered_list,
-                            create_task=True,
+                            create_task=not self.__batch_mode,
                             reorder_configlets=True,
                         )
                     except TypeError:
@@ -1930,7 +2499,12 @@ class CvDeviceTools(object):
                         MODULE_LOGGER.error(message)
                         self.__ansible.fail_json(msg=message)
                     else:
-                        if resp["data"]["status"] == "success":
+                        if self.__batch_mode:
+                            staged_changes[device_facts[Api.device.SYSMAC]] = (
+                                result_data,
+                                ["{0} adds {1}".format(device.fqdn, configlet) for configlet in device.configlets],
+                            )
+                        elif resp["data"]["status"] == "success":
                             result_data.changed = True
                             result_data.success = True
                             result_data.taskIds = resp["data"][Api.task.TASK_IDS]
@@ -1938,25 +2512,42 @@ class CvDeviceTools(object):
                                 result_data.add_entry(
                                     "{0} adds {1}".format(device.fqdn, configlet)
                                 )
-                            MODULE_LOGGER.debug("CVP response is: %s", str(resp))
+                            MODULE_LOGGER.debug("CVP response is: %s", resp)
                             MODULE_LOGGER.info(
-                                "Reponse data is: %s", str(result_data.results)
+                                "Reponse data is: %s", result_data.results
                             )
             else:
                 result_data.name = result_data.name + " - nothing attached"
             results.append(result_data)
+        self.__save_topology(staged_changes, app_name="CvDeviceTools.apply_configlets")
         return results
 
     def detach_configlets(self, user_inventory: DeviceInventory):
+        """
+        detach_configlets Entry point to detach configlets not listed in inventory from devices
+
+        Configlets inherited from parent containers are kept.
+
+        Parameters
+        ----------
+        user_inventory : DeviceInventory
+            Ansible inventory to configure on Cloudvision
+
+        Returns
+        -------
+        list
+            List of CvApiResult for all API calls
+        """
         results = []
+        staged_changes = {}
         for device in user_inventory.devices:
             result_data = CvApiResult(action_name=device.fqdn + "_configlet_removed")
             # FIXME: Should we ignore devices listed with no configlets ?
-            MODULE_LOGGER.debug("Device configlet list is: %s", str(device.configlets))
+            MODULE_LOGGER.debug("Device configlet list is: %s", device.configlets)
             if device.configlets is not None:
                 # get device facts from CV
                 device_facts = self.get_device_facts(
-                    device_lookup=device.info[self.__search_by]
+                    device_lookup=device.get_lookup_key(self.__search_by)
                 )
 
                 # List of expected configlet applied to the device, taking into account the configlets inherited from parent containers
@@ -1964,36 +2555,36 @@ class CvDeviceTools(object):
                     self.__get_configlet_list_inherited_from_container(device)
                     + device.configlets
                 )
-                MODULE_LOGGER.debug("Expected configlet list is: %s", str(expected_device_configlet_list))
+                MODULE_LOGGER.debug("Expected configlet list is: %s", expected_device_configlet_list)
                 configlets_to_remove = []
 
                 # get list of configured configlets
                 configlets_attached = self.get_device_configlets(
-                    device_lookup=device.info[self.__search_by]
+                    device_lookup=device.get_lookup_key(self.__search_by)
                 )
-                MODULE_LOGGER.debug(
-                    "Current configlet attached lru cache {0}".format(
-                        [x.name for x in configlets_attached]
+                if MODULE_LOGGER.isEnabledFor(logging.DEBUG):
+                    MODULE_LOGGER.debug(
+                        "Current configlet attached lru cache %s",
+                        [x.name for x in configlets_attached],
                     )
-                )
-                MODULE_LOGGER.debug("Configlets attached raw data {0}".format(configlets_attached))
+                MODULE_LOGGER.debug("Configlets attached raw data %s", configlets_attached)
                 # For each configlet not in the list, add to list of configlets to remove
                 for configlet in configlets_attached:
                     if configlet.name not in expected_device_configlet_list:
                         MODULE_LOGGER.info(
                             "Configlet [%s] is added to detach list",
-                            str(configlet.name),
+                            configlet.name,
                         )
                         result_data.name = result_data.name + " - " + configlet.name
                         configlets_to_remove.append(configlet.data)
                 # Detach configlets to device
                 if configlets_to_remove:
-                    MODULE_LOGGER.debug(
-                        "List of configlet to remove for device {0} is {1}".format(
+                    if MODULE_LOGGER.isEnabledFor(logging.DEBUG):
+                        MODULE_LOGGER.debug(
+                            "List of configlet to remove for device %s is %s",
                             device.fqdn,
                             [x[Api.generic.NAME] for x in configlets_to_remove],
                         )
-                    )
                     if self.__check_mode:
                         result_data.changed = False
                         result_data.success = True
@@ -2004,17 +2595,18 @@ class CvDeviceTools(object):
                             device.hostname,
                         )
                     else:
+                        self.__check_temp_actions(staged_changes, app_name="CvDeviceTools.detach_configlets")
                         try:
                             resp = self.__cv_client.api.remove_configlets_from_device(
                                 app_name="CvDeviceTools.detach_configlets",
                                 dev=device_facts,
                                 del_configlets=configlets_to_remove,
-                                create_task=True,
+                                create_task=not self.__batch_mode,
                             )
                         except CvpApiError as catch_error:
                             MODULE_LOGGER.error(
                                 "Error applying configlets to device: %s",
-                                str(catch_error),
+                                catch_error,
                             )
                             self.__ansible.fail_json(
                                 msg=f"Error detaching configlets from device {device.fqdn}: {catch_error}"
@@ -2025,7 +2617,12 @@ class CvDeviceTools(object):
                                 msg="Error detaching configlets to device. User is unauthorized!"
                             )
                         else:
-                            if resp["data"]["status"] == "success":
+                            if self.__batch_mode:
+                                staged_changes[device_facts[Api.device.SYSMAC]] = (
+                                    result_data,
+                                    ["{0} removes {1}".format(device.fqdn, configlet) for configlet in configlets_to_remove],
+                                )
+                            elif resp["data"]["status"] == "success":
                                 result_data.changed = True
                                 result_data.success = True
                                 result_data.taskIds = resp["data"][Api.task.TASK_IDS]
@@ -2038,6 +2635,7 @@ class CvDeviceTools(object):
                 else:
                     result_data.name = result_data.name + " - nothing detached"
                 results.append(result_data)
+        self.__save_topology(staged_changes, app_name="CvDeviceTools.detach_configlets")
         return results
 
     def remove_configlets(self, user_inventory: DeviceInventory):
@@ -2045,6 +2643,7 @@ class CvDeviceTools(object):
         remove_configlets UNSUPPORTED and NOT TESTED YET
         """
         results = []
+        staged_changes = {}
         for device in user_inventory.devices:
             result_data = CvApiResult(action_name=device.fqdn + "_configlet_removed")
             if device.configlets is not None:
@@ -2056,7 +2655,7 @@ class CvDeviceTools(object):
 
                 # get device facts from CV
                 device_facts = self.get_device_facts(
-                    device_lookup=device.info[self.__search_by]
+                    device_lookup=device.get_lookup_key(self.__search_by)
                 )
 
                 # Attach configlets to device
@@ -2070,12 +2669,13 @@ class CvDeviceTools(object):
                         device.hostname,
                     )
                 else:
+                    self.__check_temp_actions(staged_changes, app_name="CvDeviceTools.remove_configlets")
                     try:
                         resp = self.__cv_client.api.remove_configlets_from_device(
                             app_name="CvDeviceTools.remove_configlets",
                             dev=device_facts,
                             del_configlets=configlets_info,
-                            create_task=True,
+                            create_task=not self.__batch_mode,
                         )
                     except CvpApiError:
                         MODULE_LOGGER.error("Error removing configlets to device")
@@ -2083,7 +2683,12 @@ class CvDeviceTools(object):
                             msg="Error removing configlets to device"
                         )
                     else:
-                        if resp["data"]["status"] == "success":
+                        if self.__batch_mode:
+                            staged_changes[device_facts[Api.device.SYSMAC]] = (
+                                result_data,
+                                ["{} removes {}".format(device.fqdn, *device.configlets)],
+                            )
+                        elif resp["data"]["status"] == "success":
                             result_data.changed = True
                             result_data.success = True
                             result_data.taskIds = resp["data"][Api.task.TASK_IDS]
@@ -2091,6 +2696,7 @@ class CvDeviceTools(object):
                                 "{} removes {}".format(device.fqdn, *device.configlets)
                             )
             results.append(result_data)
+        self.__save_topology(staged_changes, app_name="CvDeviceTools.remove_configlets")
         return results
 
     def deploy_device(self, user_inventory: DeviceInventory):
@@ -2114,7 +2720,7 @@ class CvDeviceTools(object):
         results = []
         for device in user_inventory.devices:
             result_data = CvApiResult(
-                action_name=device.info[self.__search_by] + "_deployed"
+                action_name=device.get_lookup_key(self.__search_by) + "_deployed"
             )
             if device.system_mac is not None:
                 configlets_info = []
@@ -2131,16 +2737,16 @@ class CvDeviceTools(object):
                         configlets_info.append(new_configlet)
                 # Move devices when they are not in undefined container
                 current_container_info = self.get_container_current(
-                    device_lookup=device.info[self.__search_by]
+                    device_lookup=device.get_lookup_key(self.__search_by)
                 )
 
                 MODULE_LOGGER.debug(
-                    "Device {0} is currently under {1}".format(
-                        device.fqdn, current_container_info[Api.generic.NAME]
-                    )
+                    "Device %s is currently under %s",
+                    device.fqdn,
+                    current_container_info[Api.generic.NAME],
                 )
                 device_info = self.get_device_facts(
-                    device_lookup=device.info[self.__search_by]
+                    device_lookup=device.get_lookup_key(self.__search_by)
                 )
                 if (
                     current_container_info[Api.generic.NAME]
@@ -2164,9 +2770,9 @@ class CvDeviceTools(object):
                         try:
                             MODULE_LOGGER.debug(
                                 "Ansible is going to deploy device %s in container %s with configlets %s",
-                                str(device.fqdn),
-                                str(device.container),
-                                str(configlets_info),
+                                device.fqdn,
+                                device.container,
+                                configlets_info,
                             )
                             resp = self.__cv_client.api.deploy_device(
                                 app_name="CvDeviceTools.deploy",
@@ -2180,19 +2786,21 @@ class CvDeviceTools(object):
                                 msg=f"Error to deploy device {device.fqdn} to container {device.container}"
                             )
                             MODULE_LOGGER.critical(
-                                "Error deploying device {0} : {1}".format(
-                                    device.fqdn, error
-                                )
+                                "Error deploying device %s : %s", device.fqdn, error
                             )
                         else:
                             if resp["data"]["status"] == "success":
                                 result_data.changed = True
                                 result_data.success = True
                                 result_data.taskIds = resp["data"][Api.task.TASK_IDS]
+                                self.__update_device_facts(device, changes={
+                                    Api.generic.PARENT_CONTAINER_ID: target_container_info[Api.generic.KEY],
+                                    Api.device.CONTAINER_NAME: target_container_info[Api.generic.NAME],
+                                })
 
                     result_data.add_entry(
                         "{0} deployed to {1}".format(
-                            device.info[self.__search_by], device.container
+                            device.get_lookup_key(self.__search_by), device.container
                         )
                     )
             results.append(result_data)
@@ -2201,9 +2809,9 @@ class CvDeviceTools(object):
     def delete_device(self, user_inventory: DeviceInventory):
         results = []
         for device in user_inventory.devices:
-            MODULE_LOGGER.info("removing device %s from provisioning", str(device.info))
+            MODULE_LOGGER.info("removing device %s from provisioning", device.info)
             result_data = CvApiResult(
-                action_name=device.info[self.__search_by] + "_delete"
+                action_name=device.get_lookup_key(self.__search_by) + "_delete"
             )
             if self.__check_mode:
                 result_data.changed = False
@@ -2215,7 +2823,7 @@ class CvDeviceTools(object):
             else:
                 try:
                     MODULE_LOGGER.info(
-                        "send reset request for device %s", str(device.info)
+                        "send reset request for device %s", device.info
                     )
                     resp = self.__cv_client.api.delete_device(device.system_mac)
                 except CvpApiError:
@@ -2242,12 +2850,12 @@ class CvDeviceTools(object):
         decomm_success = "DECOMMISSIONING_STATUS_SUCCESS"
         decomm_failure = "DECOMMISSIONING_STATUS_FAILURE"
         for device in user_inventory.devices:
-            MODULE_LOGGER.info("removing device %s from provisioning", str(device.info))
+            MODULE_LOGGER.info("removing device %s from provisioning", device.info)
             result_data = CvApiResult(
-                action_name=device.info[self.__search_by] + "_delete"
+                action_name=device.get_lookup_key(self.__search_by) + "_delete"
             )
             try:
-                MODULE_LOGGER.info("send reset request for device %s", str(device.info))
+                MODULE_LOGGER.info("send reset request for device %s", device.info)
                 req_id = str(uuid.uuid4())
                 device_fact = self.get_device_facts(device_lookup=device.hostname)
                 device_id = device_fact["serialNumber"]
@@ -2308,9 +2916,9 @@ class CvDeviceTools(object):
     def reset_device(self, user_inventory: DeviceInventory):
         results = []
         for device in user_inventory.devices:
-            MODULE_LOGGER.info("start process resetting device %s", str(device.info))
+            MODULE_LOGGER.info("start process resetting device %s", device.info)
             result_data = CvApiResult(
-                action_name=device.info[self.__search_by] + "_reset"
+                action_name=device.get_lookup_key(self.__search_by) + "_reset"
             )
             if self.__check_mode:
                 result_data.changed = False
@@ -2322,7 +2930,7 @@ class CvDeviceTools(object):
             else:
                 try:
                     MODULE_LOGGER.info(
-                        "send reset request for device %s", str(device.info)
+                        "send reset request for device %s", device.info
                     )
                     resp = self.__cv_client.api.reset_device(
                         app_name="CvDeviceTools.reset_device",
@@ -26,41 +26,116 @@ import traceback
 import logging
 import re
 import os
+import gzip
+import json
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
 from typing import List
 from concurrent.futures import ThreadPoolExecutor
 import ansible_collections.arista.cvp.plugins.module_utils.logger   # noqa # pylint: disable=unused-import
 from ansible_collections.arista.cvp.plugins.module_utils.resources.api.fields import Api
 from ansible_collections.arista.cvp.plugins.module_utils.resources.modules.fields import FactsResponseFields
-import ansible_collections.arista.cvp.plugins.module_utils.tools_schema as schema   # noqa # pylint: disable=unused-import
+from ansible_collections.arista.cvp.plugins.module_utils.tools_metrics import record_cache_lookup
+from ansible_collections.arista.cvp.plugins.module_utils.tools_schema import HAS_JSONSCHEMA  # noqa # pylint: disable=unused-import
 try:
-    from cvprac.cvp_client import CvpClient  # noqa # pylint: disable=unused-import
     from cvprac.cvp_client_errors import CvpApiError, CvpRequestError  # noqa # pylint: disable=unused-import
     HAS_CVPRAC = True
 except ImportError:
     HAS_CVPRAC = False
     CVPRAC_IMP_ERR = traceback.format_exc()
-try:
-    import jsonschema  # noqa # pylint: disable=unused-import
-    HAS_JSONSCHEMA = True
-except ImportError:
-    HAS_JSONSCHEMA = False
 
 
 MODULE_LOGGER = logging.getLogger(__name__)
 MODULE_LOGGER.info('Start fact_tools module execution')
 
+# Default filter of scopes, matching all resources
+MATCH_ALL = re.compile('.*')
+
 
 # ------------------------------------------ #
 # Class
 # ------------------------------------------ #
 
+class CvFactsStream():
+    """
+    CvFactsStream Helper to write facts as JSON-lines to a file while they are collected
+
+    Every line is a JSON object with facts section name as key. Value is one device for
+    cvp_devices section and a single {<name>: <data>} entry for other sections.
+
+    EXAMPLE:
+    --------
+    >>> with CvFactsStream(path='/tmp/facts.jsonl.gz', compress=True) as stream:
+    ...     stream.write(resource='cvp_configlets', fact={'TEAM01-alias': 'alias a1 show version'})
+    >>> stream.counts
+    {'cvp_configlets': 1}
+    """
+    def __init__(self, path: str, compress: bool = False):
+        self.path = path
+        self.compress = compress
+        self.counts = {}
+        self._file = None
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close()
+
+    def open(self):
+        """
+        open Open output file, using gzip compression if configured
+        """
+        if self.compress:
+            self._file = gzip.open(self.path, 'wt', encoding='utf-8')
+        else:
+            self._file = open(self.path, 'w', encoding='utf-8')
+
+    def close(self):
+        """
+        close Close output file
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def write(self, resource: str, fact):
+        """
+        write Write a single fact entry as a new line in output file
+
+        Parameters
+        ----------
+        resource : str
+            Name of the facts section, for instance cvp_devices
+        fact : Any
+            Fact entry to write. Must be JSON serializable
+        """
+        line = json.dumps({resource: fact}, default=str)
+        with self._lock:
+            self._file.write(line + '\n')
+            self.counts[resource] = self.counts.get(resource, 0) + 1
+
+
 class CvFactResource():
     """
     CvFactResource Helper to render facts based on resource type
     """
-    def __init__(self, facts_type: str = 'list'):
+    RESOURCE_FIELDS = {
+        'configlet': FactsResponseFields.CONFIGLET,
+        'container': FactsResponseFields.CONTAINER,
+        'device': FactsResponseFields.DEVICE,
+        'image': FactsResponseFields.IMAGE,
+        'task': FactsResponseFields.TASK,
+    }
+
+    def __init__(self, facts_type: str = 'list', stream: CvFactsStream = None):
         if facts_type == 'list':
             self._cache = []
+        self._stream = stream
 
     def __shorten_device_facts(self, device_fact: dict):
         """
@@ -91,9 +166,10 @@ class CvFactResource():
         fact[Api.generic.PARENT_CONTAINER_NAME] = device_fact[Api.device.CONTAINER_NAME]
         return fact
 
-    def __shorten_task_facts(self, task_fact: dict):
+    @staticmethod
+    def shorten_task_facts(task_fact: dict):
         """
-        __shorten_task_facts Filter content to return for task type resource
+        shorten_task_facts Filter content to return for task type resource
 
         Parameters
         ----------
@@ -275,7 +351,7 @@ class CvFactResource():
             if verbose == 'long':
                 return {task[Api.generic.TASK_ID]: task for task in self._cache}
             else:
-                return {task[Api.generic.TASK_ID]: self.__shorten_task_facts(task_fact=task) for task in self._cache}
+                return {task[Api.generic.TASK_ID]: self.shorten_task_facts(task_fact=task) for task in self._cache}
 
     def add(self, data):
         """
@@ -296,6 +372,48 @@ class CvFactResource():
         This method transform list of data available in its cache to be exposed using CV module schema.
         Resource_type input will apply correct data transformation to be compatible with cv modules.
 
+        Parameters
+        ----------
+        resource_model : str
+            Name of the resource to apply correct transformation. Can be ['device', 'container', 'configlet']
+        verbose : str, optional
+            Trigger to include or not all fields from CV, by default 'short'
+
+        Returns
+        -------
+        Any
+            Facts based on resource_type data model. None when facts are written to a stream.
+        """
+        if self._stream is not None:
+            self.__write(resource_model=resource_model, verbose=verbose)
+            return None
+        return self.__render(resource_model=resource_model, verbose=verbose)
+
+    def __write(self, resource_model: str, verbose: str = 'short'):
+        """
+        __write Write facts available in cache to stream and empty the cache
+
+        Parameters
+        ----------
+        resource_model : str
+            Name of the resource to apply correct transformation. Can be ['device', 'container', 'configlet']
+        verbose : str, optional
+            Trigger to include or not all fields from CV, by default 'short'
+        """
+        facts = self.__render(resource_model=resource_model, verbose=verbose)
+        resource = self.RESOURCE_FIELDS[resource_model]
+        if isinstance(facts, dict):
+            for name, fact in facts.items():
+                self._stream.write(resource=resource, fact={name: fact})
+        else:
+            for fact in facts:
+                self._stream.write(resource=resource, fact=fact)
+        self._cache = []
+
+    def __render(self, resource_model: str, verbose: str = 'short'):
+        """
+        __render Transform facts available in cache using resource_model
+
         Parameters
         ----------
         resource_model : str
@@ -328,7 +446,12 @@ class CvFactsTools():
     def __init__(self, cv_connection):
         self.__cv_client = cv_connection
         self._cache = {FactsResponseFields.CACHE_CONTAINERS: None, FactsResponseFields.CACHE_MAPPERS: None}
+        self._cache_lock = threading.Lock()
         self._max_worker = min(32, (os.cpu_count() or 1) + 4)
+        self.__executor = None
+        self.__stream = None
+        # Duration of facts collection per scope in seconds - format {<scope>: <duration>}
+        self.timing = {}
         self.__init_facts()
 
     def __init_facts(self):
@@ -336,7 +459,8 @@ class CvFactsTools():
                        FactsResponseFields.CONTAINER: [], FactsResponseFields.IMAGE: [],
                        FactsResponseFields.TASK: []}
 
-    def facts(self, scope: List[str], regex_filter: str = '.*', verbose: str = 'short'):
+    def facts(self, scope: List[str], regex_filter: str = '.*', verbose: str = 'short', output_file: str = None, compress: bool = False,
+              since_task_id: int = None, since_time: int = None):
         """
         facts Public API to collect facts from Cloudvision
 
@@ -371,23 +495,112 @@ class CvFactsTools():
             Regular expression to filter devices and configlets. Only element with filter in their name will be exported
         verbose : str, optional
             Facts verbosity: full get all data from CV where short get only cv_modules data, by default 'short'
+        output_file : str, optional
+            Path of a file to stream facts to as JSON-lines while they are collected, by default None
+        compress : bool, optional
+            Compress output_file using gzip, by default False
+        since_task_id : int, optional
+            Only collect tasks with an ID greater than this one, by default None
+        since_time : int, optional
+            Only collect tasks created after this Unix timestamp in seconds, by default None
 
         Returns
         -------
         dict
-            A dictionary of information with all the data from Cloudvision
-        """
-        if 'devices' in scope:
-            self.__fact_devices(filter=regex_filter, verbose=verbose)
-        if 'containers' in scope:
-            self.__fact_containers(filter=regex_filter)
-        if 'configlets' in scope:
-            self.__fact_configlets(filter=regex_filter)
-        if 'images' in scope:
-            self.__fact_images(filter=regex_filter)
-        if 'tasks' in scope:
-            self.__fact_tasks(filter=regex_filter, verbose=verbose)
-        return self._facts
+            A dictionary of information with all the data from Cloudvision.
+            When output_file is set, only path of the file and number of facts per section.
+        """
+        if output_file is None:
+            self.__collect(scope=scope, regex_filter=regex_filter, verbose=verbose, since_task_id=since_task_id, since_time=since_time)
+            return self._facts
+        with CvFactsStream(path=output_file, compress=compress) as stream:
+            self.__stream = stream
+            try:
+                self.__collect(scope=scope, regex_filter=regex_filter, verbose=verbose, since_task_id=since_task_id, since_time=since_time)
+            finally:
+                self.__stream = None
+        counts = {self._facts_section(resource): stream.counts.get(self._facts_section(resource), 0) for resource in scope}
+        return {FactsResponseFields.OUTPUT_FILE: output_file, FactsResponseFields.COUNTS: counts}
+
+    @staticmethod
+    def _facts_section(resource: str):
+        """
+        _facts_section Get name of the facts section for a resource listed in scope
+
+        Parameters
+        ----------
+        resource : str
+            Resource name as listed in scope, for instance devices
+
+        Returns
+        -------
+        str
+            Facts section name, for instance cvp_devices
+        """
+        return CvFactResource.RESOURCE_FIELDS[resource[:-1]]
+
+    def __collect(self, scope: List[str], regex_filter: str = '.*', verbose: str = 'short', since_task_id: int = None, since_time: int = None):
+        """
+        __collect Run facts collection for all resources listed in scope
+
+        Scopes are collected concurrently on a bounded executor which is also shared by
+        scopes running parallel API calls. Duration of each scope is saved in self.timing.
+        """
+        collectors = {
+            'devices': lambda: self.__fact_devices(filter=regex, verbose=verbose),
+            'containers': lambda: self.__fact_containers(filter=regex),
+            'configlets': lambda: self.__fact_configlets(filter=regex),
+            'images': lambda: self.__fact_images(filter=regex),
+            'tasks': lambda: self.__fact_tasks(filter=regex_filter, verbose=verbose, since_task_id=since_task_id, since_time=since_time),
+        }
+        self.timing = {}
+        # Filter is compiled once and shared by all scopes
+        regex = re.compile(regex_filter)
+        # Keep at least one worker available for API calls submitted by scopes
+        with ThreadPoolExecutor(max_workers=max(self._max_worker, len(collectors) + 1)) as executor:
+            self.__executor = executor
+            try:
+                futures = [executor.submit(self.__timed_collect, resource, collector)
+                           for resource, collector in collectors.items() if resource in scope]
+                for future in futures:
+                    future.result()
+            finally:
+                self.__executor = None
+
+    def __timed_collect(self, resource: str, collector):
+        """
+        __timed_collect Run collector for a given scope and save its duration
+
+        Parameters
+        ----------
+        resource : str
+            Name of the scope, for instance devices
+        collector : Callable
+            Function collecting facts for this scope
+        """
+        start = time.perf_counter()
+        try:
+            collector()
+        finally:
+            self.timing[resource] = round(time.perf_counter() - start, 3)
+            MODULE_LOGGER.info('Facts for %s collected in %ss', resource, self.timing[resource])
+
+    def __get_configlets_mappers(self):
+        """
+        __get_configlets_mappers Get configlets and mappers from cache, built once from Cloudvision
+
+        Returns
+        -------
+        dict
+            Configlets and mappers data from Cloudvision
+        """
+        record_cache_lookup(self.__cv_client, 'facts_tools.configlets_mappers', hit=self._cache[FactsResponseFields.CACHE_MAPPERS] is not None)
+        if self._cache[FactsResponseFields.CACHE_MAPPERS] is None:
+            with self._cache_lock:
+                if self._cache[FactsResponseFields.CACHE_MAPPERS] is None:
+                    MODULE_LOGGER.warning('Build configlet mappers cache from Cloudvision')
+                    self._cache[FactsResponseFields.CACHE_MAPPERS] = self.__cv_client.api.get_configlets_and_mappers()['data']
+        return self._cache[FactsResponseFields.CACHE_MAPPERS]
 
     def __get_container_name(self, key: str = Api.container.UNDEFINED_CONTAINER_ID):
         """
@@ -406,13 +619,15 @@ class CvFactsTools():
             Container name
         """
         if self._cache[FactsResponseFields.CACHE_CONTAINERS] is None:
-            MODULE_LOGGER.warning('Build container cache from Cloudvision')
-            try:
-                self._cache[FactsResponseFields.CACHE_CONTAINERS] = self.__cv_client.api.get_containers()['data']
-            except CvpApiError as error:
-                MODULE_LOGGER.error('Can\'t get information from CV: %s', str(error))
-                return None
-        MODULE_LOGGER.debug('Current cache data is: %s', str(self._cache[FactsResponseFields.CACHE_CONTAINERS]))
+            with self._cache_lock:
+                if self._cache[FactsResponseFields.CACHE_CONTAINERS] is None:
+                    MODULE_LOGGER.warning('Build container cache from Cloudvision')
+                    try:
+                        self._cache[FactsResponseFields.CACHE_CONTAINERS] = self.__cv_client.api.get_containers()['data']
+                    except CvpApiError as error:
+                        MODULE_LOGGER.error('Can\'t get information from CV: %s', error)
+                        return None
+        MODULE_LOGGER.debug('Current cache data is: %s', self._cache[FactsResponseFields.CACHE_CONTAINERS])
         for container in self._cache[FactsResponseFields.CACHE_CONTAINERS]:
             if key == container[Api.generic.KEY]:
                 return container[Api.generic.NAME]
@@ -458,10 +673,7 @@ class CvFactsTools():
         """
         if not configletIds:
             return []
-        if self._cache[FactsResponseFields.CACHE_MAPPERS] is None:
-            MODULE_LOGGER.warning('Build configlet mappers cache from Cloudvision')
-            self._cache[FactsResponseFields.CACHE_MAPPERS] = self.__cv_client.api.get_configlets_and_mappers()['data']
-        configlets = self._cache[FactsResponseFields.CACHE_MAPPERS][Api.generic.CONFIGLETS]
+        configlets = self.__get_configlets_mappers()[Api.generic.CONFIGLETS]
         return [configlet[Api.generic.NAME] for configlet in configlets if configlet[Api.generic.KEY] in configletIds]
 
     def __device_get_configlets(self, netid: str):
@@ -481,13 +693,10 @@ class CvFactsTools():
         List[str]
             List of configlets name
         """
-        if self._cache[FactsResponseFields.CACHE_MAPPERS] is None:
-            MODULE_LOGGER.warning('Build configlet mappers cache from Cloudvision')
-            self._cache[FactsResponseFields.CACHE_MAPPERS] = self.__cv_client.api.get_configlets_and_mappers()['data']
-        mappers = self._cache[FactsResponseFields.CACHE_MAPPERS]['configletMappers']
+        mappers = self.__get_configlets_mappers()['configletMappers']
         configletIds = [mapper[Api.configlet.ID] for mapper in mappers if mapper[Api.mappers.OBJECT_ID] == netid]
-        MODULE_LOGGER.debug('** NetelementID is %s', str(netid))
-        MODULE_LOGGER.debug('** Configlet IDs are %s', str(configletIds))
+        MODULE_LOGGER.debug('** NetelementID is %s', netid)
+        MODULE_LOGGER.debug('** Configlet IDs are %s', configletIds)
         return self.__configletIds_to_configletName(configletIds=configletIds)
 
     def __containers_get_configlets(self, container_id):
@@ -506,18 +715,15 @@ class CvFactsTools():
         List[str]
             List of configlets name
         """
-        if self._cache[FactsResponseFields.CACHE_MAPPERS] is None:
-            MODULE_LOGGER.warning('Build configlet mappers cache from Cloudvision')
-            self._cache[FactsResponseFields.CACHE_MAPPERS] = self.__cv_client.api.get_configlets_and_mappers()['data']
-        mappers = self._cache[FactsResponseFields.CACHE_MAPPERS]['configletMappers']
+        mappers = self.__get_configlets_mappers()['configletMappers']
         configletIds = [mapper[Api.configlet.ID]
                         for mapper in mappers
                         if (mapper[Api.container.ID] == container_id or mapper[Api.mappers.OBJECT_ID] == container_id)
                         ]
         # Deduplicate entries as containerID is present for every inherited configlets
         configletIds = list(dict.fromkeys(configletIds))
-        MODULE_LOGGER.debug('** Container ID is %s', str(container_id))
-        MODULE_LOGGER.debug('** Configlet IDs are %s', str(configletIds))
+        MODULE_LOGGER.debug('** Container ID is %s', container_id)
+        MODULE_LOGGER.debug('** Configlet IDs are %s', configletIds)
         return self.__configletIds_to_configletName(configletIds=configletIds)
 
     def __container_get_image_bundle_name(self, container_id):
@@ -539,13 +745,13 @@ class CvFactsTools():
         try:
             bundle = self.__cv_client.api.get_image_bundle_by_container_id(container_id)
         except CvpApiError as error_msg:
-            MODULE_LOGGER.error('Error when collecting container bundle facts: %s', str(error_msg))
+            MODULE_LOGGER.error('Error when collecting container bundle facts: %s', error_msg)
 
-        MODULE_LOGGER.debug('Bundle data assigned to container: %s', str(bundle))
+        MODULE_LOGGER.debug('Bundle data assigned to container: %s', bundle)
         if len(bundle['imageBundleList']) == 1:
             bundle_name = bundle['imageBundleList'][0]['name']
         elif len(bundle['imageBundleList']) > 1:
-            MODULE_LOGGER.error('Number of image bundles is > 1 on %s', str(container_id))
+            MODULE_LOGGER.error('Number of image bundles is > 1 on %s', container_id)
         else:
             pass
         return bundle_name
@@ -569,16 +775,16 @@ class CvFactsTools():
         try:
             bundle = self.__cv_client.api.get_device_image_info(device_id)
         except CvpApiError as error_msg:
-            MODULE_LOGGER.error('Error when collecting device bundle facts: %s', str(error_msg))
+            MODULE_LOGGER.error('Error when collecting device bundle facts: %s', error_msg)
 
-        MODULE_LOGGER.debug('Bundle data assigned to container: %s', str(bundle))
+        MODULE_LOGGER.debug('Bundle data assigned to container: %s', bundle)
         if bundle is not None and bundle['bundleName'] is not None:
             return bundle['bundleName']
         else:
             return bundle_name
 
     # Fact management
-    def __fact_devices(self, filter: str = '.*', verbose: str = 'short'):
+    def __fact_devices(self, filter: re.Pattern = MATCH_ALL, verbose: str = 'short'):
         """
         __fact_devices Collect facts related to device inventory
 
@@ -586,21 +792,21 @@ class CvFactsTools():
 
         Parameters
         ----------
-        filter : str, optional
-            Regular Expression to filter device. Search is done against FQDN to allow domain filtering, by default .*
+        filter : re.Pattern, optional
+            Compiled Regular Expression to filter device. Search is done against FQDN to allow domain filtering, by default .*
         verbose : str, optional
             Facts verbosity: full get all data from CV where short get only cv_modules data, by default 'short'
         """
         try:
             cv_devices = self.__cv_client.api.get_inventory()
         except CvpApiError as error_msg:
-            MODULE_LOGGER.error('Error when collecting devices facts: %s', str(error_msg))
+            MODULE_LOGGER.error('Error when collecting devices facts: %s', error_msg)
             raise error_msg
-        MODULE_LOGGER.info('Extract device data using filter %s', str(filter))
-        facts_builder = CvFactResource()
+        MODULE_LOGGER.info('Extract device data using filter %s', filter.pattern)
+        facts_builder = CvFactResource(stream=self.__stream)
         for device in cv_devices:
-            if re.match(filter, device[Api.device.HOSTNAME]):
-                MODULE_LOGGER.debug('Filter has been matched: %s - %s', str(filter), str(device[Api.device.HOSTNAME]))
+            if filter.match(device[Api.device.HOSTNAME]):
+                MODULE_LOGGER.debug('Filter has been matched: %s - %s', filter.pattern, device[Api.device.HOSTNAME])
                 if verbose == 'long':
                     facts_builder.add(self.__device_update_info(device=device))
                 else:
@@ -608,139 +814,250 @@ class CvFactsTools():
                     device[Api.generic.IMAGE_BUNDLE_NAME] = self.__device_get_image_bundle_name(device[Api.generic.KEY])
 
                     facts_builder.add(device)
+                if self.__stream is not None:
+                    facts_builder.get(resource_model='device', verbose=verbose)
         self._facts[FactsResponseFields.DEVICE] = facts_builder.get(resource_model='device', verbose=verbose)
 
-    def __fact_containers(self, filter: str = '.*'):
+    def __fact_containers(self, filter: re.Pattern = MATCH_ALL):
         """
         __fact_containers Collect facts related to container structure
         """
         try:
             cv_containers = self.__cv_client.api.get_containers()
         except CvpApiError as error_msg:
-            MODULE_LOGGER.error('Error when collecting containers facts: %s', str(error_msg))
+            MODULE_LOGGER.error('Error when collecting containers facts: %s', error_msg)
             raise error_msg
-        facts_builder = CvFactResource()
+        facts_builder = CvFactResource(stream=self.__stream)
         for container in cv_containers['data']:
             if container[Api.generic.NAME] != 'Tenant':
-                if re.match(filter, container[Api.generic.NAME]):
-                    MODULE_LOGGER.debug('Got following information for container: %s', str(container))
+                if filter.match(container[Api.generic.NAME]):
+                    MODULE_LOGGER.debug('Got following information for container: %s', container)
                     container[Api.generic.CONFIGLETS] = self.__containers_get_configlets(container_id=container[Api.container.KEY])
                     container[Api.generic.IMAGE_BUNDLE_NAME] = self.__container_get_image_bundle_name(container_id=container[Api.container.KEY])
                     facts_builder.add(container)
         self._facts[FactsResponseFields.CONTAINER] = facts_builder.get(resource_model='container')
 
-    def __fact_configlets(self, filter: str = '.*', configlets_per_call: int = 10):
+    def __fact_configlets(self, filter: re.Pattern = MATCH_ALL, configlets_per_call: int = 10, pages_in_flight: int = 4):
         """
         __fact_configlets Collect facts related to configlets structure
 
-        Execute parallel calls to get a list of all static configlets from CVP
+        Execute parallel calls to get a list of all static configlets from CVP. Number of pages
+        requested ahead is bounded by pages_in_flight and each page is written out once processed.
 
         Parameters
         ----------
-        filter : str, optional
-            Regular Expression to filter configlets, by default .*
+        filter : re.Pattern, optional
+            Compiled Regular Expression to filter configlets, by default .*
         configlets_per_call : int, optional
             Number of configlets to retrieve per API call, by default 10
+        pages_in_flight : int, optional
+            Maximum number of pages requested ahead, by default 4
         """
         try:
             max_range_calc = self.__cv_client.api.get_configlets(start=0, end=1)['total'] + 1
         except CvpApiError as error_msg:
-            MODULE_LOGGER.error('Error when collecting configlets facts: %s', str(error_msg))
+            MODULE_LOGGER.error('Error when collecting configlets facts: %s', error_msg)
             raise error_msg
-        futures_list = []
-        results = []
-        with ThreadPoolExecutor(max_workers=self._max_worker) as executor:
-            for configlet_index in range(0, max_range_calc, configlets_per_call):
-                futures_list.append(
-                    executor.submit(self.__cv_client.api.get_configlets, start=configlet_index, end=configlet_index + configlets_per_call)
-                )
-
-            for future in futures_list:
-                try:
-                    result = future.result(timeout=60)
-                    results.append(result)
-                except Exception as error:
-                    results.append(None)
-                    MODULE_LOGGER.critical(
-                        'Exception in getting configlet (%s): %s',
-                        str(error),
-                        str(future.result())
-                    )
-        facts_builder = CvFactResource()
-        for future in results:
-            for configlet in future['data']:
-                if re.match(filter, configlet[Api.generic.NAME]):
-                    MODULE_LOGGER.debug('Adding configlet %s', str(configlet[Api.generic.NAME]))
-                    facts_builder.add(configlet)
-
-        MODULE_LOGGER.debug(
-            'Final results for configlets: %s',
-            str(facts_builder.get(resource_model='configlet').keys())
-        )
-        self._facts[FactsResponseFields.CONFIGLET] = facts_builder.get(resource_model='configlet')
-
-    def __fact_images(self, filter: str = '.*'):
+        facts_builder = CvFactResource(stream=self.__stream)
+        pages_start = iter(range(0, max_range_calc, configlets_per_call))
+        # Use executor shared by all scopes when available
+        if self.__executor is None:
+            executor_context = ThreadPoolExecutor(max_workers=pages_in_flight)
+        else:
+            executor_context = nullcontext(self.__executor)
+        with executor_context as executor:
+            futures_list = deque()
+            try:
+                while True:
+                    for configlet_index in pages_start:
+                        futures_list.append(
+                            executor.submit(self.__cv_client.api.get_configlets, start=configlet_index, end=configlet_index + configlets_per_call)
+                        )
+                        if len(futures_list) >= pages_in_flight:
+                            break
+                    if not futures_list:
+                        break
+                    # Consume pages in order and release them once processed
+                    try:
+                        result = futures_list.popleft().result(timeout=60)
+                    except Exception as error:
+                        MODULE_LOGGER.critical('Exception in getting configlet: %s', error)
+                        raise
+                    for configlet in result['data']:
+                        if filter.match(configlet[Api.generic.NAME]):
+                            MODULE_LOGGER.debug('Adding configlet %s', configlet[Api.generic.NAME])
+                            facts_builder.add(configlet)
+                    if self.__stream is not None:
+                        facts_builder.get(resource_model='configlet')
+            finally:
+                for future in futures_list:
+                    future.cancel()
+
+        configlets_facts = facts_builder.get(resource_model='configlet')
+        if configlets_facts is not None:
+            MODULE_LOGGER.debug(
+                'Final results for configlets: %s',
+                configlets_facts.keys()
+            )
+        self._facts[FactsResponseFields.CONFIGLET] = configlets_facts
+
+    def __fact_images(self, filter: re.Pattern = MATCH_ALL):
         """
         __fact_images Collect facts related to images
         """
         try:
             cv_images = self.__cv_client.api.get_images()
         except CvpApiError as error_msg:
-            MODULE_LOGGER.error('Error when collecting images facts: %s', str(error_msg))
+            MODULE_LOGGER.error('Error when collecting images facts: %s', error_msg)
             raise error_msg
 
-        facts_builder = CvFactResource()
+        facts_builder = CvFactResource(stream=self.__stream)
         for image in cv_images['data']:
             # filter by image name
-            if re.match(filter, image[Api.generic.NAME]):
-                MODULE_LOGGER.debug('Got following information for image: %s', str(image))
+            if filter.match(image[Api.generic.NAME]):
+                MODULE_LOGGER.debug('Got following information for image: %s', image)
                 facts_builder.add(image)
 
-        MODULE_LOGGER.debug(
-            'Final results for images: %s',
-            str(facts_builder.get(resource_model='image').keys())
-        )
-        self._facts[FactsResponseFields.IMAGE] = facts_builder.get(resource_model='image')
+        images_facts = facts_builder.get(resource_model='image')
+        if images_facts is not None:
+            MODULE_LOGGER.debug(
+                'Final results for images: %s',
+                images_facts.keys()
+            )
+        self._facts[FactsResponseFields.IMAGE] = images_facts
 
-    def __fact_tasks(self, filter: str = '.*', verbose: str = 'short'):
+    def __get_tasks_page(self, status: str = None, start: int = 0, end: int = 0):
         """
-        __fact_images Collect facts related to images
+        __get_tasks_page Get a page of tasks from Cloudvision
+
+        Parameters
+        ----------
+        status : str, optional
+            Task status to filter on server side, by default None to get all tasks
+        start : int, optional
+            Start index of the page, by default 0
+        end : int, optional
+            End index of the page, by default 0
+
+        Returns
+        -------
+        dict
+            Page of tasks - format {'data': [<tasks>], 'total': <total number of tasks>}
+        """
+        if status is None:
+            return self.__cv_client.api.get_tasks(start=start, end=end)
+        return {'data': self.__cv_client.api.get_tasks_by_status(status, start=start, end=end)}
+
+    def __iter_tasks_pages(self, status: str = None, tasks_per_call: int = 100, pages_in_flight: int = 4):
+        """
+        __iter_tasks_pages Generator of pages of tasks from Cloudvision
+
+        Next pages are requested in parallel while current page is processed. Number of pages
+        requested ahead is bounded by pages_in_flight. Generator stops at first incomplete page.
+
+        Parameters
+        ----------
+        status : str, optional
+            Task status to filter on server side, by default None to get all tasks
+        tasks_per_call : int, optional
+            Number of tasks to retrieve per API call, by default 100
+        pages_in_flight : int, optional
+            Maximum number of pages requested ahead, by default 4
+
+        Yields
+        ------
+        dict
+            Page of tasks - format {'data': [<tasks>], 'total': <total number of tasks>}
+        """
+        # Use executor shared by all scopes when available
+        if self.__executor is None:
+            executor_context = ThreadPoolExecutor(max_workers=pages_in_flight)
+        else:
+            executor_context = nullcontext(self.__executor)
+        with executor_context as executor:
+            futures_list = deque()
+            next_start = 0
+            try:
+                while True:
+                    while len(futures_list) < pages_in_flight:
+                        futures_list.append(
+                            executor.submit(self.__get_tasks_page, status=status, start=next_start, end=next_start + tasks_per_call)
+                        )
+                        next_start += tasks_per_call
+                    page = futures_list.popleft().result()
+                    yield page
+                    if len(page['data']) < tasks_per_call:
+                        return
+            finally:
+                for future in futures_list:
+                    future.cancel()
+
+    def __fact_tasks(self, filter: str = '.*', verbose: str = 'short', since_task_id: int = None, since_time: int = None):
+        """
+        __fact_tasks Collect facts related to tasks
+
+        Tasks are collected page by page. As Cloudvision returns newest tasks first, collection
+        stops at the first task older than since_task_id or since_time.
 
         Parameters
         ----------
         filter : str, optional
             Regular Expression to filter tasks - <task_id>,'Failed', 'Pending', 'Completed', 'Cancelled', by default '.*'
+        verbose : str, optional
+            Facts verbosity: full get all data from CV where short get only cv_modules data, by default 'short'
+        since_task_id : int, optional
+            Only collect tasks with an ID greater than this one, by default None
+        since_time : int, optional
+            Only collect tasks created after this Unix timestamp in seconds, by default None
         """
-        facts_builder = CvFactResource()
+        facts_builder = CvFactResource(stream=self.__stream)
         total_tasks = 0
-        if filter == '.*':
+        if isinstance(filter, int):
+            # filter by task_id
             try:
-                cv_tasks = self.__cv_client.api.get_tasks()
-                total_tasks = cv_tasks['total']
-                cv_tasks = cv_tasks['data']
+                cv_tasks = self.__cv_client.api.get_task_by_id(filter)
             except CvpApiError as error_msg:
-                MODULE_LOGGER.error('Error when collecting task facts: %s', str(error_msg))
+                MODULE_LOGGER.error('Error when collecting %s task facts: %s', filter, error_msg)
                 raise error_msg
-        elif isinstance(filter, str):
+            for task in cv_tasks:
+                MODULE_LOGGER.debug('Got following information for task: %s', task)
+                facts_builder.add(task if verbose == 'long' else CvFactResource.shorten_task_facts(task_fact=task))
+        else:
             # filter by task status
+            status = None if filter == '.*' else filter
+            since_time_ms = since_time * 1000 if since_time is not None else None
+            pages = self.__iter_tasks_pages(status=status)
             try:
-                cv_tasks = self.__cv_client.api.get_tasks_by_status(filter)
+                for page in pages:
+                    if status is None and since_task_id is None and since_time is None:
+                        total_tasks = page.get('total', total_tasks)
+                    watermark_reached = False
+                    for task in page['data']:
+                        if (since_task_id is not None and int(task[Api.generic.TASK_ID]) <= since_task_id) or \
+                                (since_time_ms is not None and task.get(Api.task.CREATED_DATE, 0) <= since_time_ms):
+                            watermark_reached = True
+                            continue
+                        MODULE_LOGGER.debug('Got following information for task: %s', task)
+                        # Project task as soon as page is parsed to release full task data
+                        facts_builder.add(task if verbose == 'long' else CvFactResource.shorten_task_facts(task_fact=task))
+                    if self.__stream is not None:
+                        facts_builder.get(resource_model='task', verbose='long')
+                    if watermark_reached:
+                        break
             except CvpApiError as error_msg:
-                MODULE_LOGGER.error('Error when collecting %s task facts: %s', filter, str(error_msg))
-                raise error_msg
-        elif isinstance(filter, int):
-            # filter by task_id
-            try:
-                cv_tasks = self.__cv_client.api.get_task_by_id(filter)
-            except CvpApiError as error_msg:
-                MODULE_LOGGER.error('Error when collecting %s task facts: %s', filter, str(error_msg))
+                if status is None:
+                    MODULE_LOGGER.error('Error when collecting task facts: %s', error_msg)
+                else:
+                    MODULE_LOGGER.error('Error when collecting %s task facts: %s', filter, error_msg)
                 raise error_msg
+            finally:
+                pages.close()
 
-        for task in cv_tasks:
-            MODULE_LOGGER.debug('Got following information for task: %s', str(task))
-            facts_builder.add(task)
-
-        final_result = facts_builder.get(resource_model='task', verbose=verbose)
+        # Tasks have already been projected if required
+        final_result = facts_builder.get(resource_model='task', verbose='long')
+        if final_result is None:
+            # Facts have been written to stream
+            return
 
         if not total_tasks:
             total_tasks = len(final_result)
@@ -749,7 +1066,7 @@ class CvFactsTools():
 
         MODULE_LOGGER.debug(
             'Final results for task: %s',
-            str(final_result)
+            final_result
         )
 
         self._facts[FactsResponseFields.TASK] = final_result
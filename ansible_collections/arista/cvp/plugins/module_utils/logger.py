@@ -9,10 +9,16 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import atexit
 import logging
-import uuid
+import logging.handlers
 import os
-from logging.handlers import RotatingFileHandler  # noqa # pylint: disable=unused-import
+import queue
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
 
 # Get Logging level from Environment variable / Default INFO
 
@@ -31,23 +37,156 @@ LOGLEVEL = LEVELS.get(LOGGING_LEVEL, logging.NOTSET)
 LOGGING_LEVEL_URLLIB3 = os.getenv('ANSIBLE_CVP_LOG_APICALL', 'error')
 LOGLEVEL_URLLIB3 = LEVELS.get(LOGGING_LEVEL_URLLIB3, logging.ERROR)
 
-# Get filename to write logs / default /temp/arista.cvp.debug-<uuid>.log
-DEFAULT_LOG_FILE = '/tmp/arista.cvp.debug.' + str(uuid.uuid4()) + '.log'
+# Process names of ansible CLI started by user, all module processes of a run are started under it
+ANSIBLE_COMMANDS = (b'ansible-playbook', b'ansible')
+
+
+def get_run_id():
+    """
+    get_run_id Build an ID shared by all module processes of an ansible-playbook run.
+
+    Process tree is walked up from parent process to the topmost ansible-playbook process, as
+    workers forked by ansible-playbook run the same command. ID is built from its PID and start
+    time so a reused PID does not share the file of a previous run. When /proc is not available,
+    for instance on macOS, session ID is used and the file is shared by all runs of the session.
+
+    Returns
+    -------
+    str
+        <pid>.<start time> of ansible-playbook process, session ID without /proc, parent PID when
+        no ansible-playbook process is found
+    """
+    if not os.path.isdir('/proc/self') and hasattr(os, 'getsid'):
+        return 'session{0}'.format(os.getsid(0))
+    run_id = str(os.getppid())
+    pid = os.getppid()
+    while pid > 1:
+        try:
+            with open('/proc/{0}/stat'.format(pid), 'rb') as stat_file:
+                # Process name may contain spaces, other fields start after its closing parenthesis
+                stat = stat_file.read().rsplit(b')', 1)[1].split()
+            with open('/proc/{0}/cmdline'.format(pid), 'rb') as cmdline_file:
+                cmdline = cmdline_file.read().split(b'\0')
+        except (OSError, IndexError):
+            break
+        # Command may be run by a python interpreter
+        if any(os.path.basename(arg) in ANSIBLE_COMMANDS for arg in cmdline[:2]):
+            # Fields 4 (ppid) and 22 (starttime) of proc(5), numbered from 3 after process name
+            run_id = '{0}.{1}'.format(pid, stat[19].decode())
+        pid = int(stat[1])
+    return run_id
+
+
+# Get filename to write logs / default /tmp/arista.cvp.debug.<run id>.log
+RUN_ID = os.getenv('ANSIBLE_CVP_LOG_RUN_ID') or get_run_id()
+DEFAULT_LOG_FILE = '/tmp/arista.cvp.debug.' + RUN_ID + '.log'
 LOGGING_FILENAME = os.getenv(
     'ANSIBLE_CVP_LOG_FILE', DEFAULT_LOG_FILE)
 
+# Log file is rotated when larger than LOG_MAX_BYTES, keeping LOG_BACKUP_COUNT previous files
+LOG_MAX_BYTES = 1000000
+LOG_BACKUP_COUNT = 5
+
+
+class SharedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    SharedRotatingFileHandler Rotating file handler for a log file shared by several module processes
+
+    Rollover is done by one process at a time under a lock file, and every process reopens the
+    log file once another one has rotated it, so no process keeps writing to a renamed file.
+    Without fcntl, rollover is not locked.
+    """
+
+    def __init__(self, filename, maxBytes=0, backupCount=0):
+        self.__file_id = None
+        super().__init__(filename, mode='a', maxBytes=maxBytes, backupCount=backupCount, delay=True)
+
+    def _open(self):
+        stream = super()._open()
+        file_stat = os.fstat(stream.fileno())
+        self.__file_id = (file_stat.st_dev, file_stat.st_ino)
+        return stream
+
+    def __is_rotated(self):
+        """Check if file opened by handler is no longer the one at log file path"""
+        try:
+            file_stat = os.stat(self.baseFilename)
+        except FileNotFoundError:
+            return True
+        return (file_stat.st_dev, file_stat.st_ino) != self.__file_id
+
+    def __reopen(self):
+        if self.stream is not None:
+            self.stream.close()
+        self.stream = self._open()
+
+    def emit(self, record):
+        if self.stream is not None and self.__is_rotated():
+            self.__reopen()
+        super().emit(record)
+
+    def doRollover(self):
+        if not HAS_FCNTL:
+            super().doRollover()
+            return
+        with open(self.baseFilename + '.lock', 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                # Another process may have rotated file while waiting for the lock
+                if self.__is_rotated():
+                    self.__reopen()
+                else:
+                    super().doRollover()
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+# Loggers used across the collection
+COLLECTION_LOGGERS = ['arista.cvp', 'ansible_collections.arista.cvp']
+
 # set a format which is simpler for console use
 formatter = logging.Formatter(
     '%(asctime)s - %(name)-12s: %(levelname)-s - func: %(funcName)-12s (L:%(lineno)-3d) - %(message)s')
 
-# set up ROOT handler to use logging with file rotation.
-handler = logging.handlers.RotatingFileHandler(
-    LOGGING_FILENAME, maxBytes=1000000, backupCount=5)
-handler.setFormatter(formatter)
-handler.setLevel(LOGLEVEL)
-# Unset default logging level for root handler
-logging.getLogger('').setLevel(logging.NOTSET)
-logging.getLogger('').addHandler(handler)
+
+def setup_logging():
+    """
+    setup_logging Attach collection logging to ROOT logger.
+
+    Records are pushed to a queue and written to the log file by a background listener,
+    so module code never waits on file I/O. Setup is done once per process.
+
+    Returns
+    -------
+    logging.handlers.QueueHandler
+        Handler attached to ROOT logger
+    """
+    root = logging.getLogger('')
+    for root_handler in root.handlers:
+        if getattr(root_handler, 'arista_cvp', False):
+            return root_handler
+    # File is shared by all module processes of a run and only created when first record is written
+    file_handler = SharedRotatingFileHandler(
+        LOGGING_FILENAME, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT)
+    file_handler.setFormatter(formatter)
+    file_handler.setLevel(LOGLEVEL)
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setLevel(LOGLEVEL)
+    queue_handler.arista_cvp = True
+    queue_handler.listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+    queue_handler.listener.start()
+    # flush pending records before module exits
+    atexit.register(queue_handler.listener.stop)
+    # Unset default logging level for root handler
+    root.setLevel(logging.NOTSET)
+    root.addHandler(queue_handler)
+    # Drop disabled records at logger level, before any record is built
+    for logger_name in COLLECTION_LOGGERS:
+        logging.getLogger(logger_name).setLevel(LOGLEVEL)
+    return queue_handler
+
+
+handler = setup_logging()
 
 # Configure URLLIB3 logging (default Warning to avoid too much verbosity)
 logging.getLogger("urllib3").setLevel(LOGLEVEL_URLLIB3)
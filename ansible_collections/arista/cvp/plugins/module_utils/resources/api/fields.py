@@ -107,13 +107,18 @@ class ApiConfiglet():
 # @dataclass
 class ApiMappers():
     """Keys specific to Configlets_Mappers resources"""
+    CONFIGLET_MAPPERS: str = 'configletMappers'
     OBJECT_ID: str = 'objectId'
+    ORDER: str = 'order'
+    TYPE: str = 'type'
 
 
 # @dataclass
 class ApiTask():
     """Keys specific to Task resources"""
     TASK_IDS: str = 'taskIds'
+    NETELEMENT_ID: str = 'netElementId'
+    CREATED_DATE: str = 'createdDateInLongFormat'
 
 
 # @dataclass
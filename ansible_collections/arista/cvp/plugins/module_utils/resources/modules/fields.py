@@ -47,9 +47,11 @@ class FactsResponseFields():
     CACHE_MAPPERS: str = 'configlets_mappers'
     CONFIGLET: str = 'cvp_configlets'
     CONTAINER: str = 'cvp_containers'
+    COUNTS: str = 'counts'
     DEVICE: str = 'cvp_devices'
     IMAGE_BUNDLE: str = 'cvp_image_bundle'
     IMAGE: str = 'cvp_images'
+    OUTPUT_FILE: str = 'output_file'
     TASK: str = 'cvp_tasks'
 
 
@@ -51,10 +51,14 @@ class CvApiResult():
     }
     """
 
+    __slots__ = ('__success', '__changed', '__taskIds', '__count', '__diff',
+                 '__list_changes', '__action_name', '__warnings', '__errors')
+
     def __init__(self, action_name: str):
         self.__success = False
         self.__changed = False
-        self.__taskIds = list()
+        # Ordered set of task IDs: dict keys keep insertion order and dedup in O(1)
+        self.__taskIds = dict()
         self.__count = 0
         self.__diff = None
         self.__list_changes = list()
@@ -252,7 +256,7 @@ class CvApiResult():
         list
             List of taskIds from Cloudvision
         """
-        return self.__taskIds
+        return list(self.__taskIds)
 
     @taskIds.setter
     def taskIds(self, tasks: list):
@@ -264,8 +268,7 @@ class CvApiResult():
         tasks : list
             List of TaskIds coming from Cloudvision
         """
-        self.__taskIds += tasks
-        self.__taskIds = list(set(self.__taskIds))
+        self.__taskIds.update(dict.fromkeys(tasks))
 
     @property
     def results(self):
@@ -287,7 +290,7 @@ class CvApiResult():
         result = {}
         result[FIELD_SUCCESS] = self.__success
         result[FIELD_CHANGED] = self.__changed
-        result[FIELD_TASKIDS] = self.__taskIds
+        result[FIELD_TASKIDS] = list(self.__taskIds)
         result[FIELD_DIFF] = self.__diff
         result[self.__action_name + FIELD_COUNT] = self.__count
         result[self.__action_name +
@@ -329,7 +332,7 @@ class CvManagerResult():
         self.__success = default_success
         self.__changed = False
         self.__counter: int = 0
-        self.__taskIds = list()
+        self.__taskIds = dict()
         self.__changes = dict()
         self.__diffs = dict()
         self.__changes[self.__name + FIELD_CHANGE_LIST] = list()
@@ -348,13 +351,14 @@ class CvManagerResult():
         change : CvApiResult
             Change to add to our manager
         """
-        MODULE_LOGGER.debug('receive add_change with %s', str(change.results))
+        if MODULE_LOGGER.isEnabledFor(logging.DEBUG):
+            MODULE_LOGGER.debug('receive add_change with %s', change.results)
         if change.success:
             if change.success:
                 self.__success = change.success
             if self.__changed is not True:
                 self.__changed = change.changed
-            self.__taskIds += change.taskIds
+            self.__taskIds.update(dict.fromkeys(change.taskIds))
             self.__counter += change.count
             self.__changes[self.__name + FIELD_CHANGE_LIST].append(change.name)
             if change.diff is not None:
@@ -424,7 +428,7 @@ class CvManagerResult():
         """
         self.__changes[FIELD_SUCCESS] = self.__success
         self.__changes[FIELD_CHANGED] = self.__changed
-        self.__changes[FIELD_TASKIDS] = self.__taskIds
+        self.__changes[FIELD_TASKIDS] = list(self.__taskIds)
         self.__changes[FIELD_DIFFS] = self.__diffs
         self.__changes[self.__name + FIELD_COUNT] = self.__counter
         return self.__changes
@@ -486,7 +490,7 @@ class CvAnsibleResponse():
         self.success = False
         self.changed = False
         self.data = dict()
-        self.taskIds = list()
+        self.__taskIds = dict()
 
     def add_manager(self, api_manager: CvManagerResult):
         """
@@ -497,14 +501,25 @@ class CvAnsibleResponse():
         api_manager : CvManagerResult
             Api Manager with information to display by Ansible
         """
-        self.data[api_manager.name] = api_manager.changes
+        manager_changes = api_manager.changes
+        self.data[api_manager.name] = manager_changes
         if api_manager.success:
             self.success = api_manager.success
         if self.changed is False:
             self.changed = api_manager.changed
-        for task in api_manager.changes[FIELD_TASKIDS]:
-            self.taskIds.append(task)
-        self.taskIds = list(set(self.taskIds))
+        self.__taskIds.update(dict.fromkeys(manager_changes[FIELD_TASKIDS]))
+
+    @property
+    def taskIds(self):
+        """
+        taskIds Get list of tasks collected from all registered managers
+
+        Returns
+        -------
+        list
+            List of unique taskIds in registration order
+        """
+        return list(self.__taskIds)
 
     @property
     def content(self):
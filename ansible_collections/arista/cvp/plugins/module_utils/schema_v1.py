@@ -182,6 +182,6 @@ def validate_cv_inputs(user_json, schema):
     try:
         jsonschema.validate(instance=user_json, schema=schema)
     except jsonschema.ValidationError as error_message:
-        LOGGER.error("Invalid inputs %s", str(error_message))
+        LOGGER.error("Invalid inputs %s", error_message)
         return False
     return True
@@ -16,7 +16,7 @@ import string
 from datetime import datetime
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.arista.cvp.plugins.module_utils.response import CvApiResult, CvManagerResult, CvAnsibleResponse
-from ansible_collections.arista.cvp.plugins.module_utils.resources.schemas import v3 as schema
+from ansible_collections.arista.cvp.plugins.module_utils.tools_metrics import record_cache_lookup
 from ansible_collections.arista.cvp.plugins.module_utils.tools_schema import validate_json_schema
 try:
     from cvprac.cvp_client_errors import CvpRequestError
@@ -31,7 +31,7 @@ MODULE_LOGGER.info('Start tag_tools module execution')
 
 
 class CvTagInput(object):
-    def __init__(self, tags: dict, schema=schema.SCHEMA_CV_TAG):
+    def __init__(self, tags: dict, schema="SCHEMA_CV_TAG"):
         self.__tag = tags
         self.__schema = schema
 
@@ -41,7 +41,7 @@ class CvTagInput(object):
         check_schemas Validate schemas for user's input
         """
         if not validate_json_schema(user_json=self.__tag, schema=self.__schema):
-            MODULE_LOGGER.error("Invalid tags input : \n%s", str(self.__tag))
+            MODULE_LOGGER.error("Invalid tags input : \n%s", self.__tag)
             return False
         return True
 
@@ -54,6 +54,8 @@ class CvTagTools(object):
     def __init__(self, cv_connection, ansible_module: AnsibleModule = None):
         self.__cv_client = cv_connection
         self.__ansible = ansible_module
+        # Serial numbers already resolved, a device is listed once per tag action
+        self.__serial_numbers = {}
 
     def get_serial_num(self, fqdn: str):
         """
@@ -69,11 +71,14 @@ class CvTagTools(object):
         str
             serial number of the switch
         """
+        record_cache_lookup(self.__cv_client, 'tag_tools.serial_numbers', hit=fqdn in self.__serial_numbers)
+        if fqdn in self.__serial_numbers:
+            return self.__serial_numbers[fqdn]
         device_details = self.__cv_client.api.get_device_by_name(fqdn)
+        if "serialNumber" not in device_details.keys():
+            device_details = self.__cv_client.api.get_device_by_name(fqdn, search_by_hostname=True)
         if "serialNumber" in device_details.keys():
-            return device_details["serialNumber"]
-        device_details = self.__cv_client.api.get_device_by_name(fqdn, search_by_hostname=True)
-        if "serialNumber" in device_details.keys():
+            self.__serial_numbers[fqdn] = device_details["serialNumber"]
             return device_details["serialNumber"]
         self.__ansible.fail_json(msg=f"Error, Device {fqdn} doesn't exists on CV. Check the hostname/fqdn")
 
@@ -8,18 +8,13 @@
 
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
+import importlib.util
 import logging
-try:
-    import difflib
-    HAS_DIFFLIB = True
-except ImportError:
-    HAS_DIFFLIB = False
-
-try:
-    import hashlib
-    HAS_HASHLIB = True
-except ImportError:
-    HAS_HASHLIB = False
+import re
+from functools import lru_cache
+# difflib and hashlib are only imported when a diff is computed
+HAS_DIFFLIB = importlib.util.find_spec('difflib') is not None
+HAS_HASHLIB = importlib.util.find_spec('hashlib') is not None
 
 
 LOGGER = logging.getLogger('arista.cvp.tools')
@@ -60,19 +55,21 @@ def compare(fromText, toText, fromName='', toName='', lines=10):
           '+ '    line unique to sequence 2
           '  '    line common to both sequences
           '? '    line not present in either input sequence
+        Unified diff is only computed when hash values are different.
     """
-    fromlines = str_cleanup_line_ending(content=fromText).splitlines(1)
-    tolines = str_cleanup_line_ending(content=toText).splitlines(1)
-    diff = list(difflib.unified_diff(
-        fromlines, tolines, fromName, toName, n=lines))
+    import hashlib
     # Calculate and compare hash values to produce the boolean.
     fromHash = hashlib.sha1(fromText.encode()).hexdigest()
     toHash = hashlib.sha1(toText.encode()).hexdigest()
     if fromHash == toHash:
-        cfglet_changed = False
-    else:
-        cfglet_changed = True
-    return [cfglet_changed, diff]
+        # Identical sequences have an empty diff
+        return [False, []]
+    import difflib
+    fromlines = str_cleanup_line_ending(content=fromText).splitlines(1)
+    tolines = str_cleanup_line_ending(content=toText).splitlines(1)
+    diff = list(difflib.unified_diff(
+        fromlines, tolines, fromName, toName, n=lines))
+    return [True, diff]
 
 
 def isIterable(testing_object=None):
@@ -94,6 +91,88 @@ def isIterable(testing_object=None):
         return False
 
 
+class MatchFilter():
+    """
+    MatchFilter Compiled version of a user defined filter
+
+    Filter is compiled once and then applied to any number of inputs:
+    - strict mode uses a set lookup for exact match.
+    - loose mode uses a single alternation regex for substring match.
+
+    EXAMPLE:
+    --------
+    >>> configlet_filter = MatchFilter(filter=['DC1', 'LEAF'])
+    >>> configlet_filter.match('DC1-SPINE-BASE')
+    True
+    """
+    def __init__(self, filter=None, filter_mode='loose'):
+        # W102 Workaround to avoid list as default value.
+        if filter is None:
+            LOGGER.critical(
+                'Filter is not set, configure default value to [\'all\']')
+            filter = ["all"]
+        self.filter = filter
+        self.filter_mode = filter_mode
+        self.match_all = "all" in filter
+        self._elements = frozenset(filter)
+        self._pattern = None
+        if filter_mode != "strict" and self._elements:
+            # Longest elements first, so prefix elements do not hide longer ones
+            self._pattern = re.compile("|".join(
+                re.escape(element) for element in sorted(self._elements, key=len, reverse=True)))
+
+    def match(self, input):
+        """
+        match Test if input matches filter
+
+        Parameters
+        ----------
+        input : string
+            Input to test of that match filter or not.
+
+        Returns
+        -------
+        bool
+            True if input matchs filter, False in other situation
+        """
+        if self.match_all:
+            return True
+        if self.filter_mode == "strict":
+            return input in self._elements
+        return self._pattern is not None and self._pattern.search(input) is not None
+
+
+@lru_cache(maxsize=128)
+def _get_match_filter(filter, filter_mode='loose'):
+    """
+    _get_match_filter Get compiled filter, built once per filter definition
+    """
+    return MatchFilter(filter=filter, filter_mode=filter_mode)
+
+
+def get_match_filter(filter, filter_mode='loose'):
+    """
+    get_match_filter Get a shared MatchFilter instance for a user defined filter
+
+    Parameters
+    ----------
+    filter : list
+        List of string to compare against input.
+    filter_mode : str, optional
+        Keyword to consider substring match or exact match
+
+    Returns
+    -------
+    MatchFilter
+        Compiled filter
+    """
+    if filter is None:
+        return MatchFilter(filter=filter, filter_mode=filter_mode)
+    if not isinstance(filter, str):
+        filter = tuple(filter)
+    return _get_match_filter(filter, filter_mode)
+
+
 def match_filter(input, filter, default_always='all', filter_mode='loose'):
     """
     Function to test if an object match userdefined filter.
@@ -101,6 +180,7 @@ def match_filter(input, filter, default_always='all', filter_mode='loose'):
     Function support list of string and string as filter.
     A default value is provided when calling function and if this default value for always matching is configured by user, then return True (Always matching)
     If filter is a list, then we iterate over the input and check if it matches an entry in the filter.
+    Filter is compiled once per filter definition, see MatchFilter.
 
     Parameters
     ----------
@@ -120,31 +200,14 @@ def match_filter(input, filter, default_always='all', filter_mode='loose'):
     bool
         True if input matchs filter, False in other situation
     """
+    LOGGER.debug(" * is_in_filter - filter is %s", filter)
+    LOGGER.debug(" * is_in_filter - input string is %s", input)
+    LOGGER.debug(" * is_in_filter - filter_mode is %s", filter_mode)
 
-    # W102 Workaround to avoid list as default value.
-    if filter is None:
-        LOGGER.critical(
-            'Filter is not set, configure default value to [\'all\']')
-        filter = ["all"]
-
-    LOGGER.debug(" * is_in_filter - filter is %s", str(filter))
-    LOGGER.debug(" * is_in_filter - input string is %s", str(input))
-    LOGGER.debug(" * is_in_filter - filter_mode is %s", str(filter_mode))
-
-    if "all" in filter:
+    if get_match_filter(filter=filter, filter_mode=filter_mode).match(input):
         return True
 
-    if filter_mode == "strict":
-        LOGGER.debug(" * is_in_filter - doing strict validation between %s and %s", str(input), str(filter))
-        for element in filter:
-            if element == input:
-                return True
-    else:
-        LOGGER.debug(" * is_in_filter - doing loose validation between %s and %s", str(input), str(filter))
-        if any(element in input for element in filter):
-            return True
-
-    LOGGER.debug(" * is_in_filter - NOT matched is %s", str(input))
+    LOGGER.debug(" * is_in_filter - NOT matched is %s", input)
     return False
 
 
@@ -190,8 +253,8 @@ def is_in_filter(hostname_filter=None, hostname="eos"):
     boolean
         True if device hostname is part of filter. False if not.
     """
-    LOGGER.debug(" * is_in_filter - filter is %s", str(hostname_filter))
-    LOGGER.debug(" * is_in_filter - hostname is %s", str(hostname))
+    LOGGER.debug(" * is_in_filter - filter is %s", hostname_filter)
+    LOGGER.debug(" * is_in_filter - hostname is %s", hostname)
 
     # W102 Workaround to avoid list as default value.
     if hostname_filter is None:
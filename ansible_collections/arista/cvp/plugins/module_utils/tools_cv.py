@@ -9,10 +9,14 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 import logging
+import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from ansible.module_utils.connection import Connection
+from ansible_collections.arista.cvp.plugins.module_utils.tools import get_match_filter
+from ansible_collections.arista.cvp.plugins.module_utils import tools_metrics
 try:
-    from cvprac.cvp_client import CvpClient
+    # cvprac.cvp_client pulls requests and urllib3, it is only imported to connect
     from cvprac.cvp_client_errors import CvpLoginError
     HAS_CVPRAC = True
 except ImportError:
@@ -21,6 +25,21 @@ except ImportError:
 
 LOGGER = logging.getLogger('arista.cvp.cv_tools')
 
+# Maximum number of concurrent API calls to get tasks
+MAX_WORKERS = 8
+# Polling of tasks not yet created on Cloudvision: first delay, maximum delay and total timeout in seconds
+TASK_POLL_DELAY = 0.5
+TASK_POLL_MAX_DELAY = 5
+TASK_POLL_TIMEOUT = 30
+
+
+def __getattr__(name):
+    # Expose CvpClient as a module attribute without importing it at module load
+    if name == 'CvpClient':
+        from cvprac.cvp_client import CvpClient
+        return CvpClient
+    raise AttributeError("module {} has no attribute {}".format(__name__, name))
+
 
 def cv_connect(module):
     """
@@ -38,6 +57,7 @@ def cv_connect(module):
     CvpClient
         Instanciated CvpClient with connection information.
     """
+    from cvprac.cvp_client import CvpClient
     client = CvpClient()
     LOGGER.info('Connecting to CVP')
     connection = Connection(module._socket_path)
@@ -72,9 +92,9 @@ def cv_connect(module):
     if user == 'svc_account':
         LOGGER.debug('  Connecting to a on-prem instance using service account token')
     LOGGER.debug('  Connecting to a CV instance: %s with timers %s %s',
-                 str(host),
-                 str(ansible_connect_timeout),
-                 str(ansible_command_timeout))
+                 host,
+                 ansible_connect_timeout,
+                 ansible_command_timeout)
     try:
         client.connect(nodes=[host],
                        username=user,
@@ -88,11 +108,15 @@ def cv_connect(module):
                        connect_timeout=ansible_connect_timeout
                        )
     except CvpLoginError as e:
-        LOGGER.error('Cannot connect to CVP: %s', str(e))
+        LOGGER.error('Cannot connect to CVP: %s', e)
         module.fail_json(msg=str(e))
 
     LOGGER.info('Connected to CVP')
 
+    if tools_metrics.METRICS_ENABLED:
+        LOGGER.info('API calls instrumentation is enabled')
+        tools_metrics.instrument_client(client)
+
     return client
 
 
@@ -122,6 +146,7 @@ def match_filter(input, filter, default_always='all'):
     Function support list of string and string as filter.
     A default value is provided when calling function and if this default value for always matching is configured by user, then return True (Always matching)
     If filter is a list, then we iterate over the input and check if it matches an entry in the filter.
+    Filter is compiled once per filter definition, see tools.MatchFilter.
 
     Parameters
     ----------
@@ -140,17 +165,10 @@ def match_filter(input, filter, default_always='all'):
         True if input matchs filter, False in other situation
     """
 
-    # W102 Workaround to avoid list as default value.
-    if filter is None:
-        LOGGER.critical('Filter is not set, configure default value to [\'all\']')
-        filter = ["all"]
-
-    LOGGER.debug(" * is_in_filter - filter is %s", str(filter))
-    LOGGER.debug(" * is_in_filter - input string is %s", str(input))
+    LOGGER.debug(" * is_in_filter - filter is %s", filter)
+    LOGGER.debug(" * is_in_filter - input string is %s", input)
 
-    if "all" in filter:
-        return True
-    elif any(element in input for element in filter):
+    if get_match_filter(filter=filter).match(input):
         return True
     LOGGER.debug(" * is_in_filter - NOT matched")
     return False
@@ -161,8 +179,8 @@ def cv_update_configlets_on_device(module, device_facts, add_configlets, del_con
     device_deletion = None
     device_addition = None
     # Initial Logging
-    LOGGER.debug(' * cv_update_configlets_on_device - add_configlets: %s', str(add_configlets))
-    LOGGER.debug(' * cv_update_configlets_on_device - del_configlets: %s', str(del_configlets))
+    LOGGER.debug(' * cv_update_configlets_on_device - add_configlets: %s', add_configlets)
+    LOGGER.debug(' * cv_update_configlets_on_device - del_configlets: %s', del_configlets)
     # Work on delete configlet scenario
     LOGGER.info(" * cv_update_configlets_on_device - start device deletion process")
     if len(del_configlets) > 0:
@@ -176,12 +194,12 @@ def cv_update_configlets_on_device(module, device_facts, add_configlets, del_con
             response = device_deletion
         except Exception as error:
             errorMessage = str(error)
-            LOGGER.error('OK, something wrong happens, raise an exception: %s', str(errorMessage))
-        LOGGER.info(" * cv_update_configlets_on_device - device_deletion result: %s", str(device_deletion))
+            LOGGER.error('OK, something wrong happens, raise an exception: %s', errorMessage)
+        LOGGER.info(" * cv_update_configlets_on_device - device_deletion result: %s", device_deletion)
     # Work on Add configlet scenario
     LOGGER.debug(" * cv_update_configlets_on_device - start device addition process")
     if len(add_configlets) > 0:
-        LOGGER.debug(' * cv_update_configlets_on_device - ADD configlets: %s', str(add_configlets))
+        LOGGER.debug(' * cv_update_configlets_on_device - ADD configlets: %s', add_configlets)
         try:
             device_addition = module.client.api.apply_configlets_to_device(
                 app_name="Ansible",
@@ -192,7 +210,93 @@ def cv_update_configlets_on_device(module, device_facts, add_configlets, del_con
             response.update(device_addition)
         except Exception as error:
             errorMessage = str(error)
-            LOGGER.error('OK, something wrong happens, raise an exception: %s', str(errorMessage))
-        LOGGER.info(" * cv_update_configlets_on_device - device_addition result: %s", str(device_addition))
-    LOGGER.info(" * cv_update_configlets_on_device - final result: %s", str(response))
+            LOGGER.error('OK, something wrong happens, raise an exception: %s', errorMessage)
+        LOGGER.info(" * cv_update_configlets_on_device - device_addition result: %s", device_addition)
+    LOGGER.info(" * cv_update_configlets_on_device - final result: %s", response)
     return response
+
+
+def cv_get_tasks(module, task_ids, max_workers=MAX_WORKERS, timeout=TASK_POLL_TIMEOUT):
+    """
+    cv_get_tasks Get details of a list of tasks from Cloudvision
+
+    Task IDs are deduplicated and details are fetched concurrently. Tasks not yet created on Cloudvision
+    are polled again, all together, with an exponential backoff until timeout.
+
+    Example
+    -------
+    >>> cv_get_tasks(module=module, task_ids=['12', '13', '12'])
+    [
+        {'workOrderId': '12', 'workOrderUserDefinedStatus': 'Pending', ...},
+        {'workOrderId': '13', 'workOrderUserDefinedStatus': 'Pending', ...}
+    ]
+
+    Parameters
+    ----------
+    module : AnsibleModule
+        Ansible module with cvprac client
+    task_ids : list
+        List of task IDs, can contain nested lists of task IDs
+    max_workers : int, optional
+        Maximum number of concurrent API calls, by default MAX_WORKERS
+    timeout : int, optional
+        Time in seconds to wait for tasks not yet created, by default TASK_POLL_TIMEOUT
+
+    Returns
+    -------
+    list
+        Task details in order of first appearance of their ID, tasks not found are skipped
+    """
+    return get_tasks_by_id(cv_client=module.client, task_ids=task_ids, max_workers=max_workers, timeout=timeout)
+
+
+def get_tasks_by_id(cv_client, task_ids, max_workers=MAX_WORKERS, timeout=TASK_POLL_TIMEOUT):
+    """
+    get_tasks_by_id Get details of a list of tasks from Cloudvision with a cvprac client
+
+    Same as cv_get_tasks() for callers which have a cvprac client but no Ansible module.
+
+    Parameters
+    ----------
+    cv_client : CvpClient
+        cvprac client connected to Cloudvision
+    task_ids : list
+        List of task IDs, can contain nested lists of task IDs
+    max_workers : int, optional
+        Maximum number of concurrent API calls, by default MAX_WORKERS
+    timeout : int, optional
+        Time in seconds to wait for tasks not yet created, by default TASK_POLL_TIMEOUT
+
+    Returns
+    -------
+    list
+        Task details in order of first appearance of their ID, tasks not found are skipped
+    """
+    unique_ids = list(dict.fromkeys(str(task_id) for task_id in _flatten_task_ids(task_ids)))
+    tasks = dict()
+    pending = unique_ids
+    delay = TASK_POLL_DELAY
+    deadline = time.monotonic() + timeout
+    if pending:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+            while True:
+                for task_id, task in zip(pending, executor.map(cv_client.api.get_task_by_id, pending)):
+                    if task:
+                        tasks[task_id] = task
+                pending = [task_id for task_id in pending if task_id not in tasks]
+                if not pending or time.monotonic() + delay > deadline:
+                    break
+                LOGGER.debug(' * cv_get_tasks - waiting %ss for tasks %s', delay, pending)
+                time.sleep(delay)
+                delay = min(delay * 2, TASK_POLL_MAX_DELAY)
+    if pending:
+        LOGGER.warning(' * cv_get_tasks - tasks not found on Cloudvision: %s', pending)
+    return [tasks[task_id] for task_id in unique_ids if task_id in tasks]
+
+
+def _flatten_task_ids(task_ids):
+    for task_id in task_ids:
+        if isinstance(task_id, (list, tuple, set)):
+            yield from _flatten_task_ids(task_id)
+        else:
+            yield task_id
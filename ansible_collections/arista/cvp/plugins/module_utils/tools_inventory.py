@@ -34,7 +34,7 @@ def find_hostname_by_mac(inventory, mac_address):
     for device in inventory:
         if 'systemMacAddress' in device:
             if device['systemMacAddress'] == mac_address:
-                MODULE_LOGGER.debug('device data: %s', str(device))
+                MODULE_LOGGER.debug('device data: %s', device)
                 if 'name' in device:
                     return device['name']
                 elif 'hostname' in device:
@@ -63,3 +63,207 @@ def find_containerName_by_containerId(containers_list, container_id):
             if container['Key'] == container_id:
                 return container['Name']
     return None
+
+
+def build_hostname_index(inventory):
+    """
+    Function to build a System Mac Address to device hostname index.
+
+    Index gives same result as find_hostname_by_mac for every Mac address
+    and is built with a single pass on inventory.
+
+    Parameters
+    ----------
+    inventory : list
+        Inventory list extracted from CVP.
+
+    Returns
+    -------
+    dict
+        Device hostname per System Mac Address.
+    """
+    index = {}
+    for device in inventory:
+        if 'systemMacAddress' in device and device['systemMacAddress'] not in index:
+            if 'name' in device:
+                index[device['systemMacAddress']] = device['name']
+            elif 'hostname' in device:
+                index[device['systemMacAddress']] = device['hostname']
+    return index
+
+
+def build_containerName_index(containers_list):
+    """
+    Function to build a container ID to container name index.
+
+    Index gives same result as find_containerName_by_containerId for every container ID
+    and is built with a single pass on containers list.
+
+    Parameters
+    ----------
+    containers_list : list
+        Containers list extracted from CVP.
+
+    Returns
+    -------
+    dict
+        Container name per container ID.
+    """
+    index = {}
+    for container in containers_list:
+        if 'Key' in container:
+            index.setdefault(container['Key'], container['Name'])
+    return index
+
+
+class CvFactsIndex():
+    """
+    CvFactsIndex Read only view of cv_facts with lookups by name.
+
+    Each index is built with a single pass on facts the first time it is used, then shared
+    by all helpers of a module execution. When a name is listed more than once in facts,
+    first entry is indexed, same as a linear search. Raw facts lists are still available
+    with facts_index['devices'], so a view can be used in place of cv_facts.
+
+    Example
+    -------
+    >>> facts_index = CvFactsIndex(facts=module.params['cvp_facts'])
+    >>> facts_index.devices['leaf1']['systemMacAddress']
+    '50:00:00:00:00:01'
+    >>> facts_index.configlets['leaf1-base']['key']
+    'configlet_0123'
+    """
+
+    def __init__(self, facts: dict = None):
+        self.__facts = facts if facts is not None else {}
+        self.__indexes = {}
+
+    def __getitem__(self, facts_type: str):
+        return self.__facts[facts_type]
+
+    def __contains__(self, facts_type: str):
+        return facts_type in self.__facts
+
+    def get(self, facts_type: str, default=None):
+        """
+        get Get raw facts list
+
+        Parameters
+        ----------
+        facts_type : str
+            Type of facts: devices, configlets, containers...
+        default : any, optional
+            Value if facts type is not available, by default None
+
+        Returns
+        -------
+        list
+            Facts as provided by cv_facts
+        """
+        return self.__facts.get(facts_type, default)
+
+    def __index(self, facts_type: str, *fields):
+        if facts_type not in self.__indexes:
+            index = {}
+            for entry in self.__facts.get(facts_type, []):
+                name = next((entry[field] for field in fields if field in entry), None)
+                if name is not None:
+                    index.setdefault(name, entry)
+            self.__indexes[facts_type] = index
+        return self.__indexes[facts_type]
+
+    @property
+    def devices(self):
+        """
+        devices Devices facts per hostname
+
+        Returns
+        -------
+        dict
+            Device facts indexed by hostname
+        """
+        return self.__index('devices', 'hostname')
+
+    @property
+    def configlets(self):
+        """
+        configlets Configlets facts per name
+
+        Returns
+        -------
+        dict
+            Configlet facts indexed by name
+        """
+        return self.__index('configlets', 'name')
+
+    @property
+    def containers(self):
+        """
+        containers Containers facts per name
+
+        Returns
+        -------
+        dict
+            Container facts indexed by name
+        """
+        return self.__index('containers', 'name', 'Name')
+
+    @property
+    def container_devices(self):
+        """
+        container_devices Devices facts per parent container name
+
+        Returns
+        -------
+        dict
+            List of device facts indexed by name of their parent container
+        """
+        if 'container_devices' not in self.__indexes:
+            index = {}
+            for device in self.__facts.get('devices', []):
+                if 'parentContainerName' in device:
+                    index.setdefault(device['parentContainerName'], []).append(device)
+            self.__indexes['container_devices'] = index
+        return self.__indexes['container_devices']
+
+
+def as_facts_index(facts):
+    """
+    Function to get indexed view of cv_facts, facts can already be a view.
+
+    Parameters
+    ----------
+    facts : CvFactsIndex or dict
+        Indexed view of cv_facts or dictionary from cv_facts
+
+    Returns
+    -------
+    CvFactsIndex
+        Indexed view of facts
+    """
+    if isinstance(facts, CvFactsIndex):
+        return facts
+    return CvFactsIndex(facts=facts)
+
+
+def get_facts_index(module):
+    """
+    Function to get indexed view of cv_facts provided to a module.
+
+    Index is created on first call and attached to module for next calls.
+
+    Parameters
+    ----------
+    module : AnsibleModule
+        Ansible module with cvp_facts parameter.
+
+    Returns
+    -------
+    CvFactsIndex
+        Indexed view of module.params['cvp_facts']
+    """
+    facts_index = getattr(module, 'cvp_facts_index', None)
+    if not isinstance(facts_index, CvFactsIndex):
+        facts_index = CvFactsIndex(facts=module.params.get('cvp_facts'))
+        module.cvp_facts_index = facts_index
+    return facts_index
@@ -0,0 +1,395 @@
+#!/usr/bin/env python
+# Copyright (c) 2023 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+# coding: utf-8 -*-
+#
+
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import functools
+import json
+import logging
+import os
+import threading
+import time
+
+LOGGER = logging.getLogger('arista.cvp.tools_metrics')
+
+# Opt-in instrumentation of cvprac API calls
+METRICS_FILE = os.getenv('ANSIBLE_CVP_METRICS_FILE')
+METRICS_ENABLED = os.getenv('ANSIBLE_CVP_METRICS', 'false').lower() in ['true', 'yes', '1'] or bool(METRICS_FILE)
+
+FIELD_METRICS = 'metrics'
+
+
+class CvApiMetrics():
+    """
+    CvApiMetrics Recorder for cvprac API calls and cache lookups.
+
+    Every API call is recorded with its name, latency, number of HTTP requests, size of HTTP responses
+    received, number of HTTP retries and error if any. Recorder is thread safe.
+
+    Example
+    -------
+    >>> metrics = CvApiMetrics()
+    >>> metrics.add_call(name='get_inventory', latency=0.12, payload_size=2048)
+    >>> metrics.add_cache_lookup(name='containers_index', hit=True)
+    >>> metrics.summary
+    {
+        "total_calls": 1,
+        "total_time": 0.12,
+        "api": {
+            "get_inventory": {"calls": 1, "total_time": 0.12, "max_time": 0.12, "requests": 0, "payload_size": 2048, "retries": 0, "errors": 0}
+        },
+        "cache": {
+            "containers_index": {"hit": 1, "miss": 0}
+        }
+    }
+    """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__calls = []
+        self.__cache = {}
+        self.__local = threading.local()
+
+    @property
+    def calls(self):
+        """
+        calls List of recorded API calls
+
+        Returns
+        -------
+        list
+            One dict per API call in execution order
+        """
+        return list(self.__calls)
+
+    @property
+    def current_call(self):
+        """
+        current_call Counters of API call in progress in current thread
+
+        Returns
+        -------
+        dict
+            Counters of running API call, None if no call in progress
+        """
+        return getattr(self.__local, 'call', None)
+
+    @current_call.setter
+    def current_call(self, call: dict):
+        self.__local.call = call
+
+    def add_call(self, name: str, latency: float, requests: int = 0, payload_size: int = 0, retries: int = 0, error: str = None):
+        """
+        add_call Record an API call
+
+        Parameters
+        ----------
+        name : str
+            Name of cvprac API method
+        latency : float
+            Duration of API call in seconds
+        requests : int, optional
+            Number of HTTP requests sent by the call, by default 0
+        payload_size : int, optional
+            Size in bytes of HTTP responses, by default 0
+        retries : int, optional
+            Number of HTTP requests sent again, by default 0
+        error : str, optional
+            Exception raised by API call, by default None
+        """
+        with self.__lock:
+            self.__calls.append({
+                'name': name,
+                'start': time.time() - latency,
+                'latency': latency,
+                'requests': requests,
+                'payload_size': payload_size,
+                'retries': retries,
+                'error': error,
+            })
+
+    def add_cache_lookup(self, name: str, hit: bool):
+        """
+        add_cache_lookup Record a cache hit or miss
+
+        Parameters
+        ----------
+        name : str
+            Name of the cache
+        hit : bool
+            True if data was served from cache
+        """
+        with self.__lock:
+            counters = self.__cache.setdefault(name, {'hit': 0, 'miss': 0})
+            counters['hit' if hit else 'miss'] += 1
+
+    @property
+    def summary(self):
+        """
+        summary Aggregated view of recorded metrics per API call and per cache
+
+        Returns
+        -------
+        dict
+            Metrics aggregated by API call name, sorted by total time
+        """
+        api = {}
+        with self.__lock:
+            for call in self.__calls:
+                counters = api.setdefault(call['name'], {'calls': 0, 'total_time': 0.0, 'max_time': 0.0, 'requests': 0,
+                                                         'payload_size': 0, 'retries': 0, 'errors': 0})
+                counters['calls'] += 1
+                counters['total_time'] += call['latency']
+                counters['max_time'] = max(counters['max_time'], call['latency'])
+                counters['requests'] += call['requests']
+                counters['payload_size'] += call['payload_size']
+                counters['retries'] += call['retries']
+                counters['errors'] += 1 if call['error'] else 0
+            cache = {name: dict(counters) for name, counters in self.__cache.items()}
+            total_calls = len(self.__calls)
+        for counters in api.values():
+            counters['total_time'] = round(counters['total_time'], 6)
+            counters['max_time'] = round(counters['max_time'], 6)
+        return {
+            'total_calls': total_calls,
+            'total_time': round(sum(counters['total_time'] for counters in api.values()), 6),
+            'api': dict(sorted(api.items(), key=lambda item: item[1]['total_time'], reverse=True)),
+            'cache': cache,
+        }
+
+    def dump(self, path: str, name: str = None):
+        """
+        dump Append summary and all recorded calls to a JSON lines file
+
+        One line is added per module execution so a file can collect a whole playbook run.
+
+        Parameters
+        ----------
+        path : str
+            Path of JSON lines file
+        name : str, optional
+            Name of the module reporting metrics, by default None
+        """
+        with open(path, 'a', encoding='utf8') as metrics_file:
+            metrics_file.write(json.dumps({'module': name, 'summary': self.summary, 'calls': self.calls}) + '\n')
+        LOGGER.info('API metrics saved to %s', path)
+
+
+class InstrumentedApi():
+    """
+    InstrumentedApi Proxy in front of a cvprac CvpApi instance to record every method call.
+    """
+
+    def __init__(self, api, metrics: CvApiMetrics):
+        self.__api = api
+        self.__metrics = metrics
+        self.__wrappers = {}
+
+    def __getattr__(self, name):
+        attribute = getattr(self.__api, name)
+        if name.startswith('_') or not callable(attribute):
+            return attribute
+        wrapper = self.__wrappers.get(name)
+        if wrapper is None:
+            wrapper = self.__wrappers[name] = self.__wrap(name, attribute)
+        return wrapper
+
+    def __wrap(self, name, method):
+        metrics = self.__metrics
+
+        @functools.wraps(method)
+        def instrumented(*args, **kwargs):
+            parent_call = metrics.current_call
+            call = {'requests': 0, 'attempts': 0, 'payload_size': 0, 'retries': 0}
+            metrics.current_call = call
+            error = None
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            except Exception as exception:
+                error = type(exception).__name__
+                raise
+            finally:
+                latency = time.perf_counter() - start
+                metrics.current_call = parent_call
+                if parent_call is None:
+                    metrics.add_call(name=name, latency=latency, requests=call['requests'],
+                                     payload_size=call['payload_size'], retries=call['retries'], error=error)
+                else:
+                    # Nested calls (an API method calling another one) are accounted in outer call only
+                    for counter in call:
+                        parent_call[counter] += call[counter]
+        return instrumented
+
+
+def instrument_client(client, metrics: CvApiMetrics = None):
+    """
+    instrument_client Enable API call instrumentation on a CvpClient instance
+
+    client.api is replaced by an InstrumentedApi proxy, and HTTP layer of client is wrapped
+    to count requests sent and bytes received for each API call. A request sent to more than one
+    CloudVision node, or sent again after a session reset, counts as retried.
+
+    HTTP layer relies on private methods of cvprac client. When one of them is missing, a warning is
+    logged and related counters stay at 0 while call names and latencies are still recorded.
+
+    Parameters
+    ----------
+    client : CvpClient
+        Connected cvprac client
+    metrics : CvApiMetrics, optional
+        Recorder to use, by default a new one
+
+    Returns
+    -------
+    CvApiMetrics
+        Recorder attached to client as client.metrics
+    """
+    if metrics is None:
+        metrics = CvApiMetrics()
+
+    def instrument_make_request(make_request):
+        @functools.wraps(make_request)
+        def instrumented_make_request(*args, **kwargs):
+            call = metrics.current_call
+            if call is None:
+                return make_request(*args, **kwargs)
+            call['requests'] += 1
+            attempts = call['attempts']
+            try:
+                return make_request(*args, **kwargs)
+            finally:
+                # one attempt per CloudVision node tried
+                call['retries'] += max(call['attempts'] - attempts - 1, 0)
+        return instrumented_make_request
+
+    def instrument_send_request(send_request):
+        @functools.wraps(send_request)
+        def instrumented_send_request(*args, **kwargs):
+            call = metrics.current_call
+            if call is not None:
+                call['attempts'] += 1
+            response = send_request(*args, **kwargs)
+            if call is not None:
+                call['payload_size'] += len(getattr(response, 'content', b'') or b'')
+            return response
+        return instrumented_send_request
+
+    def instrument_reset_session(reset_session):
+        @functools.wraps(reset_session)
+        def instrumented_reset_session(*args, **kwargs):
+            call = metrics.current_call
+            if call is not None:
+                call['retries'] += 1
+            return reset_session(*args, **kwargs)
+        return instrumented_reset_session
+
+    for name, instrument in [('_make_request', instrument_make_request),
+                             ('_send_request', instrument_send_request),
+                             ('_reset_session', instrument_reset_session)]:
+        method = getattr(client, name, None)
+        if not callable(method):
+            LOGGER.warning('cvprac client has no %s method, related HTTP counters are not collected', name)
+            continue
+        setattr(client, name, instrument(method))
+    client.api = InstrumentedApi(client.api, metrics)
+    client.metrics = metrics
+    return metrics
+
+
+def get_metrics(client):
+    """
+    get_metrics Get recorder attached to a client
+
+    Parameters
+    ----------
+    client : CvpClient
+        cvprac client
+
+    Returns
+    -------
+    CvApiMetrics
+        Recorder if client is instrumented, None otherwise
+    """
+    metrics = getattr(client, 'metrics', None)
+    return metrics if isinstance(metrics, CvApiMetrics) else None
+
+
+def record_cache_lookup(client, name: str, hit: bool):
+    """
+    record_cache_lookup Record a cache lookup if client is instrumented
+
+    Parameters
+    ----------
+    client : CvpClient
+        cvprac client
+    name : str
+        Name of the cache
+    hit : bool
+        True if data was served from cache
+    """
+    metrics = get_metrics(client)
+    if metrics is not None:
+        metrics.add_cache_lookup(name=name, hit=hit)
+
+
+def call_cached(client, name: str, method, *args, **kwargs):
+    """
+    call_cached Call a method decorated with lru_cache and record a cache lookup if client is instrumented
+
+    Parameters
+    ----------
+    client : CvpClient
+        cvprac client
+    name : str
+        Name of the cache
+    method : functools._lru_cache_wrapper
+        Cached method to call
+    *args, **kwargs
+        Arguments of method
+
+    Returns
+    -------
+    Any
+        Result of method
+    """
+    metrics = get_metrics(client)
+    if metrics is None:
+        return method(*args, **kwargs)
+    hits = method.cache_info().hits
+    result = method(*args, **kwargs)
+    metrics.add_cache_lookup(name=name, hit=method.cache_info().hits > hits)
+    return result
+
+
+def metrics_result(client, name: str = None):
+    """
+    metrics_result Build metrics block of module output and save metrics file if configured
+
+    Parameters
+    ----------
+    client : CvpClient
+        cvprac client
+    name : str, optional
+        Name of the module reporting metrics, by default None
+
+    Returns
+    -------
+    dict
+        {'metrics': summary} if client is instrumented, empty dict otherwise
+    """
+    metrics = get_metrics(client)
+    if metrics is None:
+        return {}
+    if METRICS_FILE:
+        try:
+            metrics.dump(METRICS_FILE, name=name)
+        except OSError as error:
+            LOGGER.error('Cannot save API metrics to %s: %s', METRICS_FILE, error)
+    return {FIELD_METRICS: metrics.summary}
@@ -12,38 +12,144 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import importlib.util
 import logging
-try:
-    import jsonschema
-    HAS_JSONSCHEMA = True
-except ImportError:
-    HAS_JSONSCHEMA = False
+
+# jsonschema and schema definitions are only imported on first validation
+HAS_JSONSCHEMA = importlib.util.find_spec('jsonschema') is not None
 
 
 LOGGER = logging.getLogger(__name__)
 
+# Validators already built for a schema, keyed by schema identity.
+# Each entry keeps a reference to its schema so an id() cannot be reused.
+_VALIDATORS = {}
+
+# Keywords of an array schema which do not need the list of entries to be checked
+_ENVELOPE_NOT_CHECKED = {"$schema", "$id", "id", "$comment", "title", "description", "default", "examples", "definitions", "$defs", "type"}
+
+
+def load_schema(schema):
+    """
+    load_schema Resolve a schema name to its definition.
+
+    Parameters
+    ----------
+    schema : str or dict
+        Name of a schema defined in resources.schemas.v3 or schema itself
+
+    Returns
+    -------
+    dict
+        JSON Schema
+    """
+    if isinstance(schema, str):
+        # Static import so AnsiballZ bundles schema definitions with the module
+        from ansible_collections.arista.cvp.plugins.module_utils.resources.schemas import v3
+        return getattr(v3, schema)
+    return schema
+
+
+def get_validator(schema: dict, validator_class=None):
+    """
+    get_validator Get a compiled validator for a JSON schema.
+
+    Validator class is selected from the $schema keyword of the schema and
+    the schema itself is checked against its metaschema only once.
+
+    Parameters
+    ----------
+    schema : dict
+        JSON Schema to compile
+    validator_class : type, optional
+        Validator class to use instead of the one declared by $schema, by default None
+
+    Returns
+    -------
+    jsonschema.protocols.Validator
+        Validator instance bound to schema
+    """
+    cached = _VALIDATORS.get(id(schema))
+    if cached is not None and cached[0] is schema:
+        return cached[1]
+    if validator_class is None:
+        from jsonschema.validators import validator_for
+        validator_class = validator_for(schema)
+        validator_class.check_schema(schema)
+    validator = validator_class(schema)
+    _VALIDATORS[id(schema)] = (schema, validator)
+    return validator
+
+
+def iter_json_schema_errors(user_json, schema: dict, per_item: bool = False):
+    """
+    iter_json_schema_errors Lazily generate all validation errors of user_json.
+
+    With per_item, entries of an array are validated one by one against the "items" schema
+    as they are consumed, so user_json can be any iterable like a generator of devices.
+    Entries are only kept when the array schema has array level keywords like minItems or
+    uniqueItems, these keywords are checked once all entries have been seen.
+    References in the "items" schema are resolved against the root schema.
+
+    Parameters
+    ----------
+    user_json : Any
+        JSON to validate
+    schema : str or dict
+        JSON Schema or name of a schema from resources.schemas.v3 to use to validate JSON
+    per_item : bool, optional
+        Validate entries of an array one at a time, by default False
+
+    Yields
+    ------
+    jsonschema.ValidationError
+        Validation error
+    """
+    schema = load_schema(schema)
+    validator = get_validator(schema)
+    if not per_item or schema.get("type") != "array" or not isinstance(schema.get("items"), dict):
+        yield from validator.iter_errors(user_json)
+        return
+    # Item schema has no $schema keyword, it must use the draft and references of its root schema
+    if hasattr(validator, "evolve"):
+        item_validator = validator.evolve(schema=schema["items"])
+    else:
+        item_validator = type(validator)(schema["items"], resolver=validator.resolver)
+    envelope = {key: value for key, value in schema.items() if key != "items"}
+    entries = [] if envelope.keys() - _ENVELOPE_NOT_CHECKED else None
+    for index, item in enumerate(user_json):
+        if entries is not None:
+            entries.append(item)
+        for error in item_validator.iter_errors(item):
+            error.path.appendleft(index)
+            yield error
+    if entries is not None:
+        yield from type(validator)(envelope).iter_errors(entries)
+
 
-def validate_json_schema(user_json: dict, schema):
+def validate_json_schema(user_json: dict, schema, per_item: bool = False):
     """
     validate_cv_inputs JSON SCHEMA Validation.
 
     Run a JSON validation against a muser's defined JSONSCHEMA.
+    All errors are collected and logged in one pass.
 
     Parameters
     ----------
     user_json : dict
         JSON to validate
-    schema : jsonschema
-        JSON Schema to use to validate JSON
+    schema : str or dict
+        JSON Schema or name of a schema from resources.schemas.v3 to use to validate JSON
+    per_item : bool, optional
+        Validate entries of an array one at a time, by default False
 
     Returns
     -------
     boolean
         True if valid, False if not.
     """
-    try:
-        jsonschema.validate(instance=user_json, schema=schema)
-    except jsonschema.ValidationError as error_message:
-        LOGGER.error("Invalid inputs %s", str(error_message))
-        return False
-    return True
+    is_valid = True
+    for error in iter_json_schema_errors(user_json=user_json, schema=schema, per_item=per_item):
+        LOGGER.error("Invalid inputs at %s: %s", "/".join(str(path) for path in error.absolute_path), error.message)
+        is_valid = False
+    return is_valid
@@ -3,22 +3,15 @@
 # Use of this source code is governed by the Apache License 2.0
 # that can be found in the LICENSE file.
 # coding: utf-8 -*-
-# pylint: disable=bare-except
 #
 
 
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 import logging
-import traceback
 import json
+from collections import deque
 from ansible.module_utils.six import string_types
-try:
-    from treelib import Tree
-    HAS_TREELIB = True
-except ImportError:
-    HAS_TREELIB = False
-    TREELIB_IMP_ERR = traceback.format_exc()
 
 
 LOGGER = logging.getLogger('arista.cvp.tree')
@@ -28,6 +21,149 @@ LOGGER = logging.getLogger('arista.cvp.tree')
 BUILTIN_CONTAINERS = ['Undefined', 'root']
 
 
+class ContainerTree():
+    """
+    ContainerTree Tree of containers built from parent/child adjacency maps
+
+    Tree only contains nodes attached to root. Children of a node are kept sorted by name,
+    so traversal order is stable whatever the order of input data.
+
+    Example:
+    --------
+        >>> tree = ContainerTree.from_parents(parents={'Fabric': 'Tenant', 'Leaves': 'Fabric', 'Spines': 'Fabric'})
+        >>> tree.traverse()
+        ['Tenant', 'Fabric', 'Leaves', 'Spines']
+        >>> tree.to_dict()
+        {'Tenant': {'children': [{'Fabric': {'children': ['Leaves', 'Spines']}}]}}
+    """
+
+    def __init__(self, root='Tenant'):
+        self.root = root
+        self.parents = {root: None}
+        self.children = {root: []}
+
+    @classmethod
+    def from_parents(cls, parents, root='Tenant'):
+        """
+        from_parents Build a tree from a mapping of container name to parent container name
+
+        Containers not attached to root, directly or through their parents, are ignored.
+
+        Parameters
+        ----------
+        parents : dict
+            Parent container name per container name
+        root : str, optional
+            Name of container to consider as root for topology, by default Tenant
+
+        Returns
+        -------
+        ContainerTree
+            Tree of containers
+        """
+        tree = cls(root=root)
+        # Adjacency map of all known containers
+        children = {}
+        for name, parent in parents.items():
+            if name != root and parent is not None:
+                children.setdefault(parent, []).append(name)
+        # Breadth-first walk from root: each container is visited once
+        queue = deque([root])
+        while queue:
+            parent = queue.popleft()
+            for name in sorted(children.get(parent, [])):
+                if name not in tree.parents:
+                    tree.parents[name] = parent
+                    tree.children[name] = []
+                    tree.children[parent].append(name)
+                    queue.append(name)
+        if len(tree.parents) < len(parents) + (0 if root in parents else 1):
+            LOGGER.warning('Containers not attached to %s are ignored: %s',
+                           str(root), str([name for name in parents if name not in tree.parents]))
+        return tree
+
+    def __contains__(self, name):
+        return name in self.parents
+
+    def __len__(self):
+        return len(self.parents)
+
+    def __str__(self):
+        return str(self.to_dict())
+
+    def traverse(self, node=None):
+        """
+        traverse Ordered list of containers: every container is listed after its parent
+
+        Parameters
+        ----------
+        node : str, optional
+            Name of the container to start from, by default root
+
+        Returns
+        -------
+        list
+            Ordered list of containers
+        """
+        node = self.root if node is None else node
+        result = []
+        stack = [node]
+        while stack:
+            name = stack.pop()
+            result.append(name)
+            stack.extend(reversed(self.children[name]))
+        return result
+
+    def subtree(self, node):
+        """
+        subtree Extract tree of containers under a given container
+
+        Parameters
+        ----------
+        node : str
+            Name of the container to use as root of the subtree
+
+        Returns
+        -------
+        ContainerTree
+            Tree of containers under node. None if node is not part of the tree.
+        """
+        if node not in self.parents:
+            return None
+        tree = ContainerTree(root=node)
+        for name in self.traverse(node=node)[1:]:
+            tree.parents[name] = self.parents[name]
+            tree.children[name] = list(self.children[name])
+        tree.children[node] = list(self.children[node])
+        return tree
+
+    def to_dict(self, node=None):
+        """
+        to_dict Nested representation of the tree
+
+        Containers with children are represented as {<name>: {"children": [...]}}, leaves as their name.
+
+        Parameters
+        ----------
+        node : str, optional
+            Name of the container to start from, by default root
+
+        Returns
+        -------
+        Any
+            Nested dictionary of containers or name of the container if it has no child
+        """
+        node = self.root if node is None else node
+        rendered = {}
+        # Children are rendered before their parent using reversed pre-order
+        for name in reversed(self.traverse(node=node)):
+            if self.children[name]:
+                rendered[name] = {name: {'children': [rendered.pop(child) for child in self.children[name]]}}
+            else:
+                rendered[name] = name
+        return rendered[node]
+
+
 def get_root_container(containers_fact, debug=True):
     """
     Extract name of the root container provided by cv_facts.
@@ -43,7 +179,7 @@ def get_root_container(containers_fact, debug=True):
         Name of the root container, if not found, return Tenant as default value
     """
     for container in containers_fact:
-        LOGGER.debug('working on container %s', str(container))
+        LOGGER.debug('working on container %s', container)
         if container['Key'] == 'root':
             # if debug:
             LOGGER.info(
@@ -67,41 +203,47 @@ def tree_to_list(json_data, myList):
 
     Parameters
     ----------
-    json_data : [type]
-        [description]
+    json_data : ContainerTree, dict, list or str
+        Tree to transform. Nested structure can be provided as a JSON string.
     myList : list
-        Ordered list of element to create on CVP / recursive function
+        List to extend with ordered list of element to create on CVP
 
     Returns
     -------
     list
         Ordered list of element to create on CVP
     """
+    if isinstance(json_data, ContainerTree):
+        myList.extend(json_data.traverse())
+        return myList
     # Cast input to be encoded as JSON structure.
     if isinstance(json_data, str):
-        json_data = json.loads(json_data)
-    # If it is a dictionary object,
-    # it means we have to go through it to extract content
-    if isinstance(json_data, dict):
-        # Get key as it is a container name we want to save.
-        for k1, v1 in json_data.items():
-            # Ensure we are getting children element.
-            if isinstance(v1, dict):
-                for k2, v2 in v1.items():
-                    if 'children' == k2:
-                        # Save entry as we are dealing with an object to create
-                        myList.append(k1)
-                        for e in v2:
-                            # Move to next element with a recursion
-                            tree_to_list(
-                                json_data=json.dumps(e), myList=myList)
-    # We are facing a end of a branch with a list of leaves.
-    elif isinstance(json_data, list):
-        for entry in json_data:
-            myList.append(entry)
-    # We are facing a end of a branch with a single leaf.
-    elif isinstance(json_data, string_types):
-        myList.append(json_data)
+        try:
+            json_data = json.loads(json_data)
+        except ValueError:
+            pass
+    # Iterative pre-order walk on nested structure
+    stack = [json_data]
+    while stack:
+        element = stack.pop()
+        # If it is a dictionary object,
+        # it means we have to go through it to extract content
+        if isinstance(element, dict):
+            branches = []
+            # Get key as it is a container name we want to save.
+            for name, content in element.items():
+                # Ensure we are getting children element.
+                if isinstance(content, dict) and 'children' in content:
+                    # Save entry as we are dealing with an object to create
+                    myList.append(name)
+                    branches.extend(content['children'])
+            stack.extend(reversed(branches))
+        # We are facing a end of a branch with a list of leaves.
+        elif isinstance(element, list):
+            myList.extend(element)
+        # We are facing a end of a branch with a single leaf.
+        elif isinstance(element, string_types):
+            myList.append(element)
     return myList
 
 
@@ -131,7 +273,7 @@ def tree_build_from_dict(containers=None, root='Tenant'):
                         'images': ['4.22.0F'],
                         'parent_container': 'Fabric'}}
         >>> print(tree_build_from_dict(containers=containers))
-            {"Tenant": {"children": [{"Fabric": {"children": [{"Leaves": {"children": ["MLAG01", "MLAG02"]}}, "Spines"]}}]}}
+            {'Tenant': {'children': [{'Fabric': {'children': [{'Leaves': {'children': ['MLAG01', 'MLAG02']}}, 'Spines']}}]}}
     Parameters
     ----------
     containers : dict, optional
@@ -141,44 +283,14 @@ def tree_build_from_dict(containers=None, root='Tenant'):
 
     Returns
     -------
-    json
+    ContainerTree
         tree topology
     """
-    # Create tree object
-    tree = Tree()  # Create the base node
-    previously_created = list()
-    # Create root node to mimic CVP behavior
-    LOGGER.debug('containers list is %s', str(containers))
-    LOGGER.debug('root container is set to: %s', str(root))
-    tree.create_node(root, root)
-    # Iterate for first level of containers directly attached under root.
-    for container_name, container_info in containers.items():
-        if container_info['parent_container'] in [root]:
-            previously_created.append(container_name)
-            tree.create_node(container_name, container_name,
-                             parent=container_info['parent_container'])
-            LOGGER.debug(
-                'create root tree entry with: %s', str(container_name))
-    # Loop since expected tree is not equal to number of entries in container topology
-    # When trying to create a tree with 1 child and 1 grandchild, the grandchild would
-    # not be added in the while loop as len(tree.all_nodes()) > len(containers)
-    if len(containers) == 2:
-        ctr = 1
-    else:
-        ctr = 0
-    while (len(tree.all_nodes()) < len(containers) + ctr):
-        LOGGER.debug(
-            ' Tree has size: %s - Containers has size: %s', str(len(tree.all_nodes())), str(len(containers)))
-        for container_name, container_info in containers.items():
-            if tree.contains(container_info['parent_container']) and container_info['parent_container'] not in [root]:
-                try:
-                    LOGGER.debug(
-                        'create new node with: %s', str(container_name))
-                    tree.create_node(container_name, container_name,
-                                     parent=container_info['parent_container'])
-                except:  # noqa E722
-                    continue
-    return tree.to_json()
+    LOGGER.debug('containers list is %s', containers)
+    LOGGER.debug('root container is set to: %s', root)
+    parents = {container_name: container_info['parent_container']
+               for container_name, container_info in containers.items()}
+    return ContainerTree.from_parents(parents=parents, root=root)
 
 
 def tree_build_from_list(containers, root='Tenant'):
@@ -213,7 +325,7 @@ def tree_build_from_list(containers, root='Tenant'):
                 "parentName": "Tenant"
             }]
         >>> print(tree_build_from_list(containers=containers))
-            {"Tenant": {"children": [{"Fabric": {"children": [{"Leaves": {"children": ["MLAG01", "MLAG02"]}}, "Spines"]}}]}}
+            {'Tenant': {'children': ['staging']}}
     Parameters
     ----------
     containers : dict, optional
@@ -223,36 +335,12 @@ def tree_build_from_list(containers, root='Tenant'):
 
     Returns
     -------
-    json
+    ContainerTree
         tree topology
     """
-    # Create tree object
-    tree = Tree()  # Create the base node
-    previously_created = list()
-    # Create root node to mimic CVP behavior
-    LOGGER.debug('containers list is %s', str(containers))
-    tree.create_node(root, root)
-    # Iterate for first level of containers directly attached under root.
-    for cvp_container in containers:
-        if cvp_container['parentName'] is None:
-            continue
-        if cvp_container['parentName'] in [root]:
-            LOGGER.debug(
-                'found container attached to %s: %s', str(root), str(cvp_container))
-            previously_created.append(cvp_container['name'])
-            tree.create_node(
-                cvp_container['name'], cvp_container['name'], parent=cvp_container['parentName'])
-    # Loop since expected tree is not equal to number of entries in container topology
-    while len(tree.all_nodes()) < len(containers):
-        for cvp_container in containers:
-            # and cvp_container['parentName'] not in ['Tenant']
-            if tree.contains(cvp_container['parentName']):
-                try:
-                    tree.create_node(
-                        cvp_container['name'], cvp_container['name'], parent=cvp_container['parentName'])
-                except:  # noqa E722
-                    continue
-    return tree.to_json()
+    LOGGER.debug('containers list is %s', containers)
+    parents = {cvp_container['name']: cvp_container['parentName'] for cvp_container in containers}
+    return ContainerTree.from_parents(parents=parents, root=root)
 
 
 def tree_build(containers=None, root='Tenant'):
@@ -297,6 +385,6 @@ def locate_relative_root_container(containers_topology):
     LOGGER.debug('relative intended topology is: %s',
                  str(containers_topology))
     for container_name, container in containers_topology.items():
-        if container['parent_container'] not in containers_topology.keys():
+        if container['parent_container'] not in containers_topology:
             return container_name
     return None
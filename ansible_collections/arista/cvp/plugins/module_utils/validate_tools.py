@@ -18,7 +18,6 @@ from ansible_collections.arista.cvp.plugins.module_utils.resources.modules.field
     DeviceResponseFields,
 )
 from ansible_collections.arista.cvp.plugins.module_utils.response import CvApiResult, CvManagerResult, CvAnsibleResponse
-from ansible_collections.arista.cvp.plugins.module_utils.resources.schemas import v3 as schema
 from ansible_collections.arista.cvp.plugins.module_utils.tools_schema import validate_json_schema
 try:
     from cvprac.cvp_client_errors import CvpApiError
@@ -33,7 +32,7 @@ MODULE_LOGGER.info('Start tag_tools module execution')
 
 
 class CvValidateInput(object):
-    def __init__(self, device: dict, schema=schema.SCHEMA_CV_VALIDATE):
+    def __init__(self, device: dict, schema="SCHEMA_CV_VALIDATE"):
         self.__device = device
         self.__schema = schema
 
@@ -43,7 +42,7 @@ class CvValidateInput(object):
         check_schemas Validate schemas for user's input
         """
         if not validate_json_schema(user_json=self.__device, schema=self.__schema):
-            MODULE_LOGGER.error("Invalid tags input : \n%s", str(self.__device))
+            MODULE_LOGGER.error("Invalid tags input : \n%s", self.__device)
             return False
         return True
 
@@ -174,8 +173,8 @@ class CvValidationTools(object):
 
             for configlet_name, config in configlets.items():
                 MODULE_LOGGER.debug(
-                    "Configlet being validated is %s", str(configlet_name))
-                MODULE_LOGGER.debug("Configlet information: %s", str(config))
+                    "Configlet being validated is %s", configlet_name)
+                MODULE_LOGGER.debug("Configlet information: %s", config)
 
                 result_data = CvApiResult(
                     action_name=configlet_name
@@ -186,11 +185,9 @@ class CvValidationTools(object):
                 MODULE_LOGGER.debug(f"adding {0} to result_data".format(configlet_name))
                 try:
                     MODULE_LOGGER.debug(
-                        "Ansible is going to validate configlet %s against device %s", str(
-                            configlet_name), str(device_info['device_name']))
+                        "Ansible is going to validate configlet %s against device %s", configlet_name, device_info['device_name'])
                     MODULE_LOGGER.debug(
-                        "queryParams are deviceMac: %s and configuration: %s", str(
-                            system_mac), str(config))
+                        "queryParams are deviceMac: %s and configuration: %s", system_mac, config)
                     resp = self.__cv_client.api.validate_config_for_device(
                         device_mac=system_mac,
                         config=config)
@@ -201,7 +198,7 @@ class CvValidationTools(object):
 
                 except CvpApiError:
                     MODULE_LOGGER.critical(
-                        "Error validation failed on device %s", str(device_info['device_name'])
+                        "Error validation failed on device %s", device_info['device_name']
                     )
                     self.__ansible.fail_json(
                         msg=f"Error validation failed on device {device_info['device_name']}")
@@ -26,6 +26,8 @@ description:
   - If a configlet is in both configlets and cvp_facts it configuration will
   - be compared and updated with the version in configlets
   - if the two are different.
+  - Only tasks generated by configlet updates of the current run are reported,
+    other pending tasks on Cloudvision are not listed.
 deprecated:
   removed_in: '4.0.0'
   why: Updated modules released with increased functionality
@@ -110,9 +112,26 @@ EXAMPLES = r'''
       register: cvp_configlet
 '''
 
+RETURN = r'''
+data:
+  description:
+    - Configlets created (new), updated and deleted on Cloudvision.
+    - tasks lists details of tasks generated by configlet updates of this run only,
+      pending tasks created outside of this run are not included.
+  returned: always
+  type: dict
+  sample:
+    deleted: []
+    new:
+      - Test_Configlet: success
+    tasks: []
+    updated: []
+'''
+
 # Required by Ansible and CVP
 import re
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from ansible.module_utils.basic import AnsibleModule
 import ansible_collections.arista.cvp.plugins.module_utils.logger   # noqa # pylint: disable=unused-import
 from ansible_collections.arista.cvp.plugins.module_utils import tools_cv
@@ -132,7 +151,7 @@ def get_tasks(taskIds, module):
                   'currentTaskName': 'currentTaskName', 'description': 'description',
                   'workOrderUserDefinedStatus': 'workOrderUserDefinedStatus', 'note': 'note',
                   'taskStatus': 'taskStatus', 'workOrderDetails': 'workOrderDetails'}
-    tasks = module.client.api.get_tasks_by_status('Pending')
+    tasks = tools_cv.cv_get_tasks(module=module, task_ids=taskIds)
     # Reduce task data to required fields
     for task in tasks:
         taskFacts = {}
@@ -212,15 +231,16 @@ def build_configlets_list(module):
 
     MODULE_LOGGER.debug(' * build_configlets_list - configlet filter is: %s', str(module.params['configlet_filter']))
     MODULE_LOGGER.debug(' * build_configlets_list - filter_mode is set to: %s', str(module.params['filter_mode']))
+    # Filter is compiled once and shared by all configlets
+    configlet_filter = tools.get_match_filter(filter=module.params['configlet_filter'],
+                                              filter_mode=module.params['filter_mode'])
 
     for configlet in module.params['cvp_facts']['configlets']:
         # Only deal with Static configlets not Configletbuilders or
         # their derived configlets
         # Include only configlets that match filter elements "all" or any user's defined names.
         if configlet['type'] == 'Static':
-            if tools.match_filter(input=configlet['name'],
-                                  filter=module.params['configlet_filter'],
-                                  filter_mode=module.params['filter_mode']):
+            if configlet_filter.match(configlet['name']):
                 # Test if module should keep, update or delete configlet
                 if configlet['name'] in module.params['configlets']:
                     # Scenario where configlet module is set to create.
@@ -244,14 +264,9 @@ def build_configlets_list(module):
                     intend['delete'].append({'data': configlet})
 
     # Look for new configlets, if a configlet is not CVP assume it has to be created.
+    cvp_configlet_names = {str(cvp_configlet['name']) for cvp_configlet in module.params['cvp_facts']['configlets']}
     for ansible_configlet in module.params['configlets']:
-        found = False
-        for cvp_configlet in module.params['cvp_facts']['configlets']:
-            if str(ansible_configlet) == str(cvp_configlet['name']):
-                found = True
-        if not found and tools.match_filter(input=ansible_configlet,
-                                            filter=module.params['configlet_filter'],
-                                            filter_mode=module.params['filter_mode']):
+        if str(ansible_configlet) not in cvp_configlet_names and configlet_filter.match(ansible_configlet):
             intend['create'].append(
                 {'data': {'name': str(ansible_configlet)},
                  'config': str(module.params['configlets'][ansible_configlet])}
@@ -297,6 +312,17 @@ def action_update(update_configlets, module):
     taskIds = list()
     configlets_notes = str(module.params['configlets_notes'])
 
+    # Updates are sent concurrently so Cloudvision generates tasks of all configlets at the same time
+    update_futures = dict()
+    if not module.check_mode and update_configlets:
+        with ThreadPoolExecutor(max_workers=min(tools_cv.MAX_WORKERS, len(update_configlets))) as executor:
+            for configlet in update_configlets:
+                update_futures[configlet['data']['key']] = executor.submit(module.client.api.update_configlet,
+                                                                           config=configlet['config'],
+                                                                           key=configlet['data']['key'],
+                                                                           name=configlet['data']['name'],
+                                                                           wait_task_ids=True)
+
     for configlet in update_configlets:
         if module.check_mode:
             response_data.append({configlet['data']['name']: 'will be updated'})
@@ -307,10 +333,7 @@ def action_update(update_configlets, module):
                 ":\n" + configlet['diff'] + "\n\n"
         else:
             try:
-                update_resp = module.client.api.update_configlet(config=configlet['config'],
-                                                                 key=configlet['data']['key'],
-                                                                 name=configlet['data']['name'],
-                                                                 wait_task_ids=True)
+                update_resp = update_futures[configlet['data']['key']].result()
             except Exception as error:
                 # Mark module execution with error
                 flag_failed = True
@@ -73,6 +73,7 @@ from ansible.module_utils.basic import AnsibleModule
 import ansible_collections.arista.cvp.plugins.module_utils.logger   # noqa # pylint: disable=unused-import
 from ansible_collections.arista.cvp.plugins.module_utils.response import CvAnsibleResponse
 from ansible_collections.arista.cvp.plugins.module_utils import tools_cv
+from ansible_collections.arista.cvp.plugins.module_utils import tools_metrics
 from ansible_collections.arista.cvp.plugins.module_utils import tools_schema
 from ansible_collections.arista.cvp.plugins.module_utils.configlet_tools import ConfigletInput, CvConfigletTools, HAS_HASHLIB, HAS_DIFFLIB
 try:
@@ -173,6 +174,7 @@ def main():
         configlet_list=user_configlets.configlets, present=is_present, note=ansible_module.params['configlets_notes'])
     result = cv_response.content
 
+    result.update(tools_metrics.metrics_result(cv_client, name='cv_configlet_v3'))
     ansible_module.exit_json(**result)
 
 
@@ -98,6 +98,7 @@ import logging
 import ansible_collections.arista.cvp.plugins.module_utils.logger   # noqa # pylint: disable=unused-import
 from ansible_collections.arista.cvp.plugins.module_utils import tools_cv
 from ansible_collections.arista.cvp.plugins.module_utils import tools
+from ansible_collections.arista.cvp.plugins.module_utils import tools_inventory
 from ansible_collections.arista.cvp.plugins.module_utils import tools_tree
 from ansible_collections.arista.cvp.plugins.module_utils import schema_v1 as schema
 from ansible.module_utils.basic import AnsibleModule
@@ -212,24 +213,19 @@ def create_new_containers(module, intended, facts):
         Facts from CVP collected by cv_facts module
     """
     count_container_creation = 0
+    facts = tools_inventory.as_facts_index(facts)
     # Get root container of topology
     topology_root = tools_tree.get_root_container(containers_fact=facts['containers'])
     # Build ordered list of containers to create: from Tenant to leaves.
     container_intended_tree = tools_tree.tree_build_from_dict(containers=intended, root=topology_root)
-    MODULE_LOGGER.debug("The ordered dict is: %s", str(container_intended_tree))
+    MODULE_LOGGER.debug("The ordered dict is: %s", container_intended_tree)
     container_intended_ordered_list = tools_tree.tree_to_list(json_data=container_intended_tree, myList=list())
     MODULE_LOGGER.debug("The ordered list is: %s", str(container_intended_ordered_list))
     # Parse ordered list of container and check if they are configured on CVP.
     # If not, then call container creation process.
     for container_name in container_intended_ordered_list:
-        found = False
-        # Check if container name is found in CVP Facts.
-        for fact_container in facts['containers']:
-            if container_name == fact_container['name']:
-                found = True
-                break
-        # If container has not been found, we create it
-        if not found:
+        # If container has not been found in CVP Facts, we create it
+        if container_name not in facts.containers:
             # module.fail_json(msg='** Create container'+container_name+' attached to '+intended[container_name]['parent_container'])
             MODULE_LOGGER.debug('sent process_container request with %s / %s', str(
                 container_name), str(intended[container_name]['parent_container']))
@@ -265,13 +261,8 @@ def is_empty(module, container_name, facts):
     facts : dict
         Facts from CVP collected by cv_facts module
     """
-    is_empty = True
-    not_empty = False
     # test if container has at least one device attached
-    for device in facts['devices']:
-        if device['parentContainerName'] == container_name:
-            return not_empty
-    return is_empty
+    return container_name not in tools_inventory.as_facts_index(facts).container_devices
 
 
 def is_container_empty(module, container_name):
@@ -302,10 +293,7 @@ def get_container_facts(container_name='Tenant', facts=None):
     facts : dict, optional
         CVP facts information, by default None
     """
-    for container in facts['containers']:
-        if container['name'] == container_name:
-            return container
-    return None
+    return tools_inventory.as_facts_index(facts).containers.get(container_name)
 
 
 def delete_unused_containers(module, intended, facts):
@@ -324,6 +312,7 @@ def delete_unused_containers(module, intended, facts):
     # default_containers = ['Tenant', 'Undefined', 'root']
     count_container_deletion = 0
     container_to_delete = list()
+    facts = tools_inventory.as_facts_index(facts)
 
     # Get root container for the topology
     topology_root = tools_tree.get_root_container(containers_fact=facts['containers'])
@@ -336,14 +325,15 @@ def delete_unused_containers(module, intended, facts):
     container_intended_tree = tools_tree.tree_build_from_dict(containers=intended, root=topology_root)
     container_intended_ordered_list = tools_tree.tree_to_list(json_data=container_intended_tree, myList=list())
 
+    container_intended = set(container_intended_ordered_list)
+
     container_to_delete = list()
     # Build a list of container configured on CVP and not on intended.
     for cvp_container in container_cvp_ordered_list:
-        # Only container with no devices can be deleted.
-        # If container is not empty, no reason to go further.
-        if is_container_empty(module=module, container_name=cvp_container):
-            # Check if a container is not present in intended topology.
-            if cvp_container not in container_intended_ordered_list:
+        # Check if a container is not present in intended topology.
+        # Only container with no devices can be deleted, so emptiness is only checked for them.
+        if cvp_container not in container_intended:
+            if is_container_empty(module=module, container_name=cvp_container):
                 container_to_delete.append(cvp_container)
 
     MODULE_LOGGER.info('List of containers to delete: %s', str(container_to_delete))
@@ -430,8 +420,52 @@ def device_info(device_name, module):
     return device_info
 
 
-def task_info(module, taskId):
-    return module.client.api.get_task_by_id(taskId)
+def container_cvpinfo_from_facts(container_name, module, facts):
+    """
+    Get container info from CVP facts, or from CVP if container is not in facts.
+
+    Containers created during module execution are not in facts and are collected with container_info().
+
+    Parameters
+    ----------
+    container_name : string
+        Name of the container to look for.
+    module : AnsibleModule
+        Ansible module to get access to cvp client.
+    facts : CvFactsIndex or dict
+        Facts from CVP collected by cv_facts module
+
+    Returns
+    -------
+    dict: Dict of container info with at least key and name fields.
+    """
+    container_facts = tools_inventory.as_facts_index(facts).containers.get(container_name)
+    if container_facts is not None and 'key' in container_facts:
+        return container_facts
+    return container_info(container_name=container_name, module=module)
+
+
+def device_cvpinfo_from_facts(device_name, module, facts):
+    """
+    Get device info from CVP facts, or from CVP if device is not in facts.
+
+    Parameters
+    ----------
+    device_name : string
+        Hostname of the device to look for.
+    module : AnsibleModule
+        Ansible module to get access to cvp client.
+    facts : CvFactsIndex or dict
+        Facts from CVP collected by cv_facts module
+
+    Returns
+    -------
+    dict: Dict of device info with at least key and fqdn fields.
+    """
+    device_facts = tools_inventory.as_facts_index(facts).devices.get(device_name)
+    if device_facts is not None and 'key' in device_facts and 'fqdn' in device_facts:
+        return device_facts
+    return device_info(device_name=device_name, module=module)
 
 
 def move_devices_to_container(module, intended, facts):
@@ -461,19 +495,22 @@ def move_devices_to_container(module, intended, facts):
     # Define wether we want to save topology or not
     # Force to True as per issue115
     save_topology = True
+    facts = tools_inventory.as_facts_index(facts)
     # Read complete intended topology to locate devices
     for container_name, container in intended.items():
         # If we have at least one device defined, then we can start process
         if 'devices' in container:
+            container_cvpinfo = None
             # Extract list of device hostname
             for device in container['devices']:
-                # Get CVP information for target container.
+                # Get CVP information for target container, once per container.
                 # move_device_to_container requires to use structure sends by CVP
-                container_cvpinfo = container_info(container_name=container_name,
-                                                   module=module)
+                if container_cvpinfo is None:
+                    container_cvpinfo = container_cvpinfo_from_facts(container_name=container_name,
+                                                                     module=module, facts=facts)
                 # Get CVP information for device.
                 # move_device_to_container requires to use structure sends by CVP
-                device_cvpinfo = device_info(device_name=device, module=module)
+                device_cvpinfo = device_cvpinfo_from_facts(device_name=device, module=module, facts=facts)
                 # Initiate a move to desired container.
                 # Task is created but not executed.
                 device_action = module.client.api.move_device_to_container(app_name="ansible_cv_container",
@@ -510,10 +547,10 @@ def container_factinfo(container_name, facts):
     dict: Dict of configlet info from CVP or exit with failure if no info for
             container is found.
     """
-    for container in facts['containers']:
-        if container['name'] == container_name:
-            return container
-    return None
+    # Only a container name can match, other types are never found
+    if not isinstance(container_name, str):
+        return None
+    return tools_inventory.as_facts_index(facts).containers.get(container_name)
 
 
 def configlet_factinfo(configlet_name, facts):
@@ -532,10 +569,7 @@ def configlet_factinfo(configlet_name, facts):
     dict: Dict of configlet info from CVP or exit with failure if no info for
             container is found.
     """
-    for configlet in facts['configlets']:
-        if configlet['name'] == configlet_name:
-            return configlet
-    return None
+    return tools_inventory.as_facts_index(facts).configlets.get(configlet_name)
 
 
 def configure_configlet_to_container(module, intended, facts):
@@ -595,12 +629,15 @@ def configure_configlet_to_container(module, intended, facts):
     configlet_action = dict()
     # Configlet filter
     configlet_filter = module.params['configlet_filter']
+    # Filter is compiled once and shared by all configlets
+    configlet_matcher = tools.get_match_filter(filter=configlet_filter)
+    facts = tools_inventory.as_facts_index(facts)
     # Read complete intended topology to locate devices
     for container_name, container in intended.items():
         MODULE_LOGGER.info('work with container %s', str(container_name))
         # If we have at least one configlet defined, then we can start process
         # Get CVP information for target container.
-        container_info_cvp = container_info(container_name=container_name, module=module)
+        container_info_cvp = container_cvpinfo_from_facts(container_name=container_name, module=module, facts=facts)
         if 'configlets' in container:
             MODULE_LOGGER.debug('container has a list of containers to configure: %s', str(container['configlets']))
             # Extract list of configlet names
@@ -608,7 +645,7 @@ def configure_configlet_to_container(module, intended, facts):
                 MODULE_LOGGER.debug('running configlet %s', str(configlet))
                 # We apply filter to know if we have to attach configlet.
                 # If filter is set to ['none'], we consider add in any situation.
-                if tools.match_filter(input=configlet, filter=configlet_filter) or ('none' in configlet_filter):
+                if configlet_matcher.match(configlet) or ('none' in configlet_filter):
                     MODULE_LOGGER.debug('collecting information for configlet %s', str(configlet))
                     # Get CVP information for device.
                     configlet_cvpinfo = configlet_factinfo(configlet_name=configlet, facts=facts)
@@ -649,8 +686,7 @@ def configure_configlet_to_container(module, intended, facts):
         if container_info_cvp is not None and 'configlets' in container_info_cvp:
             for configlet in container_info_cvp['configlets']:
                 # If configlet matchs filter, we just remove attachment.
-                match_filter = tools.match_filter(
-                    input=configlet, filter=configlet_filter, default_always='none')
+                match_filter = configlet_matcher.match(configlet)
                 MODULE_LOGGER.info('Filter test has returned: %s - Filter is %s - input is %s', str(match_filter), str(configlet_filter), str(configlet))
                 # If configlet is not in intended and does not match filter, ignore it
                 # If filter is set to ['none'], we consider to NOT touch attachment in any situation.
@@ -726,6 +762,7 @@ def delete_topology(module, intended, facts):
     # default_containers = ['Tenant', 'Undefined', 'root']
     count_container_deletion = 0
     container_to_delete = list()
+    facts = tools_inventory.as_facts_index(facts)
 
     # Get root container for current topology
     topology_root = tools_tree.get_root_container(containers_fact=facts['containers'])
@@ -801,14 +838,7 @@ def get_tasks(taskIds, module):
     list
         List of Task information.
     """
-
-    tasksList = list()
-    # remove duplicate entries
-    taskIds = list(set(taskIds))
-    # Get task content from CVP
-    for taskId in taskIds:
-        tasksList.append(task_info(module=module, taskId=taskId))
-    return tasksList
+    return tools_cv.cv_get_tasks(module=module, task_ids=taskIds)
 
 
 def main():
@@ -841,9 +871,6 @@ def main():
         module.fail_json(
             msg='cvprac required for this module. Please install using pip install cvprac')
 
-    if not tools_tree.HAS_TREELIB:
-        module.fail_json(msg='treelib required for this module')
-
     if not schema.HAS_JSONSCHEMA:
         module.fail_json(
             msg="jsonschema is required. Please install using pip install jsonschema")
@@ -863,21 +890,24 @@ def main():
     if not module.check_mode:
         module.client = tools_cv.cv_connect(module)
 
+    # Index facts once for all container operations
+    facts = tools_inventory.get_facts_index(module)
+
     # Create list of builtin containers
-    create_builtin_containers(facts=module.params['cvp_facts'])
+    create_builtin_containers(facts=facts)
     if module.params['mode'] in ['merge', 'override']:
         # -> Start process to create new containers
         if (tools.isIterable(module.params['topology']) and module.params['topology'] is not None):
             creation_process = create_new_containers(module=module,
                                                      intended=module.params['topology'],
-                                                     facts=module.params['cvp_facts'])
+                                                     facts=facts)
             if creation_process[0]:
                 result['data']['changed'] = True
                 result['data']['creation_result'] = creation_process[1]
             # -> Start process to move devices to targetted containers
             move_process = move_devices_to_container(module=module,
                                                      intended=module.params['topology'],
-                                                     facts=module.params['cvp_facts'])
+                                                     facts=facts)
             if move_process is not None:
                 result['data']['changed'] = True
                 # If a list of task exists, we expose it
@@ -890,7 +920,7 @@ def main():
             # -> Start process to move devices to targetted containers
             attached_process = configure_configlet_to_container(module=module,
                                                                 intended=module.params['topology'],
-                                                                facts=module.params['cvp_facts'])
+                                                                facts=facts)
             if attached_process is not None:
                 result['data']['changed'] = True
                 # If a list of task exists, we expose it
@@ -906,11 +936,11 @@ def main():
         if (tools.isIterable(module.params['topology']) and module.params['topology'] is not None):
             deletion_process = delete_unused_containers(module=module,
                                                         intended=module.params['topology'],
-                                                        facts=module.params['cvp_facts'])
+                                                        facts=facts)
         else:
             deletion_process = delete_unused_containers(module=module,
                                                         intended=dict(),
-                                                        facts=module.params['cvp_facts'])
+                                                        facts=facts)
         if deletion_process[0]:
             result['data']['changed'] = True
             result['data']['deletion_result'] = deletion_process[1]
@@ -921,7 +951,7 @@ def main():
         if (tools.isIterable(module.params['topology']) and module.params['topology'] is not None):
             deletion_topology_process = delete_topology(module=module,
                                                         intended=module.params['topology'],
-                                                        facts=module.params['cvp_facts'])
+                                                        facts=facts)
             if deletion_topology_process[0]:
                 result['data']['changed'] = True
                 result['data']['deletion_result'] = deletion_topology_process[1]
@@ -98,6 +98,7 @@ import logging
 import ansible_collections.arista.cvp.plugins.module_utils.logger   # noqa # pylint: disable=unused-import
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.arista.cvp.plugins.module_utils import tools_cv, container_tools
+from ansible_collections.arista.cvp.plugins.module_utils import tools_metrics
 from ansible_collections.arista.cvp.plugins.module_utils import tools_schema
 from ansible_collections.arista.cvp.plugins.module_utils.response import CvAnsibleResponse
 from ansible_collections.arista.cvp.plugins.module_utils.container_tools import CvContainerTools, ContainerInput
@@ -183,6 +184,7 @@ def main():
         'Received response from Topology builder: %s', str(cv_response))
     result = cv_response.content
 
+    result.update(tools_metrics.metrics_result(cv_client, name='cv_container_v3'))
     ansible_module.exit_json(**result)
 
 
@@ -124,10 +124,12 @@ EXAMPLES = r"""
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 import ansible_collections.arista.cvp.plugins.module_utils.logger   # noqa # pylint: disable=unused-import
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.arista.cvp.plugins.module_utils import tools_cv
 from ansible_collections.arista.cvp.plugins.module_utils import tools
+from ansible_collections.arista.cvp.plugins.module_utils import tools_inventory
 from ansible_collections.arista.cvp.plugins.module_utils import schema_v1 as schema
 
 
@@ -160,10 +162,7 @@ def device_get_from_facts(module, device_name):
     dict
         Device facts if found, else None.
     """
-    for device in module.params["cvp_facts"]["devices"]:
-        if device["hostname"] == device_name:
-            return device
-    return None
+    return tools_inventory.get_facts_index(module).devices.get(device_name)
 
 
 def facts_devices(module):
@@ -221,12 +220,7 @@ def container_get_facts(container_name, module):
     dict
         [description]
     """
-    if "cvp_facts" in module.params:
-        if "containers" in module.params["cvp_facts"]:
-            for container in module.params["cvp_facts"]["containers"]:
-                if container_name == container["Name"]:
-                    return container
-    return []
+    return tools_inventory.get_facts_index(module).containers.get(container_name, [])
 
 
 def configlet_get_fact_key(configlet_name, cvp_facts):
@@ -237,17 +231,17 @@ def configlet_get_fact_key(configlet_name, cvp_facts):
     ----------
     configlet_name : string
         Name of configlet to look for the key field
-    cvp_facts : dict
-        Dictionary from cv_facts
+    cvp_facts : CvFactsIndex or dict
+        Indexed view of cv_facts or dictionary from cv_facts
 
     Returns
     -------
     string
         Key value of the configlet.
     """
-    for configlet in cvp_facts["configlets"]:
-        if configlet_name == configlet["name"]:
-            return configlet["key"]
+    cvp_facts = tools_inventory.as_facts_index(cvp_facts)
+    if configlet_name in cvp_facts.configlets:
+        return cvp_facts.configlets[configlet_name]["key"]
     return None
 
 
@@ -268,6 +262,7 @@ def tasks_get_filtered(taskid_list, module):
         List of tasks from CVP.
     """
     tasks = module.client.api.get_tasks_by_status("Pending")
+    taskid_list = set(taskid_list)
     task_list = list()
     for task in tasks:
         if task["workOrderId"] in taskid_list:
@@ -295,6 +290,7 @@ def get_unique_from_list(source_list, compare_list):
         List of unique entries
     """
     unique_entries = list()
+    compare_list = set(compare_list)
     for entry in source_list:
         if entry not in compare_list:
             unique_entries.append(entry)
@@ -506,14 +502,15 @@ def configlet_prepare_cvp_update(configlet_name_list, facts):
     ----------
     configlet_name_list : list
         List of configlets name to build
-    facts : dict
-        Dict from cv_facts
+    facts : CvFactsIndex or dict
+        Indexed view of cv_facts or dict from cv_facts
 
     Returns
     -------
     list
         List of dictionary required to be passed to CV.
     """
+    facts = tools_inventory.as_facts_index(facts)
     configlets_structure = list()
     for configlet_name in configlet_name_list:
         configlet_data = dict()
@@ -527,6 +524,7 @@ def configlet_prepare_cvp_update(configlet_name_list, facts):
 
 
 def configlet_check_unknown_from_cvp(configlet_name_list, facts):
+    facts = tools_inventory.as_facts_index(facts)
     unknown_configlets = list()
     for configlet_name in configlet_name_list:
         if configlet_get_fact_key(configlet_name=configlet_name, cvp_facts=facts) is None:
@@ -582,6 +580,8 @@ def devices_new(module):
     # List of generated taskIds
     result_tasks_generatedtaskId = list()
 
+    facts_index = tools_inventory.get_facts_index(module)
+
     MODULE_LOGGER.debug(" * devices_new - Entering devices_new")
     MODULE_LOGGER.debug(" * devices_new - entering update function")
 
@@ -605,7 +605,7 @@ def devices_new(module):
         # Transform output to be CV compliant:
         # [{name: configlet_name, key: configlet_key_from_cv_facts}]
         configlets_add = configlet_prepare_cvp_update(
-            configlet_name_list=configlets_add, facts=module.params["cvp_facts"]
+            configlet_name_list=configlets_add, facts=facts_index
         )
 
         # Collect container information
@@ -812,6 +812,9 @@ def devices_update(module, mode="override"):
     configlets_delete = list()
     # Structure to list configlets to configure on device.
     configlets_add = list()
+    facts_index = tools_inventory.get_facts_index(module)
+    # Devices with configlets to update and their configlets to add and delete
+    pending_updates = list()
 
     MODULE_LOGGER.debug(" * devices_update - entering update function")
 
@@ -819,7 +822,7 @@ def devices_update(module, mode="override"):
         # First check all configlets are already on CV side.
         unknown_configlet = configlet_check_unknown_from_cvp(
             configlet_name_list=device_update["configlets"],
-            facts=module.params["cvp_facts"]
+            facts=facts_index
         )
         if len(unknown_configlet) > 0:
             MODULE_LOGGER.error(
@@ -859,7 +862,7 @@ def devices_update(module, mode="override"):
                 # Transform output to be CV compliant:
                 # [{name: configlet_name, key: configlet_key_from_cv_facts}]
                 configlets_delete = configlet_prepare_cvp_update(
-                    configlet_name_list=configlets_delete, facts=module.params["cvp_facts"]
+                    configlet_name_list=configlets_delete, facts=facts_index
                 )
 
                 # In any case build list of configlet to attach to device
@@ -871,7 +874,7 @@ def devices_update(module, mode="override"):
                 # Transform output to be CV compliant:
                 # [{name: configlet_name, key: configlet_key_from_cv_facts}]
                 configlets_add = configlet_prepare_cvp_update(
-                    configlet_name_list=configlets_add, facts=module.params["cvp_facts"]
+                    configlet_name_list=configlets_add, facts=facts_index
                 )
         # Start configlet update in merge mode: add configlets to device and do not update already attached devices.
         if mode == 'merge':
@@ -879,7 +882,7 @@ def devices_update(module, mode="override"):
             configlets_add = device_update["configlets"] + device_update["cv_configlets"]
             # Transform output to be CV compliant:
             # [{name: configlet_name, key: configlet_key_from_cv_facts}]
-            configlets_add = configlet_prepare_cvp_update(configlet_name_list=configlets_add, facts=module.params["cvp_facts"])
+            configlets_add = configlet_prepare_cvp_update(configlet_name_list=configlets_add, facts=facts_index)
 
         # Start configlet update in delete mode: remove listed configlets to device and do not update already attached devices.
         if mode == 'delete':
@@ -887,76 +890,76 @@ def devices_update(module, mode="override"):
             configlets_add = [x for x in device_update["cv_configlets"] if x not in device_update["configlets"]]
             # Transform output to be CV compliant:
             # [{name: configlet_name, key: configlet_key_from_cv_facts}]
-            configlets_add = configlet_prepare_cvp_update(configlet_name_list=configlets_add, facts=module.params["cvp_facts"])
+            configlets_add = configlet_prepare_cvp_update(configlet_name_list=configlets_add, facts=facts_index)
             configlets_delete = device_update["configlets"]
             # Transform output to be CV compliant:
             # [{name: configlet_name, key: configlet_key_from_cv_facts}]
             configlets_delete = configlet_prepare_cvp_update(
-                configlet_name_list=configlets_delete, facts=module.params["cvp_facts"]
+                configlet_name_list=configlets_delete, facts=facts_index
             )
 
         if len(device_facts) == 0:
             module.fail_json("Error - device does not exists on CV side.")
 
-        # Execute configlet update on device
         MODULE_LOGGER.debug(' * device_update - device_update configlets: %s', str(device_update["configlets"]))
         MODULE_LOGGER.debug(' * device_update - cv_configlets configlets: %s', str(device_update["cv_configlets"]))
         if tools.is_list_diff(device_update["configlets"], device_update["cv_configlets"]):
-            MODULE_LOGGER.debug(' * device_update - call cv_update_configlets_on_device')
-            if module.check_mode:
-                devices_updated += 1
-                result_update.append(
-                    {device_update["name"]: "update-with-configlets"}
+            pending_updates.append((device_update, device_facts, configlets_add, configlets_delete))
+
+    # Execute configlet update on devices with bounded concurrency
+    update_futures = list()
+    if not module.check_mode and pending_updates:
+        with ThreadPoolExecutor(max_workers=min(tools_cv.MAX_WORKERS, len(pending_updates))) as executor:
+            for device_update, device_facts, configlets_add, configlets_delete in pending_updates:
+                MODULE_LOGGER.debug(' * device_update - call cv_update_configlets_on_device for %s', str(device_update["name"]))
+                update_futures.append(executor.submit(tools_cv.cv_update_configlets_on_device,
+                                                      module=module,
+                                                      device_facts=device_facts,
+                                                      add_configlets=configlets_add,
+                                                      del_configlets=configlets_delete))
+
+    for position, (device_update, device_facts, configlets_add, configlets_delete) in enumerate(pending_updates):
+        if module.check_mode:
+            devices_updated += 1
+            result_update.append(
+                {device_update["name"]: "update-with-configlets"}
+            )
+        else:
+            try:
+                device_action = update_futures[position].result()
+                MODULE_LOGGER.debug(' * device_update - get response from cv_update_configlets_on_device: %s', str(device_action))
+            except Exception as error:
+                errorMessage = str(error)
+                message = "Device %s Configlets cannot be updated - %s" % (
+                    device_update["name"],
+                    errorMessage,
                 )
+                result_update.append({device_update["name"]: message})
             else:
-                try:
-                    MODULE_LOGGER.debug(' * device_update - cv_configlets configlets: %s')
-                    # device_action = module.client.api.update_configlets_on_device(
-                    #     app_name="Ansible",
-                    #     device=device_facts,
-                    #     add_configlets=configlets_add,
-                    #     del_configlets=configlets_delete,
-                    # )
-                    MODULE_LOGGER.debug("%s", str(configlets_add))
-                    device_action = tools_cv.cv_update_configlets_on_device(
-                        module=module,
-                        device_facts=device_facts,
-                        add_configlets=configlets_add,
-                        del_configlets=configlets_delete
-                    )
-                    MODULE_LOGGER.debug(' * device_update - get response from cv_update_configlets_on_device: %s', str(device_action))
-                except Exception as error:
-                    errorMessage = str(error)
-                    message = "Device %s Configlets cannot be updated - %s" % (
+                # Capture and report error message sent by CV during update
+                if "errorMessage" in str(device_action):
+                    message = "Device %s Configlets cannot be Updated - %s" % (
                         device_update["name"],
-                        errorMessage,
+                        device_action["errorMessage"],
                     )
                     result_update.append({device_update["name"]: message})
                 else:
-                    # Capture and report error message sent by CV during update
-                    if "errorMessage" in str(device_action):
-                        message = "Device %s Configlets cannot be Updated - %s" % (
-                            device_update["name"],
-                            device_action["errorMessage"],
+                    changed = True  # noqa # pylint: disable=unused-variable
+                    MODULE_LOGGER.debug(' * device_update - looking for taskIds in %s', str(device_action))
+                    if "taskIds" in str(device_action):
+                        devices_updated += 1
+                        for taskId in device_action["data"]["taskIds"]:
+                            result_tasks_generated.append(taskId)
+                        result_update.append(
+                            {
+                                device_update["name"]: "Configlets-%s"
+                                % device_action["data"]["taskIds"]
+                            }
                         )
-                        result_update.append({device_update["name"]: message})
                     else:
-                        changed = True  # noqa # pylint: disable=unused-variable
-                        MODULE_LOGGER.debug(' * device_update - looking for taskIds in %s', str(device_action))
-                        if "taskIds" in str(device_action):
-                            devices_updated += 1
-                            for taskId in device_action["data"]["taskIds"]:
-                                result_tasks_generated.append(taskId)
-                            result_update.append(
-                                {
-                                    device_update["name"]: "Configlets-%s"
-                                    % device_action["data"]["taskIds"]
-                                }
-                            )
-                        else:
-                            result_update.append(
-                                {device_update["name"]: "Configlets-No_Specific_Tasks"}
-                            )
+                        result_update.append(
+                            {device_update["name"]: "Configlets-No_Specific_Tasks"}
+                        )
 
     # Build response structure
     data = {
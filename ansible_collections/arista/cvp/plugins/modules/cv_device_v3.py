@@ -52,6 +52,13 @@ options:
     default: 'hostname'
     choices: ['fqdn', 'hostname', 'serialNumber']
     type: str
+  batch_mode:
+    description:
+      - Stage configlet changes and container moves of all devices and save CloudVision topology once per action instead of once per device.
+      - Module fails without any change when temp actions are already pending for the user on CloudVision, as they would be saved too.
+    required: false
+    default: false
+    type: bool
 '''
 
 EXAMPLES = r'''
@@ -191,6 +198,7 @@ import traceback
 import ansible_collections.arista.cvp.plugins.module_utils.logger   # noqa # pylint: disable=unused-import
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.arista.cvp.plugins.module_utils import tools_cv
+from ansible_collections.arista.cvp.plugins.module_utils import tools_metrics
 from ansible_collections.arista.cvp.plugins.module_utils import tools_schema
 from ansible_collections.arista.cvp.plugins.module_utils.device_tools import CvDeviceTools, DeviceInventory
 try:
@@ -247,7 +255,10 @@ def main():
         search_key=dict(type='str',
                         required=False,
                         default='hostname',
-                        choices=['fqdn', 'hostname', 'serialNumber'])
+                        choices=['fqdn', 'hostname', 'serialNumber']),
+        batch_mode=dict(type='bool',
+                        required=False,
+                        default=False)
     )
 
     # Make module global to use it in all functions when required
@@ -275,7 +286,8 @@ def main():
     cv_topology = CvDeviceTools(
         cv_connection=cv_client,
         ansible_module=ansible_module,
-        check_mode=ansible_module.check_mode)
+        check_mode=ansible_module.check_mode,
+        batch_mode=ansible_module.params['batch_mode'])
 
     MODULE_LOGGER.debug('Ansible user inventory is: %s', str(user_topology.devices))
     result = cv_topology.manager(
@@ -286,6 +298,7 @@ def main():
         inventory_mode=ansible_module.params['inventory_mode'],
     )
 
+    result.update(tools_metrics.metrics_result(cv_client, name='cv_device_v3'))
     ansible_module.exit_json(**result)
 
 
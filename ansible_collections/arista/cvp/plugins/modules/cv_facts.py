@@ -95,7 +95,10 @@ EXAMPLES = r'''
 '''
 
 import logging
+import time
 import traceback  # noqa # pylint: disable=unused-import
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 import ansible_collections.arista.cvp.plugins.module_utils.logger   # noqa # pylint: disable=unused-import
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.arista.cvp.plugins.module_utils import tools_inventory
@@ -105,6 +108,13 @@ from ansible_collections.arista.cvp.plugins.module_utils import tools_cv
 MODULE_LOGGER = logging.getLogger('arista.cvp.cv_facts')
 MODULE_LOGGER.info('Start cv_facts module execution')
 
+# Maximum number of concurrent per device API calls and timeout for each of them in seconds
+# Timeout is counted from the moment a call starts running, not from when its result is awaited
+MAX_WORKERS = 8
+CALL_TIMEOUT = 120
+# Interval in seconds to check if a call still queued in thread pool has started
+QUEUE_POLL_INTERVAL = 1
+
 
 def facts_devices(module, facts):
     """
@@ -128,29 +138,62 @@ def facts_devices(module, facts):
     facts['devices'] = []
     # Get Inventory Data for All Devices
     inventory = module.client.api.get_inventory()
+    devices = list()
     for device in inventory:
-        MODULE_LOGGER.info('  -> Working on %s', device['hostname'])
         if 'systemMacAddress' in device and len(device['systemMacAddress']) > 0:
+            devices.append(device)
+        else:
+            MODULE_LOGGER.error('    ! Device %s is on Cloudvision but System Mac Address is missing ... skipped', device['hostname'])
+    if not devices:
+        return facts
+
+    # Resolve container names and device configlets with one call each instead of one per device
+    container_names = {container['key']: container['name'] for container in module.client.api.get_containers()['data']}
+    configlets_and_mappers = module.client.api.get_configlets_and_mappers()['data']
+    configlets = {configlet['key']: configlet for configlet in configlets_and_mappers['configlets']}
+    device_mappers = dict()
+    for mapper in configlets_and_mappers['configletMappers']:
+        if mapper['type'] == 'netelement' and mapper['configletId'] in configlets:
+            device_mappers.setdefault(mapper['objectId'], list()).append(mapper)
+    # Configlets are listed in the order they are applied to the device, mappers order is kept if unknown
+    device_configlets = dict()
+    for object_id, mappers in device_mappers.items():
+        if all('order' in mapper for mapper in mappers):
+            mappers = sorted(mappers, key=lambda mapper: int(mapper['order']))
+        device_configlets[object_id] = dict.fromkeys(mapper['configletId'] for mapper in mappers)
+
+    # Image info and running configs are still per device: fetch them concurrently
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(devices))) as executor:
+        image_futures = dict()
+        config_futures = dict()
+        for device in devices:
+            image_futures[device['key']] = submit_call(executor, module.client.api.get_device_image_info, device['key'])
+            if 'config' in module.params['gather_subset'] and device['streamingStatus'] == "active":
+                config_futures[device['key']] = submit_call(executor, module.client.api.get_device_configuration, device['key'])
+
+        for device in devices:
+            MODULE_LOGGER.info('  -> Working on %s', device['hostname'])
             device['name'] = device['hostname']
             # Add designed config for device
-            if 'config' in module.params['gather_subset'] and device['streamingStatus'] == "active":
-                device['config'] = module.client.api.get_device_configuration(device['key'])
+            if device['key'] in config_futures:
+                device['config'] = get_future_result(module, executor, config_futures[device['key']], device['hostname'])
 
             # Add parent container name
-            container = module.client.api.get_container_by_id(device['parentContainerKey'])
-            device['parentContainerName'] = container['name']
+            if device['parentContainerKey'] in container_names:
+                device['parentContainerName'] = container_names[device['parentContainerKey']]
+            else:
+                container = module.client.api.get_container_by_id(device['parentContainerKey'])
+                device['parentContainerName'] = container['name']
 
             # Add Device Specific Configlets
-            configlets = module.client.api.get_configlets_by_device_id(device['key'])
             device['deviceSpecificConfiglets'] = []
-            for configlet in configlets:
-                if int(configlet['containerCount']) == 0:
-                    device['deviceSpecificConfiglets'].append(configlet['name'])
+            for configlet_id in device_configlets.get(device['key'], {}):
+                if int(configlets[configlet_id]['containerCount']) == 0:
+                    device['deviceSpecificConfiglets'].append(configlets[configlet_id]['name'])
 
             # Add ImageBundle Info
             device['imageBundle'] = ""
-            deviceInfo = module.client.api.get_device_image_info(
-                device['key'])  # get_device_image_info() from cvprac
+            deviceInfo = get_future_result(module, executor, image_futures[device['key']], device['hostname'])  # get_device_image_info() from cvprac
             if "imageBundleMapper" in deviceInfo:
                 # There should only be one ImageBudle but its id is not decernable
                 # If the Image is applied directly to the device its type will be 'netelement'
@@ -161,12 +204,77 @@ def facts_devices(module, facts):
             # Add device to facts list
             facts['devices'].append(device)
             MODULE_LOGGER.info('    -> Device added to facts')
-        else:
-            MODULE_LOGGER.error('    ! Device is on Cloudvision but System Mac Address is missing ... skipped')
 
     return facts
 
 
+def submit_call(executor, function, *args):
+    """
+    Submit an API call to thread pool and keep track of when it starts running.
+
+    Parameters
+    ----------
+    executor : concurrent.futures.ThreadPoolExecutor
+        Thread pool running per device API calls
+    function : callable
+        cvprac API method to call
+    *args
+        Arguments of API method
+
+    Returns
+    -------
+    tuple
+        Future of API call and list where its start time is stored once running
+    """
+    started = []
+
+    def call():
+        started.append(time.monotonic())
+        return function(*args)
+
+    return executor.submit(call), started
+
+
+def get_future_result(module, executor, call, hostname):
+    """
+    Wait for result of an API call running in thread pool.
+
+    Call fails after CALL_TIMEOUT seconds from its start. On failure, calls still queued
+    are cancelled so module exits without running them.
+
+    Parameters
+    ----------
+    module : AnsibleModule
+        Ansible module with parameters and instances
+    executor : concurrent.futures.ThreadPoolExecutor
+        Thread pool running per device API calls
+    call : tuple
+        Future of API call and its start time, as returned by submit_call()
+    hostname : str
+        Hostname of device the API call is for
+
+    Returns
+    -------
+    Any
+        Result of API call
+    """
+    future, started = call
+    while True:
+        if started:
+            timeout = max(started[0] + CALL_TIMEOUT - time.monotonic(), 0)
+        else:
+            timeout = QUEUE_POLL_INTERVAL
+        try:
+            return future.result(timeout=timeout)
+        except FuturesTimeoutError:
+            if started and time.monotonic() >= started[0] + CALL_TIMEOUT:
+                break
+    MODULE_LOGGER.error('API call for device %s did not complete in %ss', hostname, CALL_TIMEOUT)
+    # Running calls are bounded by cvprac request timeout, queued ones are dropped
+    executor.shutdown(wait=False, cancel_futures=True)
+    module.fail_json(msg='API call for device {0} did not complete in {1}s'.format(hostname, CALL_TIMEOUT))
+
+
 def facts_configlets_v1(module, facts):
     """
     DEPRECATED - Collect facts of all configlets.
@@ -257,29 +365,31 @@ def facts_configlets(module, facts):
 
     # Create list of configlets
     if 'configlets' in configlets_and_mappers:
+        # Index mappers, devices and containers once to avoid scanning them for every configlet
+        hostnames = tools_inventory.build_hostname_index(inventory=inventory)
+        container_names = tools_inventory.build_containerName_index(containers_list=containers)
+        configlet_mappers = dict()
+        for mapper in configlets_and_mappers['configletMappers']:
+            configlet_mappers.setdefault(mapper['configletId'], []).append(mapper)
         for configlet in configlets_and_mappers['configlets']:
             configlet['devices'] = list()
             configlet['containers'] = list()
             # Parse mapper section to locate potential mappings to devices and containers.
-            MODULE_LOGGER.info('building list of mapping with devices and containers for configlet %s', str(configlet['name']))
-            for mapper in configlets_and_mappers['configletMappers']:
-                # If mapper is tied to our configlet
-                if mapper['configletId'] == configlet['key']:
-                    # If mapper is for device
-                    if mapper['type'] == 'netelement':
-                        device_hostname = tools_inventory.find_hostname_by_mac(
-                            inventory=inventory, mac_address=mapper['objectId'])
-                        if device_hostname is not None:
-                            MODULE_LOGGER.debug('found mapping to device %s', str(device_hostname))
-                            configlet['devices'].append(device_hostname)
-                    # If mapper is for container
-                    if mapper['type'] == 'container':
-                        container_name = tools_inventory.find_containerName_by_containerId(containers_list=containers,
-                                                                                           container_id=mapper['objectId'])
-                        if container_name is not None:
-                            MODULE_LOGGER.debug(
-                                'found mapping to container %s', str(container_name))
-                            configlet['containers'].append(container_name)
+            MODULE_LOGGER.info('building list of mapping with devices and containers for configlet %s', configlet['name'])
+            for mapper in configlet_mappers.get(configlet['key'], []):
+                # If mapper is for device
+                if mapper['type'] == 'netelement':
+                    device_hostname = hostnames.get(mapper['objectId'])
+                    if device_hostname is not None:
+                        MODULE_LOGGER.debug('found mapping to device %s', device_hostname)
+                        configlet['devices'].append(device_hostname)
+                # If mapper is for container
+                if mapper['type'] == 'container':
+                    container_name = container_names.get(mapper['objectId'])
+                    if container_name is not None:
+                        MODULE_LOGGER.debug(
+                            'found mapping to container %s', container_name)
+                        configlet['containers'].append(container_name)
             facts['configlets'].append(configlet)
     else:
         MODULE_LOGGER.error('No configlet found on CVP')
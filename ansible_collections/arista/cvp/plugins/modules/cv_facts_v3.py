@@ -54,6 +54,25 @@ options:
     choices: ['long', 'short']
     default: 'short'
     type: str
+  output_file:
+    description:
+      - Path of a file on the controller to stream facts to as JSON-lines while they are collected.
+      - When set, module only returns path of the file and number of facts per section.
+    required: false
+    type: path
+  compress:
+    description: Compress output_file using gzip.
+    required: false
+    default: false
+    type: bool
+  since_task_id:
+    description: Only collect tasks with an ID greater than this one.
+    required: false
+    type: int
+  since_time:
+    description: Only collect tasks created after this Unix timestamp (in seconds).
+    required: false
+    type: int
 '''
 
 EXAMPLES = r'''
@@ -103,6 +122,35 @@ EXAMPLES = r'''
       regexp_filter: 95 # get facts filtered by task_Id (int)
       verbose: 'long'
     register: FACTS_DEVICES
+
+  - name: '#08 - Export all facts from {{inventory_hostname}} to a file'
+    arista.cvp.cv_facts_v3:
+      output_file: '{{ playbook_dir }}/cv_facts.jsonl.gz'
+      compress: true
+    register: FACTS_EXPORT
+
+  - name: '#09 - Collect task facts created after task 95 from {{inventory_hostname}}'
+    arista.cvp.cv_facts_v3:
+      facts:
+        - tasks
+      since_task_id: 95
+    register: FACTS_TASKS
+'''
+
+RETURN = r'''
+data:
+  description:
+    - Facts collected from CloudVision, per section (cvp_configlets, cvp_containers, cvp_devices, cvp_images, cvp_tasks).
+    - When output_file is set, path of the file and number of facts per section.
+  returned: always
+  type: dict
+timing:
+  description: Time in seconds spent to collect each scope of facts.
+  returned: always
+  type: dict
+  sample:
+    configlets: 0.412
+    devices: 1.853
 '''
 
 import logging
@@ -110,6 +158,7 @@ import traceback
 import ansible_collections.arista.cvp.plugins.module_utils.logger   # noqa # pylint: disable=unused-import
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.arista.cvp.plugins.module_utils import tools_cv  # noqa # pylint: disable=unused-import
+from ansible_collections.arista.cvp.plugins.module_utils import tools_metrics
 from ansible_collections.arista.cvp.plugins.module_utils import tools_schema as schema
 from ansible_collections.arista.cvp.plugins.module_utils.facts_tools import CvFactsTools
 # from ansible_collections.arista.cvp.plugins.module_utils.facts_tools import *
@@ -170,6 +219,23 @@ def main():
             required=False,
             choices=['long', 'short'],
             default='short'
+        ),
+        output_file=dict(
+            type='path',
+            required=False
+        ),
+        compress=dict(
+            type='bool',
+            required=False,
+            default=False
+        ),
+        since_task_id=dict(
+            type='int',
+            required=False
+        ),
+        since_time=dict(
+            type='int',
+            required=False
         )
     )
 
@@ -189,13 +255,16 @@ def main():
     facts_collector = CvFactsTools(cv_connection=cv_client)
     try:
         facts = facts_collector.facts(scope=ansible_module.params['facts'], regex_filter=ansible_module.params['regexp_filter'],
-                                      verbose=ansible_module.params['verbose'])
+                                      verbose=ansible_module.params['verbose'], output_file=ansible_module.params['output_file'],
+                                      compress=ansible_module.params['compress'], since_task_id=ansible_module.params['since_task_id'],
+                                      since_time=ansible_module.params['since_time'])
     except CvpClientError as e:
         ansible_module.fail_json(msg=str(e))
-    result = dict(changed=False, data=facts, failed=False)
+    result = dict(changed=False, data=facts, failed=False, timing=facts_collector.timing)
 
     # Implement logic
 
+    result.update(tools_metrics.metrics_result(cv_client, name='cv_facts_v3'))
     ansible_module.exit_json(**result)
 
 
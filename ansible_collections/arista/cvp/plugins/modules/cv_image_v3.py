@@ -101,6 +101,7 @@ import logging
 from ansible.module_utils.basic import AnsibleModule
 import ansible_collections.arista.cvp.plugins.module_utils.logger   # noqa # pylint: disable=unused-import
 from ansible_collections.arista.cvp.plugins.module_utils import tools_cv
+from ansible_collections.arista.cvp.plugins.module_utils import tools_metrics
 from ansible_collections.arista.cvp.plugins.module_utils.image_tools import CvImageTools
 
 MODULE_LOGGER = logging.getLogger('arista.cvp.cv_image')
@@ -156,6 +157,7 @@ def main():
     result['changed'], result['data'], warnings = cv_images.module_action(**ansible_module.params)
     MODULE_LOGGER.warning(warnings)
 
+    result.update(tools_metrics.metrics_result(cv_client, name='cv_image_v3'))
     ansible_module.exit_json(**result)
 
 
@@ -192,6 +192,7 @@ import ansible_collections.arista.cvp.plugins.module_utils.logger   # noqa # pyl
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.arista.cvp.plugins.module_utils.response import CvAnsibleResponse
 from ansible_collections.arista.cvp.plugins.module_utils import tools_cv
+from ansible_collections.arista.cvp.plugins.module_utils import tools_metrics
 from ansible_collections.arista.cvp.plugins.module_utils import tools_schema
 from ansible_collections.arista.cvp.plugins.module_utils.tag_tools import CvTagTools, CvTagInput
 try:
@@ -277,6 +278,7 @@ def main():
                                                              auto_create=ansible_module.params['auto_create'])
 
     result = ansible_response.content
+    result.update(tools_metrics.metrics_result(cv_client, name='cv_tag_v3'))
     ansible_module.exit_json(**result)
 
 
@@ -51,6 +51,7 @@ import traceback
 import ansible_collections.arista.cvp.plugins.module_utils.logger   # noqa # pylint: disable=unused-import
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.arista.cvp.plugins.module_utils import tools_cv
+from ansible_collections.arista.cvp.plugins.module_utils import tools_metrics
 from ansible_collections.arista.cvp.plugins.module_utils.response import CvAnsibleResponse
 from ansible_collections.arista.cvp.plugins.module_utils.task_tools import CvTaskTools
 try:
@@ -114,6 +115,7 @@ def main():
 
     result = ansible_response.content
 
+    result.update(tools_metrics.metrics_result(cv_client, name='cv_task_v3'))
     ansible_module.exit_json(**result)
 
 
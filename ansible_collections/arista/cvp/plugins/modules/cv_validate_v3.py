@@ -78,6 +78,7 @@ import traceback
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.arista.cvp.plugins.module_utils.response import CvAnsibleResponse
 from ansible_collections.arista.cvp.plugins.module_utils import tools_cv
+from ansible_collections.arista.cvp.plugins.module_utils import tools_metrics
 from ansible_collections.arista.cvp.plugins.module_utils import tools_schema
 from ansible_collections.arista.cvp.plugins.module_utils.validate_tools import CvValidateInput, CvValidationTools
 try:
@@ -156,6 +157,7 @@ def main():
     )
 
     result = ansible_response.content
+    result.update(tools_metrics.metrics_result(cv_client, name='cv_validate_v3'))
     ansible_module.exit_json(**result)
 
 
@@ -0,0 +1,62 @@
+# Copyright (c) 2023 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+import pytest
+from tests.lib.benchmark import (BENCHMARK_LATENCY, BENCHMARK_ROUNDS, BENCHMARK_SCALE, BENCHMARK_UPDATE,
+                                 BenchmarkBaseline, instrumented_client)
+from tests.lib.fabric_generator import FabricGenerator
+
+
+@pytest.fixture(scope='session')
+def fabric():
+    """
+    fabric - synthetic fabric at CVP_BENCHMARK_SCALE with a few devices to deploy
+    """
+    return FabricGenerator.from_scale(BENCHMARK_SCALE, undefined=5)
+
+
+@pytest.fixture(scope='session')
+def baseline():
+    """
+    baseline - stored benchmark results, saved at end of session when CVP_BENCHMARK_UPDATE is set
+    """
+    benchmark_baseline = BenchmarkBaseline()
+    yield benchmark_baseline
+    if BENCHMARK_UPDATE:
+        benchmark_baseline.save()
+
+
+@pytest.fixture
+def cv_benchmark(benchmark, baseline, fabric, request):
+    """
+    cv_benchmark - factory function to benchmark a target and check it against baseline
+
+    When with_client is True, target gets a new instrumented cvprac client on a fresh copy of
+    the fabric for every round, so rounds do not see changes of previous ones.
+    """
+    def _cv_benchmark(target, with_client: bool = True):
+        recorders = []
+
+        def setup():
+            if not with_client:
+                return (), {}
+            _, cvp_client, metrics = instrumented_client(fabric.database())
+            recorders.append(metrics)
+            return (cvp_client,), {}
+
+        output = benchmark.pedantic(target, setup=setup, rounds=BENCHMARK_ROUNDS)
+        summary = recorders[-1].summary if recorders else {'total_calls': 0, 'api': {}}
+        result = {
+            'api_calls': summary['total_calls'],
+            'requests': sum(counters['requests'] for counters in summary['api'].values()),
+            'time': round(benchmark.stats.stats.median, 6) if benchmark.stats else None,
+            'latency': BENCHMARK_LATENCY,
+        }
+        benchmark.extra_info.update(result)
+        benchmark.extra_info['api'] = {name: counters['calls'] for name, counters in summary['api'].items()}
+        regressions = baseline.check(case=request.node.name, result=result)
+        if not BENCHMARK_UPDATE:
+            assert not regressions, 'Benchmark {} regressed: {}'.format(request.node.name, ', '.join(regressions))
+        return output
+
+    return _cv_benchmark
@@ -0,0 +1,84 @@
+#!/usr/bin/python
+# Copyright (c) 2023 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+# coding: utf-8 -*-
+
+from __future__ import (absolute_import, division, print_function)
+import pytest
+from ansible_collections.arista.cvp.plugins.module_utils.container_tools import ContainerInput
+from ansible_collections.arista.cvp.plugins.module_utils.response import CvApiResult, CvManagerResult, CvAnsibleResponse
+from ansible_collections.arista.cvp.plugins.module_utils.tools_schema import validate_json_schema
+from tests.lib.fabric_generator import FabricGenerator
+
+pytest.importorskip('pytest_benchmark')
+
+# Inputs of 10k devices, independent of CVP_BENCHMARK_SCALE as no Cloudvision is involved
+LARGE_FABRIC = {'devices': 10000, 'configlets': 20000, 'depth': 5, 'fanout': 4, 'config_lines': 4}
+
+# ---------------------------------------------------------------------------- #
+#   FIXTURES
+# ---------------------------------------------------------------------------- #
+
+
+@pytest.fixture(scope='module')
+def large_fabric():
+    return FabricGenerator(**LARGE_FABRIC)
+
+
+@pytest.fixture(scope='module')
+def deep_fabric():
+    return FabricGenerator.from_scale('deep', tasks=0, change_controls=0)
+
+# ---------------------------------------------------------------------------- #
+#   PYTEST
+# ---------------------------------------------------------------------------- #
+
+
+@pytest.mark.benchmark(group='inputs')
+@pytest.mark.parametrize('topology', ['large', 'deep'])
+def test_ordered_list_containers(cv_benchmark, large_fabric, deep_fabric, topology):
+    fabric = large_fabric if topology == 'large' else deep_fabric
+    user_topology = fabric.container_inputs()
+
+    def target():
+        return ContainerInput(user_topology=user_topology).ordered_list_containers
+
+    containers = cv_benchmark(target, with_client=False)
+    assert len(containers) == len(user_topology)
+
+
+@pytest.mark.benchmark(group='schema')
+@pytest.mark.parametrize('schema', ['SCHEMA_CV_DEVICE', 'SCHEMA_CV_CONTAINER', 'SCHEMA_CV_CONFIGLET'])
+def test_validate_json_schema(cv_benchmark, large_fabric, schema):
+    user_json = {
+        'SCHEMA_CV_DEVICE': large_fabric.device_inputs,
+        'SCHEMA_CV_CONTAINER': large_fabric.container_inputs,
+        'SCHEMA_CV_CONFIGLET': large_fabric.configlet_inputs,
+    }[schema]()
+
+    def target():
+        return validate_json_schema(user_json=user_json, schema=schema)
+
+    assert cv_benchmark(target, with_client=False)
+
+
+@pytest.mark.benchmark(group='response')
+def test_manager_result_aggregation(cv_benchmark, large_fabric):
+    devices = [device['fqdn'] for device in large_fabric.devices]
+
+    def target():
+        manager = CvManagerResult(builder_name='configlets_attached')
+        for index, device in enumerate(devices):
+            change = CvApiResult(action_name=device + '_configlet_attached')
+            change.changed = True
+            change.success = True
+            change.taskIds = [str(index)]
+            change.add_entries([f'{device}-config', 'shared-1'])
+            manager.add_change(change)
+        response = CvAnsibleResponse()
+        response.add_manager(manager)
+        return response.content
+
+    content = cv_benchmark(target, with_client=False)
+    assert len(content['taskIds']) == len(devices)
@@ -0,0 +1,72 @@
+#!/usr/bin/python
+# Copyright (c) 2023 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+# coding: utf-8 -*-
+
+from __future__ import (absolute_import, division, print_function)
+import pytest
+from ansible_collections.arista.cvp.plugins.module_utils.configlet_tools import CvConfigletTools, ConfigletInput
+from ansible_collections.arista.cvp.plugins.module_utils.container_tools import CvContainerTools, ContainerInput
+from ansible_collections.arista.cvp.plugins.module_utils.device_tools import CvDeviceTools, DeviceInventory
+from ansible_collections.arista.cvp.plugins.module_utils.facts_tools import CvFactsTools
+from tests.lib.mock_ansible import get_ansible_module
+
+pytest.importorskip('pytest_benchmark')
+
+FACTS_SCOPES = ['configlets', 'containers', 'devices', 'images', 'tasks']
+
+SEARCH_KEYS = ['fqdn', 'hostname', 'serialNumber']
+
+APPLY_MODES = ['loose', 'strict']
+
+
+@pytest.mark.benchmark(group='facts')
+@pytest.mark.parametrize('scope', FACTS_SCOPES)
+def test_facts(cv_benchmark, scope):
+    def target(cvp_client):
+        return CvFactsTools(cv_connection=cvp_client).facts(scope=[scope])
+
+    facts = cv_benchmark(target)
+    assert facts
+
+
+@pytest.mark.benchmark(group='device')
+@pytest.mark.parametrize('apply_mode', APPLY_MODES)
+@pytest.mark.parametrize('search_key', SEARCH_KEYS)
+def test_device_manager_present(cv_benchmark, fabric, search_key, apply_mode):
+    user_inventory = fabric.device_inputs(moved=0.1, changed=0.1, search_key=search_key)
+
+    def target(cvp_client):
+        device_tools = CvDeviceTools(cv_connection=cvp_client, ansible_module=get_ansible_module(), search_by=search_key)
+        return device_tools.manager(user_inventory=DeviceInventory(data=user_inventory), search_mode=search_key,
+                                    apply_mode=apply_mode, state='present')
+
+    result = cv_benchmark(target)
+    assert result['success']
+    assert result['changed']
+
+
+@pytest.mark.benchmark(group='container')
+@pytest.mark.parametrize('apply_mode', APPLY_MODES)
+def test_container_build_topology(cv_benchmark, fabric, apply_mode):
+    user_topology = fabric.container_inputs(changed=0.2)
+
+    def target(cvp_client):
+        container_tools = CvContainerTools(cv_connection=cvp_client, ansible_module=get_ansible_module())
+        return container_tools.build_topology(user_topology=ContainerInput(user_topology=user_topology), present=True, apply_mode=apply_mode)
+
+    result = cv_benchmark(target)
+    assert result.content['success']
+
+
+@pytest.mark.benchmark(group='configlet')
+def test_configlet_apply(cv_benchmark, fabric):
+    user_configlets = ConfigletInput(user_topology=fabric.configlet_inputs(changed=0.1, new=10))
+
+    def target(cvp_client):
+        configlet_tools = CvConfigletTools(cv_connection=cvp_client, ansible_module=get_ansible_module())
+        return configlet_tools.apply(configlet_list=user_configlets.configlets, present=True)
+
+    result = cv_benchmark(target)
+    assert result.content['success']
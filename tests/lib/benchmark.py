@@ -0,0 +1,139 @@
+#!/usr/bin/python
+# Copyright (c) 2023 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+# coding: utf-8 -*-
+"""
+benchmark.py - Helpers for benchmarks of module_utils in tests/benchmark.
+
+Every benchmark case runs against a MockCVPServer served in process, with a cvprac client
+instrumented by tools_metrics to count API calls and HTTP requests. Results are compared to
+tests/benchmark/baseline.json: a case fails when it makes more API calls or HTTP requests than
+its baseline, or when its median time is above baseline time multiplied by a tolerance.
+
+Environment variables:
+- CVP_BENCHMARK_SCALE: scale of FabricGenerator to use, by default 100
+- CVP_BENCHMARK_LATENCY: latency in seconds added to every HTTP request, by default 0
+- CVP_BENCHMARK_ROUNDS: number of rounds per case, by default 3
+- CVP_BENCHMARK_TIME_TOLERANCE: ratio of baseline time considered as a regression, by default 2.0
+- CVP_BENCHMARK_UPDATE: save results as new baseline instead of checking them
+"""
+
+from __future__ import (absolute_import, division, print_function)
+import json
+import logging
+import os
+from ansible_collections.arista.cvp.plugins.module_utils import tools_metrics
+from tests.lib.cvp_server import MockCVPServer
+
+LOGGER = logging.getLogger(__name__)
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmark', 'baseline.json')
+
+BENCHMARK_SCALE = os.environ.get('CVP_BENCHMARK_SCALE', '100')
+BENCHMARK_LATENCY = float(os.environ.get('CVP_BENCHMARK_LATENCY', 0))
+BENCHMARK_ROUNDS = int(os.environ.get('CVP_BENCHMARK_ROUNDS', 3))
+BENCHMARK_TIME_TOLERANCE = float(os.environ.get('CVP_BENCHMARK_TIME_TOLERANCE', 2.0))
+BENCHMARK_UPDATE = os.environ.get('CVP_BENCHMARK_UPDATE', 'false').lower() in ['true', 'yes', '1']
+
+# Counters compared to baseline, a higher value is a regression
+BENCHMARK_COUNTERS = ['api_calls', 'requests']
+
+
+def instrumented_client(database, latency: float = BENCHMARK_LATENCY):
+    """
+    instrumented_client Build a cvprac client served in process from a database
+
+    Parameters
+    ----------
+    database : MockCVPDatabase
+        Database to serve, updated in place by the client
+    latency : float, optional
+        Latency in seconds added to every HTTP request, by default CVP_BENCHMARK_LATENCY
+
+    Returns
+    -------
+    tuple
+        MockCVPServer, connected CvpClient and its CvApiMetrics recorder
+    """
+    server = MockCVPServer(database=database, latency=latency)
+    cvp_client = server.local_client()
+    metrics = tools_metrics.instrument_client(cvp_client)
+    return server, cvp_client, metrics
+
+
+class BenchmarkBaseline():
+    """
+    BenchmarkBaseline Results of benchmark cases stored per scale in a JSON file.
+
+    Example
+    -------
+    >>> baseline = BenchmarkBaseline(path=BASELINE_FILE, scale='100')
+    >>> baseline.check(case='test_facts[devices]', result={'api_calls': 102, 'requests': 102, 'time': 0.3})
+    []
+    """
+
+    def __init__(self, path: str = BASELINE_FILE, scale: str = BENCHMARK_SCALE, time_tolerance: float = BENCHMARK_TIME_TOLERANCE):
+        self.path = path
+        self.scale = scale
+        self.time_tolerance = time_tolerance
+        self.__data = {}
+        if os.path.exists(path):
+            with open(path, encoding='utf8') as baseline_file:
+                self.__data = json.load(baseline_file)
+        self.results = {}
+
+    @property
+    def cases(self):
+        """
+        cases Baseline of all cases for current scale
+
+        Returns
+        -------
+        dict
+            Baseline results per case name
+        """
+        return self.__data.get(self.scale, {})
+
+    def check(self, case: str, result: dict):
+        """
+        check Compare result of a case with its baseline
+
+        Time is only compared when result and baseline were measured with the same latency.
+
+        Parameters
+        ----------
+        case : str
+            Name of benchmark case
+        result : dict
+            Counters of BENCHMARK_COUNTERS, median time in seconds and latency used
+
+        Returns
+        -------
+        list
+            Regressions found, empty if case has no baseline or no regression
+        """
+        self.results[case] = result
+        baseline = self.cases.get(case)
+        if baseline is None:
+            LOGGER.warning('No baseline for benchmark %s at scale %s', case, self.scale)
+            return []
+        regressions = []
+        for counter in BENCHMARK_COUNTERS:
+            if result[counter] > baseline[counter]:
+                regressions.append(f'{counter}: {result[counter]} > {baseline[counter]}')
+        if result.get('time') is not None and result.get('latency') == baseline.get('latency'):
+            if result['time'] > baseline['time'] * self.time_tolerance:
+                regressions.append(f'time: {result["time"]:.6f}s > {self.time_tolerance} x {baseline["time"]:.6f}s')
+        return regressions
+
+    def save(self):
+        """
+        save Save results of cases run as baseline of current scale
+        """
+        self.__data.setdefault(self.scale, {}).update(self.results)
+        self.__data[self.scale] = dict(sorted(self.__data[self.scale].items()))
+        with open(self.path, 'w', encoding='utf8') as baseline_file:
+            json.dump(self.__data, baseline_file, indent=2, sort_keys=True)
+            baseline_file.write('\n')
+        LOGGER.info('Benchmark baseline saved to %s for %d cases', self.path, len(self.results))
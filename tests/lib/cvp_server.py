@@ -0,0 +1,1193 @@
+#!/usr/bin/python
+# Copyright (c) 2023 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+# coding: utf-8 -*-
+"""
+cvp_server.py - Local stand-in of the Cloudvision API backed by a MockCVPDatabase.
+
+The server implements the cvprac endpoints used by the collection so modules and
+module_utils can run end to end against a large synthetic Cloudvision without a live cluster.
+cvprac always connects with HTTPS, so the server uses a self-signed certificate generated at startup.
+local_client() returns a client served in process without network, for benchmarks.
+
+Example
+-------
+>>> database = seed_database(devices=1000, configlets=5000)
+>>> with MockCVPServer(database=database, latency=0.005, error_rate=0.01, seed=42) as server:
+...     client = server.client()
+...     client.api.get_inventory()
+"""
+
+from __future__ import (absolute_import, division, print_function)
+import collections
+import copy
+import datetime
+import json
+import logging
+import random
+import re
+import shutil
+import ssl
+import tempfile
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+import requests
+from requests.adapters import BaseAdapter
+from cvprac.cvp_client import CvpClient
+from ansible_collections.arista.cvp.plugins.module_utils.resources.api.fields import Api
+from tests.lib.mock import MockCVPDatabase
+
+LOGGER = logging.getLogger(__name__)
+
+ROOT_CONTAINER = {
+    Api.generic.NAME: 'Tenant',
+    Api.generic.KEY: 'root',
+    Api.generic.PARENT_CONTAINER_ID: None,
+}
+
+UNDEFINED_CONTAINER = {
+    Api.generic.NAME: Api.container.UNDEFINED_CONTAINER_NAME,
+    Api.generic.KEY: Api.container.UNDEFINED_CONTAINER_ID,
+    Api.generic.PARENT_CONTAINER_ID: 'root',
+}
+
+# Requests never impacted by error injection, so a client can always log in
+NO_FAILURE_PATHS = ['/web/login/authenticate.do', '/web/cvpInfo/getCvpInfo.do', '/api/v1/rest/']
+
+
+class CvpServerError(Exception):
+    """Error returned by Cloudvision in an errorCode payload"""
+
+    def __init__(self, message: str, code: str = '112498'):
+        super().__init__(message)
+        self.message = message
+        self.code = code
+
+
+class CvpResourceNotFound(Exception):
+    """Error returned by Cloudvision resource APIs when a resource does not exist"""
+    pass
+
+
+class JsonStream(list):
+    """List of JSON objects sent one after the other, as resource APIs do for GetAll requests"""
+    pass
+
+
+def generate_certificate(path: str):
+    """
+    generate_certificate Create a self-signed certificate for localhost
+
+    Parameters
+    ----------
+    path : str
+        Directory to save certificate and key
+
+    Returns
+    -------
+    tuple
+        Path of certificate file and path of key file
+    """
+    # cryptography is installed with ansible-core
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, 'localhost')])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    certificate = (x509.CertificateBuilder()
+                   .subject_name(name)
+                   .issuer_name(name)
+                   .public_key(key.public_key())
+                   .serial_number(x509.random_serial_number())
+                   .not_valid_before(now - datetime.timedelta(days=1))
+                   .not_valid_after(now + datetime.timedelta(days=1))
+                   .sign(key, hashes.SHA256()))
+    certfile = f'{path}/cvp.crt'
+    keyfile = f'{path}/cvp.key'
+    with open(certfile, 'wb') as cert_file:
+        cert_file.write(certificate.public_bytes(serialization.Encoding.PEM))
+    with open(keyfile, 'wb') as key_file:
+        key_file.write(key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8,
+                                         serialization.NoEncryption()))
+    return certfile, keyfile
+
+
+def seed_database(devices: int = 10, configlets: int = 10):
+    """
+    seed_database Build a MockCVPDatabase with a flat fabric of N devices and M configlets
+
+    Devices are all in container Leaves under Fabric, configlets are applied in a round robin way
+    to devices.
+
+    Parameters
+    ----------
+    devices : int, optional
+        Number of devices, by default 10
+    configlets : int, optional
+        Number of configlets, by default 10
+
+    Returns
+    -------
+    MockCVPDatabase
+        Database to serve with MockCVPServer
+    """
+    database = MockCVPDatabase()
+    for name, parent in [('Fabric', 'root'), ('Leaves', 'container_fabric')]:
+        database.containers[name] = {Api.generic.NAME: name, Api.generic.KEY: f'container_{name.lower()}',
+                                     Api.generic.PARENT_CONTAINER_ID: parent}
+    for index in range(devices):
+        mac = ':'.join(['02'] + [f'{byte:02x}' for byte in index.to_bytes(5, 'big')])
+        database.devices[mac] = {
+            'hostname': f'leaf{index + 1}',
+            'fqdn': f'leaf{index + 1}.example.com',
+            'domainName': 'example.com',
+            Api.device.SYSMAC: mac,
+            Api.device.SERIAL: f'SN{index:010d}',
+            Api.device.MGMTIP: f'10.{index // 65536 % 256}.{index // 256 % 256}.{index % 256}',
+            Api.device.PARENT_CONTAINER_KEY: 'container_leaves',
+            'config': f'hostname leaf{index + 1}\n',
+        }
+    macs = list(database.devices)
+    mappers = database.configlets_mappers.setdefault('data', {}).setdefault('configletMappers', [])
+    for index in range(configlets):
+        key = f'configlet_{index:08d}'
+        database.configlets[f'configlet-{index}'] = {Api.generic.NAME: f'configlet-{index}', Api.generic.KEY: key,
+                                                     Api.generic.CONFIG: f'alias c{index} show version\n'}
+        if macs:
+            mappers.append({Api.generic.KEY: f'configletMapper_{index:08d}', Api.configlet.ID: key, 'type': 'netelement',
+                            Api.mappers.OBJECT_ID: macs[index % len(macs)], Api.container.ID: 'container_leaves'})
+    return database
+
+
+def _values(collection):
+    """Items of a mock database collection stored either as a list or as a dict"""
+    if isinstance(collection, dict):
+        return list(collection.values())
+    return list(collection)
+
+
+def _insert(collection, name: str, item: dict):
+    if isinstance(collection, dict):
+        collection[name] = item
+    else:
+        collection.append(item)
+
+
+def _remove(collection, items: list):
+    identities = {id(item) for item in items}
+    if isinstance(collection, dict):
+        for name in [name for name, item in collection.items() if id(item) in identities]:
+            del collection[name]
+    else:
+        collection[:] = [item for item in collection if id(item) not in identities]
+
+
+def _payload_list(payload):
+    """List of entries of a mock database collection stored as an API response {'data': [...]}"""
+    if isinstance(payload, dict):
+        return payload.setdefault('data', [])
+    return payload
+
+
+def _now():
+    return int(time.time() * 1000)
+
+
+def _resource_time():
+    return datetime.datetime.now(datetime.timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+
+
+def _encode(payload):
+    """HTTP body of a payload returned by a route"""
+    if isinstance(payload, JsonStream):
+        content = '\n'.join(json.dumps(entry) for entry in payload)
+    elif isinstance(payload, str):
+        content = payload
+    else:
+        content = json.dumps(payload)
+    return content.encode('utf-8')
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """HTTP handler forwarding every request to the MockCVPServer attached to the HTTP server"""
+
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately, avoid delayed ACK on every response
+    disable_nagle_algorithm = True
+
+    def __handle(self, method: str):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        status, payload, headers = self.server.cvp.handle(method, self.path, body)
+        content = _encode(payload)
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        for header, value in headers.items():
+            self.send_header(header, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        self.__handle('GET')
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        self.__handle('POST')
+
+    def do_DELETE(self):  # pylint: disable=invalid-name
+        self.__handle('DELETE')
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        LOGGER.debug('%s - %s', self.address_string(), format % args)
+
+
+class _LocalAdapter(BaseAdapter):
+    """requests transport adapter serving requests with a MockCVPServer in the current thread"""
+
+    def __init__(self, server):
+        super().__init__()
+        self.server = server
+
+    def send(self, request, **kwargs):  # pylint: disable=arguments-differ
+        body = request.body or b''
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        url = urlsplit(request.url)
+        path = f'{url.path}?{url.query}' if url.query else url.path
+        status, payload, headers = self.server.handle(request.method, path, body)
+        response = requests.Response()
+        response.status_code = status
+        response.reason = 'OK' if status == 200 else 'Error'
+        response.headers.update(headers)
+        response.headers['Content-Type'] = 'application/json'
+        response._content = _encode(payload)  # pylint: disable=protected-access
+        response.encoding = 'utf-8'
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+class LocalCvpClient(CvpClient):
+    """CvpClient sending its requests to a MockCVPServer in process, without network nor TLS"""
+
+    def __init__(self, server, **kwargs):
+        self.server = server
+        super().__init__(**kwargs)
+
+    def _login(self):
+        # Called by cvprac right after a new requests session is created
+        self.session.mount('https://', _LocalAdapter(self.server))
+        # No proxy lookup in environment for every request
+        self.session.trust_env = False
+        return super()._login()
+
+
+class MockCVPServer():
+    """
+    MockCVPServer Local HTTPS server mimicking Cloudvision API on top of a MockCVPDatabase.
+
+    Every request can be delayed with a fixed latency, and a ratio of requests can fail with an HTTP 500
+    error to test error handling. Requests received are counted per endpoint in `requests`.
+
+    The database is read and updated in place. When test code updates the database while the server
+    is running, call refresh() so the server rebuilds its indexes.
+    """
+
+    VERSION = '2022.1.0'
+
+    def __init__(self, database: MockCVPDatabase = None, host: str = '127.0.0.1', port: int = 0,
+                 latency: float = 0.0, error_rate: float = 0.0, seed: int = None, version: str = VERSION):
+        self.database = database if database is not None else MockCVPDatabase()
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.error_rate = error_rate
+        self.version = version
+        self.requests = collections.Counter()
+        self.__random = random.Random(seed)
+        self.__lock = threading.RLock()
+        self.__indexes = None
+        self.__temp_actions = []
+        self.__decommissioning = {}
+        self.__httpd = None
+        self.__thread = None
+        self.__tmpdir = None
+        self.__routes = {
+            ('POST', '/web/login/authenticate.do'): self.__login,
+            ('POST', '/web/login/logout.do'): self.__success,
+            ('GET', '/api/v1/rest/'): self.__token_login,
+            ('GET', '/web/cvpInfo/getCvpInfo.do'): self.__cvp_info,
+            # Inventory
+            ('GET', '/web/inventory/devices'): self.__inventory_devices,
+            ('DELETE', '/web/inventory/devices'): self.__delete_devices,
+            ('GET', '/web/inventory/containers'): self.__inventory_containers,
+            ('GET', '/web/inventory/device/config'): self.__device_config,
+            # Topology
+            ('GET', '/web/provisioning/getContainerInfoById.do'): self.__container_info,
+            ('GET', '/web/provisioning/searchTopology.do'): self.__search_topology,
+            ('GET', '/web/provisioning/v3/searchTopology.do'): self.__search_topology,
+            ('GET', '/web/provisioning/filterTopology.do'): self.__filter_topology,
+            ('GET', '/web/provisioning/getAllTempActions.do'): self.__temp_actions_list,
+            ('POST', '/web/provisioning/addTempAction.do'): self.__add_temp_action,
+            ('POST', '/web/provisioning/deleteAllTempAction.do'): self.__delete_temp_actions,
+            ('POST', '/web/provisioning/v2/saveTopology.do'): self.__save_topology,
+            ('GET', '/web/provisioning/getTempConfigsByNetElementId.do'): self.__temp_configs,
+            ('GET', '/web/provisioning/getConfigletsByNetElementId.do'): self.__configlets_by_device,
+            ('GET', '/web/provisioning/getConfigletsByContainerId.do'): self.__configlets_by_container,
+            ('GET', '/web/provisioning/getImageBundleByContainerId.do'): self.__image_bundle_by_container,
+            ('GET', '/web/provisioning/getNetElementInfoById.do'): self.__device_image_info,
+            ('POST', '/web/provisioning/v2/validateAndCompareConfiglets.do'): self.__validate_configlets,
+            # Configlets
+            ('GET', '/web/configlet/getConfiglets.do'): self.__configlets,
+            ('GET', '/web/configlet/getConfigletByName.do'): self.__configlet_by_name,
+            ('GET', '/web/configlet/getConfigletsAndAssociatedMappers.do'): self.__configlets_and_mappers,
+            ('POST', '/web/configlet/addConfiglet.do'): self.__add_configlet,
+            ('POST', '/web/configlet/updateConfiglet.do'): self.__update_configlet,
+            ('POST', '/web/configlet/deleteConfiglet.do'): self.__delete_configlet,
+            ('POST', '/web/configlet/addNoteToConfiglet.do'): self.__add_note_to_configlet,
+            ('POST', '/web/configlet/validateConfig.do'): self.__validate_config,
+            # Tasks
+            ('GET', '/web/task/getTasks.do'): self.__tasks,
+            ('GET', '/web/task/getTaskById.do'): self.__task_by_id,
+            ('POST', '/web/task/executeTask.do'): self.__execute_tasks,
+            ('POST', '/web/task/cancelTask.do'): self.__cancel_tasks,
+            ('POST', '/web/task/addNoteToTask.do'): self.__add_note_to_task,
+            # Images
+            ('GET', '/web/image/getImages.do'): self.__images,
+            ('GET', '/web/image/getImageBundles.do'): self.__image_bundles,
+            ('GET', '/web/image/getImageBundleByName.do'): self.__image_bundle_by_name,
+            ('POST', '/web/image/addImage.do'): self.__add_image,
+            ('POST', '/web/image/saveImageBundle.do'): self.__save_image_bundle,
+            ('POST', '/web/image/updateImageBundle.do'): self.__save_image_bundle,
+            ('POST', '/web/image/deleteImageBundles.do'): self.__delete_image_bundles,
+            # Change controls
+            ('GET', '/api/resources/changecontrol/v1/ChangeControl/all'): self.__change_controls,
+            ('GET', '/api/resources/changecontrol/v1/ChangeControl'): self.__change_control,
+            ('POST', '/api/resources/changecontrol/v1/ChangeControlConfig'): self.__change_control_config,
+            ('DELETE', '/api/resources/changecontrol/v1/ChangeControlConfig'): self.__delete_change_control,
+            ('POST', '/api/resources/changecontrol/v1/ApproveConfig'): self.__approve_change_control,
+            ('POST', '/api/v3/services/compliancecheck.Compliance/GetConfigDiffForTask'): self.__task_config_diff,
+            # Workspaces and tags
+            ('POST', '/api/resources/workspace/v1/WorkspaceConfig'): self.__workspace_config,
+            ('GET', '/api/resources/workspace/v1/WorkspaceBuild'): self.__workspace_build,
+            ('POST', '/api/resources/tag/v2/TagConfig'): self.__tag_config,
+            ('POST', '/api/resources/tag/v2/TagAssignmentConfig'): self.__tag_assignment_config,
+            # Decommissioning
+            ('POST', '/api/resources/inventory/v1/DeviceDecommissioningConfig'): self.__decommission_device,
+            ('GET', '/api/resources/inventory/v1/DeviceDecommissioning'): self.__decommissioning_status,
+        }
+
+    # ------------------------------------------------------------------------ #
+    #   Server lifecycle
+    # ------------------------------------------------------------------------ #
+
+    def start(self):
+        """
+        start Start HTTPS server in a background thread
+
+        Returns
+        -------
+        MockCVPServer
+            Running server, port attribute is set to the port actually used
+        """
+        self.__tmpdir = tempfile.mkdtemp(prefix='mock-cvp-')
+        certfile, keyfile = generate_certificate(self.__tmpdir)
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(certfile, keyfile)
+        self.__httpd = ThreadingHTTPServer((self.host, self.port), _RequestHandler)
+        self.__httpd.daemon_threads = True
+        self.__httpd.socket = context.wrap_socket(self.__httpd.socket, server_side=True, do_handshake_on_connect=False)
+        self.__httpd.cvp = self
+        self.port = self.__httpd.server_address[1]
+        self.__thread = threading.Thread(target=self.__httpd.serve_forever, name='mock-cvp-server', daemon=True)
+        self.__thread.start()
+        LOGGER.info('Mock CVP server listening on https://%s:%s', self.host, self.port)
+        return self
+
+    def stop(self):
+        """
+        stop Stop HTTPS server and remove its certificate
+        """
+        if self.__httpd is not None:
+            self.__httpd.shutdown()
+            self.__httpd.server_close()
+            self.__thread.join()
+            self.__httpd = None
+        if self.__tmpdir is not None:
+            shutil.rmtree(self.__tmpdir, ignore_errors=True)
+            self.__tmpdir = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def client(self, **kwargs) -> CvpClient:
+        """
+        client Connect a cvprac client to the server
+
+        Parameters
+        ----------
+        kwargs
+            Extra arguments for CvpClient.connect()
+
+        Returns
+        -------
+        CvpClient
+            Connected cvprac client
+        """
+        cvp_client = CvpClient()
+        cvp_client.connect(nodes=[self.host], username='cvpadmin', password='cvpadmin', port=self.port, **kwargs)
+        return cvp_client
+
+    def local_client(self, **kwargs) -> CvpClient:
+        """
+        local_client Connect a cvprac client served in process, server does not need to be started
+
+        Requests go through the whole cvprac and requests stack but skip sockets, TLS and
+        server threads, so timings only depend on client code and on configured latency.
+
+        Parameters
+        ----------
+        kwargs
+            Extra arguments for CvpClient.connect()
+
+        Returns
+        -------
+        CvpClient
+            Connected cvprac client
+        """
+        cvp_client = LocalCvpClient(self)
+        cvp_client.connect(nodes=[self.host], username='cvpadmin', password='cvpadmin', port=self.port or 443, **kwargs)
+        return cvp_client
+
+    def refresh(self):
+        """
+        refresh Drop indexes built from database so next request uses current content
+        """
+        with self.__lock:
+            self.__indexes = None
+
+    def handle(self, method: str, path: str, body: bytes):
+        """
+        handle Serve one request
+
+        Parameters
+        ----------
+        method : str
+            HTTP method
+        path : str
+            Path of request with its query string
+        body : bytes
+            Body of request
+
+        Returns
+        -------
+        tuple
+            HTTP status, payload and extra HTTP headers
+        """
+        url = urlsplit(path)
+        query = {name: values[-1] for name, values in parse_qs(url.query, keep_blank_values=True).items()}
+        endpoint = f'{method} {url.path}'
+        with self.__lock:
+            self.requests[endpoint] += 1
+            failure = self.error_rate and url.path not in NO_FAILURE_PATHS and self.__random.random() < self.error_rate
+        if self.latency:
+            time.sleep(self.latency)
+        route = self.__routes.get((method, url.path))
+        if route is None:
+            LOGGER.warning('Endpoint not implemented by mock CVP server: %s', endpoint)
+            return 404, 'Not Found', {}
+        if failure:
+            LOGGER.debug('Injected error for %s', endpoint)
+            return 500, 'Internal Server Error', {}
+        if body[:1] in (b'{', b'['):
+            body = json.loads(body)
+        with self.__lock:
+            try:
+                payload = route(query, body)
+            except CvpServerError as error:
+                payload = {'errorCode': error.code, 'errorMessage': error.message}
+            except CvpResourceNotFound as error:
+                return 404, json.dumps({'code': 5, 'message': f'resource not found: {error}'}), {}
+            if method != 'GET':
+                self.__indexes = None
+        if isinstance(payload, tuple):
+            return (200,) + payload
+        return 200, payload, {}
+
+    # ------------------------------------------------------------------------ #
+    #   Database views
+    # ------------------------------------------------------------------------ #
+
+    @property
+    def __index(self):
+        if self.__indexes is None:
+            self.__indexes = self.__build_indexes()
+        return self.__indexes
+
+    def __build_indexes(self):
+        containers = _values(self.database.containers)
+        keys = {container[Api.generic.KEY] for container in containers}
+        containers += [container for container in [ROOT_CONTAINER, UNDEFINED_CONTAINER] if container[Api.generic.KEY] not in keys]
+        indexes = {
+            'containers': containers,
+            'container_key': {},
+            'container_name': {},
+            'children': collections.defaultdict(list),
+            'devices': _values(self.database.devices),
+            'device_mac': {},
+            'device_name': {},
+            'device_serial': {},
+            'container_devices': collections.defaultdict(list),
+            'configlets': _values(self.database.configlets),
+            'configlet_key': {},
+            'configlet_name': {},
+            'mappers': collections.defaultdict(list),
+            'mapped': collections.Counter(),
+        }
+        for container in containers:
+            indexes['container_key'].setdefault(container[Api.generic.KEY], container)
+            indexes['container_name'].setdefault(container[Api.generic.NAME], container)
+            if container.get(Api.generic.PARENT_CONTAINER_ID) is not None:
+                indexes['children'][container[Api.generic.PARENT_CONTAINER_ID]].append(container)
+        for device in indexes['devices']:
+            indexes['device_mac'].setdefault(device[Api.device.SYSMAC], device)
+            for field in [Api.device.FQDN, Api.device.HOSTNAME]:
+                if device.get(field):
+                    indexes['device_name'].setdefault(device[field], device)
+            if device.get(Api.device.SERIAL):
+                indexes['device_serial'].setdefault(device[Api.device.SERIAL], device)
+            indexes['container_devices'][self.__device_parent(device)].append(device)
+        for configlet in indexes['configlets']:
+            indexes['configlet_key'].setdefault(configlet[Api.generic.KEY], configlet)
+            indexes['configlet_name'].setdefault(configlet[Api.generic.NAME], configlet)
+        for mapper in self.__mappers():
+            indexes['mappers'][mapper[Api.mappers.OBJECT_ID]].append(mapper)
+            indexes['mapped'][(mapper[Api.configlet.ID], mapper.get('type'))] += 1
+        return indexes
+
+    def __mappers(self):
+        return self.database.configlets_mappers.setdefault('data', {}).setdefault('configletMappers', [])
+
+    @staticmethod
+    def __device_parent(device: dict):
+        if Api.device.PARENT_CONTAINER_KEY in device:
+            return device[Api.device.PARENT_CONTAINER_KEY]
+        return device.get(Api.generic.PARENT_CONTAINER_ID, Api.container.UNDEFINED_CONTAINER_ID)
+
+    def __container(self, key: str):
+        container = self.__index['container_key'].get(key)
+        if container is None:
+            raise CvpServerError('Invalid Container id', code='122603')
+        return container
+
+    def __device(self, mac: str):
+        device = self.__index['device_mac'].get(mac)
+        if device is None:
+            raise CvpServerError('Invalid Netelement id', code='122401')
+        return device
+
+    def __inventory_device(self, device: dict):
+        """Device as returned by /inventory/devices"""
+        data = dict(device)
+        data.setdefault('status', device.get('deviceStatus', 'Registered'))
+        data.setdefault('mlagEnabled', device.get('isMLAGEnabled', False))
+        data.setdefault('danzEnabled', device.get('isDANZEnabled', False))
+        data.setdefault('bootupTimestamp', device.get('bootupTimeStamp', 0))
+        data.setdefault('internalBuild', device.get('internalBuildId', ''))
+        data[Api.device.PARENT_CONTAINER_KEY] = self.__device_parent(device)
+        for field, value in [('modelName', 'vEOS-lab'), ('version', '4.28.3M'), ('internalVersion', '4.28.3M'),
+                             ('deviceType', 'eos'), ('streamingStatus', 'active'), ('complianceCode', '0000'),
+                             ('complianceIndication', 'NONE'), ('ztpMode', False), ('unAuthorized', False),
+                             (Api.device.HOSTNAME, ''), (Api.device.FQDN, ''), ('domainName', ''),
+                             (Api.device.SERIAL, ''), (Api.device.MGMTIP, '')]:
+            data.setdefault(field, value)
+        data.pop(Api.generic.CONFIG, None)
+        return data
+
+    def __topology_device(self, device: dict):
+        """Device as returned by topology endpoints"""
+        data = self.__inventory_device(device)
+        parent = self.__index['container_key'].get(data[Api.device.PARENT_CONTAINER_KEY], {})
+        data.update({
+            Api.generic.KEY: data[Api.device.SYSMAC],
+            'deviceStatus': data['status'],
+            Api.generic.PARENT_CONTAINER_ID: data[Api.device.PARENT_CONTAINER_KEY],
+            Api.device.CONTAINER_NAME: parent.get(Api.generic.NAME, ''),
+            'isMLAGEnabled': data['mlagEnabled'],
+            'isDANZEnabled': data['danzEnabled'],
+            'bootupTimeStamp': data['bootupTimestamp'],
+            'internalBuildId': data['internalBuild'],
+            'type': 'netelement',
+            'tempAction': None,
+            'taskIdList': [],
+        })
+        return data
+
+    def __container_view(self, container: dict):
+        key = container[Api.generic.KEY]
+        parent = self.__index['container_key'].get(container.get(Api.generic.PARENT_CONTAINER_ID), {})
+        return {
+            Api.generic.KEY: key,
+            Api.generic.NAME: container[Api.generic.NAME],
+            'type': 'container',
+            Api.generic.PARENT_CONTAINER_ID: container.get(Api.generic.PARENT_CONTAINER_ID),
+            Api.container.PARENT_NAME: parent.get(Api.generic.NAME),
+            Api.container.COUNT_CONTAINER: len(self.__index['children'][key]),
+            Api.container.COUNT_DEVICE: len(self.__index['container_devices'][key]),
+            'mode': 'expand',
+            'deviceStatus': '',
+            'childTaskCount': 0,
+            'tempAction': None,
+            'tempEvent': None,
+        }
+
+    def __topology(self, container: dict):
+        data = self.__container_view(container)
+        data[Api.container.CHILDREN_LIST] = [self.__topology(child) for child in self.__index['children'][container[Api.generic.KEY]]]
+        data['childNetElementList'] = [self.__topology_device(device) for device in self.__index['container_devices'][container[Api.generic.KEY]]]
+        data['hierarchyNetElementCount'] = data[Api.container.COUNT_DEVICE] + sum(child['hierarchyNetElementCount'] for child in data[Api.container.CHILDREN_LIST])
+        return data
+
+    def __configlet_view(self, configlet: dict):
+        data = dict(configlet)
+        for field, value in [(Api.generic.CONFIG, ''), ('type', 'Static'), ('note', ''), ('user', 'cvpadmin'),
+                             ('reconciled', False), ('dateTimeInLongFormat', 0), ('isDefault', 'no'), ('isAutoBuilder', ''),
+                             ('editable', True), ('sslConfig', False), ('visible', True), ('isDraft', False),
+                             ('typeStudioConfiglet', False)]:
+            data.setdefault(field, value)
+        data['containerCount'] = self.__index['mapped'][(configlet[Api.generic.KEY], 'container')]
+        data['netElementCount'] = self.__index['mapped'][(configlet[Api.generic.KEY], 'netelement')]
+        data.pop('containerAttached', None)
+        return data
+
+    def __applied_configlets(self, object_id: str):
+        configlets = []
+        for mapper in self.__index['mappers'][object_id]:
+            configlet = self.__index['configlet_key'].get(mapper[Api.configlet.ID])
+            if configlet is not None:
+                configlets.append(self.__configlet_view(configlet))
+        return configlets
+
+    @staticmethod
+    def __page(entries: list, query: dict):
+        start = int(query.get('startIndex') or 0)
+        end = int(query.get('endIndex') or 0)
+        return entries[start:end] if end else entries[start:]
+
+    # ------------------------------------------------------------------------ #
+    #   Session
+    # ------------------------------------------------------------------------ #
+
+    def __login(self, query, body):
+        session_id = uuid.uuid4().hex
+        user = body.get('userId', 'cvpadmin') if isinstance(body, dict) else 'cvpadmin'
+        return ({'sessionId': session_id, 'userName': user, 'username': user, 'authenticationType': 'Local', 'permissionList': []},
+                {'Set-Cookie': f'session_id={session_id}; Path=/'})
+
+    def __token_login(self, query, body):
+        return {}
+
+    def __cvp_info(self, query, body):
+        return {'version': self.version, 'appVersion': 'Phase_2'}
+
+    @staticmethod
+    def __success(query, body):
+        return {'data': 'success'}
+
+    # ------------------------------------------------------------------------ #
+    #   Inventory and topology
+    # ------------------------------------------------------------------------ #
+
+    def __inventory_devices(self, query, body):
+        return [self.__inventory_device(device) for device in self.__index['devices']]
+
+    def __delete_devices(self, query, body):
+        serials = set(body.get('data', []))
+        _remove(self.database.devices, [device for device in self.__index['devices'] if device.get(Api.device.SERIAL) in serials])
+        return {'result': 'success'}
+
+    def __inventory_containers(self, query, body):
+        return [{'Key': container[Api.generic.KEY], 'Name': container[Api.generic.NAME], 'CreatedBy': 'cvp system',
+                 'CreatedOn': 0, 'Mode': 'expand'} for container in self.__index['containers']]
+
+    def __device_config(self, query, body):
+        return {'output': self.__device(query.get('netElementId')).get(Api.generic.CONFIG, '')}
+
+    def __container_info(self, query, body):
+        return self.__container_view(self.__container(query.get(Api.container.ID)))
+
+    def __search_topology(self, query, body):
+        keyword = query.get('queryParam', '')
+        index = self.__index
+        containers = [index['container_name'][keyword]] if keyword in index['container_name'] else []
+        device = index['device_name'].get(keyword) or index['device_mac'].get(keyword) or index['device_serial'].get(keyword)
+        devices = [device] if device is not None else []
+        if not containers and not devices:
+            containers = [container for container in index['containers'] if keyword in container[Api.generic.NAME]]
+            devices = [device for device in index['devices']
+                       if any(keyword in str(device.get(field, '')) for field in [Api.device.FQDN, Api.device.SYSMAC, Api.device.SERIAL])]
+        devices = [self.__topology_device(device) for device in devices]
+        return {
+            'total': len(containers) + len(devices),
+            'containerList': [self.__container_view(container) for container in containers],
+            'netElementList': devices,
+            'netElementContainerList': [{'netElementKey': device[Api.generic.KEY], Api.device.CONTAINER_NAME: device[Api.device.CONTAINER_NAME],
+                                         'containerKey': device[Api.generic.PARENT_CONTAINER_ID]} for device in devices],
+            'keywordList': [],
+        }
+
+    def __filter_topology(self, query, body):
+        return {Api.container.TOPOLOGY: self.__topology(self.__container(query.get('nodeId', 'root')))}
+
+    def __add_temp_action(self, query, body):
+        for action in body.get('data', []):
+            if (action.get('nodeType') == 'container' and action.get('action') == 'add'
+                    and action.get('nodeName') in self.__index['container_name']):
+                raise CvpServerError('Data already exists in Database', code='1004')
+            self.__temp_actions.append(action)
+        return {'data': 'success'}
+
+    def __temp_actions_list(self, query, body):
+        return {'data': list(self.__temp_actions), 'total': len(self.__temp_actions)}
+
+    def __delete_temp_actions(self, query, body):
+        self.__temp_actions.clear()
+        return {'data': 'success'}
+
+    def __temp_configs(self, query, body):
+        return {'proposedConfiglets': [], 'proposedConfigletBuilders': []}
+
+    def __save_topology(self, query, body):
+        actions, self.__temp_actions = self.__temp_actions, []
+        devices = {}
+        mappers = {}
+        for action in actions:
+            for device in self.__apply_action(action, mappers):
+                devices.setdefault(device[Api.device.SYSMAC], (device, action.get('info', '')))
+            self.__indexes = None
+        if mappers:
+            self.__set_mappers(mappers)
+        task_ids = [self.__create_task(device, description) for device, description in devices.values()]
+        return {'data': {'status': 'success', Api.task.TASK_IDS: task_ids}}
+
+    def __apply_action(self, action: dict, mappers: dict):
+        """Apply a temp action to database and return devices impacted"""
+        node_type = action.get('nodeType')
+        target = action.get('toId')
+        if node_type == 'container':
+            if action.get('action') == 'add':
+                container = {Api.generic.NAME: action['nodeName'], Api.generic.KEY: f'container_{uuid.uuid4()}',
+                             Api.generic.PARENT_CONTAINER_ID: target}
+                _insert(self.database.containers, action['nodeName'], container)
+            elif action.get('action') == 'delete':
+                key = action.get('nodeId')
+                if key not in [ROOT_CONTAINER[Api.generic.KEY], UNDEFINED_CONTAINER[Api.generic.KEY]] \
+                        and not self.__index['children'][key] and not self.__index['container_devices'][key]:
+                    _remove(self.database.containers, [container for container in _values(self.database.containers)
+                                                       if container[Api.generic.KEY] == key])
+                    mappers[key] = []
+            return []
+        if node_type == 'netelement':
+            device = self.__device(action.get('nodeId'))
+            if action.get('action') == 'reset':
+                target = Api.container.UNDEFINED_CONTAINER_ID
+                mappers[device[Api.device.SYSMAC]] = []
+            self.__container(target)
+            device[Api.device.PARENT_CONTAINER_KEY] = target
+            if Api.generic.PARENT_CONTAINER_ID in device:
+                device[Api.generic.PARENT_CONTAINER_ID] = target
+            return [device]
+        if node_type == 'configlet':
+            keys = action.get('configletList', []) + action.get('configletBuilderList', [])
+            for key in keys:
+                if key not in self.__index['configlet_key']:
+                    raise CvpServerError(f'Invalid configlet id {key}', code='132801')
+            mappers[target] = [(key, action.get('toIdType')) for key in keys]
+        elif node_type == 'imagebundle':
+            bundle = action.get('nodeName') if action.get('nodeId') else None
+            element = self.__index['device_mac'].get(target) if action.get('toIdType') == 'netelement' else self.__container(target)
+            if element is None:
+                raise CvpServerError('Invalid Netelement id', code='122401')
+            element[Api.generic.IMAGE_BUNDLE_NAME] = bundle
+        if action.get('toIdType') == 'netelement':
+            return [self.__device(target)]
+        return self.__devices_below(target)
+
+    def __devices_below(self, container_key: str):
+        devices = []
+        keys = [container_key]
+        while keys:
+            key = keys.pop()
+            devices.extend(self.__index['container_devices'][key])
+            keys.extend(child[Api.generic.KEY] for child in self.__index['children'][key])
+        return devices
+
+    def __set_mappers(self, mappers: dict):
+        """Replace configlets applied to several devices and containers with a single pass on mappers"""
+        applied = self.__mappers()
+        applied[:] = [mapper for mapper in applied if mapper[Api.mappers.OBJECT_ID] not in mappers]
+        for object_id, configlets in mappers.items():
+            device = self.__index['device_mac'].get(object_id, {})
+            for order, (key, object_type) in enumerate(configlets):
+                applied.append({
+                    Api.generic.KEY: f'configletMapper_{uuid.uuid4()}',
+                    Api.configlet.ID: key,
+                    'type': object_type,
+                    Api.mappers.OBJECT_ID: object_id,
+                    Api.container.ID: self.__device_parent(device) if device else '',
+                    'appliedBy': 'cvpadmin',
+                    'configletType': 'Static',
+                    'appliedDateInLongFormat': _now(),
+                    'isDraft': False,
+                    'deviceId': device.get(Api.device.SERIAL, ''),
+                    'order': order,
+                })
+
+    def __configlets_by_device(self, query, body):
+        configlets = self.__applied_configlets(query.get('netElementId'))
+        return {'configletList': configlets, 'total': len(configlets), 'configletMapper': {}}
+
+    def __configlets_by_container(self, query, body):
+        configlets = self.__applied_configlets(self.__container(query.get(Api.container.ID))[Api.generic.KEY])
+        return {'configletList': configlets, 'total': len(configlets), 'configletMapper': {}}
+
+    def __validate_configlets(self, query, body):
+        return {'mismatch': 0, 'reconcile': 0, 'new': 0, 'total': 0, 'designedConfig': [], 'runningConfig': [],
+                'warnings': [], 'errors': []}
+
+    # ------------------------------------------------------------------------ #
+    #   Configlets
+    # ------------------------------------------------------------------------ #
+
+    def __configlets(self, query, body):
+        configlets = [self.__configlet_view(configlet) for configlet in self.__index['configlets']]
+        return {'data': self.__page(configlets, query), 'total': len(configlets)}
+
+    def __configlet(self, name: str):
+        configlet = self.__index['configlet_name'].get(name)
+        if configlet is None:
+            raise CvpServerError('Entity does not exist', code='132801')
+        return configlet
+
+    def __configlet_by_name(self, query, body):
+        return self.__configlet_view(self.__configlet(query.get(Api.generic.NAME)))
+
+    def __configlets_and_mappers(self, query, body):
+        data = dict(self.database.configlets_mappers.get('data', {}))
+        data.update({
+            Api.generic.CONFIGLETS: [self.__configlet_view(configlet) for configlet in self.__index['configlets']],
+            'configletMappers': self.__mappers(),
+        })
+        for field in ['generatedConfigletMappers', 'configletBuilders', 'builderMappers']:
+            data.setdefault(field, [])
+        return {'data': data}
+
+    def __add_configlet(self, query, body):
+        if body[Api.generic.NAME] in self.__index['configlet_name']:
+            raise CvpServerError('Data already exists in Database', code='132823')
+        configlet = {Api.generic.NAME: body[Api.generic.NAME], Api.generic.KEY: f'configlet_{uuid.uuid4()}',
+                     Api.generic.CONFIG: body.get(Api.generic.CONFIG, ''), 'dateTimeInLongFormat': _now()}
+        _insert(self.database.configlets, configlet[Api.generic.NAME], configlet)
+        return {'data': configlet}
+
+    def __update_configlet(self, query, body):
+        configlet = self.__index['configlet_key'].get(body.get(Api.generic.KEY))
+        if configlet is None:
+            raise CvpServerError('Entity does not exist', code='132801')
+        configlet[Api.generic.CONFIG] = body.get(Api.generic.CONFIG, '')
+        configlet[Api.generic.NAME] = body.get(Api.generic.NAME, configlet[Api.generic.NAME])
+        devices = {}
+        for mapper in self.__mappers():
+            if mapper[Api.configlet.ID] == configlet[Api.generic.KEY]:
+                if mapper.get('type') == 'netelement':
+                    targets = [self.__index['device_mac'].get(mapper[Api.mappers.OBJECT_ID])]
+                else:
+                    targets = self.__devices_below(mapper[Api.mappers.OBJECT_ID])
+                devices.update({device[Api.device.SYSMAC]: device for device in targets if device is not None})
+        task_ids = [self.__create_task(device, f'Configlet {configlet[Api.generic.NAME]} updated') for device in devices.values()]
+        response = {'data': f'Configlet {configlet[Api.generic.NAME]} successfully updated'}
+        if body.get('waitForTaskIds'):
+            response[Api.task.TASK_IDS] = task_ids
+        return response
+
+    def __delete_configlet(self, query, body):
+        keys = {entry[Api.generic.KEY] for entry in body}
+        _remove(self.database.configlets, [configlet for configlet in self.__index['configlets'] if configlet[Api.generic.KEY] in keys])
+        self.__mappers()[:] = [mapper for mapper in self.__mappers() if mapper[Api.configlet.ID] not in keys]
+        return {'data': 'success'}
+
+    def __add_note_to_configlet(self, query, body):
+        configlet = self.__index['configlet_key'].get(body.get(Api.generic.KEY))
+        if configlet is None:
+            raise CvpServerError('Entity does not exist', code='132801')
+        configlet['note'] = body.get('note', '')
+        return {'data': 'success'}
+
+    def __validate_config(self, query, body):
+        self.__device(body.get('netElementId'))
+        return {'result': [], 'warnings': [], 'warningCount': 0, 'errors': [], 'errorCount': 0}
+
+    # ------------------------------------------------------------------------ #
+    #   Tasks
+    # ------------------------------------------------------------------------ #
+
+    def __create_task(self, device: dict, description: str):
+        self.database.taskIdCounter += 1
+        task_id = str(self.database.taskIdCounter)
+        self.database.tasks[task_id] = {
+            Api.generic.TASK_ID: task_id,
+            Api.device.STATE: 'ACTIVE',
+            Api.device.STATUS: 'Pending',
+            'currentTaskName': 'Submit',
+            'currentTaskType': 'User Task',
+            Api.device.DESCRIPTION: description,
+            'note': '',
+            Api.task.NETELEMENT_ID: device[Api.device.SYSMAC],
+            'netElementHostName': device.get(Api.device.HOSTNAME, ''),
+            Api.device.TASK_DETAILS: {
+                Api.task.NETELEMENT_ID: device[Api.device.SYSMAC],
+                'netElementHostName': device.get(Api.device.FQDN, ''),
+                Api.device.SERIAL: device.get(Api.device.SERIAL, ''),
+                Api.device.MGMTIP: device.get(Api.device.MGMTIP, ''),
+            },
+            Api.device.AUTHOR: 'cvpadmin',
+            Api.task.CREATED_DATE: _now(),
+            'executedBy': '',
+            Api.device.CCID: '',
+            Api.device.CCIDV2: '',
+            'data': {},
+        }
+        return task_id
+
+    def __task(self, task_id):
+        task = self.database.tasks.get(str(task_id))
+        if task is None:
+            raise CvpServerError('Invalid WorkOrderId', code='142603')
+        return task
+
+    def __tasks(self, query, body):
+        status = query.get('queryparam', '')
+        tasks = sorted(self.database.tasks.values(), key=lambda task: int(task[Api.generic.TASK_ID]), reverse=True)
+        if status:
+            tasks = [task for task in tasks if task[Api.device.STATUS].lower() == status.lower()]
+        return {'data': self.__page(tasks, query), 'total': len(tasks)}
+
+    def __task_by_id(self, query, body):
+        return self.__task(query.get('taskId'))
+
+    def __set_tasks_status(self, task_ids: list, status: str, state: str):
+        for task_id in task_ids:
+            task = self.__task(task_id)
+            task[Api.device.STATUS] = status
+            task[Api.device.STATE] = state
+        return {'data': 'success'}
+
+    def __execute_tasks(self, query, body):
+        return self.__set_tasks_status(body.get('data', []), 'Completed', 'COMPLETED')
+
+    def __cancel_tasks(self, query, body):
+        return self.__set_tasks_status(body.get('data', []), 'Cancelled', 'CANCELLED')
+
+    def __add_note_to_task(self, query, body):
+        self.__task(body.get(Api.generic.TASK_ID))['note'] = body.get('note', '')
+        return {'data': 'success'}
+
+    # ------------------------------------------------------------------------ #
+    #   Images
+    # ------------------------------------------------------------------------ #
+
+    def __images(self, query, body):
+        images = _payload_list(self.database.images)
+        return {'data': self.__page(images, query), 'total': len(images)}
+
+    def __image_bundles(self, query, body):
+        bundles = _payload_list(self.database.image_bundles)
+        return {'data': self.__page(bundles, query), 'total': len(bundles)}
+
+    def __image_bundle(self, name: str):
+        for bundle in _payload_list(self.database.image_bundles):
+            if bundle.get(Api.generic.NAME) == name:
+                return bundle
+        raise CvpServerError('Entity does not exist', code='162801')
+
+    def __image_bundle_by_name(self, query, body):
+        return self.__image_bundle(query.get(Api.generic.NAME))
+
+    def __image_bundle_by_container(self, query, body):
+        bundle = self.__container(query.get(Api.container.ID)).get(Api.generic.IMAGE_BUNDLE_NAME)
+        bundles = [self.__image_bundle(bundle)] if bundle else []
+        return {'imageBundleList': bundles, 'total': len(bundles)}
+
+    def __device_image_info(self, query, body):
+        bundle = self.__device(query.get('netElementId')).get(Api.generic.IMAGE_BUNDLE_NAME)
+        bundle_id = self.__image_bundle(bundle).get(Api.generic.KEY) if bundle else None
+        return {'bundleName': bundle, Api.image.ID: bundle_id, 'imageBundleMapper': {}}
+
+    def __add_image(self, query, body):
+        match = re.search(rb'filename="([^"]+)"', body if isinstance(body, bytes) else b'')
+        if match is None:
+            raise CvpServerError('Invalid image file', code='162502')
+        name = match.group(1).decode('utf-8').split('/')[-1]
+        image = {Api.generic.NAME: name, 'imageFileName': name, 'imageId': name, Api.generic.KEY: name,
+                 'imageSize': str(len(body)), 'isRebootRequired': 'true'}
+        _payload_list(self.database.images).append(image)
+        return {'result': 'success', Api.generic.NAME: name}
+
+    def __save_image_bundle(self, query, body):
+        bundles = _payload_list(self.database.image_bundles)
+        bundle_id = body.get('id')
+        bundle = next((bundle for bundle in bundles if bundle_id is not None and bundle.get('id') == bundle_id), None)
+        if bundle is None:
+            if any(bundle.get(Api.generic.NAME) == body[Api.generic.NAME] for bundle in bundles):
+                raise CvpServerError('Data already exists in Database', code='162823')
+            bundle_id = f'imagebundle_{uuid.uuid4()}'
+            bundle = {'id': bundle_id, Api.generic.KEY: bundle_id, 'appliedContainersCount': 0, 'appliedDevicesCount': 0}
+            bundles.append(bundle)
+        bundle.update({Api.generic.NAME: body[Api.generic.NAME], 'images': body.get('images', []),
+                       'isCertifiedImage': body.get('isCertifiedImage', 'true'), 'updatedTimeInLongFormat': _now()})
+        return {'data': 'success'}
+
+    def __delete_image_bundles(self, query, body):
+        keys = {entry[Api.generic.KEY] for entry in body.get('data', [])}
+        bundles = _payload_list(self.database.image_bundles)
+        bundles[:] = [bundle for bundle in bundles if bundle.get(Api.generic.KEY) not in keys]
+        return {'data': 'success'}
+
+    # ------------------------------------------------------------------------ #
+    #   Change controls
+    # ------------------------------------------------------------------------ #
+
+    def __change_control_value(self, cc_id: str):
+        value = self.database.change_controls.get(cc_id)
+        if value is None:
+            raise CvpResourceNotFound(cc_id)
+        return value
+
+    def __change_controls(self, query, body):
+        return JsonStream({'result': {'value': value, 'time': value['change'].get('time'), 'type': 'INITIAL'}}
+                          for value in self.database.change_controls.values())
+
+    def __change_control(self, query, body):
+        value = self.__change_control_value(query.get('key.id'))
+        return {'value': value, 'time': value['change'].get('time')}
+
+    def __task_ids_in_change(self, value: dict):
+        for stage in value['change'].get('stages', {}).get('values', {}).values():
+            action = stage.get('action', {})
+            if action.get('name') == 'task':
+                yield action.get('args', {}).get('values', {}).get('TaskID')
+
+    def __change_control_config(self, query, body):
+        cc_id = body['key']['id']
+        if 'change' in body:
+            value = self.database.change_controls.setdefault(cc_id, {
+                'key': {'id': cc_id}, 'approve': {'value': False}, 'status': 'CHANGE_CONTROL_STATUS_UNSPECIFIED'})
+            value['change'] = dict(copy.deepcopy(body['change']), time=_resource_time())
+            for task_id in self.__task_ids_in_change(value):
+                self.__task(task_id)[Api.device.CCIDV2] = cc_id
+        value = self.__change_control_value(cc_id)
+        if 'schedule' in body:
+            value['schedule'] = body['schedule']
+            value['status'] = 'CHANGE_CONTROL_STATUS_SCHEDULED'
+        if body.get('start', {}).get('value'):
+            if not value['approve'].get('value'):
+                raise CvpServerError(f'Change control {cc_id} is not approved', code='400')
+            self.__set_tasks_status(list(self.__task_ids_in_change(value)), 'Completed', 'COMPLETED')
+            value['status'] = 'CHANGE_CONTROL_STATUS_COMPLETED'
+        return {'value': body, 'time': _resource_time()}
+
+    def __delete_change_control(self, query, body):
+        self.__change_control_value(query.get('key.id'))
+        del self.database.change_controls[query.get('key.id')]
+        return {'key': {'id': query.get('key.id')}, 'time': _resource_time()}
+
+    def __approve_change_control(self, query, body):
+        value = self.__change_control_value(body['key']['id'])
+        if body.get('version') != value['change'].get('time'):
+            raise CvpServerError('Change control was modified since approval request', code='400')
+        value['approve'] = {'value': body['approve']['value'], 'notes': body['approve'].get('notes', ''), 'time': _resource_time()}
+        return {'value': body, 'time': _resource_time()}
+
+    def __task_config_diff(self, query, body):
+        self.__task(body.get('task_id'))
+        return []
+
+    # ------------------------------------------------------------------------ #
+    #   Workspaces and tags
+    # ------------------------------------------------------------------------ #
+
+    def __workspace(self, workspace_id: str):
+        workspace = self.database.workspaces.get(workspace_id)
+        if workspace is None:
+            raise CvpResourceNotFound(workspace_id)
+        return workspace
+
+    def __workspace_config(self, query, body):
+        workspace_id = body['key']['workspaceId']
+        workspace = self.database.workspaces.setdefault(workspace_id, {
+            'key': {'workspaceId': workspace_id}, 'state': 'WORKSPACE_STATE_PENDING', 'builds': {}, 'tags': []})
+        workspace.update(displayName=body.get('displayName', ''), description=body.get('description', ''))
+        request = body.get('request', 'REQUEST_UNSPECIFIED')
+        request_id = body.get('requestParams', {}).get('requestId', '')
+        if request == 'REQUEST_START_BUILD':
+            workspace['builds'][request_id] = 'BUILD_STATE_SUCCESS'
+        elif request == 'REQUEST_SUBMIT':
+            for tag in workspace['tags']:
+                key = {field: value for field, value in tag['key'].items() if field != 'workspaceId'}
+                self.database.tags[:] = [entry for entry in self.database.tags if entry != key]
+                if not tag['remove']:
+                    self.database.tags.append(key)
+            workspace['tags'] = []
+            workspace['state'] = 'WORKSPACE_STATE_SUBMITTED'
+        elif request == 'REQUEST_ABANDON':
+            workspace['state'] = 'WORKSPACE_STATE_ABANDONED'
+        return {'value': body, 'time': _resource_time()}
+
+    def __workspace_build(self, query, body):
+        workspace = self.__workspace(query.get('key.workspaceId'))
+        build_id = query.get('key.buildId')
+        if build_id not in workspace['builds']:
+            raise CvpResourceNotFound(build_id)
+        return {'value': {'key': {'workspaceId': workspace['key']['workspaceId'], 'buildId': build_id},
+                          'state': workspace['builds'][build_id], 'buildResults': {'values': {}}},
+                'time': _resource_time()}
+
+    def __tag_config(self, query, body):
+        self.__workspace(body['key']['workspaceId'])['tags'].append({'key': body['key'], 'remove': body.get('remove', False)})
+        return {'value': body, 'time': _resource_time()}
+
+    def __tag_assignment_config(self, query, body):
+        return self.__tag_config(query, body)
+
+    # ------------------------------------------------------------------------ #
+    #   Decommissioning
+    # ------------------------------------------------------------------------ #
+
+    def __decommission_device(self, query, body):
+        request_id = body['key'].get('request_id', body['key'].get('requestId'))
+        devices = [device for device in self.__index['devices'] if device.get(Api.device.SERIAL) == body.get('device_id')]
+        if not devices:
+            raise CvpServerError(f'Device {body.get("device_id")} does not exist', code='400')
+        _remove(self.database.devices, devices)
+        self.__decommissioning[request_id] = 'DECOMMISSIONING_STATUS_SUCCESS'
+        return {'value': body, 'time': _resource_time()}
+
+    def __decommissioning_status(self, query, body):
+        request_id = query.get('key.requestId')
+        if request_id not in self.__decommissioning:
+            raise CvpResourceNotFound(request_id)
+        return {'value': {'key': {'requestId': request_id}, 'status': self.__decommissioning[request_id]},
+                'time': _resource_time()}
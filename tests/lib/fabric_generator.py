@@ -0,0 +1,494 @@
+#!/usr/bin/python
+# Copyright (c) 2023 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+# coding: utf-8 -*-
+"""
+fabric_generator.py - Generate synthetic Cloudvision datasets at benchmark scale.
+
+Data is generated in the shapes returned by cvprac (get_inventory, get_configlets_and_mappers,
+filter_topology, get_tasks, change_control_get_all), as a MockCVPDatabase, and as inputs of
+cv_device_v3, cv_container_v3 and cv_configlet_v3 modules. Output only depends on parameters and seed.
+
+Example
+-------
+>>> fabric = FabricGenerator.from_scale('1k')
+>>> database = fabric.database()
+>>> devices = fabric.device_inputs(moved=0.1, changed=0.1)
+"""
+
+from __future__ import (absolute_import, division, print_function)
+import copy
+import logging
+import random
+import uuid
+from ansible_collections.arista.cvp.plugins.module_utils.resources.api.fields import Api
+from tests.lib.mock import MockCVPDatabase
+
+LOGGER = logging.getLogger(__name__)
+
+ROOT_CONTAINER_KEY = 'root'
+ROOT_CONTAINER_NAME = 'Tenant'
+
+# Parameters of FabricGenerator per scale
+SCALES = {
+    '100': {'devices': 100, 'configlets': 1000, 'depth': 3, 'fanout': 3, 'tasks': 1000, 'change_controls': 100},
+    '1k': {'devices': 1000, 'configlets': 10000, 'depth': 4, 'fanout': 4, 'tasks': 10000, 'change_controls': 1000},
+    '10k': {'devices': 10000, 'configlets': 50000, 'depth': 5, 'fanout': 4, 'tasks': 50000, 'change_controls': 5000},
+    'deep': {'devices': 1000, 'configlets': 5000, 'depth': 10, 'fanout': 2, 'tasks': 1000, 'change_controls': 100},
+}
+
+# Status of tasks in history with their weight
+TASK_STATUS = [('Completed', 'COMPLETED', 70), ('Pending', 'ACTIVE', 10), ('Cancelled', 'CANCELLED', 10), ('Failed', 'FAILED', 10)]
+
+IMAGE_BUNDLES = ['EOS-4.28.3M', 'EOS-4.30.1F']
+
+
+class FabricGenerator():
+    """
+    FabricGenerator Synthetic Cloudvision fabric.
+
+    Containers form a tree of `depth` levels below Tenant with `fanout` children per container. Devices
+    are spread over the deepest containers. Every container gets a base configlet, every device its own
+    configlet, and remaining configlets are shared configlets applied to devices in a round robin way.
+    `undefined` devices are left in the Undefined container without configlets, ready to be deployed.
+    """
+
+    def __init__(self, devices: int = 100, configlets: int = 1000, depth: int = 3, fanout: int = 3,
+                 tasks: int = 0, change_controls: int = 0, undefined: int = 0, config_lines: int = 20, seed: int = 0):
+        self.__random = random.Random(seed)
+        self.config_lines = config_lines
+        self.containers = []
+        self.devices = []
+        self.configlets = []
+        self.mappers = []
+        # Number of configlets applied to each object, used as order of next mapper
+        self.__mappers_count = {}
+        self.tasks = []
+        self.change_controls = []
+        self.image_bundles = [{Api.generic.NAME: name, Api.generic.KEY: f'imagebundle_{index}', 'id': f'imagebundle_{index}',
+                               'isCertifiedImage': 'true', 'images': []} for index, name in enumerate(IMAGE_BUNDLES)]
+        self.__generate_containers(depth, fanout)
+        self.__generate_devices(devices, undefined)
+        self.__generate_configlets(configlets)
+        self.__generate_tasks(tasks)
+        self.__generate_change_controls(change_controls)
+        LOGGER.info('Fabric generated: %d containers, %d devices, %d configlets, %d mappers, %d tasks, %d change controls',
+                    len(self.containers), len(self.devices), len(self.configlets), len(self.mappers), len(self.tasks),
+                    len(self.change_controls))
+
+    @classmethod
+    def from_scale(cls, scale: str, **kwargs):
+        """
+        from_scale Build a fabric from a predefined scale
+
+        Parameters
+        ----------
+        scale : str
+            One of SCALES keys
+        kwargs
+            Parameters overriding the scale values
+
+        Returns
+        -------
+        FabricGenerator
+            Generated fabric
+        """
+        return cls(**dict(SCALES[scale], **kwargs))
+
+    # ------------------------------------------------------------------------ #
+    #   Generation
+    # ------------------------------------------------------------------------ #
+
+    def __uuid(self):
+        return str(uuid.UUID(int=self.__random.getrandbits(128), version=4))
+
+    def __generate_containers(self, depth: int, fanout: int):
+        self.containers.append({Api.generic.NAME: ROOT_CONTAINER_NAME, Api.generic.KEY: ROOT_CONTAINER_KEY,
+                                Api.generic.PARENT_CONTAINER_ID: None})
+        self.containers.append({Api.generic.NAME: Api.container.UNDEFINED_CONTAINER_NAME, Api.generic.KEY: Api.container.UNDEFINED_CONTAINER_ID,
+                                Api.generic.PARENT_CONTAINER_ID: ROOT_CONTAINER_KEY})
+        level = [self.containers[0]]
+        for depth_index in range(depth):
+            children = []
+            for parent in level:
+                for index in range(fanout):
+                    if parent[Api.generic.KEY] == ROOT_CONTAINER_KEY:
+                        name = f'DC{index + 1}'
+                    else:
+                        name = f'{parent[Api.generic.NAME]}-{index + 1}'
+                    container = {Api.generic.NAME: name, Api.generic.KEY: f'container_{self.__uuid()}',
+                                 Api.generic.PARENT_CONTAINER_ID: parent[Api.generic.KEY]}
+                    if depth_index == 0:
+                        container[Api.generic.IMAGE_BUNDLE_NAME] = IMAGE_BUNDLES[index % len(IMAGE_BUNDLES)]
+                    children.append(container)
+            self.containers.extend(children)
+            level = children
+        self.leaf_containers = level if depth else []
+
+    def __generate_devices(self, devices: int, undefined: int):
+        for index in range(devices + undefined):
+            if index < devices and self.leaf_containers:
+                parent = self.leaf_containers[index % len(self.leaf_containers)][Api.generic.KEY]
+            else:
+                parent = Api.container.UNDEFINED_CONTAINER_ID
+            hostname = f'leaf{index + 1}' if parent != Api.container.UNDEFINED_CONTAINER_ID else f'new{index + 1}'
+            self.devices.append({
+                Api.device.HOSTNAME: hostname,
+                Api.device.FQDN: f'{hostname}.example.com',
+                'domainName': 'example.com',
+                Api.device.SYSMAC: ':'.join(['02'] + [f'{byte:02x}' for byte in index.to_bytes(5, 'big')]),
+                Api.device.SERIAL: f'SN{index:010d}',
+                Api.device.MGMTIP: f'10.{index // 65536 % 256}.{index // 256 % 256}.{index % 256}',
+                Api.device.PARENT_CONTAINER_KEY: parent,
+                'modelName': self.__random.choice(['DCS-7050SX3-48YC8', 'DCS-7280CR3-32P4', 'vEOS-lab']),
+                'version': '4.28.3M',
+                'status': 'Registered',
+                'mlagEnabled': False,
+                'danzEnabled': False,
+                'bootupTimestamp': 0,
+                'internalBuild': '',
+                'streamingStatus': 'active',
+                Api.generic.CONFIG: f'hostname {hostname}\n',
+            })
+
+    def __config(self, title: str):
+        lines = [f'! {title}']
+        for index in range(self.__random.randint(self.config_lines // 2, self.config_lines)):
+            lines.append(f'interface Ethernet{index + 1}\n   description {title} port {self.__random.randint(1, 64)}\n   no shutdown')
+        return '\n'.join(lines) + '\n'
+
+    def __add_configlet(self, name: str):
+        configlet = {Api.generic.NAME: name, Api.generic.KEY: f'configlet_{self.__uuid()}', Api.generic.CONFIG: self.__config(name),
+                     'type': 'Static', 'note': '', 'user': 'cvpadmin', 'dateTimeInLongFormat': 1640000000000 + len(self.configlets)}
+        self.configlets.append(configlet)
+        return configlet
+
+    def __add_mapper(self, configlet: dict, object_id: str, object_type: str, container_id: str, serial: str = ''):
+        order = self.__mappers_count.get(object_id, 0)
+        self.__mappers_count[object_id] = order + 1
+        self.mappers.append({Api.generic.KEY: f'configletMapper_{self.__uuid()}', Api.configlet.ID: configlet[Api.generic.KEY],
+                             'type': object_type, Api.mappers.OBJECT_ID: object_id, Api.container.ID: container_id,
+                             'appliedBy': 'cvpadmin', 'configletType': 'Static', 'appliedDateInLongFormat': 1640000000000,
+                             'isDraft': False, 'deviceId': serial, 'order': order})
+
+    def __generate_configlets(self, configlets: int):
+        containers = [container for container in self.containers if container[Api.generic.KEY] not in [ROOT_CONTAINER_KEY, Api.container.UNDEFINED_CONTAINER_ID]]
+        devices = [device for device in self.devices if device[Api.device.PARENT_CONTAINER_KEY] != Api.container.UNDEFINED_CONTAINER_ID]
+        for container in containers[:configlets]:
+            configlet = self.__add_configlet(f'{container[Api.generic.NAME]}-base')
+            self.__add_mapper(configlet, container[Api.generic.KEY], 'container', '')
+        for device in devices[:max(configlets - len(self.configlets), 0)]:
+            configlet = self.__add_configlet(f'{device[Api.device.HOSTNAME]}-config')
+            self.__add_mapper(configlet, device[Api.device.SYSMAC], 'netelement', device[Api.device.PARENT_CONTAINER_KEY], device[Api.device.SERIAL])
+        for index in range(max(configlets - len(self.configlets), 0)):
+            configlet = self.__add_configlet(f'shared-{index + 1}')
+            if devices:
+                device = devices[index % len(devices)]
+                self.__add_mapper(configlet, device[Api.device.SYSMAC], 'netelement', device[Api.device.PARENT_CONTAINER_KEY], device[Api.device.SERIAL])
+
+    def __generate_tasks(self, tasks: int):
+        devices = self.devices or [None]
+        weights = [weight for _, _, weight in TASK_STATUS]
+        for index in range(tasks):
+            device = devices[index % len(devices)] or {}
+            status, state, _ = self.__random.choices(TASK_STATUS, weights=weights)[0]
+            mac = device.get(Api.device.SYSMAC, '')
+            self.tasks.append({
+                Api.generic.TASK_ID: str(index + 1),
+                Api.device.STATE: state,
+                Api.device.STATUS: status,
+                'currentTaskName': 'Submit',
+                'currentTaskType': 'User Task',
+                Api.device.DESCRIPTION: f'Configlet Assign: to Device {device.get(Api.device.FQDN, "")}',
+                'note': '',
+                Api.task.NETELEMENT_ID: mac,
+                'netElementHostName': device.get(Api.device.HOSTNAME, ''),
+                Api.device.TASK_DETAILS: {Api.task.NETELEMENT_ID: mac, 'netElementHostName': device.get(Api.device.FQDN, ''),
+                                          Api.device.SERIAL: device.get(Api.device.SERIAL, ''), Api.device.MGMTIP: device.get(Api.device.MGMTIP, '')},
+                Api.device.AUTHOR: 'cvpadmin',
+                Api.task.CREATED_DATE: 1640000000000 + index * 1000,
+                'executedBy': 'cvpadmin' if status == 'Completed' else '',
+                Api.device.CCID: '',
+                Api.device.CCIDV2: '',
+                'data': {},
+            })
+
+    def __generate_change_controls(self, change_controls: int):
+        completed = [task for task in self.tasks if task[Api.device.STATUS] == 'Completed']
+        for index in range(change_controls):
+            cc_id = self.__uuid()
+            root_stage = self.__uuid()
+            stages = {root_stage: {'name': f'cc-{index + 1} root stage', 'rows': {'values': [{'values': []}]}}}
+            for task in completed[index * 3:index * 3 + 3]:
+                stage_id = self.__uuid()
+                stages[stage_id] = {'name': 'task', 'action': {'name': 'task', 'timeout': 3000,
+                                                               'args': {'values': {'TaskID': task[Api.generic.TASK_ID]}}}}
+                stages[root_stage]['rows']['values'][0]['values'].append(stage_id)
+                task[Api.device.CCIDV2] = cc_id
+            self.change_controls.append({
+                'key': {'id': cc_id},
+                'change': {'name': f'cc-{index + 1}', 'rootStageId': root_stage, 'stages': {'values': stages},
+                           'notes': 'Created by Ansible-CVP', 'time': f'2022-01-01T00:00:{index % 60:02d}.000000Z'},
+                'approve': {'value': True, 'notes': ''},
+                'status': 'CHANGE_CONTROL_STATUS_COMPLETED',
+            })
+
+    # ------------------------------------------------------------------------ #
+    #   cvprac shapes
+    # ------------------------------------------------------------------------ #
+
+    def __container_index(self):
+        return {container[Api.generic.KEY]: container for container in self.containers}
+
+    def inventory(self):
+        """
+        inventory Devices as returned by cvprac get_inventory()
+
+        Returns
+        -------
+        list
+            Devices with fields added by cvprac
+        """
+        containers = self.__container_index()
+        inventory = []
+        for device in self.devices:
+            data = {field: value for field, value in device.items() if field != Api.generic.CONFIG}
+            data.update({
+                Api.generic.KEY: device[Api.device.SYSMAC],
+                'deviceInfo': device['status'],
+                'deviceStatus': device['status'],
+                'isMLAGEnabled': device['mlagEnabled'],
+                'isDANZEnabled': device['danzEnabled'],
+                Api.generic.PARENT_CONTAINER_ID: device[Api.device.PARENT_CONTAINER_KEY],
+                'bootupTimeStamp': device['bootupTimestamp'],
+                'internalBuildId': device['internalBuild'],
+                'taskIdList': [],
+                'tempAction': None,
+                'type': 'netelement',
+                Api.device.CONTAINER_NAME: containers[device[Api.device.PARENT_CONTAINER_KEY]][Api.generic.NAME],
+            })
+            inventory.append(data)
+        return inventory
+
+    def configlets_and_mappers(self):
+        """
+        configlets_and_mappers Configlets and mappers as returned by cvprac get_configlets_and_mappers()
+
+        Returns
+        -------
+        dict
+            Configlets and mappers under data key
+        """
+        return {'data': {
+            Api.generic.CONFIGLETS: copy.deepcopy(self.configlets),
+            'configletMappers': copy.deepcopy(self.mappers),
+            'generatedConfigletMappers': [],
+            'configletBuilders': [],
+            'builderMappers': [],
+        }}
+
+    def topology(self, node_id: str = ROOT_CONTAINER_KEY):
+        """
+        topology Container tree as returned by cvprac filter_topology()
+
+        Parameters
+        ----------
+        node_id : str, optional
+            Key of the container at the top of the tree, by default root
+
+        Returns
+        -------
+        dict
+            Container tree under topology key
+        """
+        children = {}
+        for container in self.containers:
+            children.setdefault(container[Api.generic.PARENT_CONTAINER_ID], []).append(container)
+        devices = {}
+        for device in self.inventory():
+            devices.setdefault(device[Api.device.PARENT_CONTAINER_KEY], []).append(device)
+
+        def node(container):
+            key = container[Api.generic.KEY]
+            data = {
+                Api.generic.KEY: key,
+                Api.generic.NAME: container[Api.generic.NAME],
+                'type': 'container',
+                Api.generic.PARENT_CONTAINER_ID: container[Api.generic.PARENT_CONTAINER_ID],
+                Api.container.COUNT_CONTAINER: len(children.get(key, [])),
+                Api.container.COUNT_DEVICE: len(devices.get(key, [])),
+                'mode': 'expand',
+                'deviceStatus': '',
+                'childTaskCount': 0,
+                Api.container.CHILDREN_LIST: [node(child) for child in children.get(key, [])],
+                'childNetElementList': devices.get(key, []),
+                'tempAction': None,
+                'tempEvent': None,
+            }
+            data['hierarchyNetElementCount'] = data[Api.container.COUNT_DEVICE] + sum(
+                child['hierarchyNetElementCount'] for child in data[Api.container.CHILDREN_LIST])
+            return data
+
+        return {Api.container.TOPOLOGY: node(self.__container_index()[node_id])}
+
+    def get_tasks(self, status: str = None):
+        """
+        get_tasks Tasks as returned by cvprac get_tasks(), latest first
+
+        Parameters
+        ----------
+        status : str, optional
+            Only return tasks with this status, as cvprac get_tasks_by_status(), by default all tasks
+
+        Returns
+        -------
+        dict
+            Tasks under data key with total count
+        """
+        tasks = [copy.deepcopy(task) for task in reversed(self.tasks) if status is None or task[Api.device.STATUS] == status]
+        return {'data': tasks, 'total': len(tasks)}
+
+    def change_control_get_all(self):
+        """
+        change_control_get_all Change controls as returned by cvprac change_control_get_all()
+
+        Returns
+        -------
+        dict
+            Resource API results under data key
+        """
+        return {'data': [{'result': {'value': copy.deepcopy(change), 'time': change['change']['time'], 'type': 'INITIAL'}}
+                         for change in self.change_controls]}
+
+    def database(self):
+        """
+        database Build a MockCVPDatabase with the fabric, for unit tests or MockCVPServer
+
+        Returns
+        -------
+        MockCVPDatabase
+            Independent copy of the fabric
+        """
+        database = MockCVPDatabase(
+            devices={device[Api.device.SYSMAC]: copy.deepcopy(device) for device in self.devices},
+            containers={container[Api.generic.NAME]: copy.deepcopy(container) for container in self.containers},
+            configlets={configlet[Api.generic.NAME]: copy.deepcopy(configlet) for configlet in self.configlets},
+            configlets_mappers={'data': {'configletMappers': copy.deepcopy(self.mappers)}},
+            image_bundles={'data': copy.deepcopy(self.image_bundles)},
+            tasks={task[Api.generic.TASK_ID]: copy.deepcopy(task) for task in self.tasks},
+            change_controls={change['key']['id']: copy.deepcopy(change) for change in self.change_controls},
+        )
+        database.taskIdCounter = len(self.tasks)
+        return database
+
+    # ------------------------------------------------------------------------ #
+    #   Module inputs
+    # ------------------------------------------------------------------------ #
+
+    def device_inputs(self, moved: float = 0.0, changed: float = 0.0, deploy: bool = True, search_key: str = Api.device.FQDN):
+        """
+        device_inputs Devices option of cv_device_v3 matching the fabric
+
+        Parameters
+        ----------
+        moved : float, optional
+            Ratio of devices moved to the next leaf container, by default 0.0
+        changed : float, optional
+            Ratio of devices with an extra configlet, by default 0.0
+        deploy : bool, optional
+            Deploy devices from Undefined container to first leaf container, by default True
+        search_key : str, optional
+            search_key option of cv_device_v3, fqdn field contains hostname when set to hostname, by default fqdn
+
+        Returns
+        -------
+        list
+            Devices with fqdn, serialNumber, systemMacAddress, parentContainerName and configlets
+        """
+        containers = self.__container_index()
+        leaves = [container[Api.generic.KEY] for container in self.leaf_containers]
+        configlets = {configlet[Api.generic.KEY]: configlet[Api.generic.NAME] for configlet in self.configlets}
+        applied = {}
+        for mapper in self.mappers:
+            if mapper['type'] == 'netelement':
+                applied.setdefault(mapper[Api.mappers.OBJECT_ID], []).append(configlets[mapper[Api.configlet.ID]])
+        inputs = []
+        for index, device in enumerate(self.devices):
+            parent = device[Api.device.PARENT_CONTAINER_KEY]
+            if parent == Api.container.UNDEFINED_CONTAINER_ID:
+                if not deploy or not leaves:
+                    continue
+                parent = leaves[0]
+            elif leaves and index < int(len(self.devices) * moved):
+                parent = leaves[(leaves.index(parent) + 1) % len(leaves)]
+            device_configlets = list(applied.get(device[Api.device.SYSMAC], []))
+            if index < int(len(self.devices) * changed) and self.configlets:
+                device_configlets.append(self.configlets[-1 - index % len(self.configlets)][Api.generic.NAME])
+            inputs.append({
+                Api.device.FQDN: device[Api.device.HOSTNAME if search_key == Api.device.HOSTNAME else Api.device.FQDN],
+                Api.device.SERIAL: device[Api.device.SERIAL],
+                Api.device.SYSMAC: device[Api.device.SYSMAC],
+                Api.generic.PARENT_CONTAINER_NAME: containers[parent][Api.generic.NAME],
+                Api.generic.CONFIGLETS: device_configlets,
+            })
+        return inputs
+
+    def container_inputs(self, changed: float = 0.0):
+        """
+        container_inputs Topology option of cv_container_v3 matching the fabric
+
+        Parameters
+        ----------
+        changed : float, optional
+            Ratio of containers with an extra configlet, by default 0.0
+
+        Returns
+        -------
+        dict
+            Containers with parentContainerName and configlets, parents first
+        """
+        containers = self.__container_index()
+        configlets = {configlet[Api.generic.KEY]: configlet[Api.generic.NAME] for configlet in self.configlets}
+        applied = {}
+        for mapper in self.mappers:
+            if mapper['type'] == 'container':
+                applied.setdefault(mapper[Api.mappers.OBJECT_ID], []).append(configlets[mapper[Api.configlet.ID]])
+        user_containers = [container for container in self.containers
+                           if container[Api.generic.KEY] not in [ROOT_CONTAINER_KEY, Api.container.UNDEFINED_CONTAINER_ID]]
+        inputs = {}
+        for index, container in enumerate(user_containers):
+            container_configlets = list(applied.get(container[Api.generic.KEY], []))
+            if index < int(len(user_containers) * changed) and self.configlets:
+                container_configlets.append(self.configlets[-1 - index % len(self.configlets)][Api.generic.NAME])
+            inputs[container[Api.generic.NAME]] = {
+                'parentContainerName': containers[container[Api.generic.PARENT_CONTAINER_ID]][Api.generic.NAME],
+                Api.generic.CONFIGLETS: container_configlets,
+            }
+        return inputs
+
+    def configlet_inputs(self, changed: float = 0.0, new: int = 0):
+        """
+        configlet_inputs Configlets option of cv_configlet_v3 matching the fabric
+
+        Parameters
+        ----------
+        changed : float, optional
+            Ratio of configlets with an updated content, by default 0.0
+        new : int, optional
+            Number of configlets not yet on Cloudvision, by default 0
+
+        Returns
+        -------
+        dict
+            Configlets content per name
+        """
+        inputs = {}
+        for index, configlet in enumerate(self.configlets):
+            config = configlet[Api.generic.CONFIG]
+            if index < int(len(self.configlets) * changed):
+                config += 'alias updated show version\n'
+            inputs[configlet[Api.generic.NAME]] = config
+        for index in range(new):
+            inputs[f'new-{index + 1}'] = f'alias new{index + 1} show version\n'
+        return inputs
@@ -5,13 +5,24 @@
 # coding: utf-8 -*-
 
 from unittest.mock import MagicMock, create_autospec
+from collections import Counter
+from dataclasses import dataclass
+import inspect
 import pprint
 import logging
 from cvprac.cvp_client import CvpClient, CvpApi
+from ansible_collections.arista.cvp.plugins.module_utils import tools_metrics
 from ansible_collections.arista.cvp.plugins.module_utils.resources.api.fields import Api
 
 LOGGER = logging.getLogger(__name__)
 
+# cvprac methods counted as reads by ApiCallBudget, all others are writes
+API_READ_PREFIXES = ('get_', 'filter_', 'search_', 'check_')
+API_READ_METHODS = ('get',)
+
+# CvpClient methods sending a request, forwarded and recorded by get_recording_cvp_client()
+CLIENT_REQUEST_METHODS = ('get', 'post', 'delete')
+
 
 class CvpNotFoundError(Exception):
     """Exception class to be raised when data is not found in mock CVP database"""
@@ -50,7 +61,8 @@ class MockCVPDatabase:
     # CVP_DATA_CONFIGLETS_MAPPERS_INIT = magickmock_data.MOCKDATA_CONFIGLET_MAPPERS
     # CVP_DATA_CONFIGLET_INIT = magickmock_data.MOCKDATA_CONFIGLETS
 
-    def __init__(self, devices: dict = None, containers: list = None, configlets: list = None, configlets_mappers: dict = None, images: dict = None, image_bundles: dict = None):
+    def __init__(self, devices: dict = None, containers: list = None, configlets: list = None, configlets_mappers: dict = None, images: dict = None, image_bundles: dict = None,
+                 tasks: dict = None, change_controls: dict = None, workspaces: dict = None, tags: list = None):
         self.devices = devices if devices is not None else {}
         # self.containers = containers if containers is not None else {}
         self.containers = containers if containers is not None else MockCVPDatabase.CVP_DATA_CONTAINERS_INIT.copy()
@@ -58,6 +70,11 @@ class MockCVPDatabase:
         self.configlets_mappers = configlets_mappers if configlets_mappers is not None else {}
         self.images = images if images is not None else {}
         self.image_bundles = image_bundles if image_bundles is not None else {}
+        # Only used by the local CVP server in tests/lib/cvp_server.py
+        self.tasks = tasks if tasks is not None else {}
+        self.change_controls = change_controls if change_controls is not None else {}
+        self.workspaces = workspaces if workspaces is not None else {}
+        self.tags = tags if tags is not None else []
         self.taskIdCounter = 0
 
     def _get_container_by_key(self, key: str) -> dict:
@@ -185,3 +202,121 @@ def get_cvp_client(cvp_database) -> MagicMock:
     mock_client.api.get_images.side_effect = cvp_database.get_images
     mock_client.api.get_image_bundles.side_effect = cvp_database.get_image_bundles
     return mock_client
+
+
+def get_recording_cvp_client(cvp_client, side_effects: dict = None) -> MagicMock:
+    """
+    Return a mock cpvrac.cvp_client.CvpClient instance recording every CvpApi call and HTTP request.
+
+    Calls are forwarded to cvp_client, for instance a client of tests.lib.cvp_server.MockCVPServer,
+    and recorded in mock_client.method_calls. cvp_client is instrumented with tools_metrics, so HTTP
+    requests of every call are counted, including the ones of CvpApi methods called by another one.
+
+    Parameters
+    ----------
+    cvp_client : CvpClient
+        Client serving the calls
+    side_effects : dict, optional
+        Functions to use instead of cvp_client.api for some methods, like tests.lib.mockMagic ones
+
+    Returns
+    -------
+    MagicMock
+        The mock cpvrac.cvp_client.CvpClient instance, with CvApiMetrics recorder of cvp_client as metrics.
+    """
+    metrics = tools_metrics.get_metrics(cvp_client) or tools_metrics.instrument_client(cvp_client)
+    mock_client = create_autospec(CvpClient)
+    mock_client.api = create_autospec(CvpApi)
+    mock_client.apiversion = cvp_client.apiversion
+    mock_client.metrics = metrics
+    # Requests sent by callers with CvpClient methods are recorded like API calls
+    client = tools_metrics.InstrumentedApi(cvp_client, metrics)
+    for name in CLIENT_REQUEST_METHODS:
+        getattr(mock_client, name).side_effect = getattr(client, name)
+    side_effects = side_effects or {}
+    for name, _ in inspect.getmembers(CvpApi, inspect.isfunction):
+        if not name.startswith('__'):
+            getattr(mock_client.api, name).side_effect = side_effects.get(name, getattr(cvp_client.api, name))
+    return mock_client
+
+
+def get_api_calls(mock_client: MagicMock, counter: str = 'calls') -> Counter:
+    """
+    Count calls or HTTP requests recorded by a mock CvpClient instance, per method name.
+
+    Calls are the ones made by the caller. HTTP requests are sent by these calls, including through
+    other CvpApi methods, and only counted for calls served by a CvpClient, not by side effects.
+
+    Parameters
+    ----------
+    mock_client : MagicMock
+        Client returned by get_recording_cvp_client()
+    counter : str, optional
+        'calls' or 'requests', by default 'calls'
+
+    Returns
+    -------
+    Counter
+        Number of calls or HTTP requests per CvpApi or CvpClient method
+    """
+    if counter == 'requests':
+        return Counter({name: counters['requests'] for name, counters in mock_client.metrics.summary['api'].items()})
+    return Counter(name.split('.')[-1] for name, _, _ in mock_client.method_calls)
+
+
+@dataclass
+class ApiCallBudget:
+    """
+    Upper bound of CvpApi calls or HTTP requests made by an operation on N items: fixed + per_item x N
+
+    HTTP requests are counted by default so calls between CvpApi methods are covered, use
+    counter='calls' for calls served by side effects.
+    Only reads (methods starting with API_READ_PREFIXES) or writes are counted when kind is set.
+    When methods is set, budget applies to each of these methods separately.
+
+    Example
+    -------
+    >>> ApiCallBudget(fixed=3, per_item=2, kind='reads').check(mock_client, size=100)
+    >>> ApiCallBudget(fixed=1, methods=('get_inventory',)).check(mock_client, size=100)
+    """
+    fixed: int
+    per_item: float = 0
+    kind: str = 'all'
+    methods: tuple = ()
+    counter: str = 'requests'
+
+    def limit(self, size: int) -> float:
+        return self.fixed + self.per_item * size
+
+    def count(self, api_calls: Counter) -> dict:
+        """
+        Count calls or requests covered by budget
+
+        Returns
+        -------
+        dict
+            Number per method when methods is set, total number under kind otherwise
+        """
+        if self.methods:
+            return {name: api_calls.get(name, 0) for name in self.methods}
+        total = 0
+        for name, calls in api_calls.items():
+            is_read = name in API_READ_METHODS or name.startswith(API_READ_PREFIXES)
+            if self.kind == 'all' or (self.kind == 'reads') == is_read:
+                total += calls
+        return {self.kind: total}
+
+    def check(self, mock_client: MagicMock, size: int):
+        """
+        Assert calls or requests recorded by mock_client for an operation on size items are within budget
+
+        Raises
+        ------
+        AssertionError
+            With details of calls or requests when budget is exceeded
+        """
+        api_calls = get_api_calls(mock_client, counter=self.counter)
+        for name, count in self.count(api_calls).items():
+            LOGGER.info('%s %s %s for %s items, budget is %s', count, name, self.counter, size, self.limit(size))
+            assert count <= self.limit(size), \
+                f'{count} {name} {self.counter} for {size} items, budget is {self.fixed} + {self.per_item} x {size}: {dict(api_calls)}'
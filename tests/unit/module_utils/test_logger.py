@@ -0,0 +1,98 @@
+# Copyright (c) 2023 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+import logging
+import logging.handlers
+import os
+import subprocess
+import sys
+import pytest
+from ansible_collections.arista.cvp.plugins.module_utils import logger
+
+
+@pytest.mark.generic
+class TestLogger():
+    """
+    Contains unit tests for module_utils.logger
+    """
+    def test_setup_logging_once(self):
+        """
+        Test collection handler is attached only once to ROOT logger
+        """
+        assert logger.setup_logging() is logger.handler
+        handlers = [handler for handler in logging.getLogger('').handlers if getattr(handler, 'arista_cvp', False)]
+        assert handlers == [logger.handler]
+        assert isinstance(logger.handler, logging.handlers.QueueHandler)
+
+    def test_log_file_size_bound(self):
+        """
+        Test log file shared by module processes is rotated when too large
+        """
+        file_handlers = logger.handler.listener.handlers
+        assert [type(file_handler) for file_handler in file_handlers] == [logger.SharedRotatingFileHandler]
+        assert file_handlers[0].maxBytes == logger.LOG_MAX_BYTES
+        assert file_handlers[0].backupCount == logger.LOG_BACKUP_COUNT
+
+    def test_shared_rotation(self, tmp_path):
+        """
+        Test handlers sharing a log file keep writing to current file once one of them has rotated it
+        """
+        log_file = tmp_path / 'shared.log'
+        handlers = [logger.SharedRotatingFileHandler(str(log_file), maxBytes=200, backupCount=10) for _ in range(2)]
+        records = ['record {0:03d} {1}'.format(index, 'x' * 40) for index in range(20)]
+        try:
+            for index, message in enumerate(records):
+                handlers[index % 2].emit(logging.makeLogRecord({'msg': message}))
+        finally:
+            for handler in handlers:
+                handler.close()
+        files = [log_file] + [tmp_path / 'shared.log.{0}'.format(index) for index in range(1, 11)]
+        lines = [line for path in files if path.exists() for line in path.read_text(encoding='utf8').splitlines()]
+        assert sorted(lines) == records
+        # Last record is written to current file, not to a file renamed by the other handler
+        assert log_file.read_text(encoding='utf8').splitlines()[-1] == records[-1]
+        assert all(path.stat().st_size <= 200 for path in files if path.exists())
+
+    def test_run_id_without_ansible(self):
+        """
+        Test run ID is parent PID when no ansible-playbook process is found
+        """
+        assert logger.get_run_id() == str(os.getppid())
+
+    @pytest.mark.skipif(not os.path.exists('/proc/self/stat'), reason='requires /proc')
+    def test_run_id_shared_by_run(self, tmp_path):
+        """
+        Test run ID is built from PID and start time of topmost ansible-playbook process
+        """
+        module = 'from ansible_collections.arista.cvp.plugins.module_utils.logger import get_run_id; print(get_run_id())'
+        # ansible-playbook starts a forked worker, running the module in a shell
+        playbook = tmp_path / 'ansible-playbook'
+        playbook.write_text(
+            'import os, subprocess, sys\n'
+            'if os.fork() == 0:\n'
+            '    os._exit(subprocess.call(["/bin/sh", "-c", sys.executable + " -c \'" + sys.argv[1] + "\'"]))\n'
+            'os.wait()\n'
+            'print(os.getpid(), open("/proc/self/stat").read().rsplit(")", 1)[1].split()[19])\n')
+        output = subprocess.run([sys.executable, str(playbook), module], capture_output=True, check=True, text=True,
+                                env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))).stdout.split()
+        assert output[0] == '{0}.{1}'.format(output[1], output[2])
+
+    def test_collection_loggers_level(self):
+        """
+        Test disabled records are dropped by collection loggers
+        """
+        for logger_name in ['arista.cvp.cv_tools', 'ansible_collections.arista.cvp.plugins.module_utils.device_tools']:
+            assert logging.getLogger(logger_name).getEffectiveLevel() == logger.LOGLEVEL
+
+    def test_shared_log_file(self):
+        """
+        Test log file is shared by the run and written by the listener
+        """
+        assert logger.RUN_ID in logger.DEFAULT_LOG_FILE
+        logging.getLogger('arista.cvp.test_logger').critical('queued record %s', 'written')
+        logger.handler.listener.stop()
+        try:
+            with open(logger.LOGGING_FILENAME, encoding='utf8') as log_file:
+                assert 'queued record written' in log_file.read()
+        finally:
+            logger.handler.listener.start()
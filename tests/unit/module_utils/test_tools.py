@@ -0,0 +1,71 @@
+# Copyright (c) 2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+import pytest
+from ansible_collections.arista.cvp.plugins.module_utils import tools, tools_cv
+
+
+@pytest.mark.generic
+class TestMatchFilter():
+    """
+    Contains unit tests for match_filter() and MatchFilter
+    """
+    @pytest.mark.parametrize(
+        "input, filter, filter_mode, expected",
+        [
+            ('DC1-LEAF1', ['all'], 'loose', True),
+            ('DC1-LEAF1', ['LEAF'], 'loose', True),
+            ('DC1-LEAF1', ['SPINE', 'DC1'], 'loose', True),
+            ('DC1-LEAF1', ['SPINE', 'DC2'], 'loose', False),
+            ('DC1-LEAF1', [], 'loose', False),
+            ('DC1-LEAF1', ['a.b'], 'loose', False),
+            ('DC1-LEAF1', ['all'], 'strict', True),
+            ('DC1-LEAF1', ['DC1-LEAF1'], 'strict', True),
+            ('DC1-LEAF1', ['LEAF'], 'strict', False),
+            ('DC1-LEAF1', None, 'loose', True),
+        ],
+    )
+    def test_match_filter(self, input, filter, filter_mode, expected):
+        """
+        Test match_filter() returns same result for loose and strict modes
+        """
+        assert tools.match_filter(input=input, filter=filter, filter_mode=filter_mode) is expected
+        if filter_mode == 'loose':
+            assert tools_cv.match_filter(input=input, filter=filter) is expected
+
+    def test_get_match_filter_shared(self):
+        """
+        Test filter is compiled once for a given definition
+        """
+        configlet_filter = tools.get_match_filter(filter=['DC1', 'DC2'])
+        assert tools.get_match_filter(filter=['DC1', 'DC2']) is configlet_filter
+        assert tools.get_match_filter(filter=['DC1', 'DC2'], filter_mode='strict') is not configlet_filter
+
+    def test_match_filter_large(self):
+        """
+        Test a large filter is applied with a single compiled pattern
+        """
+        configlet_filter = tools.MatchFilter(filter=[f'FILTER-{index:03d}' for index in range(200)])
+        assert configlet_filter.match('DC1-FILTER-199-BASE')
+        assert not configlet_filter.match('DC1-FILTER-BASE')
+
+
+@pytest.mark.generic
+class TestCompare():
+    """
+    Contains unit tests for compare()
+    """
+    def test_compare_identical(self):
+        """
+        Test identical configs are not changed and have an empty diff
+        """
+        assert tools.compare('hostname leaf1\n', 'hostname leaf1\n', 'CVP', 'Ansible') == [False, []]
+
+    def test_compare_changed(self):
+        """
+        Test changed configs produce a unified diff
+        """
+        changed, diff = tools.compare('hostname leaf1\n', 'hostname leaf2\n', 'CVP', 'Ansible')
+        assert changed is True
+        assert '-hostname leaf1\n' in diff
+        assert '+hostname leaf2\n' in diff
@@ -0,0 +1,92 @@
+# Copyright (c) 2023 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+import pytest
+from ansible_collections.arista.cvp.plugins.module_utils import tools_inventory
+from tests.data.facts_unit import MOCKDATA_DEVICES
+
+INVENTORY = [
+    {'systemMacAddress': '50:00:00:00:00:01'},
+    {'systemMacAddress': '50:00:00:00:00:01', 'hostname': 'leaf1'},
+    {'systemMacAddress': '50:00:00:00:00:01', 'name': 'leaf1-duplicate'},
+    {'systemMacAddress': '50:00:00:00:00:02', 'name': 'leaf2', 'hostname': 'leaf2-hostname'},
+    {'hostname': 'no-mac'},
+] + MOCKDATA_DEVICES
+
+CONTAINERS = [
+    {'Key': 'root', 'Name': 'Tenant'},
+    {'Key': 'container_1', 'Name': 'Leaves'},
+    {'Key': 'container_1', 'Name': 'Leaves-duplicate'},
+    {'key': 'container_2', 'name': 'lowercase'},
+]
+
+
+@pytest.mark.generic
+class TestInventoryIndex():
+    """
+    Contains unit tests for tools_inventory indexes
+    """
+    def test_build_hostname_index(self):
+        """
+        Test index gives same result as find_hostname_by_mac
+        """
+        index = tools_inventory.build_hostname_index(inventory=INVENTORY)
+        for mac_address in [device.get('systemMacAddress') for device in INVENTORY] + ['unknown']:
+            assert index.get(mac_address) == tools_inventory.find_hostname_by_mac(inventory=INVENTORY, mac_address=mac_address)
+        assert index['50:00:00:00:00:01'] == 'leaf1'
+
+    def test_build_containerName_index(self):
+        """
+        Test index gives same result as find_containerName_by_containerId
+        """
+        index = tools_inventory.build_containerName_index(containers_list=CONTAINERS)
+        for container_id in ['root', 'container_1', 'container_2', 'unknown']:
+            assert index.get(container_id) == tools_inventory.find_containerName_by_containerId(containers_list=CONTAINERS, container_id=container_id)
+
+
+FACTS = {
+    'devices': [{'hostname': 'leaf1', 'key': 'mac1'}, {'hostname': 'leaf1', 'key': 'mac1-duplicate'}, {'hostname': 'leaf2', 'key': 'mac2'}],
+    'configlets': [{'name': 'base', 'key': 'configlet_1'}, {'name': 'base', 'key': 'configlet_2'}],
+    'containers': [{'key': 'root', 'name': 'Tenant', 'Key': 'root', 'Name': 'Tenant'}, {'Key': 'container_1', 'Name': 'Leaves'}],
+}
+
+
+@pytest.mark.generic
+class TestCvFactsIndex():
+    """
+    Contains unit tests for CvFactsIndex
+    """
+    def test_facts_index(self):
+        """
+        Test lookups return first entry of facts like a linear search
+        """
+        facts_index = tools_inventory.CvFactsIndex(facts=FACTS)
+        assert facts_index.devices['leaf1']['key'] == 'mac1'
+        assert facts_index.configlets['base']['key'] == 'configlet_1'
+        assert set(facts_index.containers) == {'Tenant', 'Leaves'}
+        assert 'unknown' not in facts_index.devices
+        assert tools_inventory.CvFactsIndex().configlets == {}
+
+    def test_get_facts_index(self):
+        """
+        Test index is built once per module
+        """
+        class Module():
+            params = {'cvp_facts': FACTS}
+        module = Module()
+        facts_index = tools_inventory.get_facts_index(module)
+        assert tools_inventory.get_facts_index(module) is facts_index
+        assert facts_index.devices['leaf2']['key'] == 'mac2'
+
+    def test_container_devices(self):
+        """
+        Test devices are grouped by parent container and raw facts stay available
+        """
+        facts = dict(FACTS, devices=[{'hostname': 'leaf1', 'parentContainerName': 'Leaves'},
+                                     {'hostname': 'leaf2', 'parentContainerName': 'Leaves'},
+                                     {'hostname': 'spine1'}])
+        facts_index = tools_inventory.as_facts_index(facts)
+        assert tools_inventory.as_facts_index(facts_index) is facts_index
+        assert [device['hostname'] for device in facts_index.container_devices['Leaves']] == ['leaf1', 'leaf2']
+        assert facts_index['devices'] is facts['devices']
+        assert 'containers' in facts_index and facts_index.get('tasks', []) == []
@@ -0,0 +1,168 @@
+# Copyright (c) 2023 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+import json
+from functools import lru_cache
+import pytest
+from ansible_collections.arista.cvp.plugins.module_utils import tools_metrics
+from ansible_collections.arista.cvp.plugins.module_utils.configlet_tools import CvConfigletTools
+from ansible_collections.arista.cvp.plugins.module_utils.tag_tools import CvTagTools
+
+
+class FakeResponse():
+    content = b'0123456789'
+
+
+class FakeApi():
+    def __init__(self, client):
+        self.client = client
+        self.version = 'v12'
+
+    def get_inventory(self, failed_nodes=0):
+        return self.client._make_request(failed_nodes)
+
+    def get_containers(self, count=3):
+        return [self.client._make_request(0) for _ in range(count)]
+
+    def get_configlet_by_name(self, name):
+        if name == 'missing':
+            raise ValueError(name)
+        return {'name': name, 'key': name}
+
+    def get_device_by_name(self, fqdn, search_by_hostname=False):
+        return {'serialNumber': 'SN-' + fqdn}
+
+
+class FakeClient():
+    """
+    Minimal CvpClient with same request workflow: _make_request tries nodes with _send_request
+    """
+    def __init__(self):
+        self.api = FakeApi(self)
+
+    def _make_request(self, failed_nodes):
+        for _ in range(failed_nodes):
+            self._send_request()
+        return self._send_request()
+
+    def _send_request(self):
+        return FakeResponse()
+
+    def _reset_session(self):
+        return None
+
+
+class NoResetClient(FakeClient):
+    """
+    CvpClient without _reset_session method
+    """
+    _reset_session = None
+
+
+class CachedLookup():
+    @lru_cache
+    def get(self, name):
+        return name
+
+
+@pytest.fixture
+def client():
+    fake_client = FakeClient()
+    tools_metrics.instrument_client(fake_client)
+    return fake_client
+
+
+@pytest.mark.generic
+class TestCvApiMetrics():
+    """
+    Contains unit tests for tools_metrics
+    """
+    def test_instrumented_calls(self, client):
+        """
+        Test API calls are recorded with requests, payload and retries
+        """
+        client.api.get_inventory()
+        client.api.get_inventory(failed_nodes=2)
+        client.api.get_containers(count=3)
+        summary = tools_metrics.get_metrics(client).summary
+        assert summary['total_calls'] == 3
+        assert summary['api']['get_inventory']['calls'] == 2
+        assert summary['api']['get_inventory']['requests'] == 2
+        assert summary['api']['get_inventory']['retries'] == 2
+        assert summary['api']['get_inventory']['payload_size'] == 40
+        assert summary['api']['get_containers']['requests'] == 3
+        assert summary['api']['get_containers']['retries'] == 0
+        assert client.api.version == 'v12'
+
+    def test_instrumented_error(self, client):
+        """
+        Test failed API calls are recorded and exception is raised again
+        """
+        with pytest.raises(ValueError):
+            client.api.get_configlet_by_name('missing')
+        assert tools_metrics.get_metrics(client).calls[0]['error'] == 'ValueError'
+        assert tools_metrics.get_metrics(client).summary['api']['get_configlet_by_name']['errors'] == 1
+
+    def test_cache_lookup(self, client):
+        """
+        Test cache lookups are recorded only for instrumented clients
+        """
+        tools_metrics.record_cache_lookup(client, 'containers', hit=False)
+        tools_metrics.record_cache_lookup(client, 'containers', hit=True)
+        tools_metrics.record_cache_lookup(client, 'containers', hit=True)
+        tools_metrics.record_cache_lookup(FakeClient(), 'containers', hit=True)
+        assert tools_metrics.get_metrics(client).summary['cache'] == {'containers': {'hit': 2, 'miss': 1}}
+
+    def test_metrics_result(self, client, tmp_path, monkeypatch):
+        """
+        Test metrics block of module output and JSON lines file
+        """
+        metrics_file = tmp_path / 'metrics.jsonl'
+        monkeypatch.setattr(tools_metrics, 'METRICS_FILE', str(metrics_file))
+        client.api.get_inventory()
+        assert tools_metrics.metrics_result(FakeClient()) == {}
+        result = tools_metrics.metrics_result(client, name='cv_device_v3')
+        assert result['metrics']['api']['get_inventory']['calls'] == 1
+        tools_metrics.metrics_result(client, name='cv_facts_v3')
+        lines = [json.loads(line) for line in metrics_file.read_text().splitlines()]
+        assert [line['module'] for line in lines] == ['cv_device_v3', 'cv_facts_v3']
+        assert lines[0]['calls'][0]['name'] == 'get_inventory'
+
+    def test_missing_private_method(self, mocker):
+        """
+        Test client is still instrumented when a private method of cvprac is missing
+        """
+        warning = mocker.spy(tools_metrics.LOGGER, 'warning')
+        no_reset_client = NoResetClient()
+        tools_metrics.instrument_client(no_reset_client)
+        assert [call.args[1] for call in warning.call_args_list] == ['_reset_session']
+        assert no_reset_client._reset_session is None
+        no_reset_client.api.get_inventory(failed_nodes=1)
+        summary = tools_metrics.get_metrics(no_reset_client).summary
+        assert summary['api']['get_inventory']['requests'] == 1
+        assert summary['api']['get_inventory']['retries'] == 1
+
+    def test_call_cached(self, client):
+        """
+        Test hits and misses of lru_cache methods are recorded
+        """
+        lookup = CachedLookup()
+        for name in ['DC1', 'DC1', 'DC2']:
+            assert tools_metrics.call_cached(client, 'lookup', lookup.get, name) == name
+        assert tools_metrics.call_cached(FakeClient(), 'lookup', lookup.get, 'DC1') == 'DC1'
+        assert tools_metrics.get_metrics(client).summary['cache'] == {'lookup': {'hit': 1, 'miss': 2}}
+
+    def test_tools_cache_lookup(self, client):
+        """
+        Test configlet and tag tools serve repeated lookups from cache
+        """
+        configlet_tools = CvConfigletTools(cv_connection=client)
+        assert configlet_tools.is_present(configlet_name='leaf1')
+        assert configlet_tools.get_configlet_data_cv(configlet_name='leaf1') == {'name': 'leaf1', 'key': 'leaf1'}
+        tag_tools = CvTagTools(cv_connection=client)
+        assert tag_tools.get_serial_num('leaf1') == tag_tools.get_serial_num('leaf1') == 'SN-leaf1'
+        summary = tools_metrics.get_metrics(client).summary
+        assert summary['cache'] == {'configlet_tools.configlets': {'hit': 1, 'miss': 1},
+                                    'tag_tools.serial_numbers': {'hit': 1, 'miss': 1}}
+        assert summary['api']['get_configlet_by_name']['calls'] == 1
+        assert summary['api']['get_device_by_name']['calls'] == 1
@@ -0,0 +1,88 @@
+# Copyright (c) 2023 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+import pytest
+from ansible_collections.arista.cvp.plugins.module_utils import tools_tree
+
+INTENDED_TOPOLOGY = {
+    'Spines': {'parent_container': 'Fabric'},
+    'MLAG02': {'parent_container': 'Leaves'},
+    'Leaves': {'parent_container': 'Fabric'},
+    'MLAG01': {'parent_container': 'Leaves'},
+    'Fabric': {'parent_container': 'Tenant'},
+}
+
+CVP_TOPOLOGY = [
+    {'name': 'Tenant', 'key': 'root', 'parentName': None},
+    {'name': 'staging', 'key': 'container_43_840035860469981', 'parentName': 'Tenant'},
+    {'name': 'Undefined', 'key': 'undefined_container', 'parentName': 'Tenant'},
+]
+
+
+@pytest.mark.generic
+class TestContainerTree():
+    """
+    Contains unit tests for ContainerTree and tree helpers
+    """
+    def test_tree_build_from_dict(self):
+        """
+        Test tree is built from unsorted dict and traversed in creation order
+        """
+        tree = tools_tree.tree_build_from_dict(containers=INTENDED_TOPOLOGY, root='Tenant')
+        assert tree.to_dict() == {'Tenant': {'children': [
+            {'Fabric': {'children': [{'Leaves': {'children': ['MLAG01', 'MLAG02']}}, 'Spines']}}]}}
+        assert tools_tree.tree_to_list(json_data=tree, myList=list()) == ['Tenant', 'Fabric', 'Leaves', 'MLAG01', 'MLAG02', 'Spines']
+
+    def test_tree_build_from_list(self):
+        """
+        Test tree is built from list of containers provided by cv_facts
+        """
+        tree = tools_tree.tree_build_from_list(containers=CVP_TOPOLOGY, root='Tenant')
+        assert tools_tree.tree_to_list(json_data=tree, myList=list()) == ['Tenant', 'Undefined', 'staging']
+
+    def test_tree_build_ignore_detached(self):
+        """
+        Test containers not attached to root are ignored
+        """
+        containers = dict(INTENDED_TOPOLOGY, Orphan={'parent_container': 'Unknown'})
+        tree = tools_tree.tree_build_from_dict(containers=containers, root='Tenant')
+        assert 'Orphan' not in tree
+        assert len(tree) == 6
+
+    @pytest.mark.parametrize(
+        "json_data",
+        [
+            {"Tenant": {"children": [{"Fabric": {"children": [{"Leaves": {"children": ["MLAG01", "MLAG02"]}}, "Spines"]}}]}},
+            '{"Tenant": {"children": [{"Fabric": {"children": [{"Leaves": {"children": ["MLAG01", "MLAG02"]}}, "Spines"]}}]}}',
+        ],
+    )
+    def test_tree_to_list_nested(self, json_data):
+        """
+        Test nested tree structure is still supported
+        """
+        assert tools_tree.tree_to_list(json_data=json_data, myList=list()) == ['Tenant', 'Fabric', 'Leaves', 'MLAG01', 'MLAG02', 'Spines']
+
+    def test_subtree(self):
+        """
+        Test extraction of a subtree
+        """
+        tree = tools_tree.tree_build_from_dict(containers=INTENDED_TOPOLOGY, root='Tenant')
+        subtree = tree.subtree('Leaves')
+        assert subtree.traverse() == ['Leaves', 'MLAG01', 'MLAG02']
+        assert subtree.to_dict() == {'Leaves': {'children': ['MLAG01', 'MLAG02']}}
+        assert tree.subtree('Unknown') is None
+
+    def test_large_tree(self):
+        """
+        Test deep tree does not hit recursion limit
+        """
+        containers = {f'C{index}': {'parent_container': f'C{index - 1}' if index else 'Tenant'} for index in range(5000)}
+        tree = tools_tree.tree_build_from_dict(containers=containers, root='Tenant')
+        assert tools_tree.tree_to_list(json_data=tree, myList=list()) == ['Tenant'] + list(containers)
+        assert tools_tree.tree_to_list(json_data=tree.to_dict(), myList=list()) == ['Tenant'] + list(containers)
+
+    def test_locate_relative_root_container(self):
+        """
+        Test relative root of partial topology is its first container with unknown parent
+        """
+        assert tools_tree.locate_relative_root_container(containers_topology=INTENDED_TOPOLOGY) == 'Fabric'
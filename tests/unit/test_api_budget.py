@@ -0,0 +1,157 @@
+#!/usr/bin/python
+# Copyright (c) 2023 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+# coding: utf-8 -*-
+
+from __future__ import (absolute_import, division, print_function)
+import pytest
+from ansible_collections.arista.cvp.plugins.module_utils.configlet_tools import CvConfigletTools, ConfigletInput
+from ansible_collections.arista.cvp.plugins.module_utils.container_tools import CvContainerTools, ContainerInput
+from ansible_collections.arista.cvp.plugins.module_utils.device_tools import CvDeviceTools, DeviceInventory
+from ansible_collections.arista.cvp.plugins.module_utils.facts_tools import CvFactsTools
+from tests.lib import mockMagic
+from tests.lib.cvp_server import MockCVPServer
+from tests.lib.fabric_generator import FabricGenerator
+from tests.lib.mock import ApiCallBudget, get_recording_cvp_client
+from tests.lib.mock_ansible import get_ansible_module
+
+# Budgets are checked at two sizes so a call added per item is caught even when fixed part has margin
+DEVICE_COUNTS = [4, 16]
+
+CONTAINER_DEPTHS = [2, 3]
+
+# ---------------------------------------------------------------------------- #
+#   FIXTURES
+# ---------------------------------------------------------------------------- #
+
+
+def get_fabric(devices: int = 4, depth: int = 2):
+    return FabricGenerator(devices=devices, configlets=3 * devices, depth=depth, fanout=2, tasks=2 * devices, undefined=1)
+
+
+def get_client(fabric: FabricGenerator, side_effects: dict = None):
+    server = MockCVPServer(database=fabric.database())
+    return get_recording_cvp_client(server.local_client(), side_effects=side_effects)
+
+
+def inventory_requests(fabric: FabricGenerator):
+    # cvprac get_inventory() reads devices and all containers, with one request per container
+    return len(fabric.containers) + 3
+
+# ---------------------------------------------------------------------------- #
+#   PYTEST
+# ---------------------------------------------------------------------------- #
+
+
+@pytest.mark.generic
+class TestApiCallBudget():
+    """
+    Contains API call budgets of *_tools managers, to catch calls made once per item when
+    one call for all items is expected.
+    """
+
+    @pytest.mark.parametrize('devices', DEVICE_COUNTS)
+    def test_facts_devices(self, devices):
+        fabric = get_fabric(devices=devices)
+        cvp_client = get_client(fabric)
+        CvFactsTools(cv_connection=cvp_client).facts(scope=['devices'])
+        # Image bundle of every device is part of facts
+        ApiCallBudget(fixed=inventory_requests(fabric) + 1, per_item=1).check(cvp_client, size=len(fabric.devices))
+        ApiCallBudget(fixed=1, methods=('get_configlets_and_mappers',)).check(cvp_client, size=len(fabric.devices))
+
+    @pytest.mark.parametrize('depth', CONTAINER_DEPTHS)
+    def test_facts_containers(self, depth):
+        fabric = get_fabric(depth=depth)
+        cvp_client = get_client(fabric)
+        CvFactsTools(cv_connection=cvp_client).facts(scope=['containers'])
+        # cvprac get_containers() sends one request per container, image bundle of every container is part of facts
+        ApiCallBudget(fixed=3, per_item=2).check(cvp_client, size=len(fabric.containers))
+        ApiCallBudget(fixed=1, methods=('get_configlets_and_mappers',)).check(cvp_client, size=len(fabric.containers))
+
+    @pytest.mark.parametrize('devices', DEVICE_COUNTS)
+    def test_facts_configlets_tasks(self, devices):
+        fabric = get_fabric(devices=devices)
+        cvp_client = get_client(fabric)
+        CvFactsTools(cv_connection=cvp_client).facts(scope=['configlets'])
+        ApiCallBudget(fixed=3, per_item=0.1).check(cvp_client, size=len(fabric.configlets))
+        cvp_client = get_client(fabric)
+        CvFactsTools(cv_connection=cvp_client).facts(scope=['tasks', 'images'])
+        ApiCallBudget(fixed=4).check(cvp_client, size=len(fabric.tasks))
+
+    @pytest.mark.parametrize('search_key', ['fqdn', 'hostname', 'serialNumber'])
+    @pytest.mark.parametrize('devices', DEVICE_COUNTS)
+    def test_device_present_loose(self, devices, search_key):
+        fabric = get_fabric(devices=devices)
+        cvp_client = get_client(fabric)
+        user_inventory = DeviceInventory(data=fabric.device_inputs(moved=0.5, changed=0.5, search_key=search_key))
+        result = CvDeviceTools(cv_connection=cvp_client, ansible_module=get_ansible_module(), search_by=search_key).manager(
+            user_inventory=user_inventory, search_mode=search_key, apply_mode='loose')
+        assert result['success']
+        # Configlets attached are only read for devices with a configlet change
+        changed = int(len(fabric.devices) * 0.5)
+        ApiCallBudget(fixed=inventory_requests(fabric) + 2, per_item=1, kind='reads').check(cvp_client, size=changed)
+        ApiCallBudget(fixed=0, per_item=1, methods=('get_configlets_by_device_id',)).check(cvp_client, size=changed)
+        ApiCallBudget(fixed=0, methods=('get_device_image_info',)).check(cvp_client, size=len(fabric.devices))
+        ApiCallBudget(fixed=1, methods=('get_configlets_and_mappers',)).check(cvp_client, size=len(fabric.devices))
+        # Deploy of a device from Undefined container takes several requests, move and configlets apply take 2
+        ApiCallBudget(fixed=6, per_item=2, kind='writes').check(cvp_client, size=len(fabric.devices))
+
+    @pytest.mark.parametrize('devices', DEVICE_COUNTS)
+    def test_device_present_strict(self, devices):
+        fabric = get_fabric(devices=devices)
+        cvp_client = get_client(fabric)
+        user_inventory = DeviceInventory(data=fabric.device_inputs(moved=0.5, changed=0.5))
+        result = CvDeviceTools(cv_connection=cvp_client, ansible_module=get_ansible_module(), search_by='fqdn').manager(
+            user_inventory=user_inventory, search_mode='fqdn', apply_mode='strict')
+        assert result['success']
+        # Container configlets are read once per container of the fabric, configlets and image bundle
+        # of every device are read to remove the ones not defined in inventory
+        ApiCallBudget(fixed=inventory_requests(fabric) + len(fabric.containers) + 1, per_item=2, kind='reads').check(
+            cvp_client, size=len(fabric.devices))
+        ApiCallBudget(fixed=6, per_item=2, kind='writes').check(cvp_client, size=len(fabric.devices))
+
+    @pytest.mark.parametrize('devices', DEVICE_COUNTS)
+    def test_device_factory_reset(self, devices):
+        fabric = get_fabric(devices=devices)
+        cvp_client = get_client(fabric, side_effects={'reset_device': mockMagic.reset_device})
+        user_inventory = DeviceInventory(data=fabric.device_inputs(deploy=False))
+        result = CvDeviceTools(cv_connection=cvp_client, ansible_module=get_ansible_module(), search_by='fqdn').manager(
+            user_inventory=user_inventory, search_mode='fqdn', state='factory_reset')
+        assert result['success']
+        ApiCallBudget(fixed=inventory_requests(fabric), kind='reads').check(cvp_client, size=devices)
+        # reset_device is served by a side effect, so calls are counted instead of requests
+        ApiCallBudget(fixed=0, per_item=1, kind='writes', counter='calls').check(cvp_client, size=devices)
+
+    @pytest.mark.parametrize('apply_mode', ['loose', 'strict'])
+    @pytest.mark.parametrize('depth', CONTAINER_DEPTHS)
+    def test_container_build_topology(self, depth, apply_mode):
+        fabric = get_fabric(depth=depth)
+        cvp_client = get_client(fabric)
+        user_topology = ContainerInput(user_topology=fabric.container_inputs(changed=0.5))
+        result = CvContainerTools(cv_connection=cvp_client, ansible_module=get_ansible_module()).build_topology(
+            user_topology=user_topology, present=True, apply_mode=apply_mode)
+        assert result.content['success']
+        containers = len(user_topology.ordered_list_containers)
+        configlets = sum(len(user_topology.get_configlets(container_name=name)) for name in user_topology.ordered_list_containers)
+        if apply_mode == 'loose':
+            ApiCallBudget(fixed=1 + configlets, per_item=5, kind='reads').check(cvp_client, size=containers)
+            ApiCallBudget(fixed=0, per_item=3, kind='writes').check(cvp_client, size=containers)
+        else:
+            # Configlets and mappers are read again for every container
+            ApiCallBudget(fixed=1 + configlets, per_item=11, kind='reads').check(cvp_client, size=containers)
+            ApiCallBudget(fixed=0, per_item=1, methods=('get_configlets_and_mappers',)).check(cvp_client, size=containers)
+            ApiCallBudget(fixed=4, per_item=3, kind='writes').check(cvp_client, size=containers)
+
+    @pytest.mark.parametrize('devices', DEVICE_COUNTS)
+    def test_configlet_apply(self, devices):
+        fabric = get_fabric(devices=devices)
+        cvp_client = get_client(fabric)
+        user_configlets = ConfigletInput(user_topology=fabric.configlet_inputs(changed=0.5, new=2))
+        result = CvConfigletTools(cv_connection=cvp_client, ansible_module=get_ansible_module()).apply(
+            configlet_list=user_configlets.configlets, present=True, note='')
+        assert result.content['success']
+        size = len(user_configlets.configlets)
+        ApiCallBudget(fixed=0, per_item=1, kind='reads').check(cvp_client, size=size)
+        # Half of configlets are updated with a note, new ones are added with 2 requests
+        ApiCallBudget(fixed=4, per_item=1, kind='writes').check(cvp_client, size=size)
@@ -0,0 +1,98 @@
+#!/usr/bin/python
+# Copyright (c) 2023 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+# coding: utf-8 -*-
+#
+
+from __future__ import (absolute_import, division, print_function)
+import time
+from unittest.mock import MagicMock
+import pytest
+from ansible_collections.arista.cvp.plugins.modules import cv_configlet
+
+
+def configlet_module(cvp_configlets: dict, ansible_configlets: dict, state: str = 'present', configlet_filter=None):
+    """
+    Build a legacy cv_configlet module with configlets from cv_facts and from inventory
+    """
+    ansible_module = MagicMock()
+    ansible_module.params = {
+        'cvp_facts': {'configlets': [{'name': name, 'key': f'configlet_{name}', 'type': 'Static', 'config': config}
+                                     for name, config in cvp_configlets.items()]},
+        'configlets': ansible_configlets,
+        'configlet_filter': configlet_filter or ['all'],
+        'filter_mode': 'loose',
+        'state': state,
+    }
+    return ansible_module
+
+
+@pytest.mark.generic
+class TestBuildConfigletsList():
+    """
+    Contains unit tests for legacy cv_configlet.build_configlets_list()
+    """
+    def test_build_configlets_list(self):
+        """
+        Test configlets are classified to create, keep, update and delete
+        """
+        module = configlet_module(
+            cvp_configlets={'keep': 'alias k1\n', 'update': 'alias u1\n', 'delete': 'alias d1\n', 'skip': 'alias s1\n'},
+            ansible_configlets={'keep': 'alias k1\n', 'update': 'alias u2\n', 'create': 'alias c1\n'},
+            configlet_filter=['keep', 'update', 'delete', 'create'])
+        intend = cv_configlet.build_configlets_list(module=module)
+        assert [configlet['data']['name'] for configlet in intend['keep']] == ['keep']
+        assert [configlet['data']['name'] for configlet in intend['update']] == ['update']
+        assert [configlet['data']['name'] for configlet in intend['delete']] == ['delete']
+        assert intend['create'] == [{'data': {'name': 'create'}, 'config': 'alias c1\n'}]
+        assert '+alias u2' in intend['update'][0]['diff']
+        assert intend['update'][0]['config'] == 'alias u2\n'
+
+    def test_build_configlets_list_absent(self):
+        """
+        Test configlets defined in inventory are deleted when state is absent
+        """
+        module = configlet_module(cvp_configlets={'c1': 'alias c1\n'}, ansible_configlets={'c1': 'alias c1\n'}, state='absent')
+        intend = cv_configlet.build_configlets_list(module=module)
+        assert [configlet['data']['name'] for configlet in intend['delete']] == ['c1']
+        assert not intend['keep'] and not intend['create']
+
+    def test_build_configlets_list_large(self):
+        """
+        Test classification of a large number of configlets is not quadratic
+        """
+        configlets = {f'configlet-{index:05d}': f'alias a{index}\n' for index in range(10000)}
+        module = configlet_module(cvp_configlets=configlets, ansible_configlets=dict(configlets, new='alias new\n'))
+        start = time.perf_counter()
+        intend = cv_configlet.build_configlets_list(module=module)
+        assert time.perf_counter() - start < 5
+        assert len(intend['keep']) == 10000
+        assert [configlet['data']['name'] for configlet in intend['create']] == ['new']
+
+
+@pytest.mark.generic
+class TestActionUpdate():
+    """
+    Contains unit tests for legacy cv_configlet.action_update() and get_tasks()
+    """
+    def test_action_update(self):
+        """
+        Test configlets are updated and tasks of all configlets collected once
+        """
+        module = configlet_module(cvp_configlets={'c1': 'alias c1\n', 'c2': 'alias c2\n'},
+                                  ansible_configlets={'c1': 'alias c1 new\n', 'c2': 'alias c2 new\n'})
+        module.check_mode = False
+        module.params['configlets_notes'] = 'Managed by Ansible'
+        module.client.api.update_configlet.side_effect = lambda config, key, name, wait_task_ids: {
+            'data': 'Configlet updated successfully', 'taskIds': ['12', '13'] if name == 'c1' else ['13']}
+        module.client.api.get_task_by_id.side_effect = lambda task_id: {'workOrderId': task_id, 'note': '', 'data': {}}
+        intend = cv_configlet.build_configlets_list(module=module)
+        result = cv_configlet.action_update(update_configlets=intend['update'], module=module)
+        assert result['changed'] and not result['failed']
+        assert result['update'] == [{'c1': 'success'}, {'c2': 'success'}]
+        assert module.client.api.update_configlet.call_count == 2
+        assert module.client.api.add_note_to_configlet.call_count == 2
+        tasks = cv_configlet.get_tasks(taskIds=result['taskIds'], module=module)
+        assert tasks == [{'workOrderId': '12', 'note': ''}, {'workOrderId': '13', 'note': ''}]
+        assert module.client.api.get_task_by_id.call_count == 2
@@ -0,0 +1,117 @@
+#!/usr/bin/python
+# Copyright (c) 2023 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+# coding: utf-8 -*-
+#
+
+from __future__ import (absolute_import, division, print_function)
+from unittest.mock import MagicMock
+import pytest
+from ansible_collections.arista.cvp.plugins.modules import cv_container
+from ansible_collections.arista.cvp.plugins.module_utils import tools_inventory
+
+
+def container(name, key, parent):
+    return {'name': name, 'key': key, 'Name': name, 'Key': key, 'parentName': parent, 'configlets': []}
+
+
+CVP_FACTS = {
+    'containers': [
+        container('Tenant', 'root', None),
+        container('Undefined', 'undefined_container', 'Tenant'),
+        container('Fabric', 'container_1', 'Tenant'),
+        container('Leaves', 'container_2', 'Fabric'),
+        container('Unused', 'container_3', 'Fabric'),
+    ],
+    'devices': [
+        {'hostname': 'leaf1', 'fqdn': 'leaf1.lab', 'key': 'mac1', 'parentContainerName': 'Undefined'},
+        {'hostname': 'leaf2', 'fqdn': 'leaf2.lab', 'key': 'mac2', 'parentContainerName': 'Leaves'},
+    ],
+    'configlets': [{'name': 'leaves-base', 'key': 'configlet_1'}],
+}
+
+TOPOLOGY = {
+    'Fabric': {'parent_container': 'Tenant'},
+    'Leaves': {'parent_container': 'Fabric', 'devices': ['leaf1', 'leaf2'], 'configlets': ['leaves-base']},
+    'Spines': {'parent_container': 'Fabric'},
+}
+
+
+@pytest.fixture
+def module():
+    ansible_module = MagicMock()
+    ansible_module.check_mode = False
+    ansible_module.params = {'cvp_facts': CVP_FACTS, 'topology': TOPOLOGY, 'configlet_filter': ['none'], 'mode': 'merge'}
+    ansible_module.client.api.move_device_to_container.return_value = {'data': {'status': 'success', 'taskIds': ['1']}}
+    ansible_module.client.api.apply_configlets_to_container.return_value = {'data': {'status': 'success', 'taskIds': ['2']}}
+    ansible_module.client.api.get_devices_in_container.return_value = []
+    return ansible_module
+
+
+@pytest.mark.generic
+class TestCvContainerFacts():
+    """
+    Contains unit tests for legacy cv_container operations backed by facts index
+    """
+    def test_move_devices_to_container(self, module):
+        """
+        Test devices and containers known in facts are moved without lookup calls
+        """
+        facts = tools_inventory.get_facts_index(module)
+        result = cv_container.move_devices_to_container(module=module, intended=TOPOLOGY, facts=facts)
+        assert result['moved_devices']['list'] == ['leaf1', 'leaf2']
+        assert result['moved_devices']['taskIds'] == ['1', '1']
+        call = module.client.api.move_device_to_container.call_args_list[0].kwargs
+        assert call['device']['key'] == 'mac1'
+        assert call['container']['key'] == 'container_2'
+        module.client.api.get_container_by_name.assert_not_called()
+        module.client.api.get_device_by_name.assert_not_called()
+
+    def test_move_devices_to_new_container(self, module):
+        """
+        Test container created during execution is collected from CVP once
+        """
+        module.client.api.get_container_by_name.return_value = {'name': 'Spines', 'key': 'container_4'}
+        intended = {'Spines': {'parent_container': 'Fabric', 'devices': ['leaf1', 'leaf2']}}
+        cv_container.move_devices_to_container(module=module, intended=intended, facts=CVP_FACTS)
+        module.client.api.get_container_by_name.assert_called_once_with('Spines')
+
+    def test_configure_configlet_to_container(self, module):
+        """
+        Test configlets are attached with container and configlet info from facts
+        """
+        result = cv_container.configure_configlet_to_container(module=module, intended=TOPOLOGY, facts=CVP_FACTS)
+        assert result['attached_configlet']['taskIds'] == ['2']
+        call = module.client.api.apply_configlets_to_container.call_args.kwargs
+        assert call['new_configlets'] == [{'name': 'leaves-base', 'key': 'configlet_1'}]
+        assert call['container']['key'] == 'container_2'
+
+    def test_is_empty(self, module):
+        """
+        Test container emptiness is based on devices facts
+        """
+        assert cv_container.is_empty(module=module, container_name='Leaves', facts=CVP_FACTS) is False
+        assert cv_container.is_empty(module=module, container_name='Fabric', facts=CVP_FACTS) is True
+
+    def test_delete_unused_containers(self, module):
+        """
+        Test only containers missing from intended topology are checked and deleted
+        """
+        module.client.api.get_containers.return_value = {'data': CVP_FACTS['containers']}
+        module.client.api.delete_container.return_value = {'data': {'status': 'success', 'taskIds': []}}
+        result = cv_container.delete_unused_containers(module=module, intended=TOPOLOGY, facts=CVP_FACTS)
+        assert result == [True, {'containers_deleted': '1'}]
+        checked = {call.args[0] for call in module.client.api.get_devices_in_container.call_args_list}
+        assert checked == {'Undefined', 'Unused'}
+        module.client.api.delete_container.assert_called_once_with('Unused', 'container_3', 'Fabric', 'container_1')
+
+    def test_create_new_containers(self, module):
+        """
+        Test only containers missing from facts are created
+        """
+        module.client.api.get_containers.return_value = {'data': CVP_FACTS['containers']}
+        module.client.api.add_container.return_value = {'data': {'status': 'success', 'taskIds': []}}
+        result = cv_container.create_new_containers(module=module, intended=TOPOLOGY, facts=CVP_FACTS)
+        assert result == [True, {'containers_created': '1'}]
+        module.client.api.add_container.assert_called_once_with('Spines', 'Fabric', 'container_1')
@@ -0,0 +1,84 @@
+#!/usr/bin/python
+# Copyright (c) 2023 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+# coding: utf-8 -*-
+#
+
+from __future__ import (absolute_import, division, print_function)
+from unittest.mock import MagicMock
+import pytest
+from ansible_collections.arista.cvp.plugins.modules import cv_device
+
+CVP_FACTS = {
+    'devices': [
+        {'hostname': f'leaf{index}', 'key': f'mac{index}', 'systemMacAddress': f'mac{index}', 'parentContainerKey': 'container_1',
+         'containerName': 'Leaves', 'deviceSpecificConfiglets': [f'leaf{index}-base']}
+        for index in range(20)
+    ] + [{'hostname': 'new', 'key': 'mac-new', 'parentContainerKey': 'undefined_container', 'containerName': 'Undefined'}],
+    'configlets': [{'name': f'leaf{index}-{suffix}', 'key': f'configlet_{index}_{suffix}'} for index in range(20) for suffix in ['base', 'extra']],
+    'containers': [{'key': 'container_1', 'name': 'Leaves', 'Key': 'container_1', 'Name': 'Leaves'}],
+}
+
+
+@pytest.fixture
+def module():
+    ansible_module = MagicMock()
+    ansible_module.check_mode = False
+    ansible_module.params = {
+        'cvp_facts': CVP_FACTS,
+        'devices': {f'leaf{index}': {'name': f'leaf{index}', 'parentContainerName': 'Leaves', 'imageBundle': [],
+                                     'configlets': [f'leaf{index}-base', f'leaf{index}-extra']}
+                    for index in range(20)},
+        'device_filter': ['all'],
+    }
+    ansible_module.client.api.apply_configlets_to_device.side_effect = lambda app_name, dev, new_configlets, create_task: {
+        'data': {'status': 'success', 'taskIds': [dev['key'].replace('mac', '')]}}
+    return ansible_module
+
+
+@pytest.mark.generic
+class TestDevicesUpdate():
+    """
+    Contains unit tests for legacy cv_device.devices_update()
+    """
+    def test_devices_update(self, module):
+        """
+        Test configlets of all devices are updated and results kept in devices order
+        """
+        result = cv_device.devices_update(module=module, mode='override')
+        assert result['updated_devices'] == 20
+        assert result['updated_tasksIds'] == [str(index) for index in range(20)]
+        assert result['updated'][0] == {'leaf0': "Configlets-['0']"}
+        assert module.client.api.apply_configlets_to_device.call_count == 20
+        module.client.api.remove_configlets_from_device.assert_not_called()
+        call = module.client.api.apply_configlets_to_device.call_args_list[0].kwargs
+        assert call['new_configlets'] == [{'name': f"{call['dev']['hostname']}-extra", 'key': f"configlet_{call['dev']['key'][3:]}_extra"}]
+
+    def test_devices_update_check_mode(self, module):
+        """
+        Test no update is sent in check mode
+        """
+        module.check_mode = True
+        result = cv_device.devices_update(module=module, mode='override')
+        assert result['updated'] == [{f'leaf{index}': 'update-with-configlets'} for index in range(20)]
+        module.client.api.apply_configlets_to_device.assert_not_called()
+
+    def test_devices_update_unknown_configlet(self, module):
+        """
+        Test module fails when a configlet is not on Cloudvision
+        """
+        module.params['devices']['leaf0']['configlets'].append('unknown')
+        module.fail_json.side_effect = SystemExit
+        with pytest.raises(SystemExit):
+            cv_device.devices_update(module=module, mode='override')
+        module.client.api.apply_configlets_to_device.assert_not_called()
+
+    def test_build_new_devices_list(self, module):
+        """
+        Test devices in undefined container are provisioned
+        """
+        module.params['devices']['new'] = {'name': 'new', 'parentContainerName': 'Leaves', 'imageBundle': [], 'configlets': []}
+        assert [device['name'] for device in cv_device.build_new_devices_list(module=module)] == ['new']
+        assert cv_device.container_get_facts(container_name='Leaves', module=module)['key'] == 'container_1'
+        assert cv_device.container_get_facts(container_name='unknown', module=module) == []
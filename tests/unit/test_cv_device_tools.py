@@ -16,6 +16,20 @@ MOCK_LIST = [
     'ansible_collections.arista.cvp.plugins.module_utils.device_tools.CvDeviceTools.get_container_current',
     'ansible_collections.arista.cvp.plugins.module_utils.device_tools.CvDeviceTools.get_container_info']
 
+
+def stage_save_topology(mock_cvpClient, staged: list, tasks: dict):
+    """
+    stage_save_topology - mock temp actions staged for devices and tasks created when topology is saved
+    """
+    mock_cvpClient.api.request_timeout = 30
+    # No temp action is pending before first change is staged
+    temp_actions = [{'data': []}, {'data': [{'nodeType': 'configlet', 'nodeId': '', 'toId': device} for device in staged]}]
+    mock_cvpClient.api.get_all_temp_actions.side_effect = lambda: temp_actions.pop(0) if len(temp_actions) > 1 else temp_actions[0]
+    mock_cvpClient.post.return_value = {'data': {'status': 'success', 'taskIds': list(tasks)}}
+    mock_cvpClient.api.get_task_by_id.side_effect = lambda task_id: {
+        'workOrderId': task_id, 'workOrderDetails': {'netElementId': tasks[task_id]}}
+
+
 @pytest.fixture
 def setup(apply_mock, mock_cvpClient):
     """
@@ -149,6 +163,19 @@ class TestApplyBundle():
         result = cv_tools.apply_bundle(user_inventory=user_topology)
         assert not result
 
+    def test_apply_bundle_without_image(self, setup):
+        """
+        Test current image bundle is not requested when no image bundle is assigned
+        """
+        user_topology = DeviceInventory(data=[{key: value for key, value in device_data[0].items() if key != 'imageBundle'}])
+        _, mock__get_device, cv_tools, mock_get_container_current, _ = setup
+        mock_get_container_current.return_value = current_container_info
+
+        result = cv_tools.apply_bundle(user_inventory=user_topology)
+
+        assert not result
+        mock__get_device.assert_not_called()
+
     def test_apply_bundle_with_same_image(self, setup):
         """
         Test when current_image_bundle and assigned_image_bundle are same
@@ -554,3 +581,341 @@ class TestDeleteDevice():
         assert result[0].success
         assert not result[0].changed
         assert result[0].taskIds == ["check_mode"]
+
+
+class TestCheckDeviceExist():
+    """
+    Contains unit tests for check_device_exist()
+    """
+    @pytest.mark.parametrize(
+        "search_mode, field",
+        [
+            ('hostname', 'fqdn'),
+            ('fqdn', 'fqdn'),
+            ('serialNumber', 'serialNumber'),
+        ],
+    )
+    def test_check_device_exist(self, setup, mock_cvpClient, search_mode, field):
+        """
+        Test devices existence is computed with a single inventory call
+        """
+        user_topology = DeviceInventory(data=device_data + device_data_invalid)
+        _, _, cv_tools, _, _ = setup
+        cv_tools.search_by = search_mode
+        mock_cvpClient.api.get_inventory.return_value = [cv_data]
+
+        result = cv_tools.check_device_exist(user_inventory=user_topology, search_mode=search_mode)
+        expected = [] if field == 'fqdn' else [device_data_invalid[0][field]]
+        assert result == expected
+        mock_cvpClient.api.get_inventory.assert_called_once_with()
+
+    def test_check_device_exist_missing(self, setup, mock_cvpClient):
+        """
+        Test devices not in Cloudvision inventory are reported
+        """
+        user_topology = DeviceInventory(data=device_data)
+        _, _, cv_tools, _, _ = setup
+        mock_cvpClient.api.get_inventory.return_value = []
+
+        result = cv_tools.check_device_exist(user_inventory=user_topology, search_mode='hostname')
+        assert result == [device_data[0]['fqdn']]
+
+
+class TestRemoveMissingDevices():
+    """
+    Contains unit tests for __remove_missing_devices()
+    """
+    def test_remove_missing_devices(self, setup, mock_cvpClient):
+        """
+        Test missing devices are removed with a single inventory call
+        """
+        user_topology = DeviceInventory(data=device_data + device_data_invalid)
+        _, _, cv_tools, _, _ = setup
+        cv_tools.search_by = 'serialNumber'
+        mock_cvpClient.api.get_inventory.return_value = [cv_data]
+
+        result = cv_tools._CvDeviceTools__remove_missing_devices(user_inventory=user_topology)
+        assert [device.serial_number for device in result.devices] == [device_data[0]['serialNumber']]
+        mock_cvpClient.api.get_inventory.assert_called_once_with()
+        mock_cvpClient.api.get_device_by_serial.assert_not_called()
+
+
+class TestRefreshInventory():
+    """
+    Contains unit tests for refresh_inventory()
+    """
+    @pytest.mark.parametrize("search_mode", ['hostname', 'fqdn', 'serialNumber'])
+    def test_refresh_inventory(self, mock_cvpClient, search_mode):
+        """
+        Test all device fields are populated in place from a single inventory call
+        """
+        user_data = [{'parentContainerName': 'TP_LEAF1', 'configlets': []}]
+        if search_mode == 'serialNumber':
+            user_data[0]['serialNumber'] = cv_data['serialNumber']
+        else:
+            user_data[0]['fqdn'] = cv_data['fqdn']
+        user_topology = DeviceInventory(data=user_data)
+        device = user_topology.devices[0]
+        inventory_data = {key: value for key, value in cv_data.items() if key != 'imageBundle'}
+        mock_cvpClient.api.get_inventory.return_value = [inventory_data]
+        mock_cvpClient.api.get_device_image_info.return_value = cv_data['imageBundle']
+        cv_tools = CvDeviceTools(mock_cvpClient, search_by=search_mode)
+
+        result = cv_tools.refresh_inventory(user_inventory=user_topology)
+
+        assert result.devices == [device]
+        assert device.system_mac == cv_data['systemMacAddress']
+        assert device.fqdn == cv_data['fqdn']
+        assert device.serial_number == cv_data['serialNumber']
+        assert device.parent_container_id == cv_data['parentContainerId']
+        assert device.current_container_name == cv_data['containerName']
+        # Facts are served from refresh data
+        assert cv_tools.get_device_facts(device_lookup=device.get_lookup_key(search_mode)) is device.facts
+        mock_cvpClient.api.get_inventory.assert_called_once_with()
+        mock_cvpClient.api.get_device_by_name.assert_not_called()
+        mock_cvpClient.api.get_device_by_serial.assert_not_called()
+        # Image bundle is only requested when needed, and once
+        mock_cvpClient.api.get_device_image_info.assert_not_called()
+        for _ in range(2):
+            assert cv_tools.get_device_image_bundle(device_lookup=device.get_lookup_key(search_mode))['imageBundle'] == \
+                cv_data['imageBundle']['bundleName']
+        # Cached facts are not updated with image information
+        assert 'imageBundle' not in device.facts
+        mock_cvpClient.api.get_device_image_info.assert_called_once_with(cv_data['key'])
+
+    def test_refresh_inventory_updated_after_change(self, mocker, mock_cvpClient):
+        """
+        Test cached facts follow a device move and image information is requested again after an image change
+        """
+        user_topology = DeviceInventory(data=[{'fqdn': cv_data['fqdn'], 'parentContainerName': 'TP_LEAF1', 'configlets': []}])
+        device = user_topology.devices[0]
+        inventory_data = {key: value for key, value in cv_data.items() if key != 'imageBundle'}
+        mock_cvpClient.api.get_inventory.return_value = [inventory_data]
+        mock_cvpClient.api.get_device_image_info.return_value = cv_data['imageBundle']
+        mock_cvpClient.api.move_device_to_container.return_value = {'data': {'status': 'success', 'taskIds': ['1']}}
+        cv_tools = CvDeviceTools(mock_cvpClient, search_by='fqdn')
+        mocker.patch.object(cv_tools, 'get_container_info', return_value={'name': 'TP_LEAF1', 'key': 'container_leaf1'})
+        cv_tools.refresh_inventory(user_inventory=user_topology)
+        cv_tools.get_device_image_bundle(device_lookup=cv_data['fqdn'])
+
+        cv_tools.move_device(user_inventory=user_topology)
+
+        assert cv_tools.get_container_current(device_lookup=cv_data['fqdn']) == {'name': 'TP_LEAF1', 'key': 'container_leaf1'}
+        assert device.parent_container_id == 'container_leaf1'
+        assert inventory_data['parentContainerId'] == cv_data['parentContainerId']
+        mock_cvpClient.api.get_device_by_name.assert_not_called()
+        # Image information is kept after a move, and dropped after an image change
+        cv_tools.get_device_image_bundle(device_lookup=cv_data['fqdn'])
+        assert mock_cvpClient.api.get_device_image_info.call_count == 1
+        cv_tools._CvDeviceTools__update_device_facts(device, image=True)
+        cv_tools.get_device_image_bundle(device_lookup=cv_data['fqdn'])
+        assert mock_cvpClient.api.get_device_image_info.call_count == 2
+
+    def test_refresh_inventory_keep_hostname(self, mock_cvpClient):
+        """
+        Test hostname given by user is not replaced by first label of FQDN
+        """
+        mock_cvpClient.api.get_inventory.return_value = [dict(cv_data, fqdn='tp-avd-leaf2.lab')]
+        user_topology = DeviceInventory(data=[
+            {'serialNumber': cv_data['serialNumber'], 'hostname': 'leaf2', 'ipAddress': '192.168.0.12',
+             'parentContainerName': 'TP_LEAF1'}])
+        CvDeviceTools(mock_cvpClient, search_by='serialNumber').refresh_inventory(user_inventory=user_topology)
+        assert user_topology.devices[0].get_lookup_key('hostname') == 'leaf2'
+
+        # Device with management IP and no hostname gets it from FQDN
+        user_topology = DeviceInventory(data=[
+            {'fqdn': 'tp-avd-leaf2.lab', 'ipAddress': '192.168.0.12', 'parentContainerName': 'TP_LEAF1'}])
+        CvDeviceTools(mock_cvpClient, search_by='fqdn').refresh_inventory(user_inventory=user_topology)
+        assert user_topology.devices[0].get_lookup_key('hostname') == 'tp-avd-leaf2'
+
+    def test_refresh_inventory_unknown_device(self, mock_cvpClient):
+        """
+        Test devices without systemMacAddress are removed from inventory
+        """
+        user_topology = DeviceInventory(data=[{'fqdn': 'unknown', 'parentContainerName': 'TP_LEAF1'}])
+        mock_cvpClient.api.get_inventory.return_value = [dict(cv_data)]
+        cv_tools = CvDeviceTools(mock_cvpClient, search_by='fqdn')
+
+        result = cv_tools.refresh_inventory(user_inventory=user_topology)
+        assert not result.devices
+        mock_cvpClient.api.get_device_image_info.assert_not_called()
+
+
+class TestBatchMode():
+    """
+    Contains unit tests for configlet changes saved with a single topology save
+    """
+    @pytest.fixture
+    def batch_setup(self, setup, mocker, mock_cvpClient):
+        """
+        batch_setup - configure cv_tools in batch mode with two devices to update
+        """
+        _, _, cv_tools, mock_get_container_current, _ = setup
+        cv_tools.batch_mode = True
+        cv_tools.search_by = 'fqdn'
+        mock_get_container_current.return_value = {'name': 'TP_LEAF1'}
+        mocker.patch.object(cv_tools, 'get_device_configlets', return_value=[])
+        mocker.patch.object(
+            cv_tools, 'get_device_facts',
+            side_effect=lambda device_lookup: {'fqdn': device_lookup, 'systemMacAddress': 'mac-' + device_lookup})
+        mocker.patch.object(
+            cv_tools, '_CvDeviceTools__get_configlet_info',
+            side_effect=lambda configlet_name: {'name': configlet_name, 'key': 'key-' + configlet_name, 'reconciled': False})
+        stage_save_topology(mock_cvpClient, staged=['mac-leaf1', 'mac-leaf2'], tasks={'1': 'mac-leaf1', '2': 'mac-leaf2'})
+        user_topology = DeviceInventory(data=[
+            {'fqdn': 'leaf1', 'parentContainerName': 'TP_LEAF1', 'configlets': ['cfg1']},
+            {'fqdn': 'leaf2', 'parentContainerName': 'TP_LEAF1', 'configlets': ['cfg2']},
+        ])
+        return cv_tools, user_topology
+
+    def test_apply_configlets_batch_mode(self, batch_setup, mock_cvpClient):
+        """
+        Test configlets are staged per device and saved with a single topology save
+        """
+        cv_tools, user_topology = batch_setup
+
+        results = cv_tools.apply_configlets(user_inventory=user_topology)
+
+        assert mock_cvpClient.api.apply_configlets_to_device.call_count == 2
+        for api_call in mock_cvpClient.api.apply_configlets_to_device.call_args_list:
+            assert api_call.kwargs['create_task'] is False
+        mock_cvpClient.post.assert_called_once_with('/provisioning/v2/saveTopology.do', data=[], timeout=30)
+        mock_cvpClient.api._save_topology_v2.assert_not_called()
+        mock_cvpClient.api.get_tasks_by_status.assert_not_called()
+        assert sorted(api_call.args[0] for api_call in mock_cvpClient.api.get_task_by_id.call_args_list) == ['1', '2']
+        assert [result.taskIds for result in results] == [['1'], ['2']]
+        assert all(result.success and result.changed for result in results)
+        assert results[0].list_changes == ['leaf1 adds cfg1']
+
+    def test_apply_configlets_batch_mode_disabled(self, batch_setup, mock_cvpClient):
+        """
+        Test topology is not saved separately when batch mode is disabled
+        """
+        cv_tools, user_topology = batch_setup
+        cv_tools.batch_mode = False
+        mock_cvpClient.api.apply_configlets_to_device.return_value = {'data': {'status': 'success', 'taskIds': ['1']}}
+
+        cv_tools.apply_configlets(user_inventory=user_topology)
+
+        for api_call in mock_cvpClient.api.apply_configlets_to_device.call_args_list:
+            assert api_call.kwargs['create_task'] is True
+        mock_cvpClient.post.assert_not_called()
+
+    def test_apply_configlets_unchanged_device(self, batch_setup, mock_cvpClient):
+        """
+        Test configlets attached are not read for a device whose configlets mappers match inventory
+        """
+        cv_tools, user_topology = batch_setup
+        cv_tools.batch_mode = False
+        mock_cvpClient.api.get_configlets_and_mappers.return_value = {'data': {
+            'configlets': [{'name': 'cfg1', 'key': 'key-cfg1'}],
+            'configletMappers': [{'configletId': 'key-cfg1', 'objectId': 'mac-leaf1', 'type': 'netelement', 'order': 0}],
+        }}
+        mock_cvpClient.api.apply_configlets_to_device.return_value = {'data': {'status': 'success', 'taskIds': ['2']}}
+
+        results = cv_tools.apply_configlets(user_inventory=user_topology)
+
+        cv_tools.get_device_configlets.assert_called_once_with(device_lookup='leaf2')
+        mock_cvpClient.api.apply_configlets_to_device.assert_called_once()
+        assert [result.taskIds for result in results] == [['2']]
+
+    @pytest.mark.parametrize('mappers', [
+        pytest.param([{'configletId': 'key-cfgA', 'order': 1}, {'configletId': 'key-cfgB', 'order': 0}], id='applied_order'),
+        pytest.param([{'configletId': 'key-cfgA'}, {'configletId': 'key-cfgB'}], id='unknown_order'),
+    ])
+    def test_apply_configlets_mapped_order(self, batch_setup, mock_cvpClient, mappers):
+        """
+        Test configlets attached are read when applied order differs from inventory or is unknown
+        """
+        cv_tools, _ = batch_setup
+        cv_tools.batch_mode = False
+        user_topology = DeviceInventory(data=[{'fqdn': 'leaf1', 'parentContainerName': 'TP_LEAF1', 'configlets': ['cfgA', 'cfgB']}])
+        mock_cvpClient.api.get_configlets_and_mappers.return_value = {'data': {
+            'configlets': [{'name': 'cfgA', 'key': 'key-cfgA'}, {'name': 'cfgB', 'key': 'key-cfgB'}],
+            'configletMappers': [dict(mapper, objectId='mac-leaf1', type='netelement') for mapper in mappers],
+        }}
+        mock_cvpClient.api.apply_configlets_to_device.return_value = {'data': {'status': 'success', 'taskIds': ['1']}}
+
+        cv_tools.apply_configlets(user_inventory=user_topology)
+
+        cv_tools.get_device_configlets.assert_called_once_with(device_lookup='leaf1')
+
+    def test_save_topology_cvp_api_error(self, batch_setup, mock_cvpClient):
+        """
+        Test fail_json is called when topology cannot be saved
+        """
+        cv_tools, user_topology = batch_setup
+        mock_cvpClient.post.side_effect = CvpApiError('dummy error')
+
+        with pytest.raises(SystemExit):
+            cv_tools.apply_configlets(user_inventory=user_topology)
+
+    def test_save_topology_failed(self, batch_setup, mock_cvpClient):
+        """
+        Test fail_json is called when Cloudvision does not report topology as saved
+        """
+        cv_tools, user_topology = batch_setup
+        mock_cvpClient.post.return_value = {'data': {'status': 'failure', 'taskIds': []}}
+
+        with pytest.raises(SystemExit):
+            cv_tools.apply_configlets(user_inventory=user_topology)
+
+    def test_save_topology_unstaged_change(self, batch_setup, mock_cvpClient):
+        """
+        Test staged changes are saved and fail_json is called when a change has not been staged
+        """
+        cv_tools, user_topology = batch_setup
+        stage_save_topology(mock_cvpClient, staged=['mac-leaf1'], tasks={'1': 'mac-leaf1'})
+
+        with pytest.raises(SystemExit):
+            cv_tools.apply_configlets(user_inventory=user_topology)
+        mock_cvpClient.post.assert_called_once()
+
+    def test_apply_configlets_pending_temp_actions(self, batch_setup, mock_cvpClient):
+        """
+        Test nothing is staged nor saved when temp actions are pending before the module run
+        """
+        cv_tools, user_topology = batch_setup
+        mock_cvpClient.api.get_all_temp_actions.side_effect = None
+        mock_cvpClient.api.get_all_temp_actions.return_value = {'data': [{'nodeType': 'configlet', 'nodeId': '', 'toId': 'other'}]}
+
+        with pytest.raises(SystemExit):
+            cv_tools.apply_configlets(user_inventory=user_topology)
+        mock_cvpClient.api.apply_configlets_to_device.assert_not_called()
+        mock_cvpClient.post.assert_not_called()
+
+
+class TestMoveDeviceBatchMode():
+    """
+    Contains unit tests for move_device() with a single topology save
+    """
+    def test_move_device_batch_mode(self, mocker, mock_cvpClient):
+        """
+        Test target containers are resolved from topology and moves saved with a single topology save
+        """
+        mocker.patch(MOCK_LIST[0])
+        mocker.patch.object(CvDeviceTools, 'get_container_current', return_value={'name': 'TP_LEAF1', 'key': 'container_1'})
+        mock_cvpClient.api.filter_topology.return_value = {'topology': {
+            'name': 'Tenant', 'key': 'root', 'parentContainerId': None, 'childContainerList': [
+                {'name': 'TP_LEAF2', 'key': 'container_2', 'parentContainerId': 'root', 'childContainerList': []}]}}
+        stage_save_topology(mock_cvpClient, staged=['mac1', 'mac2'], tasks={'1': 'mac1', '2': 'mac2'})
+        user_topology = DeviceInventory(data=[
+            {'fqdn': 'leaf1', 'systemMacAddress': 'mac1', 'parentContainerName': 'TP_LEAF2'},
+            {'fqdn': 'leaf2', 'systemMacAddress': 'mac2', 'parentContainerName': 'TP_LEAF2'},
+        ])
+        cv_tools = CvDeviceTools(mock_cvpClient, search_by='fqdn', batch_mode=True)
+
+        results = cv_tools.move_device(user_inventory=user_topology)
+
+        mock_cvpClient.api.filter_topology.assert_called_once_with()
+        mock_cvpClient.api.get_container_by_name.assert_not_called()
+        assert mock_cvpClient.api.move_device_to_container.call_count == 2
+        for api_call in mock_cvpClient.api.move_device_to_container.call_args_list:
+            assert api_call.kwargs['container'] == {'name': 'TP_LEAF2', 'key': 'container_2'}
+            assert api_call.kwargs['create_task'] is False
+            # current container is given so cvprac does not request it for every device
+            assert api_call.kwargs['device']['parentContainerId'] == 'container_1'
+        mock_cvpClient.api.get_parent_container_for_device.assert_not_called()
+        mock_cvpClient.post.assert_called_once_with('/provisioning/v2/saveTopology.do', data=[], timeout=30)
+        assert [result.taskIds for result in results] == [['1'], ['2']]
+        assert all(result.success and result.changed for result in results)
@@ -0,0 +1,181 @@
+#!/usr/bin/python
+# Copyright (c) 2023 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+# coding: utf-8 -*-
+#
+
+from __future__ import (absolute_import, division, print_function)
+import copy
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+import pytest
+from ansible_collections.arista.cvp.plugins.modules import cv_facts
+from ansible_collections.arista.cvp.plugins.module_utils import tools_inventory
+from tests.data.facts_unit import MOCKDATA_CONFIGLET_MAPPERS, MOCKDATA_CONTAINERS, MOCKDATA_DEVICES
+
+CONTAINERS = [dict(container, Key=container['key'], Name=container['name']) for container in MOCKDATA_CONTAINERS.values()]
+# Inventory as returned by get_inventory()
+INVENTORY = [dict(device, key=device['systemMacAddress'], parentContainerKey=device['parentContainerKey'] or 'undefined_container')
+             for device in MOCKDATA_DEVICES]
+
+
+def reference_configlets_mapping(configlets_and_mappers, inventory, containers):
+    """
+    Mapping of configlets to devices and containers computed with linear lookups
+    """
+    mapping = {}
+    for configlet in configlets_and_mappers['configlets']:
+        mapping[configlet['name']] = {'devices': [], 'containers': []}
+        for mapper in configlets_and_mappers['configletMappers']:
+            if mapper['configletId'] != configlet['key']:
+                continue
+            if mapper['type'] == 'netelement':
+                hostname = tools_inventory.find_hostname_by_mac(inventory=inventory, mac_address=mapper['objectId'])
+                if hostname is not None:
+                    mapping[configlet['name']]['devices'].append(hostname)
+            if mapper['type'] == 'container':
+                name = tools_inventory.find_containerName_by_containerId(containers_list=containers, container_id=mapper['objectId'])
+                if name is not None:
+                    mapping[configlet['name']]['containers'].append(name)
+    return mapping
+
+
+def device_image_info(device_key):
+    if device_key == INVENTORY[0]['key']:
+        return {'bundleName': 'EOS-4.26.3M', 'imageBundleMapper': {'mapper': {'type': 'netelement'}}}
+    return {'bundleName': 'EOS-4.25', 'imageBundleMapper': {'mapper': {'type': 'container'}}}
+
+
+@pytest.fixture
+def module():
+    ansible_module = MagicMock()
+    ansible_module.params = {'gather_subset': ['default', 'config'], 'facts': ['all']}
+    ansible_module.client.api.get_device_image_info.side_effect = device_image_info
+    ansible_module.client.api.get_device_configuration.side_effect = lambda device_key: 'hostname {0}'.format(device_key)
+    ansible_module.client.api.get_configlets_and_mappers.return_value = copy.deepcopy(MOCKDATA_CONFIGLET_MAPPERS)
+    ansible_module.client.api.get_inventory.return_value = copy.deepcopy(INVENTORY)
+    ansible_module.client.api.get_containers.return_value = {'data': copy.deepcopy(CONTAINERS), 'total': len(CONTAINERS)}
+    return ansible_module
+
+
+@pytest.mark.generic
+class TestCvFactsConfiglets():
+    """
+    Contains unit tests for legacy cv_facts.facts_configlets()
+    """
+    @pytest.mark.parametrize('cached', [True, False])
+    def test_facts_configlets_mapping(self, module, cached):
+        """
+        Test configlets are mapped to devices and containers with same result as linear lookups
+        """
+        facts = {'devices': copy.deepcopy(MOCKDATA_DEVICES), 'containers': copy.deepcopy(CONTAINERS)} if cached else {}
+        facts = cv_facts.facts_configlets(module=module, facts=facts)
+        expected = reference_configlets_mapping(MOCKDATA_CONFIGLET_MAPPERS['data'], MOCKDATA_DEVICES, CONTAINERS)
+        assert {configlet['name']: {'devices': configlet['devices'], 'containers': configlet['containers']}
+                for configlet in facts['configlets']} == expected
+        assert [configlet['name'] for configlet in facts['configlets']] == [
+            configlet['name'] for configlet in MOCKDATA_CONFIGLET_MAPPERS['data']['configlets']]
+        assert any(configlet['devices'] for configlet in facts['configlets'])
+        assert any(configlet['containers'] for configlet in facts['configlets'])
+
+
+@pytest.mark.generic
+class TestCvFactsDevices():
+    """
+    Contains unit tests for legacy cv_facts.facts_devices()
+    """
+    def test_facts_devices(self, module):
+        """
+        Test devices facts are built without per device container and configlet calls
+        """
+        facts = cv_facts.facts_devices(module=module, facts={})
+        container_names = {container['key']: container['name'] for container in CONTAINERS}
+        configlets = {configlet['key']: configlet for configlet in MOCKDATA_CONFIGLET_MAPPERS['data']['configlets']}
+        mappers = MOCKDATA_CONFIGLET_MAPPERS['data']['configletMappers']
+        assert [device['hostname'] for device in facts['devices']] == [device['hostname'] for device in MOCKDATA_DEVICES]
+        for device in facts['devices']:
+            assert device['name'] == device['hostname']
+            assert device['parentContainerName'] == container_names[device['parentContainerKey']]
+            # configlets are listed in the order they are mapped to the device
+            mapped = [configlets[mapper['configletId']] for mapper in mappers
+                      if mapper['type'] == 'netelement' and mapper['objectId'] == device['key']]
+            assert device['deviceSpecificConfiglets'] == [configlet['name'] for configlet in mapped if int(configlet['containerCount']) == 0]
+            if device['streamingStatus'] == 'active':
+                assert device['config'] == 'hostname {0}'.format(device['key'])
+            else:
+                assert 'config' not in device
+        assert facts['devices'][0]['imageBundle'] == 'EOS-4.26.3M'
+        assert facts['devices'][1]['imageBundle'] == ''
+        assert any(device['deviceSpecificConfiglets'] for device in facts['devices'])
+        module.client.api.get_container_by_id.assert_not_called()
+        module.client.api.get_configlets_by_device_id.assert_not_called()
+        assert module.client.api.get_device_image_info.call_count == len(MOCKDATA_DEVICES)
+
+    def test_facts_devices_configlets_order(self, module):
+        """
+        Test device configlets are listed in the order they are applied to the device
+        """
+        configlets_and_mappers = copy.deepcopy(MOCKDATA_CONFIGLET_MAPPERS)
+        device_key = '50:00:00:d5:5d:c0'
+        mappers = [mapper for mapper in configlets_and_mappers['data']['configletMappers']
+                   if mapper['type'] == 'netelement' and mapper['objectId'] == device_key]
+        for order, mapper in enumerate(reversed(mappers)):
+            mapper['order'] = str(order)
+        module.client.api.get_configlets_and_mappers.return_value = configlets_and_mappers
+        configlets = {configlet['key']: configlet for configlet in configlets_and_mappers['data']['configlets']}
+        facts = cv_facts.facts_devices(module=module, facts={})
+        device = next(device for device in facts['devices'] if device['key'] == device_key)
+        expected = [configlets[mapper['configletId']]['name'] for mapper in reversed(mappers)
+                    if int(configlets[mapper['configletId']]['containerCount']) == 0]
+        assert len(expected) > 1
+        assert device['deviceSpecificConfiglets'] == expected
+
+    def test_facts_devices_unknown_container(self, module):
+        """
+        Test container missing from containers list is resolved with a dedicated call
+        """
+        module.client.api.get_containers.return_value = {'data': [], 'total': 0}
+        module.client.api.get_container_by_id.return_value = {'name': 'Tenant'}
+        facts = cv_facts.facts_devices(module=module, facts={})
+        assert {device['parentContainerName'] for device in facts['devices']} == {'Tenant'}
+        assert module.client.api.get_container_by_id.call_count == len(MOCKDATA_DEVICES)
+
+
+@pytest.mark.generic
+class TestCvFactsGetFutureResult():
+    """
+    Contains unit tests for legacy cv_facts.get_future_result()
+    """
+    def test_get_future_result(self, module):
+        """
+        Test result of a call completed in time is returned
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            call = cv_facts.submit_call(executor, module.client.api.get_device_configuration, 'key')
+            assert cv_facts.get_future_result(module, executor, call, 'leaf1') == 'hostname key'
+        module.fail_json.assert_not_called()
+
+    def test_get_future_result_timeout(self, module, monkeypatch):
+        """
+        Test timeout is counted from start of call and queued calls are cancelled on failure
+        """
+        monkeypatch.setattr(cv_facts, 'CALL_TIMEOUT', 0.2)
+        module.fail_json.side_effect = SystemExit(1)
+        release = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=1)
+        call = cv_facts.submit_call(executor, release.wait)
+        queued = cv_facts.submit_call(executor, module.client.api.get_device_configuration, 'key')
+        # Call has already run for longer than its timeout when its result is awaited
+        time.sleep(0.3)
+        start = time.monotonic()
+        with pytest.raises(SystemExit):
+            cv_facts.get_future_result(module, executor, call, 'leaf1')
+        assert time.monotonic() - start < 0.1
+        assert queued[0].cancelled()
+        module.fail_json.assert_called_once_with(msg='API call for device leaf1 did not complete in 0.2s')
+        release.set()
+        executor.shutdown(wait=True)
+        module.client.api.get_device_configuration.assert_not_called()
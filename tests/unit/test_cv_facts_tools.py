@@ -5,10 +5,18 @@
 # coding: utf-8 -*-
 
 from __future__ import (absolute_import, division, print_function)
+import copy
+import gzip
+import json
+import threading
+import time
 import pytest
 import pprint
+from ansible_collections.arista.cvp.plugins.module_utils import facts_tools
 from ansible_collections.arista.cvp.plugins.module_utils.facts_tools import CvFactsTools
 from tests.lib import mock
+from tests.lib.cvp_server import MockCVPServer
+from tests.lib.fabric_generator import FabricGenerator
 from tests.data import facts_unit
 from tests.lib.parametrize import generate_list_from_dict
 from tests.lib.helpers import setup_custom_logger
@@ -165,3 +173,155 @@ def test_CvFactsTools__device_get_configlets_no_configlet(fact_unit_tools, devic
         LOGGER.info('Device is attached to container %s', str(result[mock.MockCVPDatabase.FIELD_PARENT_NAME]))
     else:
         LOGGER.warning('Device is not attached to any container')
+
+
+# CvFactsTools.facts with output_file
+
+@pytest.mark.generic
+@pytest.mark.facts
+@pytest.mark.parametrize("compress", [False, True])
+def test_CvFactsTools_facts_output_file(cvp_database, tmp_path, compress):
+    cvp_database.images = {'data': [{'name': 'EOS-4.25.4M.swi', 'key': 'EOS-4.25.4M.swi'}]}
+    cvp_client = mock.get_cvp_client(cvp_database)
+    cvp_client.api.get_inventory.return_value = copy.deepcopy(facts_unit.MOCKDATA_DEVICES)
+    expected = CvFactsTools(cv_connection=cvp_client).facts(scope=['devices', 'images'], verbose='long')
+    cvp_client.api.get_inventory.return_value = copy.deepcopy(facts_unit.MOCKDATA_DEVICES)
+    output_file = str(tmp_path / 'facts.jsonl')
+
+    result = CvFactsTools(cv_connection=cvp_client).facts(scope=['devices', 'images'], verbose='long',
+                                                         output_file=output_file, compress=compress)
+    LOGGER.info('facts_tool response: %s', str(result))
+
+    assert result == {'output_file': output_file,
+                      'counts': {'cvp_devices': len(expected['cvp_devices']), 'cvp_images': len(expected['cvp_images'])}}
+    streamed = {'cvp_devices': [], 'cvp_images': {}}
+    with (gzip.open(output_file, 'rt') if compress else open(output_file, encoding='utf-8')) as facts_file:
+        for line in facts_file:
+            for section, fact in json.loads(line).items():
+                if section == 'cvp_devices':
+                    streamed[section].append(fact)
+                else:
+                    streamed[section].update(fact)
+    assert streamed == {'cvp_devices': expected['cvp_devices'], 'cvp_images': expected['cvp_images']}
+
+
+# CvFactsTools.facts scopes concurrency
+
+@pytest.mark.generic
+@pytest.mark.facts
+def test_CvFactsTools_facts_parallel_scopes(cvp_database):
+    cvp_database.images = {'data': []}
+    cvp_client = mock.get_cvp_client(cvp_database)
+    # Each scope waits for the other one: collection only completes if scopes run concurrently
+    barrier = threading.Barrier(2, timeout=10)
+
+    def get_inventory():
+        barrier.wait()
+        return []
+
+    def get_images():
+        barrier.wait()
+        return cvp_database.get_images()
+
+    cvp_client.api.get_inventory.side_effect = get_inventory
+    cvp_client.api.get_images.side_effect = get_images
+    instance = CvFactsTools(cv_connection=cvp_client)
+
+    result = instance.facts(scope=['devices', 'images'])
+    LOGGER.info('facts_tool timing: %s', str(instance.timing))
+
+    assert result['cvp_devices'] == []
+    assert result['cvp_images'] == {}
+    assert set(instance.timing.keys()) == {'devices', 'images'}
+
+
+# CvFactsTools.__fact_configlets
+
+@pytest.mark.generic
+@pytest.mark.facts
+def test_CvFactsTools__fact_configlets_pages_in_flight(cvp_database, tmp_path):
+    configlets = [{'name': f'configlet{index}', 'key': f'configlet_{index}', 'config': 'x' * 10} for index in range(95)]
+    cvp_client = mock.get_cvp_client(cvp_database)
+    lock = threading.Lock()
+    in_flight = {'current': 0, 'max': 0}
+
+    def get_configlets(start=0, end=0):
+        with lock:
+            in_flight['current'] += 1
+            in_flight['max'] = max(in_flight['max'], in_flight['current'])
+        time.sleep(0.01)
+        with lock:
+            in_flight['current'] -= 1
+        return {'data': configlets[start:end], 'total': len(configlets)}
+
+    cvp_client.api.get_configlets.side_effect = get_configlets
+    output_file = str(tmp_path / 'facts.jsonl')
+
+    result = CvFactsTools(cv_connection=cvp_client).facts(scope=['configlets'], output_file=output_file)
+
+    assert result['counts'] == {'cvp_configlets': 95}
+    assert in_flight['max'] <= 4
+    with open(output_file, encoding='utf-8') as facts_file:
+        streamed = [json.loads(line)['cvp_configlets'] for line in facts_file]
+    assert [name for fact in streamed for name in fact] == [configlet['name'] for configlet in configlets]
+
+
+# CvFactsTools.__fact_tasks
+
+def generate_tasks(count: int):
+    """Generate a list of tasks ordered from newest to oldest as returned by Cloudvision"""
+    return [{'workOrderId': str(task_id), 'createdBy': 'cvpadmin', 'description': f'task {task_id}',
+             'workOrderUserDefinedStatus': 'Pending', 'workOrderState': 'ACTIVE', 'ccId': '', 'ccIdV2': '',
+             'workOrderDetails': {}, 'createdDateInLongFormat': task_id * 1000, 'data': {'config': 'x' * 10}}
+            for task_id in range(count, 0, -1)]
+
+
+@pytest.fixture
+def tasks_client(cvp_database):
+    tasks = generate_tasks(250)
+    cvp_client = mock.get_cvp_client(cvp_database)
+    cvp_client.api.get_tasks.side_effect = lambda start=0, end=0: {'data': tasks[start:end], 'total': len(tasks)}
+    cvp_client.api.get_tasks_by_status.side_effect = lambda status, start=0, end=0: tasks[start:end]
+    return cvp_client
+
+
+@pytest.mark.generic
+@pytest.mark.facts
+@pytest.mark.parametrize("verbose", ['short', 'long'])
+def test_CvFactsTools__fact_tasks_paginated(tasks_client, verbose):
+    result = CvFactsTools(cv_connection=tasks_client).facts(scope=['tasks'], verbose=verbose)['cvp_tasks']
+    assert result['total_tasks'] == 250
+    assert len(result) == 251
+    assert ('data' in result['1']) == (verbose == 'long')
+    assert {call.kwargs['start'] for call in tasks_client.api.get_tasks.call_args_list} >= {0, 100, 200}
+    tasks_client.api.get_tasks.assert_any_call(start=0, end=100)
+
+
+@pytest.mark.generic
+@pytest.mark.facts
+@pytest.mark.parametrize("since", [{'since_task_id': 230}, {'since_time': 230}])
+def test_CvFactsTools__fact_tasks_since(tasks_client, since):
+    result = CvFactsTools(cv_connection=tasks_client).facts(scope=['tasks'], **since)['cvp_tasks']
+    assert sorted(int(task_id) for task_id in result if task_id != 'total_tasks') == list(range(231, 251))
+    assert result['total_tasks'] == 20
+
+
+@pytest.mark.generic
+@pytest.mark.facts
+def test_CvFactsTools__fact_tasks_status(tasks_client):
+    result = CvFactsTools(cv_connection=tasks_client).facts(scope=['tasks'], regex_filter='Pending')['cvp_tasks']
+    assert result['total_tasks'] == 250
+    tasks_client.api.get_tasks.assert_not_called()
+    tasks_client.api.get_tasks_by_status.assert_any_call('Pending', start=0, end=100)
+
+
+
+@pytest.mark.generic
+@pytest.mark.facts
+def test_CvFactsTools_facts_shared_filter(mocker):
+    cvp_client = MockCVPServer(database=FabricGenerator(devices=4, configlets=12).database()).local_client()
+    compile_spy = mocker.spy(facts_tools.re, 'compile')
+    result = CvFactsTools(cv_connection=cvp_client).facts(scope=['configlets', 'devices', 'images'], regex_filter='DC1-|leaf1')
+    compile_spy.assert_called_once_with('DC1-|leaf1')
+    assert sorted(result['cvp_configlets']) == ['DC1-1-base', 'DC1-2-base', 'DC1-3-base', 'DC1-base']
+    assert [device['hostname'] for device in result['cvp_devices']] == ['leaf1']
@@ -157,3 +157,26 @@ class TestCvReponseAnsible():
                    ) == ansible_output.content["API_BUILDER"]["API_BUILDER_count"]
         logging.info("Ansible response strct result is {}".format(
             ansible_output.content))
+
+
+@pytest.mark.generic
+class TestCvReponseTaskIds():
+    def test_api_result_slots(self):
+        api_result = CvApiResult(action_name="API_TEST")
+        with pytest.raises(AttributeError):
+            api_result.unknown_attribute = True
+
+    def test_task_ids_ordered_unique(self):
+        ansible_output = CvAnsibleResponse()
+        api_manager = CvManagerResult(builder_name="API_BUILDER")
+        for index in range(10000):
+            api_action = CvApiResult(action_name="API_TEST_{}".format(index))
+            api_action.success = True
+            api_action.taskIds = [str(index % 500), str(index % 500)]
+            api_manager.add_change(change=api_action)
+        ansible_output.add_manager(api_manager=api_manager)
+        ansible_output.add_manager(api_manager=api_manager)
+        assert api_manager.changes["taskIds"] == [str(index) for index in range(500)]
+        assert ansible_output.content["taskIds"] == [str(index) for index in range(500)]
+        assert api_manager.changes["API_BUILDER_count"] == 0
+        assert len(api_manager.changes["API_BUILDER_list"]) == 10000
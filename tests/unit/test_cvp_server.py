@@ -0,0 +1,118 @@
+#!/usr/bin/python
+# Copyright (c) 2023 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+# coding: utf-8 -*-
+
+from __future__ import (absolute_import, division, print_function)
+import pytest
+from cvprac.cvp_client_errors import CvpRequestError
+from ansible_collections.arista.cvp.plugins.module_utils.device_tools import CvDeviceTools, DeviceInventory
+from ansible_collections.arista.cvp.plugins.module_utils.facts_tools import CvFactsTools
+from tests.lib.cvp_server import MockCVPServer, seed_database
+from tests.lib.mock_ansible import get_ansible_module
+
+# ---------------------------------------------------------------------------- #
+#   FIXTURES
+# ---------------------------------------------------------------------------- #
+
+
+@pytest.fixture
+def cvp_server():
+    with MockCVPServer(database=seed_database(devices=20, configlets=40), seed=0) as server:
+        yield server
+
+
+@pytest.fixture
+def cvp_client(cvp_server):
+    return cvp_server.client()
+
+# ---------------------------------------------------------------------------- #
+#   PYTEST
+# ---------------------------------------------------------------------------- #
+
+
+@pytest.mark.generic
+class TestMockCVPServer():
+    """
+    Contains unit tests for tests.lib.cvp_server with a real cvprac client
+    """
+
+    def test_inventory(self, cvp_client):
+        """
+        Test cvprac inventory and topology calls are served from database
+        """
+        inventory = cvp_client.api.get_inventory()
+        assert len(inventory) == 20
+        assert {device['containerName'] for device in inventory} == {'Leaves'}
+        assert cvp_client.api.get_device_by_name('leaf3.example.com')['parentContainerId'] == 'container_leaves'
+        topology = cvp_client.api.filter_topology()['topology']
+        assert [container['name'] for container in topology['childContainerList']] == ['Fabric', 'Undefined']
+        assert topology['hierarchyNetElementCount'] == 20
+        mappers = cvp_client.api.get_configlets_and_mappers()['data']
+        assert len(mappers['configlets']) == 40
+        assert len(mappers['configletMappers']) == 40
+
+    def test_topology_actions(self, cvp_client, cvp_server):
+        """
+        Test topology changes are saved in database and create tasks
+        """
+        fabric = cvp_client.api.get_container_by_name('Fabric')
+        assert cvp_client.api.add_container('Spines', 'Fabric', fabric['key'])['data']['taskIds'] == []
+        spines = cvp_client.api.get_container_by_name('Spines')
+        device = cvp_client.api.get_device_by_name('leaf1.example.com')
+        response = cvp_client.api.move_device_to_container('test', device, spines)
+        assert response['data']['taskIds'] == ['1']
+        configlet = cvp_client.api.get_configlet_by_name('configlet-1')
+        cvp_client.api.apply_configlets_to_device('test', device, [configlet])
+        assert [configlet['name'] for configlet in cvp_client.api.get_configlets_by_device_id(device['key'])] == ['configlet-0', 'configlet-20', 'configlet-1']
+        assert cvp_server.database.devices[device['key']]['parentContainerKey'] == spines['key']
+        assert [task['workOrderId'] for task in cvp_client.api.get_tasks_by_status('Pending')] == ['2', '1']
+        cvp_client.api.execute_task('1')
+        assert cvp_client.api.get_task_by_id('1')['workOrderUserDefinedStatus'] == 'Completed'
+        assert cvp_client.api.get_task_by_id('99') is None
+
+    def test_change_control(self, cvp_client):
+        """
+        Test change control resource APIs
+        """
+        change = {'key': {'id': 'cc1'}, 'change': {'name': 'cc1', 'rootStageId': 'root', 'stages': {'values': {'root': {'name': 'root', 'rows': {'values': []}}}}}}
+        cvp_client.api.change_control_create_with_custom_stages(change)
+        assert cvp_client.api.change_control_get_all()['data'][0]['result']['value']['change']['name'] == 'cc1'
+        assert cvp_client.api.change_control_approve('cc1') is not None
+        cvp_client.api.change_control_start('cc1')
+        assert cvp_client.api.change_control_get_one('cc1')['value']['status'] == 'CHANGE_CONTROL_STATUS_COMPLETED'
+        assert cvp_client.api.change_control_get_one('unknown') is None
+
+    def test_tag_workspace(self, cvp_client, cvp_server):
+        """
+        Test tags are applied when workspace is submitted
+        """
+        cvp_client.api.workspace_config('ws1', 'ws1')
+        cvp_client.api.tag_config('ELEMENT_TYPE_DEVICE', 'ws1', 'role', 'leaf')
+        cvp_client.api.workspace_config('ws1', 'ws1', request='REQUEST_START_BUILD', request_id='b1')
+        assert cvp_client.api.workspace_build_status('ws1', 'b1')['value']['state'] == 'BUILD_STATE_SUCCESS'
+        assert cvp_server.database.tags == []
+        cvp_client.api.workspace_config('ws1', 'ws1', request='REQUEST_SUBMIT', request_id='s1')
+        assert cvp_server.database.tags == [{'elementType': 'ELEMENT_TYPE_DEVICE', 'label': 'role', 'value': 'leaf'}]
+
+    def test_error_injection(self, cvp_client, cvp_server):
+        """
+        Test injected errors are raised as cvprac request errors
+        """
+        cvp_server.error_rate = 1.0
+        with pytest.raises(CvpRequestError):
+            cvp_client.api.get_configlets_and_mappers()
+        assert cvp_server.requests['GET /web/configlet/getConfigletsAndAssociatedMappers.do'] == 1
+
+    def test_module_utils(self, cvp_client):
+        """
+        Test module_utils run end to end against the server
+        """
+        facts = CvFactsTools(cv_connection=cvp_client).facts(scope=['devices', 'configlets'])
+        assert len(facts['cvp_devices']) == 20
+        assert len(facts['cvp_configlets']) == 40
+        inventory = DeviceInventory(data=[{'fqdn': 'leaf1.example.com', 'parentContainerName': 'Leaves', 'configlets': ['configlet-0', 'configlet-20', 'configlet-5']}])
+        result = CvDeviceTools(cv_connection=cvp_client, ansible_module=get_ansible_module()).manager(user_inventory=inventory, search_mode='fqdn')
+        assert result['configlets_attached']['configlets_attached_list'] == ['leaf1.example.com_configlet_attached']
+        assert result['taskIds'] == ['1']
@@ -99,3 +99,24 @@ class TestDeviceElement():
         if Api.device.CONTAINER_NAME in DEVICE:
             assert device.info[Api.generic.PARENT_CONTAINER_NAME] == DEVICE[Api.generic.PARENT_CONTAINER_NAME]
         logging.info("Device information: {}".format(device.info))
+
+    @pytest.mark.parametrize("SEARCH_BY", [Api.device.FQDN, Api.device.SYSMAC, Api.device.SERIAL, Api.device.HOSTNAME])
+    def test_get_lookup_key(self, DEVICE, SEARCH_BY):
+        device = DeviceElement(data=DEVICE)
+        assert device.get_lookup_key(SEARCH_BY) == device.info.get(SEARCH_BY)
+
+    def test_get_lookup_key_after_update(self, DEVICE):
+        device = DeviceElement(data=DEVICE)
+        assert device.get_lookup_key(Api.device.SYSMAC) == DEVICE.get(Api.device.SYSMAC)
+        device.system_mac = "newMacAddress"
+        assert device.get_lookup_key(Api.device.SYSMAC) == "newMacAddress"
+
+    def test_get_lookup_key_unsupported(self, DEVICE):
+        device = DeviceElement(data=DEVICE)
+        assert device.get_lookup_key("test") is None
+
+    def test_slots(self, DEVICE):
+        device = DeviceElement(data=DEVICE)
+        assert not hasattr(device, "__dict__")
+        with pytest.raises(AttributeError):
+            device.unknown_field = "test"
@@ -12,6 +12,7 @@
 
 from __future__ import (absolute_import, division, print_function)
 import logging
+import threading
 import pytest
 from ansible_collections.arista.cvp.plugins.module_utils.device_tools import DeviceInventory
 from ansible_collections.arista.cvp.plugins.module_utils.resources.api.fields import Api
@@ -120,3 +121,78 @@ class TestDeviceInventory():
                 device_string=dev_data[Api.device.FQDN],
                 search_method="test")
             assert dev_data[Api.device.FQDN] == dev_inventory.fqdn
+
+    @pytest.mark.parametrize("DEVICE_INVENTORY", generate_inventory_data(type="device"))
+    def test_get_by_serial_number(self, DEVICE_INVENTORY):
+        inventory = DeviceInventory(data=DEVICE_INVENTORY)
+        for dev_data in DEVICE_INVENTORY:
+            if Api.device.SERIAL in dev_data:
+                dev_inventory = inventory.get_device(
+                    device_string=dev_data[Api.device.SERIAL], search_method=Api.device.SERIAL)
+                assert dev_data[Api.device.SERIAL] == dev_inventory.serial_number
+
+    @pytest.mark.parametrize("DEVICE_INVENTORY", generate_inventory_data(type="device"))
+    def test_get_by_hostname(self, DEVICE_INVENTORY):
+        inventory = DeviceInventory(data=DEVICE_INVENTORY)
+        for device in inventory.devices:
+            hostname = device.get_lookup_key(Api.device.HOSTNAME)
+            if hostname is not None:
+                dev_inventory = inventory.get_device(
+                    device_string=hostname, search_method=Api.device.HOSTNAME)
+                assert dev_inventory.get_lookup_key(Api.device.HOSTNAME) == hostname
+
+    @pytest.mark.parametrize("DEVICE_INVENTORY", generate_inventory_data(type="device"))
+    def test_get_after_update(self, DEVICE_INVENTORY):
+        inventory = DeviceInventory(data=DEVICE_INVENTORY)
+        device = inventory.devices[0]
+        inventory.get_device(device_string=device.system_mac, search_method=Api.device.SYSMAC)
+        device.system_mac = "newMacAddress"
+        assert inventory.get_device(device_string="newMacAddress", search_method=Api.device.SYSMAC) is device
+
+    @pytest.mark.parametrize("DEVICE_INVENTORY", generate_inventory_data(type="device"))
+    def test_get_after_update_to_missing_key(self, DEVICE_INVENTORY):
+        inventory = DeviceInventory(data=DEVICE_INVENTORY)
+        device = inventory.devices[-1]
+        assert inventory.get_device(device_string="new.example.com") is None
+        device.fqdn = "new.example.com"
+        assert inventory.get_device(device_string="new.example.com") is device
+
+    @pytest.mark.parametrize("DEVICE_INVENTORY", generate_inventory_data(type="device"))
+    def test_update_does_not_reindex_other_inventory(self, DEVICE_INVENTORY, mocker):
+        inventory = DeviceInventory(data=DEVICE_INVENTORY)
+        other_inventory = DeviceInventory(data=DEVICE_INVENTORY)
+        other_device = other_inventory.devices[0]
+        assert other_inventory.get_device(device_string=other_device.fqdn) is other_device
+        build_index = mocker.spy(other_inventory, "_DeviceInventory__build_index")
+        inventory.devices[0].fqdn = "new.example.com"
+        assert inventory.get_device(device_string="new.example.com") is inventory.devices[0]
+        assert other_inventory.get_device(device_string=other_device.fqdn) is other_device
+        build_index.assert_not_called()
+
+    @pytest.mark.parametrize("DEVICE_INVENTORY", generate_inventory_data(type="device"))
+    def test_replaced_devices_do_not_reindex(self, DEVICE_INVENTORY, mocker):
+        inventory = DeviceInventory(data=DEVICE_INVENTORY)
+        removed_device = inventory.devices[-1]
+        inventory.devices = inventory.devices[:-1]
+        assert inventory.get_device(device_string=removed_device.fqdn) is None
+        build_index = mocker.spy(inventory, "_DeviceInventory__build_index")
+        removed_device.fqdn = "new.example.com"
+        assert inventory.get_device(device_string="new.example.com") is None
+        build_index.assert_not_called()
+
+    @pytest.mark.parametrize("DEVICE_INVENTORY", generate_inventory_data(type="device"))
+    def test_get_after_concurrent_updates(self, DEVICE_INVENTORY):
+        inventory = DeviceInventory(data=DEVICE_INVENTORY)
+
+        def update(index, device):
+            for count in range(50):
+                device.fqdn = "device{0}-{1}.example.com".format(index, count)
+                inventory.get_device(device_string=device.fqdn)
+
+        threads = [threading.Thread(target=update, args=(index, device)) for index, device in enumerate(inventory.devices)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for device in inventory.devices:
+            assert inventory.get_device(device_string=device.fqdn) is device
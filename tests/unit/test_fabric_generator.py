@@ -0,0 +1,80 @@
+#!/usr/bin/python
+# Copyright (c) 2023 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+# coding: utf-8 -*-
+
+from __future__ import (absolute_import, division, print_function)
+import pytest
+from ansible_collections.arista.cvp.plugins.module_utils.container_tools import ContainerInput
+from ansible_collections.arista.cvp.plugins.module_utils.tools_schema import validate_json_schema
+from ansible_collections.arista.cvp.plugins.module_utils.resources.schemas.v3 import (
+    SCHEMA_CV_CONTAINER, SCHEMA_CV_DEVICE, SCHEMA_CV_CONFIGLET)
+from tests.lib.fabric_generator import FabricGenerator
+
+# ---------------------------------------------------------------------------- #
+#   FIXTURES
+# ---------------------------------------------------------------------------- #
+
+
+@pytest.fixture(scope='module')
+def fabric():
+    return FabricGenerator(devices=30, configlets=100, depth=3, fanout=2, tasks=50, change_controls=5, undefined=2)
+
+# ---------------------------------------------------------------------------- #
+#   PYTEST
+# ---------------------------------------------------------------------------- #
+
+
+@pytest.mark.generic
+class TestFabricGenerator():
+    """
+    Contains unit tests for tests.lib.fabric_generator
+    """
+
+    def test_fabric_size(self, fabric):
+        """
+        Test fabric is generated with requested number of objects
+        """
+        # Tenant, Undefined and 2 + 4 + 8 user containers
+        assert len(fabric.containers) == 16
+        assert len(fabric.devices) == 32
+        assert len(fabric.configlets) == 100
+        assert len(fabric.tasks) == 50
+        assert len(fabric.change_controls) == 5
+        assert fabric.topology()['topology']['hierarchyNetElementCount'] == 32
+        assert len(fabric.inventory()) == 32
+        assert fabric.get_tasks()['data'][0]['workOrderId'] == '50'
+
+    def test_deterministic(self, fabric):
+        """
+        Test same seed generates same fabric
+        """
+        other = FabricGenerator(devices=30, configlets=100, depth=3, fanout=2, tasks=50, change_controls=5, undefined=2)
+        assert other.configlets == fabric.configlets
+        assert other.mappers == fabric.mappers
+        assert other.change_controls == fabric.change_controls
+
+    def test_module_inputs(self, fabric):
+        """
+        Test module inputs are valid against module schemas
+        """
+        devices = fabric.device_inputs(moved=0.5, changed=0.5)
+        assert len(devices) == 32
+        assert validate_json_schema(user_json=devices, schema=SCHEMA_CV_DEVICE)
+        containers = fabric.container_inputs(changed=0.5)
+        assert validate_json_schema(user_json=containers, schema=SCHEMA_CV_CONTAINER)
+        assert ContainerInput(user_topology=containers).ordered_list_containers[:2] == ['DC1', 'DC2']
+        configlets = fabric.configlet_inputs(changed=0.5, new=2)
+        assert len(configlets) == 102
+        assert validate_json_schema(user_json=configlets, schema=SCHEMA_CV_CONFIGLET)
+
+    def test_database(self, fabric):
+        """
+        Test database is an independent copy of the fabric
+        """
+        database = fabric.database()
+        assert len(database.devices) == 32
+        assert database.taskIdCounter == 50
+        database.configlets['DC1-base']['config'] = ''
+        assert fabric.database().configlets['DC1-base']['config'] != ''
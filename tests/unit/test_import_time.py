@@ -0,0 +1,84 @@
+#!/usr/bin/python
+# Copyright (c) 2023 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+# coding: utf-8 -*-
+#
+
+from __future__ import (absolute_import, division, print_function)
+import ast
+import importlib
+import logging
+import os
+import subprocess
+import sys
+import pytest
+
+MODULES_V3 = [
+    'cv_change_control_v3',
+    'cv_configlet_v3',
+    'cv_container_v3',
+    'cv_device_v3',
+    'cv_facts_v3',
+    'cv_image_v3',
+    'cv_tag_v3',
+    'cv_task_v3',
+    'cv_validate_v3',
+]
+
+# Dependencies only imported by the code path which needs them
+DEFERRED_IMPORTS = [
+    'requests',
+    'urllib3',
+    'jsonschema',
+    'difflib',
+    'cvprac.cvp_client',
+]
+
+# module_utils imported at run time which AnsiballZ must still find to bundle with modules
+BUNDLED_IMPORTS = {
+    'tools_schema': [('ansible_collections', 'arista', 'cvp', 'plugins', 'module_utils', 'resources', 'schemas', 'v3')],
+}
+
+# Regression budget for cumulative import time of a module, in microseconds
+IMPORT_TIME_BUDGET = int(os.environ.get('CVP_IMPORT_TIME_BUDGET', 500000))
+
+
+def import_time(module_name: str):
+    """
+    Import a module in a fresh interpreter and return cumulative import time per package
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import {}'.format(module_name)],
+        env=env, capture_output=True, text=True, check=True)
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, package = line.split('|')
+        timings[package.strip()] = int(cumulative)
+    return timings
+
+
+@pytest.mark.generic
+@pytest.mark.parametrize('module', MODULES_V3)
+def test_module_import_time(module):
+    module_name = 'ansible_collections.arista.cvp.plugins.modules.{}'.format(module)
+    timings = import_time(module_name)
+    logging.info('Import time of %s: %sus', module, timings[module_name])
+    for deferred in DEFERRED_IMPORTS:
+        assert deferred not in timings, '{} imported at load time by {}'.format(deferred, module)
+    assert timings[module_name] < IMPORT_TIME_BUDGET
+
+
+@pytest.mark.generic
+@pytest.mark.parametrize('module_util', BUNDLED_IMPORTS.keys())
+def test_deferred_imports_bundled(module_util):
+    module_common = pytest.importorskip('ansible.executor.module_common')
+    module_name = 'ansible_collections.arista.cvp.plugins.module_utils.{}'.format(module_util)
+    with open(importlib.import_module(module_name).__file__, encoding='utf-8') as source:
+        tree = ast.parse(source.read())
+    finder = module_common.ModuleDepFinder(module_name, tree, is_pkg_init=False)
+    for bundled in BUNDLED_IMPORTS[module_util]:
+        assert bundled in finder.submodules, '{} not bundled with {}'.format('.'.join(bundled), module_util)
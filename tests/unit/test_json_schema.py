@@ -11,7 +11,7 @@
 from __future__ import (absolute_import, division, print_function)
 import logging
 import pytest
-from ansible_collections.arista.cvp.plugins.module_utils.tools_schema import validate_json_schema
+from ansible_collections.arista.cvp.plugins.module_utils.tools_schema import validate_json_schema, get_validator, iter_json_schema_errors
 from ansible_collections.arista.cvp.plugins.module_utils.resources.schemas.v3 import (
     SCHEMA_CV_CONTAINER, SCHEMA_CV_DEVICE, SCHEMA_CV_CONFIGLET, SCHEMA_CV_CHANGE_CONTROL )
 from tests.lib.parametrize import generate_inventory_data
@@ -74,25 +74,68 @@ class TestJsonSchemaConfiglet():
 
 @pytest.mark.generic
 class TestJsonSchemaDevice():
+    @pytest.mark.parametrize("per_item", [False, True])
     @pytest.mark.parametrize("CV_DEVICE", generate_inventory_data(type="device"))
-    def test_container_schema_valid(self, CV_DEVICE):
+    def test_container_schema_valid(self, CV_DEVICE, per_item):
         logging.debug("Schema is: {}".format(SCHEMA_CV_DEVICE))
         result = validate_json_schema(
-            user_json=CV_DEVICE, schema=SCHEMA_CV_DEVICE)
+            user_json=CV_DEVICE, schema=SCHEMA_CV_DEVICE, per_item=per_item)
         assert result
         logging.info(
             "Topology {} is valid against SCHEMA_CV_DEVICE".format(CV_DEVICE))
 
+    @pytest.mark.parametrize("per_item", [False, True])
     @pytest.mark.parametrize("CV_DEVICE_INVALID", generate_inventory_data(type="device", mode="invalid"))
-    def test_container_schema_invalid(self, CV_DEVICE_INVALID):
+    def test_container_schema_invalid(self, CV_DEVICE_INVALID, per_item):
         result = validate_json_schema(
-            user_json=CV_DEVICE_INVALID, schema=SCHEMA_CV_DEVICE)
+            user_json=CV_DEVICE_INVALID, schema=SCHEMA_CV_DEVICE, per_item=per_item)
         assert result is False
         logging.info(
             "Topology {} is INVALID against SCHEMA_CV_DEVICE".format(CV_DEVICE_INVALID))
 
+    def test_device_schema_per_item_generator(self):
+        devices = ({"fqdn": "leaf{}".format(index), "parentContainerName": "Leaves"} for index in range(1000))
+        assert validate_json_schema(user_json=devices, schema=SCHEMA_CV_DEVICE, per_item=True)
+
+    def test_device_schema_all_errors(self):
+        devices = [{"fqdn": "leaf1"}, {"fqdn": "leaf2", "parentContainerName": "Leaves"}, {"fqdn": 3, "parentContainerName": "Leaves"}]
+        for per_item in [False, True]:
+            errors = list(iter_json_schema_errors(user_json=devices, schema=SCHEMA_CV_DEVICE, per_item=per_item))
+            assert sorted(list(error.absolute_path)[0] for error in errors) == [0, 2]
+
+    def test_device_schema_per_item_array_keywords(self):
+        schema = dict(SCHEMA_CV_DEVICE, uniqueItems=True)
+        devices = [{"fqdn": "leaf1", "parentContainerName": "Leaves"}] * 2
+        errors = list(iter_json_schema_errors(user_json=iter(devices), schema=schema, per_item=True))
+        assert [error.validator for error in errors] == ["uniqueItems"]
+
+    def test_device_schema_per_item_references(self):
+        schema = {
+            "$schema": "http://json-schema.org/draft-07/schema#",
+            "type": "array",
+            "definitions": {"name": {"type": "string"}},
+            "items": {"type": "object", "properties": {"fqdn": {"$ref": "#/definitions/name"}}},
+        }
+        errors = list(iter_json_schema_errors(user_json=[{"fqdn": "leaf1"}, {"fqdn": 3}], schema=schema, per_item=True))
+        assert [list(error.absolute_path) for error in errors] == [[1, "fqdn"]]
+
 # --------------------------------------------------------
-# Device format validation
+# Validator cache
+# --------------------------------------------------------
+
+
+@pytest.mark.generic
+class TestJsonSchemaValidator():
+    def test_validator_cached(self):
+        assert get_validator(SCHEMA_CV_DEVICE) is get_validator(SCHEMA_CV_DEVICE)
+        assert get_validator(SCHEMA_CV_DEVICE) is not get_validator(SCHEMA_CV_CONTAINER)
+
+    def test_validator_draft(self):
+        assert type(get_validator(SCHEMA_CV_CONTAINER)).__name__ == "Draft3Validator"
+        assert type(get_validator(SCHEMA_CV_DEVICE)).__name__ == "Draft7Validator"
+
+# --------------------------------------------------------
+# Change Control format validation
 # --------------------------------------------------------
 
 
@@ -9,6 +9,7 @@
 # flake8: noqa: W1202
 
 from __future__ import absolute_import, division, print_function
+from ansible_collections.arista.cvp.plugins.module_utils import tools_cv
 from ansible_collections.arista.cvp.plugins.module_utils.tools_cv import cv_connect
 import pytest
 from unittest import mock
@@ -123,3 +124,48 @@ def test_cv_connect(module, connection, connect_side_effect, expectation):
     ):
         with expectation:
             cv_connect(module)
+
+
+@pytest.mark.parametrize(
+    "task_ids, expected",
+    [
+        pytest.param(['12', '13', '12'], ['12', '13'], id="Duplicated IDs"),
+        pytest.param([['12', '13'], ['14'], '13'], ['12', '13', '14'], id="Nested IDs"),
+        pytest.param([12, '12'], ['12'], id="Integer IDs"),
+        pytest.param([], [], id="No task"),
+    ],
+)
+def test_cv_get_tasks(task_ids, expected):
+    """
+    Test task details are collected once per task ID and in order
+    """
+    module = mock.MagicMock()
+    module.client.api.get_task_by_id.side_effect = lambda task_id: {'workOrderId': task_id}
+    tasks = tools_cv.cv_get_tasks(module=module, task_ids=task_ids)
+    assert [task['workOrderId'] for task in tasks] == expected
+    assert module.client.api.get_task_by_id.call_count == len(expected)
+
+
+def test_cv_get_tasks_polling(monkeypatch):
+    """
+    Test tasks not yet created are polled again with backoff and missing tasks are skipped
+    """
+    sleeps = []
+    monkeypatch.setattr(tools_cv.time, 'sleep', sleeps.append)
+    module = mock.MagicMock()
+    created = {'12': 1, '13': 3}
+    calls = {}
+
+    def get_task_by_id(task_id):
+        calls[task_id] = calls.get(task_id, 0) + 1
+        if task_id in created and calls[task_id] >= created[task_id]:
+            return {'workOrderId': task_id}
+        return None
+
+    module.client.api.get_task_by_id.side_effect = get_task_by_id
+    tasks = tools_cv.cv_get_tasks(module=module, task_ids=['12', '13', '99'], timeout=4)
+    assert [task['workOrderId'] for task in tasks] == ['12', '13']
+    assert calls['12'] == 1
+    # Backoff doubles until next delay would exceed the timeout
+    assert sleeps == [0.5, 1.0, 2.0]
+    assert calls == {'12': 1, '13': 3, '99': 4}